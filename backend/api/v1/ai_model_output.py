@@ -2,48 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Optional
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from backend.core.dependencies import get_db, get_current_user_id, require_super_admin
+from backend.core.dependencies import (
+    get_current_user_id,
+    get_db,
+    get_token_payload,
+    has_admin_claims,
+    require_super_admin,
+)
 from backend.core.enums import AIOutputTargetType
+from backend.core.pagination import InvalidCursorError, set_next_cursor
+from backend.core.serialization import ndjson_response
 from backend.crud import ai_model_output as crud_ai
 from backend.models.ai_model_output import OutputType, OutputFormat
 from backend.schemas.ai_model_output import (
     AIModelOutputCreate,
     AIModelOutputRead,
+    AIOutputArchiveResult,
     AIOutputSearchParams,
     AIOutputSummary
 )
-from backend.security import decode_token
+from backend.services.ai.output_retention import AIOutputArchiver
 
 router = APIRouter(prefix="/ai", tags=["AI Outputs"])
 
-_auth_scheme = HTTPBearer()
-
-
-def _is_admin(credentials: Optional[HTTPAuthorizationCredentials]) -> bool:
-    """Return True if token has admin-like claims."""
-    if not credentials:
-        return False
-    try:
-        payload = decode_token(credentials.credentials)
-        is_superadmin = bool(payload.get("is_superadmin"))
-        is_admin = bool(payload.get("is_admin"))
-        role = str(payload.get("role", "") or "").lower()
-        perms = payload.get("permissions") or []
-        if isinstance(perms, str):
-            perms = [perms]
-        by_role = role in {"superadmin", "admin"}
-        by_perm = "users:create" in {str(p).lower() for p in perms}
-        return is_superadmin or is_admin or by_role or by_perm
-    except Exception:
-        return False
-
-
 @router.post(
     "/outputs/",
     response_model=AIModelOutputRead,
@@ -71,6 +58,43 @@ def create_ai_output(
     return crud_ai.create_ai_output(db, output_data)
 
 
+# Declared before "/outputs/{output_id}" so "export" is not parsed as an ID
+@router.get(
+    "/outputs/export",
+    response_class=StreamingResponse,
+    summary="Export AI outputs as NDJSON",
+    dependencies=[Depends(get_current_user_id)],
+)
+def export_ai_outputs(
+        user_id: int | None = Query(None, gt=0, description="Filter by user ID"),
+        output_type: OutputType | None = Query(None, description="Filter by output type"),
+        target_type: AIOutputTargetType | None = Query(None, description="Filter by target entity type"),
+        db: Session = Depends(get_db),
+        current_user_id: int = Depends(get_current_user_id),
+        token_payload: Annotated[dict[str, Any] | None, Depends(get_token_payload)] = None,
+) -> StreamingResponse:
+    """Stream AI outputs, newest first, one JSON object per line.
+
+    Outputs are loaded in batches while the response is sent, so memory
+    stays constant however many outputs match.
+
+    Security:
+        - Auth required
+        - Non-admins can only export their own outputs
+        - Admins can export any user_id or all users
+    """
+    search_params = AIOutputSearchParams(
+        user_id=user_id if has_admin_claims(token_payload) else current_user_id,
+        output_type=output_type,
+        target_type=target_type,
+    )
+    return ndjson_response(
+        crud_ai.iter_ai_outputs(db, search_params),
+        filename="ai-outputs.ndjson",
+        on_close=db.close,
+    )
+
+
 @router.get(
     "/outputs/{output_id}",
     response_model=AIModelOutputRead,
@@ -82,7 +106,7 @@ def get_ai_output(
         output_id: int,
         db: Session = Depends(get_db),
         current_user_id: int = Depends(get_current_user_id),
-        credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_auth_scheme)] = None,
+        token_payload: Annotated[dict[str, Any] | None, Depends(get_token_payload)] = None,
 ) -> AIModelOutputRead:
     """Retrieve a specific AI output by its unique identifier.
 
@@ -98,7 +122,7 @@ def get_ai_output(
             detail=f"AI output with ID {output_id} not found"
         )
 
-    if db_output.user_id != current_user_id and not _is_admin(credentials):
+    if db_output.user_id != current_user_id and not has_admin_claims(token_payload):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not allowed to access this resource",
@@ -142,6 +166,7 @@ def delete_ai_output(
     dependencies=[Depends(get_current_user_id)],
 )
 def get_all_ai_outputs(
+        response: Response,
         user_id: int | None = Query(None, gt=0, description="Filter by user ID"),
         model_version: str | None = Query(None, description="Filter by AI model version"),
         output_type: OutputType | None = Query(None, description="Filter by output type"),
@@ -151,19 +176,23 @@ def get_all_ai_outputs(
         prompt_contains: str | None = Query(None, description="Filter by text in prompt"),
         skip: int = Query(0, ge=0, description="Number of records to skip"),
         limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+        cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
         db: Session = Depends(get_db),
         current_user_id: int = Depends(get_current_user_id),
-        credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_auth_scheme)] = None,
+        token_payload: Annotated[dict[str, Any] | None, Depends(get_token_payload)] = None,
 ) -> list[AIModelOutputRead]:
     """Retrieve all AI outputs with optional search and filtering.
 
+    Newest first; the cursor for the next page is returned in the
+    ``X-Next-Cursor`` header.
+
     Security:
         - Auth required
         - Non-admins can only see their own outputs (user_id is forced to current user)
         - Admins can query any user_id or all users
     """
     effective_user_id = user_id
-    if not _is_admin(credentials):
+    if not has_admin_claims(token_payload):
         effective_user_id = current_user_id  # force self-only view
 
     search_params = AIOutputSearchParams(
@@ -176,7 +205,13 @@ def get_all_ai_outputs(
         prompt_contains=prompt_contains,
     )
 
-    return crud_ai.get_all_ai_outputs(db, search_params, skip, limit)
+    try:
+        outputs = crud_ai.get_all_ai_outputs(db, search_params, skip, limit, cursor=cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    set_next_cursor(response, crud_ai.AI_OUTPUT_KEYSET.next_cursor(outputs, limit))
+    return outputs
 
 
 @router.get(
@@ -193,7 +228,7 @@ def get_ai_outputs_by_target(
         limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
         db: Session = Depends(get_db),
         current_user_id: int = Depends(get_current_user_id),
-        credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_auth_scheme)] = None,
+        token_payload: Annotated[dict[str, Any] | None, Depends(get_token_payload)] = None,
 ) -> list[AIModelOutputRead]:
     """Retrieve all AI outputs associated with a specific target entity.
 
@@ -204,7 +239,7 @@ def get_ai_outputs_by_target(
     """
     outputs = crud_ai.get_ai_outputs_by_target(db, target_type, target_id, skip, limit)
 
-    if _is_admin(credentials):
+    if has_admin_claims(token_payload):
         return outputs
 
     # Filter to current user only for non-admins
@@ -224,4 +259,23 @@ def get_ai_output_summary(db: Session = Depends(get_db)) -> AIOutputSummary:
     Security:
         - Admin-only
     """
-    return crud_ai.get_ai_output_summary(db)
\ No newline at end of file
+    return crud_ai.get_ai_output_summary(db)
+
+
+@router.post(
+    "/outputs/archive",
+    response_model=AIOutputArchiveResult,
+    status_code=status.HTTP_200_OK,
+    summary="Archive AI outputs past their retention period",
+    dependencies=[Depends(require_super_admin)],
+)
+def archive_ai_outputs(
+        dry_run: bool = Query(True, description="Only count outputs that would be archived"),
+        db: Session = Depends(get_db),
+) -> AIOutputArchiveResult:
+    """Move AI outputs matching the retention policy to archive files.
+
+    Security:
+        - Admin-only
+    """
+    return AIOutputArchiver().run(db, dry_run=dry_run)
@@ -1,28 +1,73 @@
 """AI recipe generation endpoints."""
 
-from typing import Annotated
+import time
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from backend.core.dependencies import get_db, get_current_user_id, require_same_user
+from backend.core.config import settings
+from backend.core.dependencies import get_db, get_current_user_id, require_same_user, require_super_admin
 from backend.core.enums import OutputType, OutputFormat, AIOutputTargetType
 from backend.crud import ai_model_output as crud_ai_output
 from backend.crud import kitchen as crud_kitchen
-from backend.schemas.ai_model_output import AIModelOutputCreate, AIModelOutputUpdate
+from backend.schemas.ai_model_output import AIModelOutputCreate, AIModelOutputRead, AIModelOutputUpdate
 from backend.schemas.ai_service import (
+    KitchenInsightsRequest,
+    KitchenInsightsResponse,
     RecipeGenerationAPIRequest,
+    RecipeGenerationRequest,
     RecipeWithAIOutput,
     RecipeGenerationResponse
 )
 from backend.schemas.recipe import RecipeCreate
 from backend.services.ai.factory import AIServiceFactory
+from backend.services.ai.kitchen_insights import KitchenInsightsService
 from backend.services.ai.prompt_builder import PromptBuilder
+from backend.services.ai.resilience import (
+    AIServiceTimeoutError,
+    AIServiceUnavailableError,
+    get_resilience_status,
+)
 from backend.services.conversions.unit_conversion_service import UnitConversionService
 
 router = APIRouter(prefix="/ai", tags=["AI Services"])
 
 
+def _store_recipe_output(
+        db: Session,
+        *,
+        user_id: int,
+        model_version: str,
+        system_prompt: str,
+        user_prompt: str,
+        request: RecipeGenerationRequest,
+        recipe_response: RecipeGenerationResponse,
+) -> AIModelOutputRead:
+    """Persist a generated recipe together with the prompt that produced it.
+
+    The system prompt is stored once by hash and shared across outputs; the
+    user prompt and request parameters are kept as structured fields.
+    """
+    return crud_ai_output.create_ai_output(
+        db=db,
+        output_data=AIModelOutputCreate(
+            user_id=user_id,
+            model_version=model_version,
+            output_type=OutputType.RECIPE,
+            output_format=OutputFormat.JSON,
+            prompt_used=user_prompt,
+            system_prompt=system_prompt,
+            prompt_params=request.model_dump(mode="json"),
+            raw_output=recipe_response.model_dump_json(),
+            target_type=AIOutputTargetType.RECIPE,
+            target_id=None,
+            extra_data={"status": "generated"}
+        )
+    )
+
+
 @router.post("/recipes", response_model=RecipeWithAIOutput)
 async def generate_recipe(
         *,
@@ -49,42 +94,35 @@ async def generate_recipe(
     try:
         ai_service = AIServiceFactory.create_ai_service(db)
 
-        # Build the prompt to capture what was actually sent to the AI
+        # Build the context once and the prompt to capture what was actually sent to the AI
         prompt_builder = PromptBuilder(db)
+        context = prompt_builder.build_context(
+            user_id=data.user_id,
+            kitchen_id=data.kitchen_id,
+            request=data.request
+        )
         system_prompt, user_prompt = prompt_builder.build_recipe_prompt(
             request=data.request,
             user_id=data.user_id,
-            kitchen_id=data.kitchen_id
+            kitchen_id=data.kitchen_id,
+            context=context
         )
 
         recipe_response = await ai_service.generate_recipe(
             request=data.request,
             user_id=data.user_id,
-            kitchen_id=data.kitchen_id
+            kitchen_id=data.kitchen_id,
+            context=context
         )
 
-        model_version = getattr(ai_service, 'model', 'unknown')
-
-        # Create structured prompt data for storage
-        prompt_data = {
-            "system_prompt": system_prompt,
-            "user_prompt": user_prompt,
-            "original_request": data.request.model_dump()
-        }
-
-        ai_output = crud_ai_output.create_ai_output(
-            db=db,
-            output_data=AIModelOutputCreate(
-                user_id=data.user_id,
-                model_version=model_version,
-                output_type=OutputType.RECIPE,
-                output_format=OutputFormat.JSON,
-                prompt_used=str(prompt_data),
-                raw_output=recipe_response.model_dump_json(),
-                target_type=AIOutputTargetType.RECIPE,
-                target_id=None,
-                extra_data={"status": "generated"}
-            )
+        ai_output = _store_recipe_output(
+            db,
+            user_id=data.user_id,
+            model_version=getattr(ai_service, 'model', 'unknown'),
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            request=data.request,
+            recipe_response=recipe_response,
         )
 
         return RecipeWithAIOutput(
@@ -92,6 +130,17 @@ async def generate_recipe(
             ai_output=ai_output
         )
 
+    except AIServiceTimeoutError as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Recipe generation timed out: {str(e)}"
+        )
+    except AIServiceUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"AI service unavailable: {str(e)}",
+            headers={"Retry-After": str(int(settings.AI_CIRCUIT_RESET_SECONDS))}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -99,6 +148,76 @@ async def generate_recipe(
         )
 
 
+@router.post("/kitchen-insights", response_model=KitchenInsightsResponse)
+async def get_kitchen_insights(
+        *,
+        db: Annotated[Session, Depends(get_db)],
+        data: KitchenInsightsRequest,
+        current_user_id: int = Depends(get_current_user_id),
+) -> KitchenInsightsResponse:
+    """Return inventory analysis, cooking suggestions and an optional recipe.
+
+    The kitchen context is loaded once and all parts run concurrently under a
+    single deadline. Each part reports its own status and duration, so a slow
+    or failing part does not hide the others.
+
+    Security:
+        - Auth required
+        - User must be the same as data.user_id
+        - User must be a member of the specified kitchen_id
+    """
+    if current_user_id != data.user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not allowed to access this resource")
+
+    # The deadline covers the membership check too
+    started = time.monotonic()
+    rel = await run_in_threadpool(
+        crud_kitchen.get_user_kitchen_relationship, db, kitchen_id=data.kitchen_id, user_id=current_user_id
+    )
+    if rel is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a member of this kitchen")
+
+    try:
+        ai_service = AIServiceFactory.create_ai_service(db)
+        prompt_builder = PromptBuilder(db)
+        insights = await KitchenInsightsService(ai_service, prompt_builder).gather(
+            user_id=data.user_id,
+            kitchen_id=data.kitchen_id,
+            include_recipe=data.include_recipe,
+            recipe_request=data.recipe_request,
+            deadline=data.deadline_seconds,
+            started=started,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Kitchen insights failed: {str(e)}"
+        )
+
+    response = insights.response
+    if insights.recipe is not None:
+        recipe_request = insights.context.request
+        system_prompt, user_prompt = prompt_builder.build_recipe_prompt(
+            request=recipe_request,
+            user_id=data.user_id,
+            kitchen_id=data.kitchen_id,
+            context=insights.context
+        )
+        response.ai_output = _store_recipe_output(
+            db,
+            user_id=data.user_id,
+            model_version=getattr(ai_service, 'model', 'unknown'),
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            request=recipe_request,
+            recipe_response=insights.recipe,
+        )
+
+    return response
+
+
 @router.post("/recipes/{ai_output_id}/convert-to-recipe-create", response_model=RecipeCreate,
              dependencies=[Depends(require_same_user)])
 async def convert_ai_recipe_to_create(
@@ -181,4 +300,14 @@ async def mark_ai_recipe_as_saved(
         raise HTTPException(
             status_code=500,
             detail=f"Failed to mark recipe as saved: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/status", dependencies=[Depends(require_super_admin)])
+def get_ai_service_status() -> dict[str, Any]:
+    """Return circuit breaker state and call metrics per AI provider.
+
+    Security:
+        - Admin-only
+    """
+    return {"providers": get_resilience_status()}
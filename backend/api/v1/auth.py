@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+import datetime
 import os
+import uuid
 from typing import Annotated, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from passlib.exc import MissingBackendError
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from backend.core.dependencies import get_db
+from backend.core.config import settings
+from backend.core.dependencies import get_current_user_id, get_db, require_super_admin
+from backend.crud import refresh_token as crud_refresh_token
 from backend.crud import user as crud_user
 from backend.crud import user_credentials as crud_user_credentials
+from backend.models.user import User
+from backend.models.user_credentials import UserCredentials
 from backend.schemas.auth import LoginRequest, RegisterRequest, TokenPair
-from backend.schemas.user import UserCreate
+from backend.schemas.user import UserCreate, UserRead
 from backend.schemas.user_credentials import UserCredentialsCreate
 from backend.security import create_access_token, create_refresh_token, decode_token
-from backend.security.passwords import verify_password
+from backend.security.passwords import hash_password_async, verify_and_update_async
+from backend.security.revocation import revocation_index
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -60,35 +68,49 @@ def _admin_claims_for_email(email: str) -> dict:
     return {}
 
 
-@router.post(
-    "/register",
-    response_model=TokenPair,
-    status_code=status.HTTP_201_CREATED,
-    summary="Register a new account",
-)
-def register(
-        payload: RegisterRequest,
-        db: Annotated[Session, Depends(get_db)],
-) -> TokenPair:
-    """Register a new user and return token pair (auto-login)."""
-    # 1) Check uniqueness by email
-    existing = crud_user.get_user_orm_by_email(db, email=payload.email)
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
+def _issue_token_pair(db: Session, user_id: int, email: str) -> TokenPair:
+    """Issue an access/refresh pair and record the refresh token (commits)."""
+    pair, jti, expires_at = _new_token_pair(user_id, email)
+    crud_refresh_token.add_refresh_token(db, user_id=user_id, jti=jti, expires_at=expires_at)
+    db.commit()
+    return pair
+
 
-    # 2) Create user (returns a schema)
-    user = crud_user.create_user(
-        db=db,
-        user_data=UserCreate(name=payload.name, email=payload.email, diet_type=None, allergies=None, preferences=None),
+def _new_token_pair(user_id: int, email: str) -> tuple[TokenPair, str, datetime.datetime]:
+    """Create a token pair; returns it with the refresh token's jti and expiry."""
+    # Access token with admin claims based on whitelist
+    claims = {"email": email, **_admin_claims_for_email(email)}
+    jti = uuid.uuid4().hex
+    expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        days=settings.REFRESH_TOKEN_EXPIRE_DAYS
     )
 
+    access = create_access_token(user_id=user_id, extra_claims=claims)
+    refresh = create_refresh_token(user_id=user_id, extra_claims={"jti": jti})
+    return TokenPair(access_token=access, refresh_token=refresh, token_type="bearer"), jti, expires_at
+
+
+def _email_taken() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
+
+
+def _create_account(db: Session, payload: RegisterRequest, password_hash: str) -> UserRead:
+    """Create the user and its credentials; runs in the request threadpool."""
+    # 1) Create user (returns a schema); the unique email constraint catches
+    #    registrations racing past the check in ``register``
     try:
-        # 3) Create credentials (hashing handled in the CRUD)
+        user = crud_user.create_user(
+            db=db,
+            user_data=UserCreate(name=payload.name, email=payload.email, diet_type=None, allergies=None, preferences=None),
+        )
+    except IntegrityError:
+        db.rollback()
+        raise _email_taken()
+
+    try:
+        # 2) Create credentials (already hashed, so the CRUD stores it as-is)
         cred_in = UserCredentialsCreate(
-            password_hash=payload.password,
+            password_hash=password_hash,
             first_name=None,
             last_name=None,
             address=None,
@@ -101,19 +123,8 @@ def register(
             db=db, user_id=user.id, credentials_data=cred_in
         )
 
-    except MissingBackendError:
-        # bcrypt backend not installed; cleanup user ORM and return a clear error
-        user_orm = crud_user.get_user_orm_by_email(db, email=payload.email)
-        if user_orm:
-            db.delete(user_orm)
-            db.commit()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Password hashing backend not available. Please install 'bcrypt' and restart the service.",
-        )
-
     except Exception as exc:
-        # Any other failure during credential creation -> cleanup newly created user (ORM)
+        # Any failure during credential creation -> cleanup newly created user (ORM)
         user_orm = crud_user.get_user_orm_by_email(db, email=payload.email)
         if user_orm:
             try:
@@ -126,76 +137,145 @@ def register(
             detail="Registration failed. Please try again later.",
         ) from exc
 
-    # 4) Issue token pair (auto-login) with optional admin claims based on whitelist
-    email_str = cast(str, user.email)
-    base_claims = {"email": email_str}
-    claims = {**base_claims, **_admin_claims_for_email(email_str)}
+    return user
 
-    access = create_access_token(user_id=user.id, extra_claims=claims)
-    refresh = create_refresh_token(user_id=user.id)
-    return TokenPair(access_token=access, refresh_token=refresh, token_type="bearer")
 
-
-@router.post("/login", response_model=TokenPair, summary="Authenticate and issue tokens")
-def login(
-        payload: LoginRequest,
+@router.post(
+    "/register",
+    response_model=TokenPair,
+    status_code=status.HTTP_201_CREATED,
+    summary="Register a new account",
+)
+async def register(
+        payload: RegisterRequest,
         db: Annotated[Session, Depends(get_db)],
 ) -> TokenPair:
-    """Authenticate using email and password and return JWT tokens."""
-    user_orm = crud_user.get_user_orm_by_email(db, email=payload.email)
-    if not user_orm:
+    """Register a new user and return token pair (auto-login).
+
+    The email is checked first, so duplicate signups never cost a hash. The
+    password is then hashed on the password hashing pool before anything is
+    written; database work runs in the threadpool.
+    """
+    if await run_in_threadpool(crud_user.get_user_orm_by_email, db, email=payload.email):
+        raise _email_taken()
+
+    try:
+        password_hash = await hash_password_async(payload.password)
+    except MissingBackendError:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Password hashing backend not available. Please install 'bcrypt' and restart the service.",
         )
 
+    user = await run_in_threadpool(_create_account, db, payload, password_hash)
+
+    # 3) Issue token pair (auto-login) with optional admin claims based on whitelist
+    return await run_in_threadpool(_issue_token_pair, db, user.id, cast(str, user.email))
+
+
+def _get_login_credentials(db: Session, email: str) -> tuple[User, UserCredentials] | None:
+    """Return the user and credentials for ``email`` if a password is set."""
+    user_orm = crud_user.get_user_orm_by_email(db, email=email)
+    if not user_orm:
+        return None
+
     creds_orm = crud_user_credentials.get_user_credentials_orm_by_user_id(
         db, user_id=user_orm.id
     )
     if not creds_orm or not creds_orm.password_hash:
+        return None
+    return user_orm, creds_orm
+
+
+def _store_rehashed_password(db: Session, creds_orm: UserCredentials, new_hash: str) -> None:
+    """Replace a hash created with outdated bcrypt rounds."""
+    try:
+        creds_orm.password_hash = new_hash
+        db.commit()
+    except SQLAlchemyError:
+        # The old hash still verifies; retry on the next login
+        db.rollback()
+
+
+@router.post("/login", response_model=TokenPair, summary="Authenticate and issue tokens")
+async def login(
+        payload: LoginRequest,
+        db: Annotated[Session, Depends(get_db)],
+) -> TokenPair:
+    """Authenticate using email and password and return JWT tokens.
+
+    Verification runs on the password hashing pool. Hashes stored with
+    different bcrypt rounds than configured are transparently replaced.
+    """
+    found = await run_in_threadpool(_get_login_credentials, db, payload.email)
+    if found is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         )
+    user_orm, creds_orm = found
 
     stored_hash: str = cast(str, creds_orm.password_hash)
-    if not verify_password(payload.password, stored_hash):
+    valid, new_hash = await verify_and_update_async(payload.password, stored_hash)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         )
+    if new_hash:
+        await run_in_threadpool(_store_rehashed_password, db, creds_orm, new_hash)
 
-    # Access token with admin claims based on whitelist
-    email_str = cast(str, user_orm.email)
-    base_claims = {"email": email_str}
-    claims = {**base_claims, **_admin_claims_for_email(email_str)}
+    return await run_in_threadpool(_issue_token_pair, db, user_orm.id, cast(str, user_orm.email))
+
+
+def _decode_refresh_token(refresh_token: str) -> tuple[int, str]:
+    """Return ``(user_id, jti)`` of a valid refresh token or raise 401."""
+    try:
+        payload = decode_token(refresh_token)
+        if payload.get("type") != "refresh":
+            raise ValueError("Not a refresh token")
+        # Tokens issued before rotation was introduced have no jti
+        return int(payload["sub"]), str(payload["jti"])
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
+        )
 
-    access = create_access_token(user_id=user_orm.id, extra_claims=claims)
-    refresh = create_refresh_token(user_id=user_orm.id)
 
-    return TokenPair(access_token=access, refresh_token=refresh, token_type="bearer")
+def _revoke_user(db: Session, user_id: int) -> None:
+    """Revoke all refresh and access tokens of a user."""
+    revoked_before = crud_refresh_token.revoke_user_tokens(db, user_id)
+    revocation_index.revoke_user(user_id, revoked_before)
 
 
-@router.post("/refresh", response_model=TokenPair, summary="Refresh access token")
+@router.post("/refresh", response_model=TokenPair, summary="Rotate the refresh token and issue new tokens")
 def refresh(
         refresh_token: str,
         db: Annotated[Session, Depends(get_db)],
 ) -> TokenPair:
-    """Issue a new access token from a valid refresh token.
+    """Exchange a refresh token for a new token pair.
 
-    Recomputes admin claims via whitelist to retain permissions on refresh.
+    Each refresh token can be used once: it is revoked and replaced by the
+    returned one. Presenting an already rotated token again is treated as
+    theft and revokes all tokens of the user, unless it happens within
+    ``REFRESH_TOKEN_REUSE_GRACE_SECONDS`` of the rotation (concurrent
+    requests of one client). Admin claims are recomputed via the whitelist.
     """
-    try:
-        payload = decode_token(refresh_token)
-    except Exception:
+    user_id, jti = _decode_refresh_token(refresh_token)
+
+    stored = crud_refresh_token.get_refresh_token_orm(db, jti)
+    if stored is None or stored.user_id != user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
         )
 
-    if payload.get("type") != "refresh":
+    if stored.revoked_at is not None:
+        revoked_for = datetime.datetime.now(datetime.timezone.utc) - crud_refresh_token.as_utc(stored.revoked_at)
+        grace = datetime.timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS)
+        if stored.replaced_by_jti is not None and revoked_for > grace:
+            _revoke_user(db, user_id)
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token type"
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token has been revoked"
         )
 
-    user_id = int(payload.get("sub"))
-
     # Recompute admin claims based on user's current email
     user_schema = crud_user.get_user_by_id(db, user_id)
     if not user_schema:
@@ -203,17 +283,59 @@ def refresh(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
         )
 
-    email_str = cast(str, user_schema.email)
-    base_claims = {"email": email_str}
-    claims = {**base_claims, **_admin_claims_for_email(email_str)}
+    pair, new_jti, expires_at = _new_token_pair(user_id, cast(str, user_schema.email))
+    try:
+        crud_refresh_token.rotate_refresh_token(db, stored, new_jti=new_jti, expires_at=expires_at)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token has been revoked"
+        )
+    return pair
 
-    access = create_access_token(user_id=user_id, extra_claims=claims)
-    new_refresh = create_refresh_token(user_id=user_id)
 
-    return TokenPair(access_token=access, refresh_token=new_refresh, token_type="bearer")
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, summary="Logout and revoke the refresh token")
+def logout(
+        db: Annotated[Session, Depends(get_db)],
+        refresh_token: str | None = None,
+) -> Response:
+    """Revoke the given refresh token. Client must delete stored tokens.
+
+    The access token stays valid until it expires; use ``/logout-all`` to
+    end every session immediately.
+    """
+    if refresh_token:
+        try:
+            _, jti = _decode_refresh_token(refresh_token)
+        except HTTPException:
+            # Nothing to revoke; logging out must not fail
+            jti = None
+        if jti:
+            crud_refresh_token.revoke_refresh_token(db, jti)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT, summary="Revoke all tokens of the current user")
+def logout_all(
+        current_user_id: Annotated[int, Depends(get_current_user_id)],
+        db: Annotated[Session, Depends(get_db)],
+) -> Response:
+    """Revoke every refresh and access token of the current user."""
+    _revoke_user(db, current_user_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, summary="Logout (stateless)")
-def logout() -> Response:
-    """Stateless logout. Client must delete stored tokens."""
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+@router.post(
+    "/users/{user_id}/revoke",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Revoke all tokens of a user",
+    dependencies=[Depends(require_super_admin)],
+)
+def revoke_user_tokens(
+        user_id: int,
+        db: Annotated[Session, Depends(get_db)],
+) -> Response:
+    """Revoke every refresh and access token of the given user (admin only)."""
+    if not crud_user.get_user_by_id(db, user_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    _revoke_user(db, user_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.core.dependencies import get_db, get_current_user_id, require_super_admin
 from backend.core.enums import UnitType
+from backend.core.http_cache import check_not_modified, table_etag
 from backend.crud import core as crud_core
+from backend.models.core import Unit, UnitConversion
 from backend.schemas.core import (
     ConversionResult,
     UnitConversionCreate,
@@ -64,9 +66,16 @@ def create_unit(
 )
 def get_all_units(
     db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response,
         unit_type: Annotated[UnitType | None, Query(description="Filter by unit type")] = None,
-) -> list[UnitRead]:
-    """Retrieve all units, optionally filtered by type."""
+) -> list[UnitRead] | Response:
+    """Retrieve all units, optionally filtered by type.
+
+    Supports conditional requests: 304 if ``If-None-Match`` matches the ETag.
+    """
+    if (cached := check_not_modified(request, response, table_etag(db, request, Unit))) is not None:
+        return cached
     return crud_core.get_all_units(db=db, unit_type=unit_type)
 
 
@@ -79,8 +88,12 @@ def get_all_units(
 def get_unit_by_id(
     unit_id: int,
         db: Annotated[Session, Depends(get_db)],
-) -> UnitRead:
-    """Retrieve a specific unit by its ID."""
+        request: Request,
+        response: Response,
+) -> UnitRead | Response:
+    """Retrieve a specific unit by its ID (supports ``If-None-Match``)."""
+    if (cached := check_not_modified(request, response, table_etag(db, request, Unit))) is not None:
+        return cached
     unit = crud_core.get_unit_by_id(db=db, unit_id=unit_id)
     if not unit:
         raise HTTPException(
@@ -163,8 +176,13 @@ def delete_unit(
 def get_unit_conversions(
     unit_id: int,
         db: Annotated[Session, Depends(get_db)],
-) -> UnitWithConversions:
-    """Retrieve a unit along with all its available conversions to other units."""
+        request: Request,
+        response: Response,
+) -> UnitWithConversions | Response:
+    """Retrieve a unit along with all its available conversions to other units (supports ``If-None-Match``)."""
+    etag = table_etag(db, request, Unit, UnitConversion)
+    if (cached := check_not_modified(request, response, etag)) is not None:
+        return cached
     unit_with_conversions = crud_core.get_unit_with_conversions(db=db, unit_id=unit_id)
     if not unit_with_conversions:
         raise HTTPException(
@@ -227,10 +245,15 @@ def create_unit_conversion(
 )
 def get_unit_conversions_filtered(
     db: Annotated[Session, Depends(get_db)],
+    request: Request,
+    response: Response,
     from_unit_id: Annotated[int | None, Query(description="Filter by source unit ID")] = None,
         to_unit_id: Annotated[int | None, Query(description="Filter by target unit ID")] = None,
-) -> list[UnitConversionRead]:
-    """Retrieve unit conversions with optional filtering by source or target unit."""
+) -> list[UnitConversionRead] | Response:
+    """Retrieve unit conversions with optional filtering by source or target unit (supports ``If-None-Match``)."""
+    etag = table_etag(db, request, UnitConversion)
+    if (cached := check_not_modified(request, response, etag)) is not None:
+        return cached
     if from_unit_id and to_unit_id:
         # Get specific conversion
         conversion = crud_core.get_unit_conversion(
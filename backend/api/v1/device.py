@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from backend.core.dependencies import (
@@ -13,7 +13,9 @@ from backend.core.dependencies import (
     require_kitchen_role,
 )
 from backend.core.enums import KitchenRole
+from backend.core.http_cache import check_not_modified, table_etag
 from backend.crud import device as crud_device
+from backend.models.device import DeviceType
 from backend.schemas.device import (
     DeviceTypeCreate, DeviceTypeRead, DeviceTypeUpdate,
     ApplianceCreate, ApplianceRead, ApplianceUpdate, ApplianceWithDeviceType,
@@ -86,18 +88,26 @@ def create_device_type(
     dependencies=[Depends(get_current_user_id)],
 )
 def get_all_device_types(
+        request: Request,
+        response: Response,
         category: str | None = Query(None, description="Filter by category"),
         db: Session = Depends(get_db)
-) -> list[DeviceTypeRead]:
+) -> list[DeviceTypeRead] | Response:
     """Get all device types with optional category filtering.
 
+    Supports conditional requests: 304 if ``If-None-Match`` matches the ETag.
+
     Args:
+        request: Incoming request, may carry ``If-None-Match``.
+        response: Outgoing response, carries the ETag.
         category: Optional category filter (e.g., 'appliance', 'tool').
         db: Database session dependency.
 
     Returns:
         List of device types, optionally filtered by category.
     """
+    if (cached := check_not_modified(request, response, table_etag(db, request, DeviceType))) is not None:
+        return cached
     if category:
         return crud_device.get_device_types_by_category(db, category)
     return crud_device.get_all_device_types(db)
@@ -112,20 +122,26 @@ def get_all_device_types(
 )
 def get_device_type(
         device_type_id: int,
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db)
-) -> DeviceTypeRead:
-    """Get a device type by ID.
+) -> DeviceTypeRead | Response:
+    """Get a device type by ID (supports ``If-None-Match``).
 
     Args:
         device_type_id: Primary key of the device type.
+        request: Incoming request, may carry ``If-None-Match``.
+        response: Outgoing response, carries the ETag.
         db: Database session dependency.
 
     Returns:
-        The requested device type.
+        The requested device type, or 304 if unchanged.
 
     Raises:
         HTTPException: 404 if the device type does not exist.
     """
+    if (cached := check_not_modified(request, response, table_etag(db, request, DeviceType))) is not None:
+        return cached
     device_type = crud_device.get_device_type_by_id(db, device_type_id)
     if device_type is None:
         raise HTTPException(
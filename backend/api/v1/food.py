@@ -4,13 +4,17 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.core.dependencies import get_db, get_current_user_id, require_super_admin
+from backend.core.http_cache import check_not_modified, table_etag
+from backend.core.pagination import InvalidCursorError, set_next_cursor
 from backend.crud import core as crud_core
 from backend.crud import food as crud_food
+from backend.models.core import Unit
+from backend.models.food import FoodItem, FoodItemUnitConversion
 from backend.schemas.food import (
     FoodItemCreate, FoodItemRead, FoodItemUpdate, FoodItemWithConversions,
     FoodItemUnitConversionCreate, FoodItemUnitConversionRead,
@@ -81,24 +85,46 @@ def create_food_item(
 def get_food_items(
         *,
         db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response,
         category: str | None = None,
         skip: int = 0,
-        limit: int = 100
-) -> list[FoodItemRead]:
+        limit: int = 100,
+        cursor: str | None = None
+) -> list[FoodItemRead] | Response:
     """Get all food items with optional filtering.
 
+    The cursor for the next page is returned in the ``X-Next-Cursor`` header.
+    Supports conditional requests: 304 if ``If-None-Match`` matches the ETag.
+
     Args:
         db: Database session
+        request: Incoming request, may carry ``If-None-Match``
+        response: Outgoing response, carries the next-page cursor
         category: Optional category filter
-        skip: Number of items to skip
+        skip: Number of items to skip (ignored when a cursor is given)
         limit: Maximum number of items to return
+        cursor: Cursor of the previous page for keyset pagination
 
     Returns:
         List of food items
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid
     """
-    return crud_food.get_all_food_items(
-        db=db, category=category, skip=skip, limit=limit
-    )
+    try:
+        food_items = crud_food.get_all_food_items(
+            db=db, category=category, skip=skip, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    set_next_cursor(response, crud_food.FOOD_ITEM_KEYSET.next_cursor(food_items, limit))
+    # The page is loaded for its cursor, but not serialized when unchanged
+    etag = table_etag(db, request, FoodItem, Unit)
+    if (cached := check_not_modified(request, response, etag)) is not None:
+        return cached
+    return food_items
 
 
 @food_items_router.get(
@@ -109,20 +135,26 @@ def get_food_items(
 def get_food_item_by_id(
         *,
         db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response,
         food_item_id: int
-) -> FoodItemRead:
-    """Get food item by ID.
+) -> FoodItemRead | Response:
+    """Get food item by ID (supports ``If-None-Match``).
 
     Args:
         db: Database session
+        request: Incoming request, may carry ``If-None-Match``
+        response: Outgoing response, carries the ETag
         food_item_id: Food item ID
 
     Returns:
-        Food item data
+        Food item data, or 304 if unchanged
 
     Raises:
         HTTPException: 404 if food item not found
     """
+    if (cached := check_not_modified(request, response, table_etag(db, request, FoodItem, Unit))) is not None:
+        return cached
     food_item = crud_food.get_food_item_by_id(db=db, food_item_id=food_item_id)
     if not food_item:
         raise HTTPException(
@@ -239,20 +271,27 @@ def delete_food_item(
 def get_food_item_with_conversions(
         *,
         db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response,
         food_item_id: int
-) -> FoodItemWithConversions:
-    """Get food item with its unit conversions.
+) -> FoodItemWithConversions | Response:
+    """Get food item with its unit conversions (supports ``If-None-Match``).
 
     Args:
         db: Database session
+        request: Incoming request, may carry ``If-None-Match``
+        response: Outgoing response, carries the ETag
         food_item_id: Food item ID
 
     Returns:
-        Food item data with unit conversions
+        Food item data with unit conversions, or 304 if unchanged
 
     Raises:
         HTTPException: 404 if food item not found
     """
+    etag = table_etag(db, request, FoodItem, Unit, FoodItemUnitConversion)
+    if (cached := check_not_modified(request, response, etag)) is not None:
+        return cached
     food_item = crud_food.get_food_item_by_id(db=db, food_item_id=food_item_id)
     if not food_item:
         raise HTTPException(
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.core.dependencies import (
@@ -13,11 +14,13 @@ from backend.core.dependencies import (
     require_kitchen_role,
 )
 from backend.core.enums import KitchenRole
+from backend.core.serialization import json_response, ndjson_response
 from backend.crud import inventory as crud_inventory
 from backend.schemas.inventory import (
     InventoryItemCreate,
     InventoryItemRead,
     InventoryItemUpdate,
+    KitchenInventoryStats,
     StorageLocationCreate,
     StorageLocationRead,
     StorageLocationUpdate,
@@ -187,9 +190,32 @@ def get_kitchen_inventory(
         *,
         db: Annotated[Session, Depends(get_db)],
         kitchen_id: int
-) -> list[InventoryItemRead]:
+) -> Response:
     """Get all inventory items for a kitchen."""
-    return crud_inventory.get_kitchen_inventory(db, kitchen_id)
+    return json_response(crud_inventory.get_kitchen_inventory(db, kitchen_id))
+
+
+@inventory_items_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export a kitchen's inventory as NDJSON",
+    dependencies=[Depends(require_kitchen_member())],
+)
+def export_kitchen_inventory(
+        *,
+        db: Annotated[Session, Depends(get_db)],
+        kitchen_id: int
+) -> StreamingResponse:
+    """Stream all inventory items of a kitchen, one JSON object per line.
+
+    Rows are read in batches while the response is sent, so memory stays
+    constant however large the kitchen is.
+    """
+    return ndjson_response(
+        crud_inventory.iter_kitchen_inventory(db, kitchen_id),
+        filename=f"kitchen-{kitchen_id}-inventory.ndjson",
+        on_close=db.close,
+    )
 
 
 @inventory_items_router.get(
@@ -275,9 +301,9 @@ def get_low_stock_items(
         *,
         db: Annotated[Session, Depends(get_db)],
         kitchen_id: int
-) -> list[InventoryItemRead]:
+) -> Response:
     """Get all inventory items that are below their minimum quantity threshold."""
-    return crud_inventory.get_low_stock_items(db, kitchen_id)
+    return json_response(crud_inventory.get_low_stock_items(db, kitchen_id))
 
 
 @inventory_items_router.get(
@@ -291,9 +317,9 @@ def get_expiring_items(
         db: Annotated[Session, Depends(get_db)],
         kitchen_id: int,
         threshold_days: int = 7
-) -> list[InventoryItemRead]:
+) -> Response:
     """Get all inventory items that expire within the specified threshold."""
-    return crud_inventory.get_expiring_items(db, kitchen_id, threshold_days)
+    return json_response(crud_inventory.get_expiring_items(db, kitchen_id, threshold_days))
 
 
 @inventory_items_router.get(
@@ -306,9 +332,25 @@ def get_expired_items(
         *,
         db: Annotated[Session, Depends(get_db)],
         kitchen_id: int
-) -> list[InventoryItemRead]:
+) -> Response:
     """Get all inventory items that have already expired."""
-    return crud_inventory.get_expired_items(db, kitchen_id)
+    return json_response(crud_inventory.get_expired_items(db, kitchen_id))
+
+
+@inventory_items_router.get(
+    "/analysis/stats",
+    response_model=KitchenInventoryStats,
+    summary="Count inventory items by stock and expiry state",
+    dependencies=[Depends(require_kitchen_member())],
+)
+def get_inventory_stats(
+        *,
+        db: Annotated[Session, Depends(get_db)],
+        kitchen_id: int,
+        threshold_days: int = 7
+) -> KitchenInventoryStats:
+    """Get total, low-stock, expired and expiring item counts without the items."""
+    return crud_inventory.get_kitchen_inventory_stats(db, kitchen_id, threshold_days)
 
 
 # ================================================================== #
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.core.dependencies import (
@@ -14,7 +15,10 @@ from backend.core.dependencies import (
     require_recipe_owner_or_admin,
     require_same_user,
 )
-from backend.core.enums import DifficultyLevel
+from backend.core.enums import DifficultyLevel, RecipePagePart, RecipeSortField, SortOrder
+from backend.core.http_cache import conditional_json
+from backend.core.pagination import InvalidCursorError, set_next_cursor
+from backend.core.serialization import ndjson_response
 from backend.crud import recipe as crud_recipe
 from backend.crud.recipe import InsufficientIngredientsError, cook_recipe
 from backend.schemas.recipe import (
@@ -23,7 +27,8 @@ from backend.schemas.recipe import (
     RecipeStepCreate, RecipeStepRead, RecipeStepUpdate,
     RecipeNutritionCreate, RecipeNutritionRead, RecipeNutritionUpdate,
     RecipeReviewUpsert, RecipeReviewRead, RecipeReviewUpdate,
-    RecipeSearchParams, RecipeSummary, RecipeRatingSummary, RecipeCookResponse
+    RecipeSearchParams, RecipeSummary, RecipeRatingSummary, RecipeCookResponse, RecipeCount,
+    RecipePage
 )
 
 # ================================================================== #
@@ -81,6 +86,8 @@ def create_recipe(
 )
 def get_all_recipes(
         db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response,
         title_contains: Annotated[str | None, Query(description="Filter by title containing text")] = None,
         is_ai_generated: Annotated[bool | None, Query(description="Filter by AI generated flag")] = None,
         created_by_user_id: Annotated[int | None, Query(description="Filter by creator user ID")] = None,
@@ -89,13 +96,24 @@ def get_all_recipes(
         max_kcal: Annotated[int | None, Query(description="Filter by max calories")] = None,
         min_protein_g: Annotated[float | None, Query(description="Filter by min protein (g)")] = None,
         tags_contains: Annotated[list[str] | None, Query(description="Filter by tags containing")] = None,
+        min_average_rating: Annotated[
+            float | None, Query(description="Filter by min average rating", ge=1, le=5)] = None,
+        min_review_count: Annotated[int | None, Query(description="Filter by min number of reviews", ge=0)] = None,
+        sort_by: Annotated[RecipeSortField | None, Query(description="Field to order by")] = None,
+        sort_order: Annotated[SortOrder, Query(description="Sort direction")] = SortOrder.DESC,
         skip: int = 0,
-        limit: int = 100
-) -> list[RecipeRead]:
+        limit: int = 100,
+        cursor: Annotated[str | None, Query(description="Cursor from the X-Next-Cursor header of the previous page")] = None
+) -> Response:
     """Get all recipes with pagination and optional filtering.
 
+    The cursor for the next page is returned in the ``X-Next-Cursor`` header.
+    Supports conditional requests: 304 if ``If-None-Match`` matches the ETag.
+
     Args:
         db: Database session dependency.
+        request: Incoming request, may carry ``If-None-Match``.
+        response: Outgoing response, carries the next-page cursor.
         title_contains: Filter by title containing text.
         is_ai_generated: Filter by AI generated flag.
         created_by_user_id: Filter by creator user ID.
@@ -104,16 +122,25 @@ def get_all_recipes(
         max_kcal: Filter by maximum calories.
         min_protein_g: Filter by minimum protein (g).
         tags_contains: Filter by tags containing specified values.
-        skip: Number of records to skip (for pagination).
+        min_average_rating: Filter by minimum average rating.
+        min_review_count: Filter by minimum number of reviews.
+        sort_by: Order by title, created_at, average_rating or review_count.
+        sort_order: Sort direction (asc, desc); unrated recipes always come last.
+        skip: Number of records to skip (ignored when a cursor is given).
         limit: Maximum number of records to return.
+        cursor: Cursor of the previous page for keyset pagination.
 
     Returns:
         List of recipes matching the criteria.
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid for this ordering.
     """
     # Build search parameters
     search_params = None
     if any([title_contains, is_ai_generated is not None, created_by_user_id, difficulty,
-            has_nutrition is not None, max_kcal, min_protein_g, tags_contains]):
+            has_nutrition is not None, max_kcal, min_protein_g, tags_contains,
+            min_average_rating is not None, min_review_count is not None, sort_by]):
         search_params = RecipeSearchParams(
             title_contains=title_contains,
             is_ai_generated=is_ai_generated,
@@ -122,15 +149,26 @@ def get_all_recipes(
             has_nutrition=has_nutrition,
             max_kcal=max_kcal,
             min_protein_g=min_protein_g,
-            tags_contains=tags_contains
+            tags_contains=tags_contains,
+            min_average_rating=min_average_rating,
+            min_review_count=min_review_count,
+            sort_by=sort_by,
+            sort_order=sort_order
         )
 
-    return crud_recipe.get_all_recipes(
-        db=db,
-        search_params=search_params,
-        skip=skip,
-        limit=limit
-    )
+    try:
+        recipes = crud_recipe.get_all_recipes(
+            db=db,
+            search_params=search_params,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    set_next_cursor(response, crud_recipe.recipe_keyset(search_params).next_cursor(recipes, limit))
+    return conditional_json(request, response, recipes)
 
 
 @recipe_router.get(
@@ -153,6 +191,61 @@ def get_recipe_summary(
     return crud_recipe.get_recipe_summary(db=db)
 
 
+@recipe_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all recipes with details as NDJSON",
+    dependencies=[Depends(get_current_user_id)],
+)
+def export_recipes(
+        db: Annotated[Session, Depends(get_db)]
+) -> StreamingResponse:
+    """Stream all recipes with ingredients, steps and nutrition, one per line.
+
+    Recipes are loaded in batches while the response is sent, so memory
+    stays constant however many recipes exist.
+
+    Args:
+        db: Database session dependency.
+
+    Returns:
+        NDJSON stream of recipes with details.
+    """
+    return ndjson_response(
+        crud_recipe.iter_recipes_with_details(db),
+        filename="recipes.ndjson",
+        on_close=db.close,
+    )
+
+
+@recipe_router.get(
+    "/count",
+    response_model=RecipeCount,
+    summary="Count recipes with optional filtering",
+    dependencies=[Depends(get_current_user_id)],
+)
+def count_recipes(
+        db: Annotated[Session, Depends(get_db)],
+        created_by_user_id: Annotated[int | None, Query(description="Filter by creator user ID")] = None,
+        is_ai_generated: Annotated[bool | None, Query(description="Filter by AI generated flag")] = None,
+) -> RecipeCount:
+    """Count recipes without downloading them.
+
+    Args:
+        db: Database session dependency.
+        created_by_user_id: Filter by creator user ID.
+        is_ai_generated: Filter by AI generated flag.
+
+    Returns:
+        Number of matching recipes.
+    """
+    return crud_recipe.count_recipes(
+        db=db,
+        created_by_user_id=created_by_user_id,
+        is_ai_generated=is_ai_generated
+    )
+
+
 @recipe_router.get(
     "/suggestions/by-ingredients",
     response_model=list[RecipeRead],
@@ -220,16 +313,20 @@ def get_ai_generated_recipes(
 )
 def get_recipe(
         recipe_id: int,
-        db: Annotated[Session, Depends(get_db)]
-) -> RecipeRead:
-    """Get a recipe by ID.
+        db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response
+) -> Response:
+    """Get a recipe by ID (supports ``If-None-Match``).
 
     Args:
         recipe_id: Recipe ID.
         db: Database session dependency.
+        request: Incoming request, may carry ``If-None-Match``.
+        response: Outgoing response.
 
     Returns:
-        The recipe with basic information.
+        The recipe with basic information, or 304 if unchanged.
 
     Raises:
         HTTPException: 404 if recipe not found.
@@ -247,7 +344,7 @@ def get_recipe(
             detail=f"Recipe with ID {recipe_id} not found"
         )
 
-    return recipe
+    return conditional_json(request, response, recipe)
 
 
 @recipe_router.get(
@@ -258,16 +355,22 @@ def get_recipe(
 )
 def get_recipe_details(
         recipe_id: int,
-        db: Annotated[Session, Depends(get_db)]
-) -> RecipeWithDetails:
+        db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response
+) -> Response:
     """Get a recipe with full details including ingredients, steps, and nutrition.
 
+    Supports conditional requests: 304 if ``If-None-Match`` matches the ETag.
+
     Args:
         recipe_id: Recipe ID.
         db: Database session dependency.
+        request: Incoming request, may carry ``If-None-Match``.
+        response: Outgoing response.
 
     Returns:
-        The recipe with all details.
+        The recipe with all details, or 304 if unchanged.
 
     Raises:
         HTTPException: 404 if recipe not found.
@@ -285,7 +388,73 @@ def get_recipe_details(
             detail=f"Recipe with ID {recipe_id} not found"
         )
 
-    return recipe
+    return conditional_json(request, response, recipe)
+
+
+@recipe_router.get(
+    "/{recipe_id}/page",
+    response_model=RecipePage,
+    summary="Get recipe details, reviews and rating summary in one request",
+    dependencies=[Depends(get_current_user_id)],
+)
+def get_recipe_page(
+        recipe_id: int,
+        db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response,
+        include: Annotated[
+            list[RecipePagePart] | None,
+            Query(description="Parts to return (repeatable); all parts when omitted")
+        ] = None,
+        review_limit: Annotated[int, Query(ge=1, le=100)] = 100,
+        review_cursor: Annotated[str | None, Query(description="next_reviews_cursor of the previous page")] = None
+) -> Response:
+    """Get everything needed to render a recipe page in one request.
+
+    Replaces separate calls to ``/details``, ``/reviews`` and
+    ``/reviews/rating-summary``. Supports conditional requests: 304 if
+    ``If-None-Match`` matches the ETag.
+
+    Args:
+        recipe_id: Recipe ID.
+        db: Database session dependency.
+        request: Incoming request, may carry ``If-None-Match``.
+        response: Outgoing response.
+        include: Parts to return; parts not requested are ``null``.
+        review_limit: Maximum number of reviews to return.
+        review_cursor: Cursor of the previous review page.
+
+    Returns:
+        The requested parts of the recipe page.
+
+    Raises:
+        HTTPException: 400 if the recipe ID or cursor is invalid, 404 if the
+            recipe is not found.
+    """
+    if recipe_id <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Recipe ID must be a positive integer"
+        )
+
+    try:
+        page = crud_recipe.get_recipe_page(
+            db=db,
+            recipe_id=recipe_id,
+            include=set(include or RecipePagePart),
+            review_limit=review_limit,
+            review_cursor=review_cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    if not page:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Recipe with ID {recipe_id} not found"
+        )
+
+    return conditional_json(request, response, page)
 
 
 @recipe_router.patch(
@@ -985,19 +1154,28 @@ def create_recipe_review(
 def get_recipe_reviews(
         recipe_id: int,
         db: Annotated[Session, Depends(get_db)],
+        response: Response,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Annotated[str | None, Query(description="Cursor from the X-Next-Cursor header of the previous page")] = None
 ) -> list[RecipeReviewRead]:
-    """Get all reviews for a recipe.
+    """Get all reviews for a recipe, newest first.
+
+    The cursor for the next page is returned in the ``X-Next-Cursor`` header.
 
     Args:
         recipe_id: Recipe ID.
         db: Database session dependency.
-        skip: Number of records to skip.
+        response: Outgoing response, carries the next-page cursor.
+        skip: Number of records to skip (ignored when a cursor is given).
         limit: Maximum number of records to return.
+        cursor: Cursor of the previous page for keyset pagination.
 
     Returns:
         List of recipe reviews.
+
+    Raises:
+        HTTPException: 400 if the recipe ID or cursor is invalid.
     """
     if recipe_id <= 0:
         raise HTTPException(
@@ -1005,12 +1183,19 @@ def get_recipe_reviews(
             detail="Recipe ID must be a positive integer"
         )
 
-    return crud_recipe.get_recipe_reviews(
-        db=db,
-        recipe_id=recipe_id,
-        skip=skip,
-        limit=limit
-    )
+    try:
+        reviews = crud_recipe.get_recipe_reviews(
+            db=db,
+            recipe_id=recipe_id,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    set_next_cursor(response, crud_recipe.RECIPE_REVIEW_KEYSET.next_cursor(reviews, limit))
+    return reviews
 
 
 @reviews_router.get(
@@ -1031,6 +1216,9 @@ def get_recipe_rating_summary(
 
     Returns:
         Rating summary with average rating and distribution.
+
+    Raises:
+        HTTPException: 404 if recipe not found.
     """
     if recipe_id <= 0:
         raise HTTPException(
@@ -1038,7 +1226,14 @@ def get_recipe_rating_summary(
             detail="Recipe ID must be a positive integer"
         )
 
-    return crud_recipe.get_recipe_rating_summary(db=db, recipe_id=recipe_id)
+    summary = crud_recipe.get_recipe_rating_summary(db=db, recipe_id=recipe_id)
+    if not summary:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Recipe with ID {recipe_id} not found"
+        )
+
+    return summary
 
 
 @reviews_router.patch(
@@ -13,6 +13,7 @@ from backend.core.dependencies import (
     require_kitchen_role,
 )
 from backend.core.enums import KitchenRole
+from backend.core.pagination import InvalidCursorError, set_next_cursor
 from backend.crud import shopping as crud_shopping
 from backend.schemas.shopping import (
     ShoppingListCreate, ShoppingListRead, ShoppingListUpdate,
@@ -99,6 +100,7 @@ def create_shopping_product(
     dependencies=[Depends(get_current_user_id)],
 )
 def search_shopping_products(
+    response: Response,
     food_item_id: int | None = Query(None, description="Filter by food item ID"),
     package_unit_id: int | None = Query(None, description="Filter by package unit ID"),
     min_price: float | None = Query(None, description="Minimum price filter"),
@@ -106,25 +108,32 @@ def search_shopping_products(
     package_type: str | None = Query(None, description="Package type contains filter"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
+    cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db)
 ) -> list[ShoppingProductRead]:
     """Search shopping products with filters.
 
     Supports filtering by food item, package unit, price range, and package type.
-    Results are ordered by creation date (newest first).
+    Results are ordered by creation date (newest first); the cursor for the
+    next page is returned in the ``X-Next-Cursor`` header.
 
     Args:
+        response: Outgoing response, carries the next-page cursor.
         food_item_id: Optional food item ID filter.
         package_unit_id: Optional package unit ID filter.
         min_price: Optional minimum price filter.
         max_price: Optional maximum price filter.
         package_type: Optional package type contains filter.
-        skip: Number of records to skip for pagination.
+        skip: Number of records to skip (ignored when a cursor is given).
         limit: Maximum number of records to return.
+        cursor: Cursor of the previous page for keyset pagination.
         db: Database session dependency.
 
     Returns:
         List of shopping products matching the filters.
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid.
     """
     search_params = ShoppingProductSearchParams(
         food_item_id=food_item_id,
@@ -134,9 +143,15 @@ def search_shopping_products(
         package_type=package_type
     )
 
-    return crud_shopping.get_all_shopping_products(
-        db, search_params=search_params, skip=skip, limit=limit
-    )
+    try:
+        products = crud_shopping.get_all_shopping_products(
+            db, search_params=search_params, skip=skip, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    set_next_cursor(response, crud_shopping.SHOPPING_PRODUCT_KEYSET.next_cursor(products, limit))
+    return products
 
 
 @products_router.get(
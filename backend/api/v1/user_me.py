@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from typing import Annotated
 
-from backend.core.dependencies import get_current_user
-from backend.schemas.user import UserRead
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from backend.core.dependencies import get_current_user, get_current_user_id, get_db
+from backend.crud import inventory as crud_inventory
+from backend.crud import kitchen as crud_kitchen
+from backend.crud import recipe as crud_recipe
+from backend.schemas.kitchen import KitchenWithRole
+from backend.schemas.user import UserDashboardStats, UserRead
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -17,3 +24,50 @@ router = APIRouter(prefix="/users", tags=["Users"])
 def get_me(current_user=Depends(get_current_user)) -> UserRead:
     """Return the current authenticated user's profile."""
     return current_user
+
+
+@router.get(
+    "/me/kitchens",
+    response_model=list[KitchenWithRole],
+    summary="Get the current user's kitchens with roles",
+)
+def get_my_kitchens(
+        db: Annotated[Session, Depends(get_db)],
+        current_user_id: Annotated[int, Depends(get_current_user_id)],
+) -> list[KitchenWithRole]:
+    """Return every kitchen the current user belongs to, with their role."""
+    return crud_kitchen.get_user_kitchens_with_roles(db, current_user_id)
+
+
+@router.get(
+    "/me/dashboard",
+    response_model=UserDashboardStats,
+    summary="Get dashboard counts for the current user",
+)
+def get_my_dashboard(
+        db: Annotated[Session, Depends(get_db)],
+        current_user_id: Annotated[int, Depends(get_current_user_id)],
+        kitchen_id: Annotated[int | None, Query(description="Kitchen to include inventory counts for")] = None,
+        threshold_days: Annotated[int, Query(ge=0, description="Days counted as expiring soon")] = 7,
+) -> UserDashboardStats:
+    """Return recipe and inventory counts in one request, without any rows.
+
+    Raises:
+        HTTPException: 403 if the user is not a member of ``kitchen_id``.
+    """
+    inventory = None
+    if kitchen_id is not None:
+        if crud_kitchen.get_user_kitchen_relationship(db, kitchen_id=kitchen_id, user_id=current_user_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not a member of this kitchen",
+            )
+        inventory = crud_inventory.get_kitchen_inventory_stats(db, kitchen_id, threshold_days)
+
+    summary = crud_recipe.get_recipe_summary(db)
+    return UserDashboardStats(
+        my_recipes=crud_recipe.count_recipes(db, created_by_user_id=current_user_id).count,
+        ai_recipes=summary.ai_generated_count,
+        total_recipes=summary.total_recipes,
+        inventory=inventory,
+    )
@@ -0,0 +1,143 @@
+"""Benchmark JSON rendering per endpoint: stdlib ``json`` against orjson.
+
+Seeds an in-memory SQLite database (food items, recipes, AI outputs with
+multi-kilobyte blobs), requests each endpoint once through ``create_app`` to
+capture the data FastAPI hands to its response class, then times rendering
+that data with Starlette's ``JSONResponse`` (stdlib ``json``, the previous
+default) and with ``FastJSONResponse`` (orjson, the default now).
+
+Endpoints returning pre-serialized responses (``json_response`` /
+``conditional_json``) bypass the response class and are not listed.
+
+Usage (CLI):
+    python -m backend.core.benchmark_json                 # 10k food items
+    python -m backend.core.benchmark_json --rows 50000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+import click
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.dependencies import get_current_user_id, get_db, get_token_payload
+from backend.core.enums import AIOutputTargetType, OutputFormat, OutputType
+from backend.core.serialization import FastJSONResponse
+from backend.crud import ai_model_output as crud_ai
+from backend.db.base import Base
+from backend.db.benchmark_serialization import seed
+from backend.main import create_app
+from backend.models.user import User
+from backend.schemas.ai_model_output import AIModelOutputCreate
+
+AI_OUTPUTS = 1_000
+
+# A generated recipe as stored in ai_model_outputs.raw_output
+_RAW_OUTPUT = json.dumps({
+    "title": "Tomato Pasta",
+    "ingredients": [{"name": f"Ingredient {i}", "quantity": i * 12.5, "unit": "g"} for i in range(20)],
+    "steps": [f"Step {i}: stir, season and simmer for a few minutes. " * 3 for i in range(15)],
+})
+
+
+def seed_ai_outputs(db: Session, count: int) -> None:
+    """Insert ``count`` AI outputs for user 1 through the CRUD layer."""
+    db.add(User(id=1, name="Benchmark", email="benchmark@example.com"))
+    db.commit()
+    for i in range(count):
+        crud_ai.create_ai_output(db, AIModelOutputCreate(
+            user_id=1,
+            model_version="gpt-4o-mini",
+            output_type=OutputType.RECIPE,
+            output_format=OutputFormat.JSON,
+            prompt_used=f"Generate recipe {i % 50}",
+            prompt_params={"servings": 2, "diet": "vegetarian"},
+            raw_output=_RAW_OUTPUT,
+            target_type=AIOutputTargetType.RECIPE,
+            target_id=i + 1,
+            extra_data={"tokens": 1500 + i, "cost": 0.003},
+        ))
+
+
+def time_render(response_class: type[JSONResponse], content: Any, repeat: int) -> float:
+    """Return the best of ``repeat`` render timings in ms."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response_class(content)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def benchmark_json(rows: int, repeat: int) -> list[tuple[str, int, float, float]]:
+    """Time rendering the responses of list endpoints with both encoders.
+
+    Args:
+        rows: Number of food items and recipes to seed.
+        repeat: Renders per measurement; the best one is reported.
+
+    Returns:
+        ``(endpoint, body bytes, stdlib_ms, orjson_ms)`` per endpoint.
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        click.echo(f"Seeding {rows:,} food items and recipes, {AI_OUTPUTS:,} AI outputs …")
+        seed(db, rows)
+        seed_ai_outputs(db, AI_OUTPUTS)
+
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: Session(engine)
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+    app.dependency_overrides[get_token_payload] = lambda: {"sub": "1", "is_admin": True}
+    client = TestClient(app)
+
+    endpoints: list[tuple[str, Callable[[], Any]]] = [
+        ("/v1/units/", lambda: client.get("/v1/units/")),
+        (f"/v1/food-items/?limit={rows}", lambda: client.get("/v1/food-items/", params={"limit": rows})),
+        (f"/v1/ai/outputs/?limit={AI_OUTPUTS}", lambda: client.get("/v1/ai/outputs/", params={"limit": AI_OUTPUTS})),
+    ]
+    results = []
+    for name, request in endpoints:
+        response = request()
+        response.raise_for_status()
+        content = response.json()
+        if JSONResponse(content).body != JSONResponse(json.loads(FastJSONResponse(content).body)).body:
+            raise RuntimeError(f"{name}: orjson output differs")
+        results.append((
+            name,
+            len(response.content),
+            time_render(JSONResponse, content, repeat),
+            time_render(FastJSONResponse, content, repeat),
+        ))
+    engine.dispose()
+    return results
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Compare stdlib json and orjson rendering of API responses.")
+@click.option("--rows", type=int, default=10_000, show_default=True, help="Food items and recipes to seed.")
+@click.option("--repeat", type=int, default=10, show_default=True, help="Renders per measurement.")
+def _cli(rows: int, repeat: int) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    results = benchmark_json(rows, repeat)
+    click.echo(f"{'endpoint':<32}  {'KiB':>8}  {'json ms':>8}  {'orjson ms':>9}  {'speed-up':>8}")
+    for name, size, stdlib_ms, orjson_ms in results:
+        click.echo(
+            f"{name:<32}  {size / 1024:>8.0f}  {stdlib_ms:>8.1f}  {orjson_ms:>9.1f}  {stdlib_ms / orjson_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
@@ -0,0 +1,287 @@
+"""Read-through cache for reference data (units, conversions, device types, food).
+
+Reference data is read on nearly every request but written rarely. CRUD read
+functions opt in with the ``reference_cache.cached(namespace)`` decorator;
+results are cached per function and arguments for
+``REFERENCE_CACHE_TTL_SECONDS``.
+
+Writes invalidate write-through: each CRUD module *watches* the models its
+cached reads depend on. When a session flushes new, changed or deleted rows
+of a watched model, the dependent namespaces are marked stale and dropped once
+the session commits. Until then, reads in that session bypass the cache and
+see their own uncommitted changes.
+
+Entries live in an in-process LRU by default. Setting ``REFERENCE_CACHE_URL``
+to a ``redis://`` URL shares them between worker processes instead (requires
+the optional ``redis`` package). Namespaces are invalidated by bumping a
+generation number that is part of every key, so no key scan is needed.
+
+Example:
+    >>> reference_cache.watch(Unit, "units")
+    >>> @reference_cache.cached("units")
+    ... def get_all_units(db: Session) -> list[UnitRead]: ...
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import pickle
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, ParamSpec, Protocol, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.core.metrics import Counter, Gauge, Metric, registry
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+MISSING: Any = object()
+"""Returned by cache backends for absent or expired keys."""
+
+
+class CacheBackend(Protocol):
+    """Storage for cache entries and namespace generations."""
+
+    def get(self, key: str) -> Any:
+        """Return the value of ``key`` or ``MISSING``."""
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    def generation(self, namespace: str) -> int:
+        """Return the current generation of ``namespace``."""
+
+    def bump(self, namespace: str) -> None:
+        """Advance the generation of ``namespace``, orphaning its entries."""
+
+
+class LRUCacheBackend:
+    """Thread-safe in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # Kept apart from the entries so eviction never resets a generation
+        self._generations: dict[str, int] = defaultdict(int)
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            if self._clock() >= entry[0]:
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self, namespace: str) -> int:
+        with self._lock:
+            return self._generations[namespace]
+
+    def bump(self, namespace: str) -> None:
+        with self._lock:
+            self._generations[namespace] += 1
+
+
+class RedisCacheBackend:
+    """Redis-backed entries shared by all worker processes.
+
+    Values are pickled; expiry and memory limits are left to Redis.
+    """
+
+    def __init__(self, url: str, prefix: str = "nugamoto:ref:"):
+        try:
+            import redis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("REFERENCE_CACHE_URL requires the 'redis' package") from exc
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Any:
+        raw = self._client.get(self._prefix + key)
+        return MISSING if raw is None else pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._client.set(self._prefix + key, pickle.dumps(value), px=max(1, int(ttl * 1000)))
+
+    def generation(self, namespace: str) -> int:
+        return int(self._client.get(f"{self._prefix}gen:{namespace}") or 0)
+
+    def bump(self, namespace: str) -> None:
+        self._client.incr(f"{self._prefix}gen:{namespace}")
+
+
+@dataclass
+class CacheMetrics:
+    """Hit, miss and invalidation counts of one namespace."""
+
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters plus the derived hit ratio."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+_STALE_NAMESPACES = "reference_cache_stale_namespaces"
+
+
+class ReferenceCache:
+    """Namespaced read-through cache with write-through invalidation."""
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self._watched: dict[type, set[str]] = defaultdict(set)
+        self._metrics: dict[str, CacheMetrics] = defaultdict(CacheMetrics)
+        self._lock = threading.Lock()
+
+    def watch(self, model: type, *namespaces: str) -> None:
+        """Invalidate ``namespaces`` whenever rows of ``model`` are written."""
+        self._watched[model].update(namespaces)
+
+    def cached(self, namespace: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Decorate a CRUD read ``fn(db, *args, **kwargs)`` to cache its result.
+
+        The remaining arguments must have stable ``repr``s; they form the key
+        after defaults are applied, so positional and keyword calls share it.
+        """
+
+        def decorator(fn: Callable[P, R]) -> Callable[P, R]:
+            signature = inspect.signature(fn)
+
+            @functools.wraps(fn)
+            def wrapper(db: Session, *args: Any, **kwargs: Any) -> Any:
+                if self.ttl <= 0 or namespace in self._stale_in(db):
+                    self._record(namespace, "bypassed")
+                    return fn(db, *args, **kwargs)
+
+                bound = signature.bind(db, *args, **kwargs)
+                bound.apply_defaults()
+                arguments = list(bound.arguments.values())[1:]
+                key = (
+                    f"{namespace}:{self.backend.generation(namespace)}:"
+                    f"{fn.__module__}.{fn.__qualname__}:{arguments!r}"
+                )
+                value = self.backend.get(key)
+                if value is not MISSING:
+                    self._record(namespace, "hits")
+                    return _copy(value)
+
+                self._record(namespace, "misses")
+                value = fn(db, *args, **kwargs)
+                self.backend.set(key, value, self.ttl)
+                return _copy(value)
+
+            return wrapper
+
+        return decorator
+
+    def invalidate(self, namespaces: Iterable[str] | None = None) -> None:
+        """Drop the given namespaces, or every watched namespace if None."""
+        if namespaces is None:
+            namespaces = {ns for watched in self._watched.values() for ns in watched} | set(self._metrics)
+        for namespace in namespaces:
+            self.backend.bump(namespace)
+            self._record(namespace, "invalidations")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the metrics of every namespace used so far."""
+        with self._lock:
+            return {namespace: metrics.as_dict() for namespace, metrics in sorted(self._metrics.items())}
+
+    def _record(self, namespace: str, counter: str) -> None:
+        with self._lock:
+            metrics = self._metrics[namespace]
+            setattr(metrics, counter, getattr(metrics, counter) + 1)
+
+    def _stale_in(self, db: Session) -> set[str]:
+        """Namespaces with uncommitted writes in ``db``, flushed or pending."""
+        stale = set(db.info.get(_STALE_NAMESPACES, ()))
+        if db.new or db.dirty or db.deleted:
+            stale |= self._namespaces_for(db)
+        return stale
+
+    def _namespaces_for(self, db: Session) -> set[str]:
+        namespaces: set[str] = set()
+        for obj in (*db.new, *db.dirty, *db.deleted):
+            namespaces |= self._watched.get(type(obj), set())
+        return namespaces
+
+
+def _copy(value: Any) -> Any:
+    # Callers may modify what they get back; keep the cached value intact
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    if isinstance(value, BaseModel):
+        return value.model_copy()
+    return value
+
+
+def _create_backend() -> CacheBackend:
+    if settings.REFERENCE_CACHE_URL:
+        return RedisCacheBackend(settings.REFERENCE_CACHE_URL)
+    return LRUCacheBackend(max_entries=settings.REFERENCE_CACHE_MAX_ENTRIES)
+
+
+reference_cache = ReferenceCache(_create_backend(), ttl=settings.REFERENCE_CACHE_TTL_SECONDS)
+
+
+@event.listens_for(Session, "before_flush")
+def _mark_stale_namespaces(session: Session, _flush_context: Any, _instances: Any) -> None:
+    namespaces = reference_cache._namespaces_for(session)
+    if namespaces:
+        session.info.setdefault(_STALE_NAMESPACES, set()).update(namespaces)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_namespaces(session: Session) -> None:
+    namespaces = session.info.pop(_STALE_NAMESPACES, None)
+    if namespaces:
+        reference_cache.invalidate(namespaces)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_namespaces(session: Session) -> None:
+    session.info.pop(_STALE_NAMESPACES, None)
+
+
+@registry.collect
+def _cache_metrics() -> list[Metric]:
+    lookups = Counter(
+        "reference_cache_lookups_total", "Reference cache lookups by result.", ("namespace", "result")
+    )
+    hit_ratio = Gauge("reference_cache_hit_ratio", "Reference cache hits per lookup.", ("namespace",))
+    for namespace, stats in reference_cache.stats().items():
+        for result in ("hits", "misses", "bypassed"):
+            lookups.inc(namespace, result, amount=stats[result])
+        hit_ratio.set(namespace, value=stats["hit_ratio"])
+    return [lookups, hit_ratio]
@@ -46,11 +46,61 @@ class Settings(BaseSettings):
     # API keys (example)
     OPENAI_API_KEY: str = "dummy-key"
 
+    # AI provider resilience
+    DEFAULT_AI_PROVIDER: str = "openai"
+    AI_RESILIENCE_ENABLED: bool = True
+    AI_ATTEMPT_TIMEOUT_SECONDS: float = 30.0
+    AI_REQUEST_DEADLINE_SECONDS: float = 60.0
+    AI_MAX_RETRIES: int = 2
+    AI_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    AI_RETRY_MAX_DELAY_SECONDS: float = 8.0
+    AI_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    AI_CIRCUIT_RESET_SECONDS: float = 30.0
+
+    # AI output retention
+    AI_OUTPUT_RETENTION_DAYS: int = 180
+    AI_OUTPUT_RETENTION_STATUSES: str = "generated"
+    AI_OUTPUT_ARCHIVE_DIR: str = str(PROJECT_ROOT / "archive" / "ai_outputs")
+    AI_OUTPUT_ARCHIVE_BATCH_SIZE: int = 1000
+
+    # Streaming NDJSON exports
+    EXPORT_BATCH_SIZE: int = 500  # rows fetched per round trip; bounds memory per export
+
+    # Metrics
+    METRICS_ENABLED: bool = True  # /metrics in Prometheus text format plus request timing middleware
+
+    # Request profiling
+    PROFILING_SAMPLE_RATE: float = 0.0  # fraction of requests profiled; admins can always send X-Profile: 1
+    PROFILING_INTERVAL_SECONDS: float = 0.005  # stack sampling interval
+    PROFILING_DIR: str = str(PROJECT_ROOT / "profiles")
+    PROFILING_MAX_FILES: int = 200  # oldest profiles are deleted beyond this
+
+    # SQL instrumentation
+    QUERY_STATS_ENABLED: bool = False  # Server-Timing header and /health/queries; dev only, exposes DB internals
+    QUERY_STATS_HISTORY: int = 200  # recent requests kept for /health/queries
+    QUERY_STATS_REPEAT_THRESHOLD: int = 5  # same statement more often per request is logged as N+1
+
+    # Aggregate counters
+    AGGREGATE_CACHE_TTL_SECONDS: float = 30.0
+
+    # Reference data cache (units, conversions, device types, food items)
+    REFERENCE_CACHE_TTL_SECONDS: float = 300.0
+    REFERENCE_CACHE_MAX_ENTRIES: int = 1024
+    REFERENCE_CACHE_URL: str | None = None  # e.g. redis://localhost:6379/0; in-process when unset
+
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12  # stored hashes with other rounds are rehashed on login
+    PASSWORD_HASH_WORKERS: int = 2  # concurrent hash/verify operations
+    PASSWORD_HASH_USE_PROCESSES: bool = False  # process pool instead of threads
+
     # JWT
     SECRET_KEY: str = "CHANGE_ME_TO_A_SECURE_RANDOM_VALUE"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    TOKEN_CACHE_MAX_ENTRIES: int = 4096  # verified tokens kept until expiry; 0 disables
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10  # reuse of a just-rotated token is only rejected
+    REVOCATION_INDEX_REFRESH_SECONDS: float = 30.0  # reload per-user revocations from the DB
 
     # Admin whitelist (comma-separated)
     ADMIN_EMAILS: str = ""
@@ -1,7 +1,7 @@
 """Shared FastAPI dependencies."""
 from __future__ import annotations
 
-from typing import Annotated, Generator
+from typing import Annotated, Any, Generator
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -13,6 +13,7 @@ from backend.crud import recipe as crud_recipe
 from backend.crud import user as crud_user
 from backend.db.session import SessionLocal
 from backend.security import decode_token
+from backend.security.revocation import revocation_index
 
 _auth_scheme = HTTPBearer()
 
@@ -33,22 +34,65 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def get_current_user_id(
+def get_token_payload(
         credentials: Annotated[HTTPAuthorizationCredentials, Depends(_auth_scheme)],
+) -> dict[str, Any] | None:
+    """Return the verified bearer token payload, or None if the token is invalid.
+
+    FastAPI caches dependency results per request, so the token is decoded
+    once no matter how many dependencies of a route need it.
+    """
+    try:
+        return decode_token(credentials.credentials)
+    except Exception:
+        return None
+
+
+def has_admin_claims(payload: dict[str, Any] | None) -> bool:
+    """Return True if a token payload carries a global admin privilege.
+
+    Supported token claims (any one is sufficient):
+      - is_superadmin: true
+      - is_admin: true
+      - role: "superadmin" or "admin"
+      - permissions: contains "users:create"
+    """
+    if not payload:
+        return False
+    is_superadmin = bool(payload.get("is_superadmin"))
+    is_admin = bool(payload.get("is_admin"))
+    role = str(payload.get("role", "") or "").lower()
+    perms = payload.get("permissions") or []
+    if isinstance(perms, str):
+        perms = [perms]
+
+    allowed_by_role = role in {"superadmin", "admin"}
+    allowed_by_perm = "users:create" in {str(p).lower() for p in perms}
+    return is_superadmin or is_admin or allowed_by_role or allowed_by_perm
+
+
+def _is_valid_access_token(db: Session, payload: dict[str, Any] | None) -> bool:
+    """Return True for an access token whose user has not been revoked since it was issued."""
+    if payload is None or payload.get("type") != "access":
+        return False
+    return not revocation_index.is_revoked(db, int(payload["sub"]), payload.get("iat"))
+
+
+def get_current_user_id(
+        payload: Annotated[dict[str, Any] | None, Depends(get_token_payload)],
+        db: Annotated[Session, Depends(get_db)],
 ) -> int:
     """Extract and validate the current user id from the access token.
 
     Raises:
-        HTTPException: 401 if the token is invalid, expired, or not an access token.
+        HTTPException: 401 if the token is invalid, expired, revoked, or not an access token.
 
     Returns:
         int: Current user ID from the token subject ('sub').
     """
     try:
-        token = credentials.credentials
-        payload = decode_token(token)
-        if payload.get("type") != "access":
-            raise ValueError("Not an access token")
+        if not _is_valid_access_token(db, payload):
+            raise ValueError("Not a valid access token")
         return int(payload["sub"])
     except Exception:
         raise HTTPException(
@@ -69,41 +113,18 @@ def get_current_user(
 
 
 def require_super_admin(
-        credentials: Annotated[HTTPAuthorizationCredentials, Depends(_auth_scheme)],
+        payload: Annotated[dict[str, Any] | None, Depends(get_token_payload)],
+        db: Annotated[Session, Depends(get_db)],
 ) -> None:
     """Ensure the caller has a global admin/superadmin privilege.
 
-    Supported token claims (any one is sufficient):
-      - is_superadmin: true
-      - is_admin: true
-      - role: "superadmin" or "admin"
-      - permissions: contains "users:create"
-
-    Raise 403 otherwise.
+    See ``has_admin_claims`` for the accepted claims. Raise 403 otherwise.
     """
     try:
-        payload = decode_token(credentials.credentials)
-        if payload.get("type") != "access":
-            raise ValueError("Not an access token")
-
-        is_superadmin = bool(payload.get("is_superadmin"))
-        is_admin = bool(payload.get("is_admin"))
-        role = str(payload.get("role", "") or "").lower()
-        perms = payload.get("permissions") or []
-        if isinstance(perms, str):
-            perms = [perms]
-
-        allowed_by_role = role in {"superadmin", "admin"}
-        allowed_by_perm = "users:create" in {str(p).lower() for p in perms}
-
-        if not (is_superadmin or is_admin or allowed_by_role or allowed_by_perm):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Admin privileges required",
-            )
-    except HTTPException:
-        raise
+        allowed = _is_valid_access_token(db, payload) and has_admin_claims(payload)
     except Exception:
+        allowed = False
+    if not allowed:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required",
@@ -170,7 +191,7 @@ def require_recipe_owner_or_admin(
         recipe_id: int,
         current_user_id: Annotated[int, Depends(get_current_user_id)],
         db: Annotated[Session, Depends(get_db)],
-        credentials: Annotated[HTTPAuthorizationCredentials, Depends(_auth_scheme)] = None,
+        payload: Annotated[dict[str, Any] | None, Depends(get_token_payload)],
 ) -> None:
     """Ensure current user is the recipe owner or has admin privileges.
 
@@ -192,21 +213,9 @@ def require_recipe_owner_or_admin(
     if getattr(recipe_orm, "created_by_user_id", None) == current_user_id:
         return
 
-    # Fallback to admin claim check (inline to avoid double-decoding in require_super_admin)
-    try:
-        payload = decode_token(credentials.credentials)
-        is_superadmin = bool(payload.get("is_superadmin"))
-        is_admin = bool(payload.get("is_admin"))
-        role = str(payload.get("role", "") or "").lower()
-        perms = payload.get("permissions") or []
-        if isinstance(perms, str):
-            perms = [perms]
-        allowed_by_role = role in {"superadmin", "admin"}
-        allowed_by_perm = "users:create" in {str(p).lower() for p in perms}
-        if is_superadmin or is_admin or allowed_by_role or allowed_by_perm:
-            return
-    except Exception:
-        pass
+    # Fallback to admin claims of the already decoded token
+    if has_admin_claims(payload):
+        return
 
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -67,6 +67,30 @@ class DifficultyLevel(str, Enum):
     HARD = "hard"
 
 
+class RecipeSortField(str, Enum):
+    """Fields recipe listings can be ordered by."""
+
+    TITLE = "title"
+    CREATED_AT = "created_at"
+    AVERAGE_RATING = "average_rating"
+    REVIEW_COUNT = "review_count"
+
+
+class RecipePagePart(str, Enum):
+    """Parts of a recipe page that can be requested in one call."""
+
+    DETAILS = "details"
+    REVIEWS = "reviews"
+    RATING_SUMMARY = "rating_summary"
+
+
+class SortOrder(str, Enum):
+    """Sort direction for listings."""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
 class PackageType(str, Enum):
     """Package types for shopping products."""
 
@@ -0,0 +1,115 @@
+"""Conditional GET support with ``ETag`` / ``If-None-Match``.
+
+Read endpoints attach an ``ETag`` to their responses. Clients send it back in
+``If-None-Match`` and get an empty ``304 Not Modified`` while the data is
+unchanged. ETags come in two flavours:
+
+* **Table fingerprints** – ``MAX(updated_at)`` and ``COUNT(*)`` of the tables
+  a response is built from. They are checked *before* loading anything, so a
+  304 costs one small query and no serialization. Used for reference data
+  (units, food items, device types).
+* **Content hashes** – a hash of the serialized response body. The response
+  is still built, but unchanged bodies are not sent again. Used where the
+  data spans too many tables to fingerprint cheaply (recipes).
+
+Example:
+    >>> etag = table_etag(db, request, Unit)
+    >>> if (cached := check_not_modified(request, response, etag)) is not None:
+    ...     return cached
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.core.serialization import json_response
+
+# Clients may keep responses but must revalidate them on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(parts: Iterable[str | bytes]) -> str:
+    """Return a weak ETag hashing ``parts``."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else part.encode())
+        digest.update(b"\0")
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def table_etag(db: Session, request: Request, *models: Any) -> str:
+    """Return an ETag for a response built from ``models`` for this request URL.
+
+    Any insert, update (via ``updated_at``) or delete in one of the tables
+    changes the ETag.
+    """
+    parts = [request.url.path, str(sorted(request.query_params.multi_items()))]
+    for model in models:
+        latest, count = db.execute(
+            select(func.max(model.updated_at), func.count()).select_from(model)
+        ).one()
+        parts.append(f"{model.__tablename__}:{latest}:{count}")
+    return make_etag(parts)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return whether the request's ``If-None-Match`` header matches ``etag``.
+
+    Uses the weak comparison required for ``If-None-Match``.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty ``304 Not Modified`` response for ``etag``."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def check_not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """Return a 304 if the client already has ``etag``; otherwise tag ``response``.
+
+    Headers already set on ``response`` (e.g. the next-page cursor) are
+    copied onto the 304.
+    """
+    if etag_matches(request, etag):
+        return _copy_headers(response, not_modified(etag))
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
+
+
+def conditional_json(request: Request, response: Response, content: Any) -> Response:
+    """Serialize ``content`` and tag it with a hash of the body.
+
+    Returns a 304 if the client already has the same body. Headers set on
+    ``response`` (e.g. the next-page cursor) are kept. Schemas are serialized
+    directly, without FastAPI's ``response_model`` validation.
+    """
+    rendered = json_response(content)
+    etag = make_etag([rendered.body])
+    result = not_modified(etag) if etag_matches(request, etag) else rendered
+    result.headers["ETag"] = etag
+    result.headers["Cache-Control"] = CACHE_CONTROL
+    return _copy_headers(response, result)
+
+
+def _copy_headers(source: Response, target: Response) -> Response:
+    for name, value in source.headers.items():
+        if name != "content-length":
+            target.headers[name] = value
+    return target
@@ -0,0 +1,299 @@
+"""Process-wide metrics in the Prometheus text exposition format.
+
+A small, dependency-free registry of counters, gauges and histograms, served
+by ``GET /metrics``. Instrumented code records into module-level metrics:
+
+* ``MetricsMiddleware`` – per-route request latency histograms, in-flight
+  requests and server error counts;
+* ``instrument_pool`` – time spent waiting for a database pool connection;
+* the OpenAI provider – API call latency and token usage per model.
+
+State owned by other modules (reference cache hit rates, AI resilience
+counters) is read at scrape time through collectors registered with
+``registry.collect``, so it is never duplicated.
+
+Example:
+    >>> LOGINS = registry.counter("logins_total", "Successful logins.", ("method",))
+    >>> LOGINS.inc("password")
+    >>> print(registry.render())
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from sqlalchemy.pool import Pool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; suits API requests
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """A named metric family with a fixed set of label names."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _labels(self, values: Sequence[Any]) -> LabelValues:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(values)}")
+        return tuple(str(value) for value in values)
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        """Yield ``(suffix, formatted labels, value)`` per exposed sample."""
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        """Return the exposition lines of this metric family."""
+        lines = [f"# HELP {self.name} {_escape(self.documentation)}", f"# TYPE {self.name} {self.type}"]
+        lines += [f"{self.name}{suffix}{labels} {_format_value(value)}" for suffix, labels, value in self.samples()]
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing value per label combination."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: Any, amount: float = 1.0) -> None:
+        """Add ``amount`` to the counter of ``labels``."""
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._labels(labels), 0.0)
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label combination."""
+
+    type = "gauge"
+
+    def dec(self, *labels: Any, amount: float = 1.0) -> None:
+        """Subtract ``amount`` from the gauge of ``labels``."""
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: Any, value: float) -> None:
+        """Set the gauge of ``labels`` to ``value``."""
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """Observation counts per bucket, plus their sum, per label combination."""
+
+    type = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per labels: non-cumulative bucket counts (last one is +Inf) and the sum
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: Any) -> None:
+        """Record one observation of ``value`` for ``labels``."""
+        key = self._labels(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labels: Any) -> int:
+        with self._lock:
+            series = self._series.get(self._labels(labels))
+            return sum(series[0]) if series else 0
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        with self._lock:
+            series = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._series.items())
+        for key, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                labels = _format_labels((*self.labelnames, "le"), (*key, _format_value(bound)))
+                yield "_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield "_sum", labels, total
+            yield "_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Metric families of this process plus scrape-time collectors."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], Iterable[Metric]]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Any:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def collect(self, collector: Callable[[], Iterable[Metric]]) -> Callable[[], Iterable[Metric]]:
+        """Register ``collector``; it builds metrics from foreign state on every scrape."""
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def render(self) -> str:
+        """Return all metrics in the text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            metrics.extend(collector())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge("http_requests_in_flight", "HTTP requests currently being served.")
+HTTP_SERVER_ERRORS = registry.counter(
+    "http_server_errors_total", "Responses with a 5xx status, including unhandled exceptions.", ("method", "route")
+)
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+AI_REQUEST_DURATION = registry.histogram(
+    "ai_request_duration_seconds",
+    "AI provider API call latency.",
+    ("model", "operation"),
+    buckets=(0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+AI_TOKENS = registry.counter("ai_tokens_total", "AI tokens used, by kind (prompt or completion).", ("model", "kind"))
+
+# Requests not matched by any route share one label value
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """Return the path template of the route that served ``scope``."""
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """Record latency, in-flight requests and server errors of every HTTP request.
+
+    Latency is labelled with the route template (``/v1/recipes/{recipe_id}``),
+    never the raw path, so the number of series stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, scope["method"], route, status_code)
+            if status_code >= 500:
+                HTTP_SERVER_ERRORS.inc(scope["method"], route)
+
+
+def instrument_pool(pool: Pool) -> None:
+    """Time ``pool.connect()`` – the wait for a free connection – into ``DB_POOL_CHECKOUT_WAIT``.
+
+    ``Engine.dispose()`` replaces the pool; instrument the new one again if needed.
+    """
+    connect = pool.connect
+
+    def timed_connect() -> Any:
+        started = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+    pool.connect = timed_connect  # type: ignore[method-assign]
@@ -0,0 +1,220 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+OFFSET pagination makes the database read and discard every skipped row, so
+deep pages get linearly slower. A *keyset* instead remembers the sort values
+of the last row returned and continues with ``WHERE (sort key, id) > last``,
+which an index on the sort key answers in constant time at any depth.
+
+Cursors are opaque to clients: URL-safe base64 of the sort key names and the
+last row's values. List endpoints return the cursor for the next page in the
+``X-Next-Cursor`` response header, which is absent on the last page.
+
+Example:
+    >>> keyset = Keyset(SortKey(Recipe.created_at, descending=True), SortKey(Recipe.id))
+    >>> query = keyset.paginate(select(Recipe), cursor=cursor, limit=50)
+    >>> recipes = db.scalars(query).all()
+    >>> next_cursor = keyset.next_cursor(recipes, limit=50)
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from fastapi import Response
+from sqlalchemy import ColumnElement, Select, and_, false, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or belongs to a different ordering."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a keyset ordering.
+
+    Attributes:
+        column: Mapped ORM attribute to order by.
+        descending: Order from high to low.
+
+    NULLs of nullable columns always sort last, in either direction.
+    """
+
+    column: InstrumentedAttribute
+    descending: bool = False
+
+    @property
+    def name(self) -> str:
+        """Attribute name, used to read the value from ORM rows and schemas."""
+        return self.column.key
+
+    @property
+    def nullable(self) -> bool:
+        """Whether the mapped column allows NULL."""
+        return bool(self.column.expression.nullable)
+
+    def order_by(self) -> ColumnElement:
+        """Return the ORDER BY clause for this key."""
+        ordered = self.column.desc() if self.descending else self.column.asc()
+        return ordered.nulls_last() if self.nullable else ordered
+
+    def after(self, value: Any) -> ColumnElement:
+        """Return the condition for rows sorting strictly after ``value``."""
+        if value is None:
+            # NULLs sort last, so nothing but further NULLs can follow
+            return false()
+        beyond = self.column < value if self.descending else self.column > value
+        return or_(beyond, self.column.is_(None)) if self.nullable else beyond
+
+    def at_or_after(self, value: Any) -> ColumnElement:
+        """Return the condition for rows sorting at or after ``value``."""
+        if value is None:
+            return self.column.is_(None)
+        bound = self.column <= value if self.descending else self.column >= value
+        return or_(bound, self.column.is_(None)) if self.nullable else bound
+
+    def equals(self, value: Any) -> ColumnElement:
+        """Return the condition for rows sharing ``value``."""
+        return self.column.is_(None) if value is None else self.column == value
+
+
+class Keyset:
+    """A total ordering over sort keys that supports cursor pagination.
+
+    The last key must be unique (usually the primary key) so that every row
+    has exactly one position and no row is skipped or repeated across pages.
+    """
+
+    def __init__(self, *keys: SortKey):
+        if not keys:
+            raise ValueError("A keyset needs at least one sort key")
+        self.keys = keys
+
+    @property
+    def names(self) -> list[str]:
+        """Attribute names of all sort keys, in order."""
+        return [key.name for key in self.keys]
+
+    @property
+    def signature(self) -> list[str]:
+        """Sort key names prefixed with ``-`` when descending, stored in cursors."""
+        return [f"-{key.name}" if key.descending else key.name for key in self.keys]
+
+    def order_by(self) -> list[ColumnElement]:
+        """Return the ORDER BY clauses of this keyset."""
+        return [key.order_by() for key in self.keys]
+
+    def after(self, values: Sequence[Any]) -> ColumnElement:
+        """Return the WHERE clause for rows after the row with ``values``.
+
+        Expands ``(k1, k2, k3) > (v1, v2, v3)`` into
+        ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR (k1 = v1 AND k2 = v2 AND k3 > v3)``,
+        which also works for mixed directions and nullable keys. The whole
+        expression is additionally bounded by ``k1 >= v1`` so the database can
+        answer it with a range scan on the first key's index.
+        """
+        clauses = []
+        for position, key in enumerate(self.keys):
+            prefix = [k.equals(v) for k, v in zip(self.keys[:position], values)]
+            clauses.append(and_(*prefix, key.after(values[position])))
+        return and_(self.keys[0].at_or_after(values[0]), or_(*clauses))
+
+    def paginate(self, query: Select, *, cursor: str | None = None, skip: int = 0, limit: int = 100) -> Select:
+        """Order ``query`` by this keyset and select one page.
+
+        Args:
+            query: Base query with all filters applied.
+            cursor: Cursor from a previous page; ``skip`` is ignored if given.
+            skip: Number of rows to skip (OFFSET) when no cursor is given.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            The paginated query.
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not issued for this keyset.
+        """
+        query = query.order_by(*self.order_by())
+        if cursor is None:
+            return query.offset(skip).limit(limit)
+        return query.where(self.after(self.decode(cursor))).limit(limit)
+
+    def next_cursor(self, items: Sequence[Any], limit: int) -> str | None:
+        """Return the cursor following ``items``, or None on the last page.
+
+        Args:
+            items: The page just returned (ORM rows or read schemas exposing
+                the sort key attributes).
+            limit: The page size that was requested.
+        """
+        if not items or len(items) < limit:
+            return None
+        last = items[-1]
+        return self.encode([getattr(last, name) for name in self.names])
+
+    def encode(self, values: Sequence[Any]) -> str:
+        """Encode the sort values of one row as an opaque cursor."""
+        payload = {"k": self.signature, "v": [_to_json(value) for value in values]}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list[Any]:
+        """Decode a cursor into the sort values of its row.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued for
+                a different ordering.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            names, values = payload["k"], payload["v"]
+        except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+            raise InvalidCursorError("Malformed pagination cursor") from exc
+
+        if names != self.signature or not isinstance(values, list) or len(values) != len(self.keys):
+            raise InvalidCursorError("Pagination cursor does not match the requested ordering")
+
+        try:
+            return [_from_json(key, value) for key, value in zip(self.keys, values)]
+        except (TypeError, ValueError) as exc:
+            raise InvalidCursorError("Malformed pagination cursor") from exc
+
+
+def set_next_cursor(response: Response, cursor: str | None) -> None:
+    """Expose ``cursor`` in the ``X-Next-Cursor`` header when there is a next page."""
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        # Stored naive (UTC) by SQLite; compare like with like
+        return value.replace(tzinfo=None).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _from_json(key: SortKey, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = key.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if not isinstance(value, (str, int, float)):
+        raise TypeError(f"Unsupported cursor value for {key.name}")
+    return value
@@ -0,0 +1,357 @@
+"""Opt-in sampling profiler for single requests.
+
+``ProfilingMiddleware`` profiles a request when
+
+* the caller sends ``X-Profile: 1`` and passes ``require_super_admin``, or
+* it is picked by ``PROFILING_SAMPLE_RATE`` (``1.0`` profiles every request).
+
+While the request runs, a ``SamplingProfiler`` thread records the Python
+stacks of all busy threads every ``PROFILING_INTERVAL_SECONDS``. A sampler is
+used instead of ``cProfile`` because sync endpoints run in the threadpool,
+and ``cProfile`` only sees the thread that enabled it. Samples from other
+requests served at the same time are included, so profile on a quiet
+instance when the numbers matter.
+
+Each profile is stored in ``PROFILING_DIR`` in speedscope format (open it at
+https://www.speedscope.app). Only the newest ``PROFILING_MAX_FILES`` are
+kept. The response carries the profile's name in ``X-Profile-Id``. Admins
+can list and download profiles under ``/health/profiles``.
+
+The CLI aggregates stored profiles into the hottest functions in ``crud``
+and ``services``.
+
+Usage (CLI):
+    python -m backend.core.profiling                      # top 20 crud/services functions
+    python -m backend.core.profiling --match backend/api/ --limit 50
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import anyio
+import click
+from fastapi import HTTPException
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import settings
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_SUFFIX = ".speedscope.json"
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Innermost frames of threads waiting for work (thread pool, event loop, locks)
+_IDLE_FILES = ("threading.py", "selectors.py", "queue.py")
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+_PROFILE_NAME = re.compile(r"^[A-Za-z0-9_.-]+\.speedscope\.json$")
+
+# (function, file, first line)
+Frame = tuple[str, str, int]
+
+
+# ================================================================== #
+# Sampling                                                           #
+# ================================================================== #
+
+@dataclass
+class SamplingProfiler:
+    """Record the stacks of all busy threads every ``interval`` seconds."""
+
+    interval: float
+    frames: list[Frame] = field(default_factory=list)
+    samples: list[list[int]] = field(default_factory=list)
+    weights: list[float] = field(default_factory=list)
+    duration: float = 0.0
+    _started: float = field(default=0.0, repr=False)
+    _frame_ids: dict[Frame, int] = field(default_factory=dict, repr=False)
+    _stop: threading.Event = field(default_factory=threading.Event, repr=False)
+    _thread: threading.Thread | None = field(default=None, repr=False)
+
+    def __enter__(self) -> SamplingProfiler:
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        last = self._started
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self._record(frame, now - last)
+            last = now
+
+    def _record(self, frame: Any, weight: float) -> None:
+        if frame.f_code.co_filename.endswith(_IDLE_FILES):
+            return
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            frame_id = self._frame_ids.get(key)
+            if frame_id is None:
+                frame_id = self._frame_ids[key] = len(self.frames)
+                self.frames.append(key)
+            stack.append(frame_id)
+            frame = frame.f_back
+        stack.reverse()
+        self.samples.append(stack)
+        self.weights.append(weight)
+
+    def to_speedscope(self, name: str) -> dict[str, Any]:
+        """Return the samples as a speedscope "sampled" profile document."""
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "nugamoto",
+            "shared": {"frames": [{"name": fn, "file": file, "line": line} for fn, file, line in self.frames]},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.duration,
+                "samples": self.samples,
+                "weights": self.weights,
+            }],
+        }
+
+
+# ================================================================== #
+# Storage                                                            #
+# ================================================================== #
+
+class ProfileStore:
+    """Directory of speedscope profiles, pruned to the newest ``max_files``."""
+
+    def __init__(self, directory: str | Path, max_files: int):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def new_name(self, method: str, path: str) -> str:
+        """Return a unique, filesystem-safe profile name for a request."""
+        slug = _UNSAFE_NAME_CHARS.sub("_", path.strip("/")) or "root"
+        return f"{time.time_ns()}-{method}-{slug[:80]}{PROFILE_SUFFIX}"
+
+    def save(self, name: str, profile: dict[str, Any]) -> Path:
+        path = self.directory / name
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(profile), encoding="utf-8")
+            for stale in self._paths()[self.max_files:]:
+                stale.unlink(missing_ok=True)
+        return path
+
+    def list(self) -> list[dict[str, Any]]:
+        """Return name, size and modification time of stored profiles, newest first."""
+        with self._lock:
+            paths = self._paths()
+        profiles = []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pruned meanwhile
+                continue
+            profiles.append({"name": path.name, "bytes": stat.st_size, "created_at": stat.st_mtime})
+        return profiles
+
+    def path(self, name: str) -> Path | None:
+        """Return the file of profile ``name``, or None for unknown or unsafe names."""
+        if not _PROFILE_NAME.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+    def _paths(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        # Names start with a nanosecond timestamp
+        return sorted(self.directory.glob(f"*{PROFILE_SUFFIX}"), key=lambda path: path.name, reverse=True)
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
+
+
+# ================================================================== #
+# Middleware                                                         #
+# ================================================================== #
+
+def is_admin_request(scope: Scope) -> bool:
+    """Return True if the request's bearer token passes ``require_super_admin``.
+
+    Blocking: the revocation check may query the database, so call it from a
+    worker thread. Tokens without admin claims are rejected before that.
+    """
+    from backend.core.dependencies import has_admin_claims, require_super_admin
+    from backend.db.session import SessionLocal
+    from backend.security import decode_token
+
+    scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        payload = decode_token(token)
+    except Exception:
+        return False
+    if not has_admin_claims(payload):
+        return False
+    db = SessionLocal()
+    try:
+        require_super_admin(payload, db)
+    except HTTPException:
+        return False
+    finally:
+        db.close()
+    return True
+
+
+class ProfilingMiddleware:
+    """Profile requests chosen by ``sample_rate`` or requested by admins via ``X-Profile``."""
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            store: ProfileStore = profile_store,
+            sample_rate: float | None = None,
+            interval: float | None = None,
+            authorize: Callable[[Scope], bool] = is_admin_request,
+    ):
+        self.app = app
+        self.store = store
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.interval = settings.PROFILING_INTERVAL_SECONDS if interval is None else interval
+        self.authorize = authorize
+
+    async def _should_profile(self, scope: Scope) -> bool:
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return True
+        if Headers(scope=scope).get(PROFILE_HEADER, "").lower() not in {"1", "true", "yes"}:
+            return False
+        # Keep the (possibly database-backed) check off the event loop
+        return await anyio.to_thread.run_sync(self.authorize, scope)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not await self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        name = self.store.new_name(scope["method"], scope["path"])
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, name)
+            await send(message)
+
+        # Failed requests are stored too; they are often the interesting ones
+        profiler = SamplingProfiler(self.interval)
+        try:
+            with profiler:
+                await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile = profiler.to_speedscope(f"{scope['method']} {scope['path']}")
+            await anyio.to_thread.run_sync(self.store.save, name, profile)
+
+
+# ================================================================== #
+# Aggregation                                                        #
+# ================================================================== #
+
+@dataclass
+class FunctionTime:
+    """Sampled time of one function across profiles."""
+
+    function: str
+    location: str
+    total: float = 0.0
+    own: float = 0.0
+    profiles: int = 0
+
+
+def aggregate_profiles(paths: Iterable[Path], match: tuple[str, ...]) -> list[FunctionTime]:
+    """Sum sampled time per function over speedscope profiles.
+
+    Only frames whose file path contains one of ``match`` are counted.
+    ``total`` is the time such a function was on the stack; ``own`` is the
+    time it was the innermost matching frame, i.e. time spent in it or in
+    library code (SQLAlchemy, pydantic, …) it called.
+
+    Returns:
+        Matching functions, most ``own`` time first.
+    """
+    functions: dict[tuple[str, str], FunctionTime] = {}
+    for path in paths:
+        document = json.loads(path.read_text(encoding="utf-8"))
+        frames = document["shared"]["frames"]
+        matching = [any(fragment in frame.get("file", "") for fragment in match) for frame in frames]
+        seen_in_profile: set[tuple[str, str]] = set()
+        for profile in document["profiles"]:
+            for stack, weight in zip(profile["samples"], profile["weights"]):
+                keys = []
+                for frame_id in stack:
+                    if matching[frame_id]:
+                        frame = frames[frame_id]
+                        keys.append((frame["name"], f"{frame['file']}:{frame.get('line', 0)}"))
+                if not keys:
+                    continue
+                for key in dict.fromkeys(keys):
+                    entry = functions.setdefault(key, FunctionTime(*key))
+                    entry.total += weight
+                    seen_in_profile.add(key)
+                functions[keys[-1]].own += weight
+        for key in seen_in_profile:
+            functions[key].profiles += 1
+    return sorted(functions.values(), key=lambda entry: entry.own, reverse=True)
+
+
+def _relative(location: str) -> str:
+    marker = location.rfind("backend/")
+    return location[marker:] if marker >= 0 else location
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Aggregate stored request profiles into the hottest functions.")
+@click.option("--dir", "directory", type=click.Path(path_type=Path), default=Path(settings.PROFILING_DIR),
+              show_default=True, help="Profile directory.")
+@click.option("--match", multiple=True, default=("backend/crud/", "backend/services/"), show_default=True,
+              help="Path fragment of files to report; repeatable.")
+@click.option("--limit", type=int, default=20, show_default=True, help="Functions to list.")
+def _cli(directory: Path, match: tuple[str, ...], limit: int) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    paths = sorted(directory.glob(f"*{PROFILE_SUFFIX}"))
+    if not paths:
+        raise click.ClickException(f"No profiles in {directory}")
+    click.echo(f"{len(paths)} profiles from {directory}")
+    click.echo(f"{'own ms':>9}  {'total ms':>9}  {'profiles':>8}  function")
+    for entry in aggregate_profiles(paths, match)[:limit]:
+        click.echo(
+            f"{entry.own * 1000:>9.1f}  {entry.total * 1000:>9.1f}  {entry.profiles:>8}  "
+            f"{entry.function} ({_relative(entry.location)})"
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
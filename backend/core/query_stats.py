@@ -0,0 +1,203 @@
+"""Per-request SQL instrumentation and N+1 detection.
+
+SQLAlchemy cursor events record every statement executed while a
+``track_queries()`` block is active: the number of statements, the time spent
+in the database and how often each statement *shape* ran. Shapes are the
+parameterised SQL text, with expanded ``IN (?, ?, …)`` lists collapsed, so the
+same query issued once per parent row shows up as one shape with a high count
+– the signature of an N+1 loop.
+
+``QueryStatsMiddleware`` tracks each HTTP request, reports the totals in a
+``Server-Timing`` header (visible in browser dev tools), logs a warning for
+shapes repeated more than ``QUERY_STATS_REPEAT_THRESHOLD`` times and keeps
+the most recent requests in ``query_log`` for the ``/health/queries`` debug
+endpoint. It is only installed with ``QUERY_STATS_ENABLED`` (off by default,
+since the header exposes database internals to every client). The test suite uses the same tracking to enforce query budgets
+(see ``tests/query_budget.py``).
+
+Example:
+    >>> with track_queries() as stats:
+    ...     crud_inventory.get_kitchen_inventory(db, kitchen_id=1)
+    >>> stats.count, stats.repeated(threshold=1)
+    (1, {})
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bound parameter lists of ``IN`` clauses (qmark and pyformat placeholders)
+_IN_LIST = re.compile(r"\((?:\?|%\(\w+\)s)(?:, (?:\?|%\(\w+\)s))+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_START_TIMES = "query_stats_start_times"
+
+
+def statement_shape(statement: str) -> str:
+    """Return ``statement`` normalised for counting repetitions."""
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one ``track_queries()`` block."""
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        """Count one execution of ``statement`` taking ``duration`` seconds."""
+        self.count += 1
+        self.duration += duration
+        self.statements[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Return the statement shapes executed more than ``threshold`` times."""
+        return {statement: count for statement, count in self.statements.most_common() if count > threshold}
+
+    def server_timing(self) -> str:
+        """Return the totals as a ``Server-Timing`` header value."""
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+    def as_dict(self, threshold: int) -> dict[str, Any]:
+        """Return the totals plus the shapes repeated more than ``threshold`` times."""
+        return {
+            "queries": self.count,
+            "duration_ms": round(self.duration * 1000, 3),
+            "repeated": self.repeated(threshold),
+        }
+
+
+# Every block active in the current context; nested blocks all see a statement
+_active: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record the statements executed in the current context until exit."""
+    stats = QueryStats()
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _active.get():
+        conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get(_START_TIMES)
+    if not started:
+        return
+    duration = time.perf_counter() - started.pop()
+    for stats in _active.get():
+        stats.record(statement, duration)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context) -> None:
+    # Failed statements never reach ``after_cursor_execute``
+    started = exception_context.connection and exception_context.connection.info.get(_START_TIMES)
+    if started:
+        started.pop()
+
+
+class QueryLog:
+    """Thread-safe ring buffer of the most recent requests' query stats."""
+
+    def __init__(self, max_entries: int):
+        self._entries: deque[dict[str, Any]] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def add(self, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def recent(self) -> list[dict[str, Any]]:
+        """Return the logged requests, newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+query_log = QueryLog(settings.QUERY_STATS_HISTORY)
+
+
+class QueryStatsMiddleware:
+    """Track the SQL statements of every HTTP request.
+
+    Adds a ``Server-Timing: db;dur=<ms>;desc="<n> queries"`` header, appends
+    the request to ``log`` and warns about statement shapes repeated more than
+    ``repeat_threshold`` times. Statements of a streamed body run after the
+    header is sent; they are counted in the log entry only.
+    """
+
+    def __init__(self, app: ASGIApp, log: QueryLog = query_log, repeat_threshold: int | None = None):
+        self.app = app
+        self.log = log
+        self.repeat_threshold = (
+            settings.QUERY_STATS_REPEAT_THRESHOLD if repeat_threshold is None else repeat_threshold
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._report(scope, status_code, stats)
+
+    def _report(self, scope: Scope, status_code: int, stats: QueryStats) -> None:
+        entry = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            **stats.as_dict(self.repeat_threshold),
+        }
+        self.log.add(entry)
+        if entry["repeated"]:
+            logger.warning(
+                "Possible N+1 queries in %s %s: %s",
+                entry["method"],
+                entry["path"],
+                "; ".join(f"{count}x {statement}" for statement, count in entry["repeated"].items()),
+            )
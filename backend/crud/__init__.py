@@ -1,8 +1,10 @@
 """CRUD operations package."""
 
-from backend.crud import ai_model_output, core, recipe, food, user, device, inventory, kitchen, shopping, user_health, user_credentials
+from backend.crud import aggregate, ai_model_output, core, recipe, food, user, device, inventory, kitchen, shopping, user_health, user_credentials
 
-__all__ = ["ai_model_output", "core",
+__all__ = ["aggregate",
+           "ai_model_output",
+           "core",
            "recipe",
            "food",
            "user",
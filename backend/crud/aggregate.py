@@ -0,0 +1,460 @@
+"""CRUD operations for incrementally maintained aggregate counters.
+
+Counters are adjusted inside the caller's transaction and never committed
+here, so they stay consistent with the writes they count. Reads go through
+a small process-local cache that is invalidated when a session touching a
+scope commits and otherwise expires after ``AGGREGATE_CACHE_TTL_SECONDS``.
+
+Every scope prefix registers a *source* function computing its counters
+from the underlying tables. Sources seed a scope the first time it is read
+and let ``check_counters`` detect and repair drift. Seeding runs in its own
+session and transaction, so reads never commit the caller's session.
+
+Seeding and increments of a scope are serialized on its ``_meta`` row: both
+lock it first, so an increment committed while a seed counts is neither
+dropped by the seed nor counted twice.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+
+from sqlalchemy import delete, event, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.models.aggregate import AggregateCounter
+
+logger = logging.getLogger(__name__)
+
+# Marker row of a scope: value 1 once seeded by ``replace_counters``, 0 while
+# it only serves as the scope's lock
+META_DIMENSION = "_meta"
+INITIALIZED_KEY = "initialized"
+SCOPE_SEPARATOR = ":"
+
+CounterKey = tuple[str, str]
+"""A ``(dimension, key)`` pair identifying one counter within a scope."""
+
+Counters = dict[str, dict[str, int]]
+"""Counters of one scope grouped by dimension: ``{dimension: {key: value}}``."""
+
+CounterSource = Callable[[Session, "int | None"], Mapping[str, Mapping[str, int]]]
+"""Computes the counters of a scope from scratch, given the scope's entity id."""
+
+_sources: dict[str, CounterSource] = {}
+
+
+@dataclass(frozen=True)
+class CounterMismatch:
+    """A stored counter that differs from the value computed from source."""
+
+    scope: str
+    dimension: str
+    key: str
+    stored: int
+    expected: int
+
+
+# ================================================================== #
+# Scopes and Sources                                                 #
+# ================================================================== #
+
+def counter_scope(prefix: str, entity_id: int | None = None) -> str:
+    """Return the scope name for ``prefix``, optionally bound to one entity.
+
+    Example:
+        >>> counter_scope("kitchen_devices", 3)
+        'kitchen_devices:3'
+    """
+    return prefix if entity_id is None else f"{prefix}{SCOPE_SEPARATOR}{entity_id}"
+
+
+def register_counter_source(prefix: str, source: CounterSource) -> None:
+    """Register the function computing counters for scopes with ``prefix``."""
+    _sources[prefix] = source
+
+
+def counter_key(value: object) -> str:
+    """Return the counter key for a column value (enum values, not reprs)."""
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+def counter_deltas(
+        removed: Iterable[CounterKey] = (),
+        added: Iterable[CounterKey] = (),
+) -> dict[CounterKey, int]:
+    """Return the deltas for replacing ``removed`` counter keys by ``added`` ones."""
+    deltas: dict[CounterKey, int] = defaultdict(int)
+    for key in removed:
+        deltas[key] -= 1
+    for key in added:
+        deltas[key] += 1
+    return deltas
+
+
+def _parse_scope(scope: str) -> tuple[str, int | None]:
+    prefix, _, entity_id = scope.partition(SCOPE_SEPARATOR)
+    return prefix, int(entity_id) if entity_id else None
+
+
+# ================================================================== #
+# Cache                                                              #
+# ================================================================== #
+
+class CounterCache:
+    """Thread-safe, TTL-bounded cache of counters per scope."""
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, Counters]] = {}
+
+    def get(self, scope: str) -> Counters | None:
+        """Return cached counters for ``scope`` unless missing or expired."""
+        with self._lock:
+            entry = self._entries.get(scope)
+            if entry is None or self._clock() - entry[0] > self.ttl:
+                return None
+            return _copy(entry[1])
+
+    def set(self, scope: str, counters: Counters) -> None:
+        """Cache ``counters`` for ``scope``."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[scope] = (self._clock(), _copy(counters))
+
+    def invalidate(self, scopes: Iterable[str] | None = None) -> None:
+        """Drop the given scopes, or everything if ``scopes`` is None."""
+        with self._lock:
+            if scopes is None:
+                self._entries.clear()
+                return
+            for scope in scopes:
+                self._entries.pop(scope, None)
+
+
+counter_cache = CounterCache(ttl=settings.AGGREGATE_CACHE_TTL_SECONDS)
+
+_DIRTY_SCOPES = "aggregate_dirty_scopes"
+
+
+def _mark_dirty(db: Session, scope: str) -> None:
+    db.info.setdefault(_DIRTY_SCOPES, set()).add(scope)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_scopes(session: Session) -> None:
+    scopes = session.info.pop(_DIRTY_SCOPES, None)
+    if scopes:
+        counter_cache.invalidate(scopes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_scopes(session: Session) -> None:
+    session.info.pop(_DIRTY_SCOPES, None)
+
+
+def _copy(counters: Mapping[str, Mapping[str, int]]) -> Counters:
+    return {dimension: dict(values) for dimension, values in counters.items()}
+
+
+# ================================================================== #
+# Writes                                                             #
+# ================================================================== #
+
+def increment_counters(db: Session, scope: str, deltas: Mapping[CounterKey, int]) -> None:
+    """Add ``deltas`` to the counters of ``scope`` - does not commit.
+
+    Args:
+        db: Database session.
+        scope: Counter scope, e.g. ``"ai_outputs"``.
+        deltas: Mapping of ``(dimension, key)`` to the amount to add.
+
+    Example:
+        >>> increment_counters(db, "ai_outputs", {("total", "all"): 1, ("by_user", "42"): 1})
+    """
+    if not any(deltas.values()):
+        return
+    lock_scope(db, scope)
+    now = datetime.now(timezone.utc)
+    dialect = db.get_bind().dialect.name
+
+    for (dimension, key), delta in deltas.items():
+        if not delta:
+            continue
+        _mark_dirty(db, scope)
+
+        if dialect in ("sqlite", "postgresql"):
+            insert_fn = sqlite_insert if dialect == "sqlite" else postgresql_insert
+            stmt = insert_fn(AggregateCounter).values(
+                scope=scope, dimension=dimension, key=key, value=delta, updated_at=now
+            )
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["scope", "dimension", "key"],
+                set_={"value": AggregateCounter.value + delta, "updated_at": now},
+            ))
+            continue
+
+        result = db.execute(
+            update(AggregateCounter)
+            .where(
+                AggregateCounter.scope == scope,
+                AggregateCounter.dimension == dimension,
+                AggregateCounter.key == key,
+            )
+            .values(value=AggregateCounter.value + delta, updated_at=now)
+        )
+        if result.rowcount == 0:
+            db.execute(insert(AggregateCounter).values(
+                scope=scope, dimension=dimension, key=key, value=delta, updated_at=now
+            ))
+
+
+def lock_scope(db: Session, scope: str) -> None:
+    """Lock the marker row of ``scope`` until the transaction ends - does not commit.
+
+    Creates the row (uninitialized) if needed. A no-op update of an existing
+    row takes the row lock in one statement.
+    """
+    now = datetime.now(timezone.utc)
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert_fn = sqlite_insert if dialect == "sqlite" else postgresql_insert
+        stmt = insert_fn(AggregateCounter).values(
+            scope=scope, dimension=META_DIMENSION, key=INITIALIZED_KEY, value=0, updated_at=now
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["scope", "dimension", "key"], set_={"value": AggregateCounter.value}
+        ))
+        return
+
+    locked = db.scalar(
+        select(AggregateCounter.value)
+        .where(
+            AggregateCounter.scope == scope,
+            AggregateCounter.dimension == META_DIMENSION,
+            AggregateCounter.key == INITIALIZED_KEY,
+        )
+        .with_for_update()
+    )
+    if locked is None:
+        db.execute(insert(AggregateCounter).values(
+            scope=scope, dimension=META_DIMENSION, key=INITIALIZED_KEY, value=0, updated_at=now
+        ))
+
+
+def replace_counters(db: Session, scope: str, counts: Mapping[str, Mapping[str, int]]) -> None:
+    """Replace all counters of ``scope`` and mark it as initialized - does not commit.
+
+    Args:
+        db: Database session.
+        scope: Counter scope.
+        counts: Mapping of dimension to ``{key: value}``.
+    """
+    now = datetime.now(timezone.utc)
+    reset_counters(db, scope)
+
+    rows = [
+        {"scope": scope, "dimension": dimension, "key": key, "value": value, "updated_at": now}
+        for dimension, values in counts.items()
+        for key, value in values.items()
+        if value
+    ]
+    rows.append({
+        "scope": scope, "dimension": META_DIMENSION, "key": INITIALIZED_KEY, "value": 1, "updated_at": now
+    })
+
+    # Seeds are serialized by ``lock_scope``; still never fail on existing rows
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert_fn = sqlite_insert if dialect == "sqlite" else postgresql_insert
+        db.execute(insert_fn(AggregateCounter).on_conflict_do_nothing(), rows)
+    else:
+        db.execute(insert(AggregateCounter), rows)
+
+
+def reset_counters(db: Session, scope: str) -> None:
+    """Delete all counters of ``scope`` - does not commit.
+
+    The scope is re-seeded from its source the next time it is read. Use
+    this when rows are removed in bulk (e.g. by cascades) rather than
+    computing individual deltas.
+    """
+    _mark_dirty(db, scope)
+    db.execute(delete(AggregateCounter).where(AggregateCounter.scope == scope))
+
+
+# ================================================================== #
+# Reads                                                              #
+# ================================================================== #
+
+def read_counters(db: Session, scope: str) -> Counters:
+    """Return the counters of ``scope``, seeding them on first use.
+
+    Served from the in-memory cache when possible; otherwise one indexed
+    read of ``aggregate_counters``. An uninitialized scope is computed from
+    its registered source and stored in a separate transaction. While the
+    caller's session has uncommitted counter writes, it is computed in that
+    session instead and nothing is stored.
+
+    Args:
+        db: Database session; never committed.
+        scope: Counter scope.
+
+    Returns:
+        Mapping of dimension to ``{key: value}`` (zero counters omitted).
+
+    Raises:
+        KeyError: If no source is registered for the scope's prefix.
+    """
+    cached = counter_cache.get(scope)
+    if cached is not None:
+        return cached
+
+    if is_initialized(db, scope):
+        counters = get_counters(db, scope)
+    elif db.info.get(_DIRTY_SCOPES):
+        # Seeding from another connection would miss (or wait for) these writes
+        return _compute_counters(db, scope)
+    else:
+        counters = _seed_counters(db, scope)
+
+    counter_cache.set(scope, counters)
+    return counters
+
+
+def _seed_counters(db: Session, scope: str) -> Counters:
+    """Store the source counters of ``scope`` in a session of its own."""
+    try:
+        with Session(db.get_bind()) as seed_db:
+            # Increments wait for the seed, and the seed for committing increments
+            lock_scope(seed_db, scope)
+            if not is_initialized(seed_db, scope):
+                prefix, entity_id = _parse_scope(scope)
+                replace_counters(seed_db, scope, _sources[prefix](seed_db, entity_id))
+                seed_db.commit()
+            else:
+                seed_db.rollback()
+            return get_counters(seed_db, scope)
+    except SQLAlchemyError:
+        # E.g. SQLite locked by another writer; seeding is retried on the next read
+        logger.warning("Could not seed aggregate counters of %s", scope, exc_info=True)
+        return _compute_counters(db, scope)
+
+
+def _compute_counters(db: Session, scope: str) -> Counters:
+    """Return the source counters of ``scope`` without storing them."""
+    prefix, entity_id = _parse_scope(scope)
+    counts = _sources[prefix](db, entity_id)
+    return {
+        dimension: {key: value for key, value in values.items() if value}
+        for dimension, values in counts.items()
+        if any(values.values())
+    }
+
+
+def is_initialized(db: Session, scope: str) -> bool:
+    """Return True once ``scope`` has been seeded by ``replace_counters``."""
+    return bool(db.scalar(
+        select(AggregateCounter.value).where(
+            AggregateCounter.scope == scope,
+            AggregateCounter.dimension == META_DIMENSION,
+            AggregateCounter.key == INITIALIZED_KEY,
+        )
+    ))
+
+
+def get_counters(db: Session, scope: str) -> Counters:
+    """Return all non-zero stored counters of ``scope``, bypassing the cache.
+
+    Args:
+        db: Database session.
+        scope: Counter scope.
+
+    Returns:
+        Mapping of dimension to ``{key: value}``.
+    """
+    rows = db.execute(
+        select(AggregateCounter.dimension, AggregateCounter.key, AggregateCounter.value)
+        .where(
+            AggregateCounter.scope == scope,
+            AggregateCounter.dimension != META_DIMENSION,
+            AggregateCounter.value != 0,
+        )
+    ).all()
+
+    counters: Counters = defaultdict(dict)
+    for dimension, key, value in rows:
+        counters[dimension][key] = value
+    return dict(counters)
+
+
+# ================================================================== #
+# Consistency Checking                                               #
+# ================================================================== #
+
+def check_counters(db: Session, *, repair: bool = False) -> list[CounterMismatch]:
+    """Compare every initialized scope with its source.
+
+    Args:
+        db: Database session.
+        repair: Rebuild drifted scopes from their source and commit.
+
+    Returns:
+        All mismatching counters found (before repair).
+    """
+    scopes = db.scalars(
+        select(AggregateCounter.scope)
+        .where(AggregateCounter.dimension == META_DIMENSION, AggregateCounter.value != 0)
+        .order_by(AggregateCounter.scope)
+    ).all()
+
+    mismatches: list[CounterMismatch] = []
+    for scope in scopes:
+        prefix, entity_id = _parse_scope(scope)
+        source = _sources.get(prefix)
+        if source is None:
+            continue
+
+        expected = source(db, entity_id)
+        stored = get_counters(db, scope)
+        found = [
+            CounterMismatch(
+                scope=scope,
+                dimension=dimension,
+                key=key,
+                stored=stored.get(dimension, {}).get(key, 0),
+                expected=expected.get(dimension, {}).get(key, 0),
+            )
+            for dimension in sorted(set(stored) | set(expected))
+            for key in sorted(set(stored.get(dimension, {})) | set(expected.get(dimension, {})))
+            if stored.get(dimension, {}).get(key, 0) != expected.get(dimension, {}).get(key, 0)
+        ]
+        mismatches.extend(found)
+
+        if repair and found:
+            replace_counters(db, scope, expected)
+
+    if repair:
+        db.commit()
+    return mismatches
+
+
+def reset_all_counters(db: Session) -> None:
+    """Delete every counter so all scopes are re-seeded on their next read - commits."""
+    db.execute(delete(AggregateCounter))
+    db.commit()
+    counter_cache.invalidate()
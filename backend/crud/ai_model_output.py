@@ -1,10 +1,20 @@
 """CRUD operations for AI-related functionality v2.0 - Schema Returns."""
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+import hashlib
+import json
+import zlib
+from collections import defaultdict
+from collections.abc import Iterator
 
+from sqlalchemy import Select, delete, func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from backend.core.config import settings
 from backend.core.enums import AIOutputTargetType
-from backend.models.ai_model_output import AIModelOutput, OutputFormat, OutputType
+from backend.core.pagination import Keyset, SortKey
+from backend.crud import aggregate as crud_aggregate
+from backend.models.ai_model_output import AIModelOutput, AIPrompt, OutputFormat, OutputType
 from backend.schemas.ai_model_output import (
     AIModelOutputCreate,
     AIModelOutputRead,
@@ -17,9 +27,68 @@ from backend.schemas.ai_model_output import (
 # Helper Functions for Schema Conversion                            #
 # ================================================================== #
 
+RAW_OUTPUT_ENCODING = "zlib"
+
+# Scope of the summary counters maintained in ``aggregate_counters``
+AI_OUTPUT_COUNTER_SCOPE = "ai_outputs"
+
+# Ordering of ``get_all_ai_outputs``: newest first
+AI_OUTPUT_KEYSET = Keyset(SortKey(AIModelOutput.created_at, descending=True), SortKey(AIModelOutput.id, descending=True))
+
+
+def encode_raw_output(raw_output: str) -> tuple[bytes, str]:
+    """Compress a raw AI output for storage.
+
+    Returns:
+        Tuple of (stored bytes, encoding name).
+    """
+    return zlib.compress(raw_output.encode("utf-8"), 6), RAW_OUTPUT_ENCODING
+
+
+def decode_raw_output(data: bytes, encoding: str) -> str:
+    """Decompress a stored raw AI output.
+
+    Raises:
+        ValueError: If the encoding is unknown.
+    """
+    if encoding == "zlib":
+        return zlib.decompress(data).decode("utf-8")
+    if encoding == "plain":
+        return data.decode("utf-8")
+    raise ValueError(f"Unknown raw output encoding: {encoding}")
+
+
+def compose_prompt_used(output_orm: AIModelOutput) -> str:
+    """Rebuild the ``prompt_used`` string exposed by the Read schema."""
+    user_prompt = output_orm.prompt.content
+    if output_orm.system_prompt is None:
+        return user_prompt
+    return json.dumps(
+        {
+            "system_prompt": output_orm.system_prompt.content,
+            "user_prompt": user_prompt,
+            "original_request": output_orm.prompt_params,
+        },
+        ensure_ascii=False,
+    )
+
+
 def build_ai_model_output_read(output_orm: AIModelOutput) -> AIModelOutputRead:
-    """Convert AIModelOutput ORM to Read schema."""
-    return AIModelOutputRead.model_validate(output_orm, from_attributes=True)
+    """Convert AIModelOutput ORM to Read schema, decompressing the stored output."""
+    return AIModelOutputRead(
+        id=output_orm.id,
+        user_id=output_orm.user_id,
+        model_version=output_orm.model_version,
+        output_type=output_orm.output_type,
+        output_format=output_orm.output_format,
+        prompt_used=compose_prompt_used(output_orm),
+        raw_output=decode_raw_output(output_orm.raw_output_data, output_orm.raw_output_encoding),
+        extra_data=output_orm.extra_data,
+        target_type=output_orm.target_type,
+        target_id=output_orm.target_id,
+        created_at=output_orm.created_at,
+        updated_at=output_orm.updated_at,
+    )
 
 
 # ================================================================== #
@@ -50,19 +119,31 @@ def create_ai_output(db: Session, output_data: AIModelOutputCreate) -> AIModelOu
         ... )
         >>> result = create_ai_output(db, data)
     """
+    prompt = get_or_create_prompt_orm(db, output_data.prompt_used)
+    system_prompt = (
+        get_or_create_prompt_orm(db, output_data.system_prompt)
+        if output_data.system_prompt
+        else None
+    )
+    raw_output_data, raw_output_encoding = encode_raw_output(output_data.raw_output)
+
     db_output = AIModelOutput(
         user_id=output_data.user_id,
         model_version=output_data.model_version,
         output_type=output_data.output_type,
         output_format=output_data.output_format,
-        prompt_used=output_data.prompt_used,
-        raw_output=output_data.raw_output,
+        prompt=prompt,
+        system_prompt=system_prompt,
+        prompt_params=output_data.prompt_params,
+        raw_output_data=raw_output_data,
+        raw_output_encoding=raw_output_encoding,
         extra_data=output_data.extra_data,
         target_type=output_data.target_type,
         target_id=output_data.target_id,
     )
 
     db.add(db_output)
+    _adjust_ai_output_counters(db, db_output, +1)
     db.commit()
     db.refresh(db_output)
 
@@ -123,15 +204,31 @@ def update_ai_output(
 
     # Update only fields that are provided (not None)
     update_data = output_data.model_dump(exclude_unset=True)
+    old_counter_keys = _ai_output_counter_keys(output_orm)
+
+    prompt_used = update_data.pop("prompt_used", None)
+    if prompt_used is not None:
+        output_orm.prompt = get_or_create_prompt_orm(db, prompt_used)
+
+    raw_output = update_data.pop("raw_output", None)
+    if raw_output is not None:
+        output_orm.raw_output_data, output_orm.raw_output_encoding = encode_raw_output(raw_output)
 
     for field, value in update_data.items():
         setattr(output_orm, field, value)
 
+    crud_aggregate.increment_counters(
+        db,
+        AI_OUTPUT_COUNTER_SCOPE,
+        crud_aggregate.counter_deltas(removed=old_counter_keys, added=_ai_output_counter_keys(output_orm)),
+    )
+
     db.commit()
     db.refresh(output_orm)
 
     return build_ai_model_output_read(output_orm)
 
+
 def delete_ai_output(db: Session, output_id: int) -> bool:
     """Delete an AI output by its ID.
 
@@ -152,7 +249,7 @@ def delete_ai_output(db: Session, output_id: int) -> bool:
     if output_orm is None:
         return False
 
-    db.delete(output_orm)
+    delete_ai_outputs_orm(db, [output_orm])
     db.commit()
     return True
 
@@ -161,19 +258,24 @@ def get_all_ai_outputs(
         db: Session,
         search_params: AIOutputSearchParams,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
 ) -> list[AIModelOutputRead]:
     """Retrieve all AI outputs with optional filtering and pagination - returns schemas.
 
     Args:
         db: Database session.
         search_params: Search and filter parameters.
-        skip: Number of records to skip for pagination.
+        skip: Number of records to skip for pagination (ignored when a cursor is given).
         limit: Maximum number of records to return.
+        cursor: Cursor of the previous page (see ``AI_OUTPUT_KEYSET``).
 
     Returns:
         A list of AI output schemas matching the criteria, ordered by creation time (newest first).
 
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+
     Example:
         >>> params = AIOutputSearchParams(
         ...     user_id=123,
@@ -183,9 +285,38 @@ def get_all_ai_outputs(
         ... )
         >>> outputs = get_all_ai_outputs(db, params, skip=1, limit=5)
     """
-    query = select(AIModelOutput)
+    query = _filter_ai_outputs(select(AIModelOutput), search_params)
+
+    # Order by creation time (newest first) and apply pagination
+    query = AI_OUTPUT_KEYSET.paginate(query, cursor=cursor, skip=skip, limit=limit)
+
+    outputs_list = db.scalars(query).all()
+    return [build_ai_model_output_read(output) for output in outputs_list]
+
+
+def iter_ai_outputs(
+        db: Session,
+        search_params: AIOutputSearchParams,
+        batch_size: int | None = None
+) -> Iterator[AIModelOutputRead]:
+    """Yield all AI outputs matching ``search_params``, newest first.
+
+    Outputs and their prompts are loaded ``batch_size`` at a time, so memory
+    is bounded by one batch however many outputs match. Used by the
+    streaming export.
+    """
+    query = (
+        _filter_ai_outputs(select(AIModelOutput), search_params)
+        .options(selectinload(AIModelOutput.prompt), selectinload(AIModelOutput.system_prompt))
+        .order_by(*AI_OUTPUT_KEYSET.order_by())
+        .execution_options(yield_per=batch_size or settings.EXPORT_BATCH_SIZE)
+    )
+    for output in db.scalars(query):
+        yield build_ai_model_output_read(output)
+
 
-    # Apply filters
+def _filter_ai_outputs(query: Select, search_params: AIOutputSearchParams) -> Select:
+    """Apply the filters of ``search_params`` to a query over AI outputs."""
     if search_params.user_id:
         query = query.where(AIModelOutput.user_id == search_params.user_id)
 
@@ -205,18 +336,27 @@ def get_all_ai_outputs(
         query = query.where(AIModelOutput.target_id == search_params.target_id)
 
     if search_params.prompt_contains:
-        query = query.where(AIModelOutput.prompt_used.ilike(f"%{search_params.prompt_contains}%"))
-
-    # Order by creation time (newest first) and apply pagination
-    query = query.order_by(AIModelOutput.created_at.desc()).offset(skip).limit(limit)
+        # Search the deduplicated prompt table instead of every output row
+        matching_prompts = select(AIPrompt.id).where(
+            AIPrompt.content.ilike(f"%{search_params.prompt_contains}%")
+        )
+        query = query.where(
+            or_(
+                AIModelOutput.prompt_id.in_(matching_prompts),
+                AIModelOutput.system_prompt_id.in_(matching_prompts),
+            )
+        )
 
-    outputs_list = db.scalars(query).all()
-    return [build_ai_model_output_read(output) for output in outputs_list]
+    return query
 
 
 def get_ai_output_summary(db: Session) -> AIOutputSummary:
     """Get summary statistics for all AI outputs.
 
+    Reads the counters in ``aggregate_counters`` that are kept up to date by
+    every write, so the cost does not grow with the table. The counters are
+    seeded by ``compute_ai_output_counts`` the first time they are read.
+
     Args:
         db: Database session.
 
@@ -228,52 +368,49 @@ def get_ai_output_summary(db: Session) -> AIOutputSummary:
         >>> print(f"Total: {summary.total_outputs}")
         >>> print(f"Recipe outputs: {summary.outputs_by_target_type.get('Recipe', 0)}")
     """
-    # Total count
-    total_outputs = db.scalar(select(func.count(AIModelOutput.id))) or 0
+    counters = crud_aggregate.read_counters(db, AI_OUTPUT_COUNTER_SCOPE)
 
-    # Count by user
-    user_counts = db.execute(
-        select(AIModelOutput.user_id, func.count(AIModelOutput.id))
-        .group_by(AIModelOutput.user_id)
-    ).all()
-    outputs_by_user = {str(user_id): count for user_id, count in user_counts}
+    return AIOutputSummary(
+        total_outputs=counters.get("total", {}).get("all", 0),
+        outputs_by_user=counters.get("by_user", {}),
+        outputs_by_model=counters.get("by_model", {}),
+        outputs_by_type=counters.get("by_type", {}),
+        outputs_by_format=counters.get("by_format", {}),
+        outputs_by_target_type=counters.get("by_target_type", {}),
+    )
 
-    # Count by model version
-    model_counts = db.execute(
-        select(AIModelOutput.model_version, func.count(AIModelOutput.id))
-        .group_by(AIModelOutput.model_version)
-    ).all()
-    outputs_by_model = {str(model or "unknown"): count for model, count in model_counts}
 
-    # Count by output type
-    type_counts = db.execute(
-        select(AIModelOutput.output_type, func.count(AIModelOutput.id))
-        .group_by(AIModelOutput.output_type)
-    ).all()
-    outputs_by_type = {str(output_type): count for output_type, count in type_counts}
+def compute_ai_output_counts(db: Session) -> dict[str, dict[str, int]]:
+    """Count AI outputs per summary dimension with a single grouped scan.
 
-    # Count by output format
-    format_counts = db.execute(
-        select(AIModelOutput.output_format, func.count(AIModelOutput.id))
-        .group_by(AIModelOutput.output_format)
-    ).all()
-    outputs_by_format = {str(output_format or "unknown"): count for output_format, count in format_counts}
+    This is the source of truth the incremental counters are checked and
+    rebuilt against.
 
-    # Count by target type
-    target_type_counts = db.execute(
-        select(AIModelOutput.target_type, func.count(AIModelOutput.id))
-        .group_by(AIModelOutput.target_type)
+    Returns:
+        Mapping of counter dimension to ``{key: count}``.
+    """
+    rows = db.execute(
+        select(
+            AIModelOutput.user_id,
+            AIModelOutput.model_version,
+            AIModelOutput.output_type,
+            AIModelOutput.output_format,
+            AIModelOutput.target_type,
+            func.count(AIModelOutput.id),
+        ).group_by(
+            AIModelOutput.user_id,
+            AIModelOutput.model_version,
+            AIModelOutput.output_type,
+            AIModelOutput.output_format,
+            AIModelOutput.target_type,
+        )
     ).all()
-    outputs_by_target_type = {str(target_type): count for target_type, count in target_type_counts}
 
-    return AIOutputSummary(
-        total_outputs=total_outputs,
-        outputs_by_user=outputs_by_user,
-        outputs_by_model=outputs_by_model,
-        outputs_by_type=outputs_by_type,
-        outputs_by_format=outputs_by_format,
-        outputs_by_target_type=outputs_by_target_type,
-    )
+    counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for user_id, model_version, output_type, output_format, target_type, count in rows:
+        for dimension, key in _counter_keys(user_id, model_version, output_type, output_format, target_type):
+            counts[dimension][key] += count
+    return {dimension: dict(values) for dimension, values in counts.items()}
 
 
 def get_ai_outputs_by_target(
@@ -323,3 +460,93 @@ def get_ai_outputs_by_target(
 def get_ai_output_orm_by_id(db: Session, output_id: int) -> AIModelOutput | None:
     """Get AIModelOutput ORM object by ID - for internal use."""
     return db.scalar(select(AIModelOutput).where(AIModelOutput.id == output_id))
+
+
+def delete_ai_outputs_orm(db: Session, outputs: list[AIModelOutput]) -> None:
+    """Delete AIModelOutput ORM objects and adjust the counters - does not commit."""
+    removed: list[crud_aggregate.CounterKey] = []
+    for output_orm in outputs:
+        removed.extend(_ai_output_counter_keys(output_orm))
+        db.delete(output_orm)
+    crud_aggregate.increment_counters(
+        db, AI_OUTPUT_COUNTER_SCOPE, crud_aggregate.counter_deltas(removed=removed)
+    )
+
+
+def delete_orphan_prompts(db: Session) -> int:
+    """Delete prompts no longer referenced by any output - does not commit.
+
+    Returns:
+        Number of deleted prompts.
+    """
+    result = db.execute(
+        delete(AIPrompt)
+        .where(
+            AIPrompt.id.not_in(select(AIModelOutput.prompt_id)),
+            AIPrompt.id.not_in(
+                select(AIModelOutput.system_prompt_id).where(AIModelOutput.system_prompt_id.is_not(None))
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def get_or_create_prompt_orm(db: Session, content: str) -> AIPrompt:
+    """Return the AIPrompt row for ``content``, creating it if needed - for internal use.
+
+    Prompts are addressed by the SHA-256 of their text, so identical prompts
+    share a single row. The new row is flushed but not committed.
+    """
+    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    prompt = db.scalar(select(AIPrompt).where(AIPrompt.content_hash == content_hash))
+    if prompt is not None:
+        return prompt
+
+    try:
+        with db.begin_nested():
+            prompt = AIPrompt(content_hash=content_hash, content=content)
+            db.add(prompt)
+    except IntegrityError:
+        # Another request stored the same prompt concurrently
+        prompt = db.scalar(select(AIPrompt).where(AIPrompt.content_hash == content_hash))
+    return prompt
+
+
+def _counter_keys(
+        user_id: int,
+        model_version: str | None,
+        output_type: OutputType | str,
+        output_format: OutputFormat | str | None,
+        target_type: str,
+) -> list[crud_aggregate.CounterKey]:
+    """Return the ``(dimension, key)`` counters one output contributes to."""
+    return [
+        ("total", "all"),
+        ("by_user", str(user_id)),
+        ("by_model", str(model_version or "unknown")),
+        ("by_type", crud_aggregate.counter_key(output_type)),
+        ("by_format", crud_aggregate.counter_key(output_format or "unknown")),
+        ("by_target_type", crud_aggregate.counter_key(target_type)),
+    ]
+
+
+def _ai_output_counter_keys(output_orm: AIModelOutput) -> list[crud_aggregate.CounterKey]:
+    return _counter_keys(
+        output_orm.user_id,
+        output_orm.model_version,
+        output_orm.output_type,
+        output_orm.output_format,
+        output_orm.target_type,
+    )
+
+
+def _adjust_ai_output_counters(db: Session, output_orm: AIModelOutput, delta: int) -> None:
+    crud_aggregate.increment_counters(
+        db, AI_OUTPUT_COUNTER_SCOPE, {key: delta for key in _ai_output_counter_keys(output_orm)}
+    )
+
+
+crud_aggregate.register_counter_source(
+    AI_OUTPUT_COUNTER_SCOPE, lambda db, _entity_id: compute_ai_output_counts(db)
+)
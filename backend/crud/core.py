@@ -7,6 +7,7 @@ from typing import List
 from sqlalchemy import select, ColumnElement
 from sqlalchemy.orm import Session, selectinload
 
+from backend.core.cache import reference_cache
 from backend.core.enums import UnitType
 from backend.models.core import Unit, UnitConversion
 from backend.schemas.core import (
@@ -20,6 +21,12 @@ from backend.schemas.core import (
     UnitWithConversions
 )
 
+# Cache namespace of all unit and unit conversion reads
+UNIT_CACHE_NAMESPACE = "units"
+
+reference_cache.watch(Unit, UNIT_CACHE_NAMESPACE)
+reference_cache.watch(UnitConversion, UNIT_CACHE_NAMESPACE)
+
 
 # ================================================================== #
 # Schema Conversion Helpers                                          #
@@ -79,6 +86,7 @@ def create_unit(db: Session, unit_data: UnitCreate) -> UnitRead:
     return build_unit_read(db_unit)
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_unit_by_id(db: Session, unit_id: int) -> UnitRead | None:
     """Get unit by ID - returns schema.
     
@@ -99,6 +107,7 @@ def get_unit_by_id(db: Session, unit_id: int) -> UnitRead | None:
     return build_unit_read(unit_orm)
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_unit_by_name(db: Session, unit_name: str) -> UnitRead | None:
     """Get unit by name - returns schema.
     
@@ -119,6 +128,7 @@ def get_unit_by_name(db: Session, unit_name: str) -> UnitRead | None:
     return build_unit_read(unit_orm)
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_all_units(
         db: Session,
         unit_type: UnitType | None = None
@@ -142,6 +152,7 @@ def get_all_units(
     return [build_unit_read(unit) for unit in units_orm]
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_units_by_type(db: Session, unit_type: UnitType) -> list[UnitRead]:
     """Get all units of a specific type - returns schemas.
     
@@ -288,6 +299,7 @@ def create_unit_conversion(
     return build_unit_conversion_read(db_conversion)
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_unit_conversion(
         db: Session,
         from_unit_id: int,
@@ -322,6 +334,7 @@ def get_unit_conversion(
 
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_conversion_factor(
     db: Session,
     from_unit_id: int,
@@ -379,6 +392,7 @@ def get_conversion_factor(
         return None
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_conversions_from_unit(db: Session, unit_id: int) -> list[UnitConversionRead]:
     """Get all conversions from a specific unit - returns schemas.
     
@@ -402,6 +416,7 @@ def get_conversions_from_unit(db: Session, unit_id: int) -> list[UnitConversionR
     return [build_unit_conversion_read(conv) for conv in conversions_orm]
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_conversions_to_unit(db: Session, unit_id: int) -> list[UnitConversionRead]:
     """Get all conversions to a specific unit - returns schemas.
     
@@ -425,6 +440,7 @@ def get_conversions_to_unit(db: Session, unit_id: int) -> list[UnitConversionRea
     return [build_unit_conversion_read(conv) for conv in conversions_orm]
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_all_unit_conversions(db: Session) -> list[UnitConversionRead]:
     """Get all unit conversions - returns schemas.
     
@@ -566,6 +582,7 @@ def can_convert_units(
     return get_conversion_factor(db, from_unit_id, to_unit_id) is not None
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_unit_with_conversions(db: Session, unit_id: int) -> UnitWithConversions | None:
     """Get unit with all its available conversions - returns schema.
     
@@ -623,6 +640,7 @@ def create_conversion_result(
     )
 
 
+@reference_cache.cached(UNIT_CACHE_NAMESPACE)
 def get_compatible_units_for_base_unit(db: Session, base_unit_id: int) -> List[UnitRead]:
     """
     Get all units that are compatible with the given base unit.
@@ -5,6 +5,8 @@ from __future__ import annotations
 from sqlalchemy import select, and_, func
 from sqlalchemy.orm import Session, selectinload
 
+from backend.core.cache import reference_cache
+from backend.crud import aggregate as crud_aggregate
 from backend.models.device import DeviceType, Appliance, KitchenTool
 from backend.models.kitchen import Kitchen
 from backend.schemas.device import (
@@ -15,6 +17,15 @@ from backend.schemas.device import (
 )
 
 
+# Counters in ``aggregate_counters`` are kept per kitchen under this prefix
+KITCHEN_DEVICE_COUNTER_PREFIX = "kitchen_devices"
+
+# Cache namespace of device type reads
+DEVICE_TYPE_CACHE_NAMESPACE = "device_types"
+
+reference_cache.watch(DeviceType, DEVICE_TYPE_CACHE_NAMESPACE)
+
+
 # ================================================================== #
 # Helper Functions for Schema Conversion                            #
 # ================================================================== #
@@ -89,6 +100,7 @@ def create_device_type(db: Session, device_type_data: DeviceTypeCreate) -> Devic
     return build_device_type_read(device_type_orm)
 
 
+@reference_cache.cached(DEVICE_TYPE_CACHE_NAMESPACE)
 def get_device_type_by_id(db: Session, device_type_id: int) -> DeviceTypeRead | None:
     """Get device type by ID - returns schema."""
     device_type_orm = db.scalar(
@@ -101,6 +113,7 @@ def get_device_type_by_id(db: Session, device_type_id: int) -> DeviceTypeRead |
     return build_device_type_read(device_type_orm)
 
 
+@reference_cache.cached(DEVICE_TYPE_CACHE_NAMESPACE)
 def get_device_type_by_name(db: Session, name: str) -> DeviceTypeRead | None:
     """Get device type by name - returns schema."""
     device_type_orm = db.scalar(
@@ -113,6 +126,7 @@ def get_device_type_by_name(db: Session, name: str) -> DeviceTypeRead | None:
     return build_device_type_read(device_type_orm)
 
 
+@reference_cache.cached(DEVICE_TYPE_CACHE_NAMESPACE)
 def get_all_device_types(db: Session) -> list[DeviceTypeRead]:
     """Get all device types - returns schemas."""
     device_types = db.scalars(
@@ -122,6 +136,7 @@ def get_all_device_types(db: Session) -> list[DeviceTypeRead]:
     return [build_device_type_read(dt) for dt in device_types]
 
 
+@reference_cache.cached(DEVICE_TYPE_CACHE_NAMESPACE)
 def get_device_types_by_category(db: Session, category: str) -> list[DeviceTypeRead]:
     """Get device types by category - returns schemas."""
     device_types = db.scalars(
@@ -219,6 +234,8 @@ def create_appliance(
         **appliance_data.model_dump()
     )
     db.add(appliance_orm)
+    db.flush()
+    _adjust_device_counters(db, kitchen_id, added=_appliance_counter_keys(appliance_orm))
     db.commit()
     db.refresh(appliance_orm)
 
@@ -304,11 +321,16 @@ def update_appliance(
     if not appliance_orm:
         return None
 
+    old_counter_keys = _appliance_counter_keys(appliance_orm)
+
     # Apply updates
     update_data = appliance_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(appliance_orm, field, value)
 
+    _adjust_device_counters(
+        db, appliance_orm.kitchen_id, removed=old_counter_keys, added=_appliance_counter_keys(appliance_orm)
+    )
     db.commit()
     db.refresh(appliance_orm)
 
@@ -324,6 +346,7 @@ def delete_appliance(db: Session, appliance_id: int) -> bool:
     if not appliance_orm:
         return False
 
+    _adjust_device_counters(db, appliance_orm.kitchen_id, removed=_appliance_counter_keys(appliance_orm))
     db.delete(appliance_orm)
     db.commit()
 
@@ -355,6 +378,8 @@ def create_kitchen_tool(
         **tool_data.model_dump()
     )
     db.add(tool_orm)
+    db.flush()
+    _adjust_device_counters(db, kitchen_id, added=_tool_counter_keys(tool_orm))
     db.commit()
     db.refresh(tool_orm)
 
@@ -428,11 +453,16 @@ def update_kitchen_tool(
     if not tool_orm:
         return None
 
+    old_counter_keys = _tool_counter_keys(tool_orm)
+
     # Apply updates
     update_data = tool_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(tool_orm, field, value)
 
+    _adjust_device_counters(
+        db, tool_orm.kitchen_id, removed=old_counter_keys, added=_tool_counter_keys(tool_orm)
+    )
     db.commit()
     db.refresh(tool_orm)
 
@@ -448,6 +478,7 @@ def delete_kitchen_tool(db: Session, tool_id: int) -> bool:
     if not tool_orm:
         return False
 
+    _adjust_device_counters(db, tool_orm.kitchen_id, removed=_tool_counter_keys(tool_orm))
     db.delete(tool_orm)
     db.commit()
 
@@ -459,57 +490,89 @@ def delete_kitchen_tool(db: Session, tool_id: int) -> bool:
 # ================================================================== #
 
 def get_kitchen_device_summary(db: Session, kitchen_id: int) -> KitchenDeviceSummary:
-    """Get device summary for a kitchen - returns schema."""
-    # Count appliances using func.count() for better performance
-    total_appliances = db.scalar(
-        select(func.count(Appliance.id)).where(Appliance.kitchen_id == kitchen_id)
-    ) or 0
-
-    available_appliances = db.scalar(
-        select(func.count(Appliance.id)).where(
-            and_(Appliance.kitchen_id == kitchen_id, Appliance.available == True)
-        )
-    ) or 0
+    """Get device summary for a kitchen from the maintained counters - returns schema."""
+    counters = crud_aggregate.read_counters(db, _device_scope(kitchen_id))
+    appliances = counters.get("appliances", {})
+    tools = counters.get("tools", {})
 
-    smart_appliances = db.scalar(
-        select(func.count(Appliance.id)).where(
-            and_(Appliance.kitchen_id == kitchen_id, Appliance.smart == True)
-        )
-    ) or 0
+    return KitchenDeviceSummary(
+        kitchen_id=kitchen_id,
+        total_appliances=appliances.get("total", 0),
+        total_tools=tools.get("total", 0),
+        available_appliances=appliances.get("available", 0),
+        available_tools=tools.get("available", 0),
+        smart_appliances=appliances.get("smart", 0),
+        device_types_used=len(counters.get("device_types", {}))
+    )
 
-    # Count tools
-    total_tools = db.scalar(
-        select(func.count(KitchenTool.id)).where(KitchenTool.kitchen_id == kitchen_id)
-    ) or 0
 
-    available_tools = db.scalar(
-        select(func.count(KitchenTool.id)).where(
-            and_(KitchenTool.kitchen_id == kitchen_id, KitchenTool.available == True)
-        )
-    ) or 0
+def compute_kitchen_device_counts(db: Session, kitchen_id: int) -> dict[str, dict[str, int]]:
+    """Count the devices of one kitchen per summary dimension."""
+    counts: dict[str, dict[str, int]] = {}
 
-    # Get unique device types used - properly convert to lists
-    appliance_device_types = list(db.scalars(
-        select(Appliance.device_type_id).where(Appliance.kitchen_id == kitchen_id)
-    ).all())
+    def add(keys: list[crud_aggregate.CounterKey], count: int) -> None:
+        for dimension, key in keys:
+            values = counts.setdefault(dimension, {})
+            values[key] = values.get(key, 0) + count
 
-    tool_device_types = list(db.scalars(
-        select(KitchenTool.device_type_id).where(KitchenTool.kitchen_id == kitchen_id)
-    ).all())
+    appliance_rows = db.execute(
+        select(Appliance.available, Appliance.smart, Appliance.device_type_id, func.count(Appliance.id))
+        .where(Appliance.kitchen_id == kitchen_id)
+        .group_by(Appliance.available, Appliance.smart, Appliance.device_type_id)
+    ).all()
+    for available, smart, device_type_id, count in appliance_rows:
+        add(_device_counter_keys("appliances", available, device_type_id, smart=smart), count)
 
-    device_types_used = len(set(appliance_device_types + tool_device_types))
+    tool_rows = db.execute(
+        select(KitchenTool.available, KitchenTool.device_type_id, func.count(KitchenTool.id))
+        .where(KitchenTool.kitchen_id == kitchen_id)
+        .group_by(KitchenTool.available, KitchenTool.device_type_id)
+    ).all()
+    for available, device_type_id, count in tool_rows:
+        add(_device_counter_keys("tools", available, device_type_id), count)
 
-    return KitchenDeviceSummary(
-        kitchen_id=kitchen_id,
-        total_appliances=total_appliances,
-        total_tools=total_tools,
-        available_appliances=available_appliances,
-        available_tools=available_tools,
-        smart_appliances=smart_appliances,
-        device_types_used=device_types_used
+    return counts
+
+
+def _device_scope(kitchen_id: int) -> str:
+    return crud_aggregate.counter_scope(KITCHEN_DEVICE_COUNTER_PREFIX, kitchen_id)
+
+
+def _device_counter_keys(
+        kind: str, available: bool, device_type_id: int, smart: bool = False
+) -> list[crud_aggregate.CounterKey]:
+    keys = [(kind, "total"), ("device_types", str(device_type_id))]
+    if available:
+        keys.append((kind, "available"))
+    if smart:
+        keys.append((kind, "smart"))
+    return keys
+
+
+def _appliance_counter_keys(appliance_orm: Appliance) -> list[crud_aggregate.CounterKey]:
+    return _device_counter_keys(
+        "appliances", appliance_orm.available, appliance_orm.device_type_id, smart=appliance_orm.smart
+    )
+
+
+def _tool_counter_keys(tool_orm: KitchenTool) -> list[crud_aggregate.CounterKey]:
+    return _device_counter_keys("tools", tool_orm.available, tool_orm.device_type_id)
+
+
+def _adjust_device_counters(
+        db: Session,
+        kitchen_id: int,
+        removed: list[crud_aggregate.CounterKey] | None = None,
+        added: list[crud_aggregate.CounterKey] | None = None,
+) -> None:
+    crud_aggregate.increment_counters(
+        db, _device_scope(kitchen_id), crud_aggregate.counter_deltas(removed or [], added or [])
     )
 
 
+crud_aggregate.register_counter_source(KITCHEN_DEVICE_COUNTER_PREFIX, compute_kitchen_device_counts)
+
+
 # ================================================================== #
 # ORM-based Functions (for internal use when ORM objects needed)     #
 # ================================================================== #
@@ -2,18 +2,39 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
+
 from sqlalchemy import and_, select
 from sqlalchemy.orm import Session, selectinload
 
+from backend.core.cache import reference_cache
+from backend.core.pagination import Keyset, SortKey
+from backend.core.serialization import ColumnProjection, RowLayout
 from backend.crud.core import get_conversion_factor
+from backend.models.core import Unit
 from backend.models.food import FoodItem, FoodItemUnitConversion, FoodItemAlias
 from backend.models.inventory import InventoryItem
+from backend.schemas.core import UnitRead
 from backend.schemas.food import (
     FoodItemCreate, FoodItemRead, FoodItemUpdate,
     FoodItemUnitConversionCreate, FoodItemUnitConversionRead,
     FoodItemAliasCreate, FoodItemAliasRead
 )
 
+# Ordering of ``get_all_food_items``; uncategorised items come last
+FOOD_ITEM_KEYSET = Keyset(SortKey(FoodItem.category), SortKey(FoodItem.name), SortKey(FoodItem.id))
+
+# Cache namespace of food catalogue reads; they embed the base unit
+FOOD_ITEM_CACHE_NAMESPACE = "food_items"
+
+reference_cache.watch(FoodItem, FOOD_ITEM_CACHE_NAMESPACE)
+reference_cache.watch(Unit, FOOD_ITEM_CACHE_NAMESPACE)
+
+# Food item list rows: food item columns followed by its base unit's
+_FOOD_COLUMNS = ColumnProjection(FoodItemRead, FoodItem.__table__)
+_UNIT_COLUMNS = ColumnProjection(UnitRead, Unit.__table__)
+_FOOD_ROW = RowLayout(_FOOD_COLUMNS, _UNIT_COLUMNS)
+
 
 # ================================================================== #
 # Helper Functions for Schema Conversion                            #
@@ -92,6 +113,7 @@ def create_food_item(db: Session, food_item_data: FoodItemCreate) -> FoodItemRea
     return build_food_item_read(db_food_item)
 
 
+@reference_cache.cached(FOOD_ITEM_CACHE_NAMESPACE)
 def get_food_item_by_id(db: Session, food_item_id: int) -> FoodItemRead | None:
     """Get food item by ID - returns schema.
 
@@ -136,37 +158,45 @@ def get_food_item_by_name(db: Session, food_item_name: str) -> FoodItemRead | No
     return build_food_item_read(food_orm)
 
 
+@reference_cache.cached(FOOD_ITEM_CACHE_NAMESPACE)
 def get_all_food_items(
         db: Session,
         category: str | None = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
 ) -> list[FoodItemRead]:
     """Get all food items with optional filtering - returns schemas.
 
     Args:
         db: Database session
         category: Optional category filter
-        skip: Number of items to skip
+        skip: Number of items to skip (ignored when a cursor is given)
         limit: Maximum number of items to return
+        cursor: Cursor of the previous page (see ``FOOD_ITEM_KEYSET``)
 
     Returns:
         List of food item schemas
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
     """
-    query = (
-        select(FoodItem)
-        .options(selectinload(FoodItem.base_unit))
-        .order_by(FoodItem.category, FoodItem.name)
-        .offset(skip)
-        .limit(limit)
-    )
+    # Plain column rows; the few distinct base units are built once
+    query = select(*_FOOD_ROW.columns).join(Unit, Unit.id == FoodItem.base_unit_id)
 
     if category:
         query = query.where(FoodItem.category == category.strip().title())
 
-    food_orms = db.scalars(query).all()
-
-    return [build_food_item_read(food) for food in food_orms]
+    query = FOOD_ITEM_KEYSET.paginate(query, cursor=cursor, skip=skip, limit=limit)
+    unit_index = _FOOD_ROW.index(_UNIT_COLUMNS, "id")
+    units: dict[int, UnitRead] = {}
+    food_items = []
+    for row in db.execute(query):
+        unit = units.get(row[unit_index])
+        if unit is None:
+            unit = units[row[unit_index]] = _FOOD_ROW.build(row, _UNIT_COLUMNS)
+        food_items.append(_FOOD_ROW.build(row, _FOOD_COLUMNS, base_unit=unit))
+    return food_items
 
 
 def get_food_items_by_category(db: Session, category: str) -> list[FoodItemRead]:
@@ -625,6 +655,43 @@ def get_conversions_for_food_item(
     return [build_food_item_unit_conversion_read(conv) for conv in conversion_orms]
 
 
+def get_conversions_for_food_items(
+        db: Session,
+        food_item_ids: Collection[int]
+) -> dict[int, list[FoodItemUnitConversionRead]]:
+    """Get the unit conversions of several food items at once - returns schemas.
+
+    Batched form of ``get_conversions_for_food_item`` for callers that would
+    otherwise query once per item.
+
+    Args:
+        db: Database session
+        food_item_ids: Food item IDs
+
+    Returns:
+        Conversion schemas per food item ID; every requested ID is present
+    """
+    conversions: dict[int, list[FoodItemUnitConversionRead]] = {food_item_id: [] for food_item_id in food_item_ids}
+    if not conversions:
+        return conversions
+
+    conversion_orms = db.scalars(
+        select(FoodItemUnitConversion)
+        .options(
+            selectinload(FoodItemUnitConversion.food_item),
+            selectinload(FoodItemUnitConversion.from_unit),
+            selectinload(FoodItemUnitConversion.to_unit)
+        )
+        .where(FoodItemUnitConversion.food_item_id.in_(conversions))
+        .where(FoodItemUnitConversion.from_unit_id != FoodItemUnitConversion.to_unit_id)
+        .order_by(FoodItemUnitConversion.from_unit_id, FoodItemUnitConversion.to_unit_id)
+    ).all()
+
+    for conv in conversion_orms:
+        conversions[conv.food_item_id].append(build_food_item_unit_conversion_read(conv))
+    return conversions
+
+
 def delete_food_unit_conversion(
         db: Session,
         food_item_id: int,
@@ -4,19 +4,27 @@ from __future__ import annotations
 
 import datetime
 
-from sqlalchemy import and_, select
+from collections.abc import Iterator, Sequence
+
+from sqlalchemy import Row, Select, and_, func, select
 from sqlalchemy.orm import Session, selectinload
 
+from backend.core.config import settings
+from backend.core.serialization import ColumnProjection, RowLayout, construct_from_orm
+from backend.models.core import Unit
 from backend.models.food import FoodItem
 from backend.models.inventory import (
     EXPIRING_ITEMS_THRESHOLD_DAYS,
     InventoryItem,
     StorageLocation
 )
+from backend.schemas.core import UnitRead
+from backend.schemas.food import FoodItemRead
 from backend.schemas.inventory import (
     InventoryItemCreate,
     InventoryItemRead,
     InventoryItemUpdate,
+    KitchenInventoryStats,
     StorageLocationCreate,
     StorageLocationRead,
     StorageLocationUpdate
@@ -32,7 +40,7 @@ def build_inventory_item_read(item_orm: InventoryItem) -> InventoryItemRead:
     Returns:
         InventoryItemRead schema
     """
-    return InventoryItemRead.model_validate(item_orm, from_attributes=True)
+    return construct_from_orm(InventoryItemRead, item_orm)
 
 
 def build_storage_location_read(location_orm: StorageLocation) -> StorageLocationRead:
@@ -44,7 +52,55 @@ def build_storage_location_read(location_orm: StorageLocation) -> StorageLocatio
     Returns:
         StorageLocationRead schema
     """
-    return StorageLocationRead.model_validate(location_orm, from_attributes=True)
+    return construct_from_orm(StorageLocationRead, location_orm)
+
+
+_ITEM_COLUMNS = ColumnProjection(InventoryItemRead, InventoryItem.__table__)
+_FOOD_COLUMNS = ColumnProjection(FoodItemRead, FoodItem.__table__)
+_UNIT_COLUMNS = ColumnProjection(UnitRead, Unit.__table__)
+_LOCATION_COLUMNS = ColumnProjection(StorageLocationRead, StorageLocation.__table__)
+_INVENTORY_ROW = RowLayout(_ITEM_COLUMNS, _FOOD_COLUMNS, _UNIT_COLUMNS, _LOCATION_COLUMNS)
+
+
+def _select_inventory_reads() -> Select:
+    """Select the columns of inventory items joined with their food item, unit and location.
+
+    List reads use plain column rows instead of ORM entities with eager loads;
+    see ``_build_inventory_reads``.
+    """
+    return (
+        select(*_INVENTORY_ROW.columns)
+        .join(FoodItem, FoodItem.id == InventoryItem.food_item_id)
+        .join(Unit, Unit.id == FoodItem.base_unit_id)
+        .join(StorageLocation, StorageLocation.id == InventoryItem.storage_location_id)
+    )
+
+
+def _build_inventory_reads(rows: Sequence[Row]) -> list[InventoryItemRead]:
+    """Build inventory item schemas from rows of ``_select_inventory_reads``.
+
+    Food items, units and locations shared by several rows are built once.
+    """
+    units: dict[int, UnitRead] = {}
+    foods: dict[int, FoodItemRead] = {}
+    locations: dict[int, StorageLocationRead] = {}
+    food_index = _INVENTORY_ROW.index(_FOOD_COLUMNS, "id")
+    unit_index = _INVENTORY_ROW.index(_UNIT_COLUMNS, "id")
+    location_index = _INVENTORY_ROW.index(_LOCATION_COLUMNS, "id")
+
+    items = []
+    for row in rows:
+        unit = units.get(row[unit_index])
+        if unit is None:
+            unit = units[row[unit_index]] = _INVENTORY_ROW.build(row, _UNIT_COLUMNS)
+        food = foods.get(row[food_index])
+        if food is None:
+            food = foods[row[food_index]] = _INVENTORY_ROW.build(row, _FOOD_COLUMNS, base_unit=unit)
+        location = locations.get(row[location_index])
+        if location is None:
+            location = locations[row[location_index]] = _INVENTORY_ROW.build(row, _LOCATION_COLUMNS)
+        items.append(_INVENTORY_ROW.build(row, _ITEM_COLUMNS, food_item=food, storage_location=location))
+    return items
 
 
 # ================================================================== #
@@ -299,14 +355,39 @@ def get_kitchen_inventory(db: Session, kitchen_id: int) -> list[InventoryItemRea
     Returns:
         List of inventory item schemas with computed properties
     """
-    items_orm = db.scalars(
-        select(InventoryItem)
-        .options(selectinload(InventoryItem.food_item).selectinload(FoodItem.base_unit))
-        .options(selectinload(InventoryItem.storage_location))
-        .where(InventoryItem.kitchen_id == kitchen_id)
+    rows = db.execute(
+        _select_inventory_reads().where(InventoryItem.kitchen_id == kitchen_id)
     ).all()
-    
-    return [build_inventory_item_read(item) for item in items_orm]
+
+    return _build_inventory_reads(rows)
+
+
+def iter_kitchen_inventory(
+        db: Session,
+        kitchen_id: int,
+        batch_size: int | None = None
+) -> Iterator[InventoryItemRead]:
+    """Yield all inventory items of a kitchen, fetching ``batch_size`` rows at a time.
+
+    Used by the streaming export; memory is bounded by one batch however
+    large the kitchen is.
+
+    Args:
+        db: Database session
+        kitchen_id: Kitchen ID
+        batch_size: Rows per fetch (default ``settings.EXPORT_BATCH_SIZE``)
+
+    Yields:
+        Inventory item schemas ordered by ID
+    """
+    result = db.execute(
+        _select_inventory_reads()
+        .where(InventoryItem.kitchen_id == kitchen_id)
+        .order_by(InventoryItem.id)
+        .execution_options(yield_per=batch_size or settings.EXPORT_BATCH_SIZE)
+    )
+    for rows in result.partitions():
+        yield from _build_inventory_reads(rows)
 
 
 def get_kitchen_inventory_grouped_by_storage(
@@ -325,26 +406,14 @@ def get_kitchen_inventory_grouped_by_storage(
     # Get all storage locations for the kitchen (as schemas)
     storage_locations = get_kitchen_storage_locations(db, kitchen_id)
 
-    result = {}
-
-    for storage_schema in storage_locations:
-        # Get inventory items for this storage location
-        items_orm = db.scalars(
-            select(InventoryItem)
-            .options(selectinload(InventoryItem.food_item).selectinload(FoodItem.base_unit))
-            .options(selectinload(InventoryItem.storage_location))
-            .where(
-                and_(
-                    InventoryItem.kitchen_id == kitchen_id,
-                    InventoryItem.storage_location_id == storage_schema.id
-                )
-            )
-        ).all()
-        
-        items_schemas = [build_inventory_item_read(item) for item in items_orm]
-        result[storage_schema] = items_schemas
+    # One query for the whole kitchen instead of one per storage location
+    items_by_location: dict[int, list[InventoryItemRead]] = {location.id: [] for location in storage_locations}
+    for item in get_kitchen_inventory(db, kitchen_id):
+        location_items = items_by_location.get(item.storage_location_id)
+        if location_items is not None:
+            location_items.append(item)
 
-    return result
+    return {location: items_by_location[location.id] for location in storage_locations}
 
 
 def update_inventory_item(
@@ -427,12 +496,8 @@ def get_low_stock_items(
     Returns:
         List of low-stock inventory item schemas with computed properties
     """
-    items_orm = db.scalars(
-        select(InventoryItem)
-        .options(
-            selectinload(InventoryItem.food_item).selectinload(FoodItem.base_unit),
-            selectinload(InventoryItem.storage_location)
-        )
+    rows = db.execute(
+        _select_inventory_reads()
         .where(
             and_(
                 InventoryItem.kitchen_id == kitchen_id,
@@ -442,8 +507,8 @@ def get_low_stock_items(
         )
         .order_by(InventoryItem.food_item_id)
     ).all()
-    
-    return [build_inventory_item_read(item) for item in items_orm]
+
+    return _build_inventory_reads(rows)
 
 
 def get_expiring_items(
@@ -463,12 +528,8 @@ def get_expiring_items(
     """
     threshold_date = datetime.date.today() + datetime.timedelta(days=threshold_days)
 
-    items_orm = db.scalars(
-        select(InventoryItem)
-        .options(
-            selectinload(InventoryItem.food_item).selectinload(FoodItem.base_unit),
-            selectinload(InventoryItem.storage_location)
-        )
+    rows = db.execute(
+        _select_inventory_reads()
         .where(
             and_(
                 InventoryItem.kitchen_id == kitchen_id,
@@ -478,8 +539,8 @@ def get_expiring_items(
         )
         .order_by(InventoryItem.expiration_date)
     ).all()
-    
-    return [build_inventory_item_read(item) for item in items_orm]
+
+    return _build_inventory_reads(rows)
 
 
 def get_expired_items(db: Session, kitchen_id: int) -> list[InventoryItemRead]:
@@ -494,12 +555,8 @@ def get_expired_items(db: Session, kitchen_id: int) -> list[InventoryItemRead]:
     """
     today = datetime.date.today()
 
-    items_orm = db.scalars(
-        select(InventoryItem)
-        .options(
-            selectinload(InventoryItem.food_item).selectinload(FoodItem.base_unit),
-            selectinload(InventoryItem.storage_location)
-        )
+    rows = db.execute(
+        _select_inventory_reads()
         .where(
             and_(
                 InventoryItem.kitchen_id == kitchen_id,
@@ -509,8 +566,51 @@ def get_expired_items(db: Session, kitchen_id: int) -> list[InventoryItemRead]:
         )
         .order_by(InventoryItem.expiration_date)
     ).all()
-    
-    return [build_inventory_item_read(item) for item in items_orm]
+
+    return _build_inventory_reads(rows)
+
+
+def get_kitchen_inventory_stats(
+        db: Session,
+        kitchen_id: int,
+        threshold_days: int = EXPIRING_ITEMS_THRESHOLD_DAYS
+) -> KitchenInventoryStats:
+    """Count a kitchen's inventory items by stock and expiry state.
+
+    One aggregate query over the kitchen's rows, using the same conditions
+    as ``get_low_stock_items``, ``get_expired_items`` and
+    ``get_expiring_items`` without loading any items.
+
+    Args:
+        db: Database session
+        kitchen_id: Kitchen ID
+        threshold_days: Number of days to consider as "expiring soon"
+
+    Returns:
+        Inventory counts for the kitchen
+    """
+    today = datetime.date.today()
+    threshold_date = today + datetime.timedelta(days=threshold_days)
+
+    total, low_stock, expired, expires_soon = db.execute(
+        select(
+            func.count(),
+            func.count().filter(and_(
+                InventoryItem.min_quantity.is_not(None),
+                InventoryItem.quantity < InventoryItem.min_quantity
+            )),
+            func.count().filter(InventoryItem.expiration_date < today),
+            func.count().filter(InventoryItem.expiration_date <= threshold_date),
+        ).where(InventoryItem.kitchen_id == kitchen_id)
+    ).one()
+
+    return KitchenInventoryStats(
+        kitchen_id=kitchen_id,
+        total_items=total,
+        low_stock_items=low_stock,
+        expired_items=expired,
+        expires_soon_items=expires_soon
+    )
 
 
 # ================================================================== #
@@ -6,10 +6,12 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 
+from backend.crud import aggregate as crud_aggregate
+from backend.crud import device as crud_device
 from backend.models.kitchen import Kitchen, UserKitchen
 from backend.models.user import User
 from backend.schemas.kitchen import (
-    KitchenCreate, KitchenRead, KitchenUpdate, KitchenWithUsers,
+    KitchenCreate, KitchenRead, KitchenUpdate, KitchenWithRole, KitchenWithUsers,
     UserKitchenCreate, UserKitchenRead, UserKitchenUpdate
 )
 
@@ -181,6 +183,9 @@ def delete_kitchen(db: Session, kitchen_id: int) -> bool:
     if not kitchen_orm:
         return False
 
+    crud_aggregate.reset_counters(
+        db, crud_aggregate.counter_scope(crud_device.KITCHEN_DEVICE_COUNTER_PREFIX, kitchen_id)
+    )
     db.delete(kitchen_orm)
     db.commit()
 
@@ -364,6 +369,32 @@ def get_user_kitchens(db: Session, user_id: int) -> list[UserKitchenRead]:
     return [build_user_kitchen_read(uk) for uk in user_kitchen_orms]
 
 
+def get_user_kitchens_with_roles(db: Session, user_id: int) -> list[KitchenWithRole]:
+    """Get all kitchens a user belongs to with the user's role - returns schemas.
+
+    One joined query, unlike ``get_user_kitchens`` which also loads the
+    user and kitchen relationships of every membership.
+
+    Args:
+        db: Database session.
+        user_id: Primary key of the user.
+
+    Returns:
+        List of kitchen schemas with roles, ordered by kitchen name.
+    """
+    rows = db.execute(
+        select(Kitchen, UserKitchen.role)
+        .join(UserKitchen, UserKitchen.kitchen_id == Kitchen.id)
+        .where(UserKitchen.user_id == user_id)
+        .order_by(Kitchen.name, Kitchen.id)
+    ).all()
+
+    return [
+        KitchenWithRole(**build_kitchen_read(kitchen).model_dump(), role=role)
+        for kitchen, role in rows
+    ]
+
+
 # ================================================================== #
 # ORM-based Functions (for internal use when ORM objects needed)     #
 # ================================================================== #
@@ -2,27 +2,52 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Collection, Iterator
 from typing import Any, TYPE_CHECKING, cast
 
-from sqlalchemy import and_, func, select, text
+from sqlalchemy import and_, func, select, text, update
 from sqlalchemy.orm import Session, selectinload
 
-from backend.core.enums import DifficultyLevel
+from backend.core.config import settings
+from backend.core.enums import DifficultyLevel, RecipePagePart, RecipeSortField, SortOrder
+from backend.core.pagination import Keyset, SortKey
+from backend.core.serialization import ColumnProjection, RowLayout, construct_from_orm
+from backend.crud import aggregate as crud_aggregate
 from backend.models.food import FoodItem
 from backend.models.recipe import Recipe, RecipeIngredient, RecipeStep, RecipeNutrition, RecipeReview
+from backend.models.user import User
 from backend.schemas.recipe import (
     RecipeCreate, RecipeRead, RecipeUpdate, RecipeWithDetails,
     RecipeIngredientCreate, RecipeIngredientRead, RecipeIngredientUpdate,
     RecipeStepCreate, RecipeStepRead, RecipeStepUpdate,
     RecipeNutritionCreate, RecipeNutritionRead, RecipeNutritionUpdate,
     RecipeReviewUpsert, RecipeReviewRead, RecipeReviewUpdate,
-    RecipeSearchParams, RecipeSummary, RecipeRatingSummary
+    RecipeSearchParams, RecipeSummary, RecipeRatingSummary, RecipeCount, RecipePage
 )
+from backend.schemas.user import UserRead
 
 if TYPE_CHECKING:
     from backend.models.inventory import InventoryItem
 
 
+# Columns ``get_all_recipes`` can order by (all indexed)
+_RECIPE_SORT_COLUMNS = {
+    RecipeSortField.TITLE: Recipe.title,
+    RecipeSortField.CREATED_AT: Recipe.created_at,
+    RecipeSortField.AVERAGE_RATING: Recipe.average_rating,
+    RecipeSortField.REVIEW_COUNT: Recipe.review_count,
+}
+
+# Reviews of one recipe are unique per user
+RECIPE_REVIEW_KEYSET = Keyset(SortKey(RecipeReview.created_at, descending=True), SortKey(RecipeReview.user_id))
+
+# Recipe list rows: recipe columns followed by the creator's (NULL if none)
+_RECIPE_COLUMNS = ColumnProjection(RecipeRead, Recipe.__table__)
+_CREATOR_COLUMNS = ColumnProjection(UserRead, User.__table__)
+_RECIPE_ROW = RowLayout(_RECIPE_COLUMNS, _CREATOR_COLUMNS)
+
+
 # ================================================================== #
 # Schema Builder Functions                                           #
 # ================================================================== #
@@ -36,7 +61,7 @@ def build_recipe_read(recipe_orm: Recipe) -> RecipeRead:
     Returns:
         RecipeRead schema
     """
-    return RecipeRead.model_validate(recipe_orm, from_attributes=True)
+    return construct_from_orm(RecipeRead, recipe_orm)
 
 
 def build_recipe_with_details(recipe_orm: Recipe) -> RecipeWithDetails:
@@ -48,7 +73,7 @@ def build_recipe_with_details(recipe_orm: Recipe) -> RecipeWithDetails:
     Returns:
         RecipeWithDetails schema
     """
-    # Manually construct to ensure computed fields are populated correctly
+    # Children need derived values, the recipe fields come straight from the ORM
     ingredients = [build_recipe_ingredient_read(ing) for ing in recipe_orm.ingredients]
     steps = [build_recipe_step_read(step) for step in getattr(recipe_orm, "steps", [])]
     nutrition = (
@@ -57,34 +82,9 @@ def build_recipe_with_details(recipe_orm: Recipe) -> RecipeWithDetails:
         else None
     )
 
-    # Ensure difficulty is an Enum instance (ORM likely stores a string)
-    orm_difficulty = getattr(recipe_orm, "difficulty", None)
-    difficulty_enum = (
-        DifficultyLevel(orm_difficulty) if isinstance(orm_difficulty, str) else orm_difficulty
-    )
-
-    return RecipeWithDetails(
-        # Base recipe fields
-        id=recipe_orm.id,
-        title=recipe_orm.title,
-        description=recipe_orm.description,
-        cuisine_type=recipe_orm.cuisine_type,
-        meal_type=recipe_orm.meal_type,
-        prep_time_minutes=recipe_orm.prep_time_minutes,
-        cook_time_minutes=recipe_orm.cook_time_minutes,
-        total_time_minutes=recipe_orm.total_time_minutes,
-        is_ai_generated=recipe_orm.is_ai_generated,
-        created_by_user_id=recipe_orm.created_by_user_id,
-        difficulty=difficulty_enum,
-        servings=recipe_orm.servings,
-        tags=recipe_orm.tags,
-
-        # Timestamps
-        created_at=recipe_orm.created_at,
-        updated_at=recipe_orm.updated_at,
-
-        # Relations
-        created_by_user=recipe_orm.created_by_user,  # schema uses from_attributes=True
+    return construct_from_orm(
+        RecipeWithDetails,
+        recipe_orm,
         ingredients=ingredients,
         steps=steps,
         nutrition=nutrition,
@@ -106,16 +106,9 @@ def build_recipe_ingredient_read(ingredient_orm: RecipeIngredient) -> RecipeIngr
     base_unit_name = ingredient_orm.food_item.base_unit.name
     original_unit_name = ingredient_orm.original_unit.name if ingredient_orm.original_unit else None
 
-    return RecipeIngredientRead(
-        # Base fields
-        recipe_id=ingredient_orm.recipe_id,
-        food_item_id=ingredient_orm.food_item_id,
-        amount_in_base_unit=ingredient_orm.amount_in_base_unit,
-        original_unit_id=ingredient_orm.original_unit_id,
-        original_amount=ingredient_orm.original_amount,
-        created_at=ingredient_orm.created_at,
-        updated_at=ingredient_orm.updated_at,
-
+    return construct_from_orm(
+        RecipeIngredientRead,
+        ingredient_orm,
         # Computed/derived fields required by the schema
         food_item_name=food_item_name,
         base_unit_name=base_unit_name,
@@ -134,7 +127,7 @@ def build_recipe_step_read(step_orm: RecipeStep) -> RecipeStepRead:
     Returns:
         RecipeStepRead schema
     """
-    return RecipeStepRead.model_validate(step_orm, from_attributes=True)
+    return construct_from_orm(RecipeStepRead, step_orm)
 
 
 def build_recipe_nutrition_read(nutrition_orm: RecipeNutrition) -> RecipeNutritionRead:
@@ -146,18 +139,9 @@ def build_recipe_nutrition_read(nutrition_orm: RecipeNutrition) -> RecipeNutriti
     Returns:
         RecipeNutritionRead schema
     """
-    return RecipeNutritionRead(
-        # Base nutrition fields
-        recipe_id=nutrition_orm.recipe_id,
-        kcal=nutrition_orm.kcal,
-        protein_g=nutrition_orm.protein_g,
-        fat_g=nutrition_orm.fat_g,
-        carbs_g=nutrition_orm.carbs_g,
-        fiber_g=nutrition_orm.fiber_g,
-        source=nutrition_orm.source,
-        created_at=nutrition_orm.created_at,
-        updated_at=nutrition_orm.updated_at,
-
+    return construct_from_orm(
+        RecipeNutritionRead,
+        nutrition_orm,
         # Computed fields (call the methods to get values)
         has_complete_macros=nutrition_orm.has_complete_macros(),
         calculated_kcal=nutrition_orm.calculated_kcal(),
@@ -173,7 +157,7 @@ def build_recipe_review_read(review_orm: RecipeReview) -> RecipeReviewRead:
     Returns:
         RecipeReviewRead schema
     """
-    return RecipeReviewRead.model_validate(review_orm, from_attributes=True)
+    return construct_from_orm(RecipeReviewRead, review_orm)
 
 
 # ================================================================== #
@@ -233,6 +217,13 @@ def create_recipe(db: Session, recipe_data: RecipeCreate) -> RecipeRead:
         )
         db.add(nutrition_orm)
 
+    deltas = crud_aggregate.counter_deltas(
+        added=_recipe_counter_keys(recipe_orm.is_ai_generated, recipe_orm.difficulty)
+    )
+    if recipe_data.nutrition:
+        deltas[_WITH_NUTRITION_KEY] += 1
+    crud_aggregate.increment_counters(db, RECIPE_COUNTER_SCOPE, deltas)
+
     db.commit()
 
     # Get the recipe with relationships and convert to RecipeRead
@@ -256,16 +247,53 @@ def get_recipe_with_details(db: Session, recipe_id: int) -> RecipeWithDetails |
     return build_recipe_with_details(recipe_orm)
 
 
+def iter_recipes_with_details(db: Session, batch_size: int | None = None) -> Iterator[RecipeWithDetails]:
+    """Yield all recipes with details, loading ``batch_size`` recipes at a time.
+
+    Relationships are selectin-loaded per batch, so memory is bounded by one
+    batch however many recipes exist. Used by the streaming export.
+    """
+    query = (
+        select(Recipe)
+        .options(*_RECIPE_DETAIL_OPTIONS)
+        .order_by(Recipe.id)
+        .execution_options(yield_per=batch_size or settings.EXPORT_BATCH_SIZE)
+    )
+    for recipe_orm in db.scalars(query):
+        yield build_recipe_with_details(recipe_orm)
+
+
+def recipe_keyset(search_params: RecipeSearchParams | None = None) -> Keyset:
+    """Return the ordering of ``get_all_recipes`` for the given search parameters.
+
+    Recipes are ordered by id unless ``sort_by`` is set; the id then breaks
+    ties in the same direction, so the sort column's index covers the order.
+    """
+    if search_params is None or search_params.sort_by is None:
+        return Keyset(SortKey(Recipe.id))
+    descending = search_params.sort_order == SortOrder.DESC
+    return Keyset(
+        SortKey(_RECIPE_SORT_COLUMNS[search_params.sort_by], descending=descending),
+        SortKey(Recipe.id, descending=descending),
+    )
+
+
 def get_all_recipes(
         db: Session,
         search_params: RecipeSearchParams | None = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
 ) -> list[RecipeRead]:
-    """Get all recipes with pagination and optional filtering."""
-    query = select(Recipe).options(
-        selectinload(Recipe.created_by_user)
-    )
+    """Get all recipes with pagination and optional filtering.
+
+    Pass the cursor from ``recipe_keyset(search_params).next_cursor(...)`` to
+    continue after the previous page; ``skip`` is then ignored.
+
+    Raises:
+        InvalidCursorError: If ``cursor`` was issued for a different ordering.
+    """
+    query = select(*_RECIPE_ROW.columns).outerjoin(User, User.id == Recipe.created_by_user_id)
 
     # Apply filters if search_params provided
     if search_params:
@@ -294,12 +322,28 @@ def get_all_recipes(
                 safe = str(tag).strip()
                 if safe:
                     query = query.where(Recipe.tags.like(f'%"{safe}"%'))
-
-    query = query.offset(skip).limit(limit)
-    result = db.execute(query)
-    recipes = result.scalars().all()
-
-    return [build_recipe_read(recipe) for recipe in recipes]
+        if search_params.min_average_rating is not None:
+            query = query.where(Recipe.average_rating >= search_params.min_average_rating)
+        if search_params.min_review_count is not None:
+            query = query.where(Recipe.review_count >= search_params.min_review_count)
+
+    # Indexed sort columns; unrated recipes always sort last
+    query = recipe_keyset(search_params).paginate(query, cursor=cursor, skip=skip, limit=limit)
+    rows = db.execute(query).all()
+
+    # Plain column rows avoid loading ORM entities for large pages
+    creator_index = _RECIPE_ROW.index(_CREATOR_COLUMNS, "id")
+    creators: dict[int, UserRead] = {}
+    recipes = []
+    for row in rows:
+        creator_id = row[creator_index]
+        creator = None
+        if creator_id is not None:
+            creator = creators.get(creator_id)
+            if creator is None:
+                creator = creators[creator_id] = _RECIPE_ROW.build(row, _CREATOR_COLUMNS)
+        recipes.append(_RECIPE_ROW.build(row, _RECIPE_COLUMNS, created_by_user=creator))
+    return recipes
 
 
 def update_recipe(db: Session, recipe_id: int, recipe_data: RecipeUpdate) -> RecipeRead | None:
@@ -308,11 +352,18 @@ def update_recipe(db: Session, recipe_id: int, recipe_data: RecipeUpdate) -> Rec
     if not recipe_orm:
         return None
 
+    old_counter_keys = _recipe_counter_keys(recipe_orm.is_ai_generated, recipe_orm.difficulty)
+
     # Update fields
     update_data = recipe_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(recipe_orm, field, value)
 
+    crud_aggregate.increment_counters(db, RECIPE_COUNTER_SCOPE, crud_aggregate.counter_deltas(
+        removed=old_counter_keys,
+        added=_recipe_counter_keys(recipe_orm.is_ai_generated, recipe_orm.difficulty),
+    ))
+
     db.commit()
 
     # Get updated recipe with relationships and convert
@@ -326,45 +377,56 @@ def delete_recipe(db: Session, recipe_id: int) -> None:
     if not recipe_orm:
         raise ValueError(f"Recipe with ID {recipe_id} not found")
 
+    deltas = crud_aggregate.counter_deltas(
+        removed=_recipe_counter_keys(recipe_orm.is_ai_generated, recipe_orm.difficulty)
+    )
+    if recipe_orm.nutrition is not None:
+        deltas[_WITH_NUTRITION_KEY] -= 1
+    crud_aggregate.increment_counters(db, RECIPE_COUNTER_SCOPE, deltas)
+    crud_aggregate.reset_counters(db, _rating_scope(recipe_id))
+
     db.delete(recipe_orm)
     db.commit()
 
 
 def get_recipe_summary(db: Session) -> RecipeSummary:
-    """Get recipe statistics summary."""
-    # Count total recipes
-    total_recipes = db.scalar(select(func.count(Recipe.id)))
-
-    # Count AI generated recipes
-    ai_generated_count = db.scalar(
-        select(func.count(Recipe.id)).where(Recipe.is_ai_generated == True)
-    )
-
-    # Count manual recipes
-    manual_count = total_recipes - ai_generated_count
+    """Get recipe statistics summary from the maintained counters."""
+    counters = crud_aggregate.read_counters(db, RECIPE_COUNTER_SCOPE)
 
-    # Count recipes with nutrition
-    with_nutrition_count = db.scalar(
-        select(func.count(Recipe.id)).join(RecipeNutrition)
-    )
-
-    # Count by difficulty
-    difficulty_counts = db.execute(
-        select(Recipe.difficulty, func.count(Recipe.id))
-        .group_by(Recipe.difficulty)
-    ).all()
-
-    by_difficulty = {difficulty: count for difficulty, count in difficulty_counts}
+    total_recipes = counters.get("total", {}).get("all", 0)
+    ai_generated_count = counters.get("ai_generated", {}).get("true", 0)
 
     return RecipeSummary(
         total_recipes=total_recipes,
         ai_generated_count=ai_generated_count,
-        manual_count=manual_count,
-        with_nutrition_count=with_nutrition_count,
-        by_difficulty=by_difficulty
+        manual_count=total_recipes - ai_generated_count,
+        with_nutrition_count=counters.get("with_nutrition", {}).get("all", 0),
+        by_difficulty=counters.get("by_difficulty", {})
     )
 
 
+def count_recipes(
+        db: Session,
+        created_by_user_id: int | None = None,
+        is_ai_generated: bool | None = None
+) -> RecipeCount:
+    """Count recipes, optionally by creator and AI flag, without loading them.
+
+    Global counts come from the maintained counters; per-creator counts are
+    one COUNT over the indexed ``created_by_user_id`` column.
+    """
+    if created_by_user_id is None:
+        summary = get_recipe_summary(db)
+        if is_ai_generated is None:
+            return RecipeCount(count=summary.total_recipes)
+        return RecipeCount(count=summary.ai_generated_count if is_ai_generated else summary.manual_count)
+
+    query = select(func.count()).select_from(Recipe).where(Recipe.created_by_user_id == created_by_user_id)
+    if is_ai_generated is not None:
+        query = query.where(Recipe.is_ai_generated == is_ai_generated)
+    return RecipeCount(count=db.scalar(query) or 0)
+
+
 # ================================================================== #
 # Recipe Ingredient CRUD Operations                                  #
 # ================================================================== #
@@ -610,6 +672,7 @@ def create_or_update_recipe_nutrition(
             source=nutrition_data.source
         )
         db.add(nutrition_orm)
+        crud_aggregate.increment_counters(db, RECIPE_COUNTER_SCOPE, {_WITH_NUTRITION_KEY: 1})
         db.commit()
         return build_recipe_nutrition_read(nutrition_orm)
 
@@ -644,6 +707,7 @@ def delete_recipe_nutrition(db: Session, recipe_id: int) -> None:
     if not nutrition_orm:
         raise ValueError(f"Nutrition information for recipe {recipe_id} not found")
 
+    crud_aggregate.increment_counters(db, RECIPE_COUNTER_SCOPE, {_WITH_NUTRITION_KEY: -1})
     db.delete(nutrition_orm)
     db.commit()
 
@@ -681,10 +745,21 @@ def get_recipes_by_available_ingredients(
         (subquery.c.matching_ingredients / subquery.c.total_ingredients).desc()
     )
 
-    result = db.execute(query)
-    recipes = result.scalars().all()
+    rows = db.execute(query).all()
 
-    return [build_recipe_read(recipe) for recipe in recipes]
+    # Plain column rows avoid loading ORM entities for large pages
+    creator_index = _RECIPE_ROW.index(_CREATOR_COLUMNS, "id")
+    creators: dict[int, UserRead] = {}
+    recipes = []
+    for row in rows:
+        creator_id = row[creator_index]
+        creator = None
+        if creator_id is not None:
+            creator = creators.get(creator_id)
+            if creator is None:
+                creator = creators[creator_id] = _RECIPE_ROW.build(row, _CREATOR_COLUMNS)
+        recipes.append(_RECIPE_ROW.build(row, _RECIPE_COLUMNS, created_by_user=creator))
+    return recipes
 
 
 def get_ai_generated_recipes(db: Session, skip: int = 0, limit: int = 100) -> list[RecipeRead]:
@@ -693,10 +768,21 @@ def get_ai_generated_recipes(db: Session, skip: int = 0, limit: int = 100) -> li
         selectinload(Recipe.created_by_user)
     ).where(Recipe.is_ai_generated == True).offset(skip).limit(limit)
 
-    result = db.execute(query)
-    recipes = result.scalars().all()
+    rows = db.execute(query).all()
 
-    return [build_recipe_read(recipe) for recipe in recipes]
+    # Plain column rows avoid loading ORM entities for large pages
+    creator_index = _RECIPE_ROW.index(_CREATOR_COLUMNS, "id")
+    creators: dict[int, UserRead] = {}
+    recipes = []
+    for row in rows:
+        creator_id = row[creator_index]
+        creator = None
+        if creator_id is not None:
+            creator = creators.get(creator_id)
+            if creator is None:
+                creator = creators[creator_id] = _RECIPE_ROW.build(row, _CREATOR_COLUMNS)
+        recipes.append(_RECIPE_ROW.build(row, _RECIPE_COLUMNS, created_by_user=creator))
+    return recipes
 
 
 # ================================================================== #
@@ -722,8 +808,12 @@ def create_or_update_recipe_review(
 
     if existing_review:
         # Update existing review
+        crud_aggregate.increment_counters(
+            db, _rating_scope(recipe_id), _review_counter_deltas(existing_review.rating, review_data.rating)
+        )
         existing_review.rating = review_data.rating
         existing_review.comment = review_data.comment
+        _refresh_recipe_rating(db, recipe_id)
         db.commit()
 
         # Get updated review with relationships and convert
@@ -738,6 +828,10 @@ def create_or_update_recipe_review(
             comment=review_data.comment
         )
         db.add(review_orm)
+        crud_aggregate.increment_counters(
+            db, _rating_scope(recipe_id), _review_counter_deltas(None, review_data.rating)
+        )
+        _refresh_recipe_rating(db, recipe_id)
         db.commit()
 
         # Get new review with relationships and convert
@@ -745,11 +839,18 @@ def create_or_update_recipe_review(
         return build_recipe_review_read(new_review)
 
 
-def get_recipe_reviews(db: Session, recipe_id: int, skip: int = 0, limit: int = 100) -> list[RecipeReviewRead]:
-    """Get all reviews for a recipe."""
+def get_recipe_reviews(
+        db: Session,
+        recipe_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+) -> list[RecipeReviewRead]:
+    """Get all reviews for a recipe, newest first (see ``RECIPE_REVIEW_KEYSET``)."""
     query = select(RecipeReview).options(
         selectinload(RecipeReview.user)
-    ).where(RecipeReview.recipe_id == recipe_id).offset(skip).limit(limit)
+    ).where(RecipeReview.recipe_id == recipe_id)
+    query = RECIPE_REVIEW_KEYSET.paginate(query, cursor=cursor, skip=skip, limit=limit)
 
     result = db.execute(query)
     reviews = result.scalars().all()
@@ -775,11 +876,17 @@ def update_recipe_review(
     if not review_orm:
         return None
 
+    old_rating = review_orm.rating
+
     # Update fields
     update_data = review_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(review_orm, field, value)
 
+    crud_aggregate.increment_counters(
+        db, _rating_scope(recipe_id), _review_counter_deltas(old_rating, review_orm.rating)
+    )
+    _refresh_recipe_rating(db, recipe_id)
     db.commit()
 
     # Get updated review with relationships and convert
@@ -800,38 +907,77 @@ def delete_recipe_review(db: Session, user_id: int, recipe_id: int) -> None:
     if not review_orm:
         raise ValueError(f"Review for recipe {recipe_id} by user {user_id} not found")
 
+    crud_aggregate.increment_counters(
+        db, _rating_scope(recipe_id), _review_counter_deltas(review_orm.rating, None)
+    )
     db.delete(review_orm)
+    _refresh_recipe_rating(db, recipe_id)
     db.commit()
 
 
-def get_recipe_rating_summary(db: Session, recipe_id: int) -> RecipeRatingSummary:
-    """Return rating statistics for a recipe."""
-    ratings_query = select(RecipeReview.rating).where(RecipeReview.recipe_id == recipe_id)
-    ratings = db.execute(ratings_query).scalars().all()
-
-    if not ratings:
-        return RecipeRatingSummary(
-            recipe_id=recipe_id,
-            total_reviews=0,
-            average_rating=None,
-            rating_distribution={str(i): 0 for i in range(1, 6)},
-        )
+def get_recipe_rating_summary(db: Session, recipe_id: int) -> RecipeRatingSummary | None:
+    """Return rating statistics for a recipe, or None if the recipe does not exist.
 
-    average_rating = sum(ratings) / len(ratings)
-
-    rating_distribution: dict[str, int] = {str(i): 0 for i in range(1, 6)}
-    for rating in ratings:
-        if rating in (1, 2, 3, 4, 5):
-            rating_distribution[str(rating)] += 1
+    Total and average come from the recipe's denormalized columns; only the
+    per-rating distribution is read from the maintained counters.
+    """
+    stats = db.execute(
+        select(Recipe.review_count, Recipe.average_rating).where(Recipe.id == recipe_id)
+    ).one_or_none()
+    if stats is None:
+        return None
 
+    by_rating = crud_aggregate.read_counters(db, _rating_scope(recipe_id)).get("by_rating", {})
     return RecipeRatingSummary(
         recipe_id=recipe_id,
-        total_reviews=len(ratings),
-        average_rating=average_rating,
-        rating_distribution=rating_distribution,
+        total_reviews=stats.review_count,
+        average_rating=stats.average_rating,
+        rating_distribution={str(i): by_rating.get(str(i), 0) for i in range(1, 6)},
     )
 
 
+def get_recipe_page(
+        db: Session,
+        recipe_id: int,
+        include: Collection[RecipePagePart] = tuple(RecipePagePart),
+        review_limit: int = 100,
+        review_cursor: str | None = None
+) -> RecipePage | None:
+    """Get the requested parts of a recipe page from one session.
+
+    Details and reviews are loaded with their relationships eagerly, so each
+    part costs a fixed number of queries.
+
+    Args:
+        db: Database session.
+        recipe_id: Recipe ID.
+        include: Parts to load; the others are left ``None``.
+        review_limit: Maximum number of reviews to return.
+        review_cursor: Cursor of the previous review page.
+
+    Returns:
+        The recipe page, or None if the recipe does not exist.
+
+    Raises:
+        InvalidCursorError: If ``review_cursor`` is not a review cursor.
+    """
+    page = RecipePage(recipe_id=recipe_id)
+    if RecipePagePart.DETAILS in include:
+        recipe_orm = get_recipe_orm_with_relationships(db, recipe_id)
+        if not recipe_orm:
+            return None
+        page.details = build_recipe_with_details(recipe_orm)
+    elif db.scalar(select(Recipe.id).where(Recipe.id == recipe_id)) is None:
+        return None
+
+    if RecipePagePart.REVIEWS in include:
+        page.reviews = get_recipe_reviews(db, recipe_id, limit=review_limit, cursor=review_cursor)
+        page.next_reviews_cursor = RECIPE_REVIEW_KEYSET.next_cursor(page.reviews, review_limit)
+    if RecipePagePart.RATING_SUMMARY in include:
+        page.rating_summary = get_recipe_rating_summary(db, recipe_id)
+    return page
+
+
 # ================================================================== #
 # Helper Functions for ORM Objects with Relationships               #
 # ================================================================== #
@@ -841,15 +987,19 @@ def get_recipe_orm_by_id(db: Session, recipe_id: int) -> Recipe | None:
     return db.get(Recipe, recipe_id)
 
 
+# Relationships ``build_recipe_with_details`` reads
+_RECIPE_DETAIL_OPTIONS = (
+    selectinload(Recipe.created_by_user),
+    selectinload(Recipe.ingredients).selectinload(RecipeIngredient.food_item).selectinload(FoodItem.base_unit),
+    selectinload(Recipe.ingredients).selectinload(RecipeIngredient.original_unit),
+    selectinload(Recipe.steps),
+    selectinload(Recipe.nutrition),
+)
+
+
 def get_recipe_orm_with_relationships(db: Session, recipe_id: int) -> Recipe | None:
     """Get a recipe ORM object with all relationships loaded."""
-    query = select(Recipe).options(
-        selectinload(Recipe.created_by_user),
-        selectinload(Recipe.ingredients).selectinload(RecipeIngredient.food_item).selectinload(FoodItem.base_unit),
-        selectinload(Recipe.ingredients).selectinload(RecipeIngredient.original_unit),
-        selectinload(Recipe.steps),
-        selectinload(Recipe.nutrition)
-    ).where(Recipe.id == recipe_id)
+    query = select(Recipe).options(*_RECIPE_DETAIL_OPTIONS).where(Recipe.id == recipe_id)
 
     result = db.execute(query)
     return result.scalar_one_or_none()
@@ -887,6 +1037,96 @@ def get_recipe_review_orm_with_relationships(db: Session, user_id: int, recipe_i
     return result.scalar_one_or_none()
 
 
+# ================================================================== #
+# Aggregate Counters                                                 #
+# ================================================================== #
+
+RECIPE_COUNTER_SCOPE = "recipes"
+RECIPE_RATING_COUNTER_PREFIX = "recipe_ratings"
+
+_WITH_NUTRITION_KEY: crud_aggregate.CounterKey = ("with_nutrition", "all")
+
+
+def compute_recipe_counts(db: Session) -> dict[str, dict[str, int]]:
+    """Count recipes per summary dimension with a single grouped scan."""
+    rows = db.execute(
+        select(
+            Recipe.is_ai_generated,
+            Recipe.difficulty,
+            RecipeNutrition.recipe_id.is_not(None),
+            func.count(Recipe.id),
+        )
+        .outerjoin(RecipeNutrition, Recipe.id == RecipeNutrition.recipe_id)
+        .group_by(Recipe.is_ai_generated, Recipe.difficulty, RecipeNutrition.recipe_id.is_not(None))
+    ).all()
+
+    counts: dict[str, dict[str, int]] = {}
+    for is_ai_generated, difficulty, has_nutrition, count in rows:
+        keys = _recipe_counter_keys(is_ai_generated, difficulty)
+        if has_nutrition:
+            keys.append(_WITH_NUTRITION_KEY)
+        for dimension, key in keys:
+            values = counts.setdefault(dimension, {})
+            values[key] = values.get(key, 0) + count
+    return counts
+
+
+def compute_recipe_rating_counts(db: Session, recipe_id: int) -> dict[str, dict[str, int]]:
+    """Count the reviews of one recipe per rating."""
+    rows = db.execute(
+        select(RecipeReview.rating, func.count(RecipeReview.rating))
+        .where(RecipeReview.recipe_id == recipe_id)
+        .group_by(RecipeReview.rating)
+    ).all()
+    return {"by_rating": {str(rating): count for rating, count in rows}}
+
+
+def _recipe_counter_keys(is_ai_generated: bool, difficulty: DifficultyLevel | str) -> list[crud_aggregate.CounterKey]:
+    return [
+        ("total", "all"),
+        ("ai_generated", "true" if is_ai_generated else "false"),
+        ("by_difficulty", crud_aggregate.counter_key(difficulty)),
+    ]
+
+
+def _review_counter_deltas(old_rating: int | None, new_rating: int | None) -> dict[crud_aggregate.CounterKey, int]:
+    """Return counter deltas for a review whose rating changes (None = absent)."""
+    return crud_aggregate.counter_deltas(
+        removed=[("by_rating", str(old_rating))] if old_rating is not None else [],
+        added=[("by_rating", str(new_rating))] if new_rating is not None else [],
+    )
+
+
+def _refresh_recipe_rating(db: Session, recipe_id: int) -> None:
+    """Recompute ``average_rating``/``review_count`` of one recipe - does not commit.
+
+    Pending review changes are flushed first; the recompute only touches the
+    reviews of this recipe (primary key prefix of ``recipe_reviews``).
+    """
+    db.flush()
+    stats = select(func.avg(RecipeReview.rating), func.count(RecipeReview.rating)).where(
+        RecipeReview.recipe_id == recipe_id
+    )
+    average_rating, review_count = db.execute(stats).one()
+    db.execute(
+        update(Recipe)
+        .where(Recipe.id == recipe_id)
+        # Reviews are not a recipe edit, so keep updated_at
+        .values(average_rating=average_rating, review_count=review_count, updated_at=Recipe.updated_at)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def _rating_scope(recipe_id: int) -> str:
+    return crud_aggregate.counter_scope(RECIPE_RATING_COUNTER_PREFIX, recipe_id)
+
+
+crud_aggregate.register_counter_source(
+    RECIPE_COUNTER_SCOPE, lambda db, _entity_id: compute_recipe_counts(db)
+)
+crud_aggregate.register_counter_source(RECIPE_RATING_COUNTER_PREFIX, compute_recipe_rating_counts)
+
+
 # ================================================================== #
 # New Crud to refactor                                           #
 # ================================================================== #
@@ -930,15 +1170,21 @@ def cook_recipe(
         insufficient_ingredients = []
         inventory_updates = []
 
+        # Stock of every ingredient in one query, soonest-expiring first
+        stock_by_food_item: dict[int, list[InventoryItem]] = defaultdict(list)
+        stock = (
+            db.query(InventoryItem)
+            .filter(InventoryItem.kitchen_id == kitchen_id)
+            .filter(InventoryItem.food_item_id.in_({ingredient.food_item_id for ingredient in recipe.ingredients}))
+            .filter(InventoryItem.quantity > 0)
+            .order_by(text("expiration_date ASC NULLS LAST"))
+            .all()
+        )
+        for item in stock:
+            stock_by_food_item[item.food_item_id].append(item)
+
         for ingredient in recipe.ingredients:
-            available_items = (
-                db.query(InventoryItem)
-                .filter(InventoryItem.kitchen_id == kitchen_id)
-                .filter(InventoryItem.food_item_id == ingredient.food_item_id)
-                .filter(InventoryItem.quantity > 0)
-                .order_by(text("expiration_date ASC NULLS LAST"))
-                .all()
-            )
+            available_items = stock_by_food_item[ingredient.food_item_id]
 
             total_available = sum(cast(float, item.quantity) for item in available_items)
             required_amount = cast(float, ingredient.amount_in_base_unit)
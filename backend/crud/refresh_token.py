@@ -0,0 +1,124 @@
+"""CRUD operations for the refresh token store and per-user revocations."""
+
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from backend.models.refresh_token import RefreshToken, TokenRevocation
+
+
+def _now_utc() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def as_utc(value: datetime.datetime) -> datetime.datetime:
+    """Return ``value`` as an aware UTC datetime (SQLite drops the tzinfo)."""
+    return value if value.tzinfo else value.replace(tzinfo=datetime.timezone.utc)
+
+
+# ================================================================== #
+# Refresh Tokens                                                     #
+# ================================================================== #
+
+def get_refresh_token_orm(db: Session, jti: str) -> RefreshToken | None:
+    """Return the stored refresh token with the given ``jti``."""
+    return db.get(RefreshToken, jti)
+
+
+def add_refresh_token(db: Session, user_id: int, jti: str, expires_at: datetime.datetime) -> RefreshToken:
+    """Record a newly issued refresh token (flushed, not committed)."""
+    token = RefreshToken(jti=jti, user_id=user_id, expires_at=expires_at)
+    db.add(token)
+    db.flush()
+    return token
+
+
+def rotate_refresh_token(
+        db: Session,
+        token: RefreshToken,
+        new_jti: str,
+        expires_at: datetime.datetime,
+) -> RefreshToken:
+    """Revoke ``token`` in favour of a new one and commit both.
+
+    Raises:
+        ValueError: If ``token`` was revoked or rotated concurrently.
+    """
+    # Conditional update so two concurrent refreshes cannot both succeed
+    result = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.jti == token.jti, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=_now_utc(), replaced_by_jti=new_jti)
+        .execution_options(synchronize_session="fetch")
+    )
+    if result.rowcount != 1:
+        db.rollback()
+        raise ValueError("Refresh token was already used")
+
+    successor = add_refresh_token(db, token.user_id, new_jti, expires_at)
+    db.commit()
+    return successor
+
+
+def revoke_refresh_token(db: Session, jti: str) -> bool:
+    """Revoke a single refresh token; returns False if unknown or already revoked."""
+    result = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.jti == jti, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=_now_utc())
+        .execution_options(synchronize_session="fetch")
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def purge_expired_refresh_tokens(db: Session, now: datetime.datetime | None = None) -> int:
+    """Delete refresh tokens that have expired; returns the number removed."""
+    result = db.execute(delete(RefreshToken).where(RefreshToken.expires_at < (now or _now_utc())))
+    db.commit()
+    return result.rowcount
+
+
+# ================================================================== #
+# Per-user Revocation                                                #
+# ================================================================== #
+
+def revoke_user_tokens(db: Session, user_id: int) -> datetime.datetime:
+    """Revoke every refresh token of a user and set their token cut-off to now.
+
+    Returns:
+        datetime.datetime: The cut-off; tokens issued earlier are invalid.
+    """
+    # Whole seconds, matching the resolution of the ``iat`` claim; tokens issued
+    # in this second are revoked too
+    revoked_before = _now_utc().replace(microsecond=0)
+
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=revoked_before)
+        .execution_options(synchronize_session="fetch")
+    )
+    revocation = db.get(TokenRevocation, user_id)
+    if revocation is None:
+        db.add(TokenRevocation(user_id=user_id, revoked_before=revoked_before))
+    else:
+        revocation.revoked_before = revoked_before
+    db.commit()
+    return revoked_before
+
+
+def get_revocation_cutoffs(db: Session, since: datetime.datetime) -> dict[int, datetime.datetime]:
+    """Return the cut-off of every user revoked after ``since``.
+
+    Older cut-offs no longer matter once every token issued before them has
+    expired, so callers pass ``now - longest token lifetime``.
+    """
+    rows = db.execute(
+        select(TokenRevocation.user_id, TokenRevocation.revoked_before)
+        .where(TokenRevocation.revoked_before > since)
+    ).all()
+    return {user_id: as_utc(revoked_before) for user_id, revoked_before in rows}
@@ -5,9 +5,12 @@ from __future__ import annotations
 import datetime
 
 from sqlalchemy import select, and_, func
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, aliased, selectinload
 from sqlalchemy.sql import Select
 
+from backend.core.pagination import Keyset, SortKey
+from backend.core.serialization import ColumnProjection, RowLayout, construct
+from backend.models.core import Unit
 from backend.models.food import FoodItem
 from backend.models.kitchen import Kitchen
 from backend.models.shopping import (
@@ -30,6 +33,19 @@ from backend.schemas.shopping import (
     ShoppingListWithProducts
 )
 
+# Ordering of ``get_all_shopping_products``: newest first
+SHOPPING_PRODUCT_KEYSET = Keyset(
+    SortKey(ShoppingProduct.created_at, descending=True), SortKey(ShoppingProduct.id, descending=True)
+)
+
+# Assignment list rows: assignment and product columns, then the names of the
+# product's food item, package unit and base unit (NULL if missing)
+_ASSIGNMENT_COLUMNS = ColumnProjection(ShoppingProductAssignmentRead, ShoppingProductAssignment.__table__)
+_PRODUCT_COLUMNS = ColumnProjection(ShoppingProductRead, ShoppingProduct.__table__)
+_ASSIGNMENT_ROW = RowLayout(_ASSIGNMENT_COLUMNS, _PRODUCT_COLUMNS)
+_PackageUnit = aliased(Unit)
+_BaseUnit = aliased(Unit)
+
 
 # ================================================================== #
 # Helper Functions for Schema Conversion                            #
@@ -55,11 +71,6 @@ def build_shopping_product_read(product_orm: ShoppingProduct) -> ShoppingProduct
     if product_orm.food_item and product_orm.food_item.base_unit:
         base_unit_name = product_orm.food_item.base_unit.name
 
-    # Calculate unit price
-    unit_price = None
-    if product_orm.estimated_price and product_orm.quantity_in_base_unit > 0:
-        unit_price = product_orm.estimated_price / product_orm.quantity_in_base_unit
-
     return ShoppingProductRead(
         id=product_orm.id,
         food_item_id=product_orm.food_item_id,
@@ -73,10 +84,17 @@ def build_shopping_product_read(product_orm: ShoppingProduct) -> ShoppingProduct
         food_item_name=food_item_name,
         package_unit_name=package_unit_name,
         base_unit_name=base_unit_name,
-        unit_price=unit_price
+        unit_price=_unit_price(product_orm.estimated_price, product_orm.quantity_in_base_unit)
     )
 
 
+def _unit_price(estimated_price: float | None, quantity_in_base_unit: float) -> float | None:
+    """Return the price per base unit, or None without a price."""
+    if estimated_price and quantity_in_base_unit > 0:
+        return estimated_price / quantity_in_base_unit
+    return None
+
+
 def build_shopping_product_assignment_read(
         assignment_orm: ShoppingProductAssignment
 ) -> ShoppingProductAssignmentRead:
@@ -362,18 +380,23 @@ def get_all_shopping_products(
         db: Session,
         search_params: ShoppingProductSearchParams | None = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
 ) -> list[ShoppingProductRead]:
     """Get all shopping products with optional filtering - returns schemas.
 
     Args:
         db: Database session.
         search_params: Optional search parameters.
-        skip: Number of records to skip.
+        skip: Number of records to skip (ignored when a cursor is given).
         limit: Maximum number of records to return.
+        cursor: Cursor of the previous page (see ``SHOPPING_PRODUCT_KEYSET``).
 
     Returns:
-        A list of shopping product schemas.
+        A list of shopping product schemas, newest first.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
     """
     query: Select = (
         select(ShoppingProduct)
@@ -381,9 +404,6 @@ def get_all_shopping_products(
             selectinload(ShoppingProduct.food_item).selectinload(FoodItem.base_unit),
             selectinload(ShoppingProduct.package_unit)
         )
-        .order_by(ShoppingProduct.created_at.desc())
-        .offset(skip)
-        .limit(limit)
     )
 
     if search_params:
@@ -398,6 +418,7 @@ def get_all_shopping_products(
         if search_params.package_type is not None:
             query = query.where(ShoppingProduct.package_type.ilike(f"%{search_params.package_type}%"))
 
+    query = SHOPPING_PRODUCT_KEYSET.paginate(query, cursor=cursor, skip=skip, limit=limit)
     products = db.scalars(query).all()
     return [build_shopping_product_read(product) for product in products]
 
@@ -582,14 +603,11 @@ def get_shopping_list_product_assignments(
         A list of assignment schemas.
     """
     query: Select = (
-        select(ShoppingProductAssignment)
-        .options(
-            selectinload(ShoppingProductAssignment.shopping_product)
-            .selectinload(ShoppingProduct.food_item)
-            .selectinload(FoodItem.base_unit),
-            selectinload(ShoppingProductAssignment.shopping_product)
-            .selectinload(ShoppingProduct.package_unit)
-        )
+        select(*_ASSIGNMENT_ROW.columns, FoodItem.name, _PackageUnit.name, _BaseUnit.name)
+        .join(ShoppingProduct, ShoppingProduct.id == ShoppingProductAssignment.shopping_product_id)
+        .outerjoin(FoodItem, FoodItem.id == ShoppingProduct.food_item_id)
+        .outerjoin(_PackageUnit, _PackageUnit.id == ShoppingProduct.package_unit_id)
+        .outerjoin(_BaseUnit, _BaseUnit.id == FoodItem.base_unit_id)
         .where(ShoppingProductAssignment.shopping_list_id == list_id)
         .order_by(ShoppingProductAssignment.created_at.desc())
         .offset(skip)
@@ -606,12 +624,27 @@ def get_shopping_list_product_assignments(
                 ShoppingProductAssignment.added_by_user_id == search_params.added_by_user_id
             )
         if search_params.food_item_id is not None:
-            query = query.join(ShoppingProduct).where(
-                ShoppingProduct.food_item_id == search_params.food_item_id
-            )
+            query = query.where(ShoppingProduct.food_item_id == search_params.food_item_id)
 
-    assignments = db.scalars(query).all()
-    return [build_shopping_product_assignment_read(assignment) for assignment in assignments]
+    # Plain column rows instead of assignments with three levels of eager loads
+    product_index = _ASSIGNMENT_ROW.index(_PRODUCT_COLUMNS, "id")
+    names_index = len(_ASSIGNMENT_ROW.columns)
+    products: dict[int, ShoppingProductRead] = {}
+    assignments = []
+    for row in db.execute(query):
+        product = products.get(row[product_index])
+        if product is None:
+            food_item_name, package_unit_name, base_unit_name = row[names_index:]
+            values = _ASSIGNMENT_ROW.values(row, _PRODUCT_COLUMNS)
+            values.update(
+                food_item_name=food_item_name or "Unknown",
+                package_unit_name=package_unit_name or "Unknown",
+                base_unit_name=base_unit_name or "Unknown",
+                unit_price=_unit_price(values["estimated_price"], values["quantity_in_base_unit"]),
+            )
+            product = products[row[product_index]] = construct(ShoppingProductRead, values)
+        assignments.append(_ASSIGNMENT_ROW.build(row, _ASSIGNMENT_COLUMNS, shopping_product=product))
+    return assignments
 
 
 def update_product_assignment(
@@ -6,6 +6,8 @@ from pydantic import EmailStr
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.crud import aggregate as crud_aggregate
+from backend.crud import recipe as crud_recipe
 from backend.models.user import User
 from backend.schemas.user import UserCreate, UserRead, UserUpdate
 
@@ -189,6 +191,14 @@ def delete_user(db: Session, user_id: int) -> bool:
     if not user_orm:
         return False
 
+    # Created recipes are removed by cascade; let their counters re-seed
+    if user_orm.created_recipes:
+        crud_aggregate.reset_counters(db, crud_recipe.RECIPE_COUNTER_SCOPE)
+        for recipe in user_orm.created_recipes:
+            crud_aggregate.reset_counters(
+                db, crud_aggregate.counter_scope(crud_recipe.RECIPE_RATING_COUNTER_PREFIX, recipe.id)
+            )
+
     db.delete(user_orm)
     db.commit()
 
@@ -0,0 +1,110 @@
+"""Benchmark OFFSET against keyset (cursor) pagination on a large recipes table.
+
+Seeds a throw-away SQLite database with ``--rows`` recipes and times fetching
+one page at increasing depths through ``crud_recipe.get_all_recipes`` – once
+with ``skip`` (OFFSET) and once with the cursor of the preceding row. OFFSET
+latency grows with the depth while keyset latency stays flat.
+
+Usage (CLI):
+    python -m backend.db.benchmark_pagination                      # 1M rows
+    python -m backend.db.benchmark_pagination --rows 200000 --page-size 50
+"""
+
+from __future__ import annotations
+
+import datetime
+import tempfile
+import time
+from pathlib import Path
+
+import click
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from backend.core.enums import RecipeSortField, SortOrder
+from backend.crud import recipe as crud_recipe
+from backend.db.base import Base
+from backend.models import user  # noqa: F401  – ensures users table is registered for the FK
+from backend.models.recipe import Recipe
+from backend.schemas.recipe import RecipeSearchParams
+
+_SEED_BATCH = 50_000
+
+
+def seed_recipes(db: Session, rows: int) -> None:
+    """Insert ``rows`` minimal recipes, three per creation second."""
+    start = datetime.datetime(2020, 1, 1)
+    for offset in range(0, rows, _SEED_BATCH):
+        db.execute(insert(Recipe), [
+            {
+                "title": f"Recipe {i}",
+                "created_at": start + datetime.timedelta(seconds=i // 3),
+                "updated_at": start,
+            }
+            for i in range(offset, min(offset + _SEED_BATCH, rows))
+        ])
+    db.commit()
+
+
+def time_page(db: Session, search_params: RecipeSearchParams, page_size: int, **page) -> float:
+    """Return the best of three timings (in ms) for fetching one page."""
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        crud_recipe.get_all_recipes(db, search_params, limit=page_size, **page)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def benchmark_pagination(rows: int, page_size: int) -> list[tuple[int, float, float]]:
+    """Time OFFSET and keyset pages at increasing depths.
+
+    Args:
+        rows: Number of recipes to seed.
+        page_size: Rows per page.
+
+    Returns:
+        ``(depth, offset_ms, keyset_ms)`` per measured depth.
+    """
+    search_params = RecipeSearchParams(sort_by=RecipeSortField.CREATED_AT, sort_order=SortOrder.DESC)
+    keyset = crud_recipe.recipe_keyset(search_params)
+    depths = sorted({0, *(depth for depth in (1_000, 10_000, 100_000, 500_000) if depth < rows), rows - page_size})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'benchmark.sqlite'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            click.echo(f"Seeding {rows:,} recipes …")
+            seed_recipes(db, rows)
+
+            results = []
+            for depth in depths:
+                # Cursor of the row just before the page, as the previous page would return it
+                previous = db.scalars(
+                    keyset.paginate(select(Recipe), skip=depth - 1, limit=1)
+                ).first() if depth else None
+                cursor = keyset.encode([getattr(previous, name) for name in keyset.names]) if previous else None
+
+                offset_ms = time_page(db, search_params, page_size, skip=depth)
+                keyset_ms = time_page(db, search_params, page_size, cursor=cursor)
+                results.append((depth, offset_ms, keyset_ms))
+        engine.dispose()
+    return results
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Compare OFFSET and keyset pagination latency.")
+@click.option("--rows", type=int, default=1_000_000, show_default=True, help="Recipes to seed.")
+@click.option("--page-size", type=int, default=50, show_default=True, help="Rows per page.")
+def _cli(rows: int, page_size: int) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    results = benchmark_pagination(rows, page_size)
+    click.echo(f"{'depth':>10}  {'offset ms':>10}  {'keyset ms':>10}")
+    for depth, offset_ms, keyset_ms in results:
+        click.echo(f"{depth:>10,}  {offset_ms:>10.2f}  {keyset_ms:>10.2f}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
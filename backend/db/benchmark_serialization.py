@@ -0,0 +1,177 @@
+"""Benchmark validated against constructed serialization of large list responses.
+
+Seeds an in-memory SQLite database with ``--rows`` inventory items and
+recipes. A throw-away app then serves the same lists two ways, timed end to
+end (query included) through FastAPI:
+
+* **validated** – ORM entities with eager-loaded relationships,
+  ``Schema.model_validate(orm, from_attributes=True)`` per row, then FastAPI's
+  ``response_model`` validation and JSON encoding (the previous behaviour of
+  the inventory and recipe list endpoints);
+* **constructed** – ``crud.inventory.get_kitchen_inventory`` /
+  ``crud.recipe.get_all_recipes``, which build schemas from plain column rows
+  without validation, rendered with ``json_response`` as the endpoints do now.
+
+Usage (CLI):
+    python -m backend.db.benchmark_serialization               # 10k rows
+    python -m backend.db.benchmark_serialization --rows 50000
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+from collections.abc import Callable
+
+import click
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import Engine, Select, create_engine, insert, select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.pool import StaticPool
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.enums import UnitType
+from backend.core.serialization import json_response
+from backend.crud import inventory as crud_inventory
+from backend.crud import recipe as crud_recipe
+from backend.db.base import Base
+from backend.models.core import Unit
+from backend.models.food import FoodItem
+from backend.models.inventory import InventoryItem, StorageLocation
+from backend.models.kitchen import Kitchen
+from backend.models.recipe import Recipe
+from backend.schemas.inventory import InventoryItemRead
+from backend.schemas.recipe import RecipeRead
+
+
+def seed(db: Session, rows: int) -> None:
+    """Insert ``rows`` inventory items (one per food item) and ``rows`` recipes."""
+    now = datetime.datetime(2025, 1, 1)
+    db.add_all([
+        Unit(id=1, name="g", type=UnitType.WEIGHT, to_base_factor=1.0),
+        Kitchen(id=1, name="Benchmark"),
+        StorageLocation(id=1, kitchen_id=1, name="Pantry"),
+    ])
+    db.flush()
+    db.execute(insert(FoodItem), [
+        {"id": i, "name": f"Food {i}", "base_unit_id": 1, "created_at": now, "updated_at": now}
+        for i in range(1, rows + 1)
+    ])
+    db.execute(insert(InventoryItem), [
+        {
+            "kitchen_id": 1,
+            "food_item_id": i + 1,
+            "storage_location_id": 1,
+            "quantity": float(i % 7),
+            "min_quantity": 2.0,
+            "expiration_date": (now + datetime.timedelta(days=i % 30)).date(),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ])
+    db.execute(insert(Recipe), [
+        {
+            "title": f"Recipe {i}",
+            "difficulty": ("easy", "medium", "hard")[i % 3],
+            "tags": ["quick", "dinner"],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ])
+    db.commit()
+
+
+def _build_app(engine: Engine, rows: int) -> FastAPI:
+    app = FastAPI()
+
+    def validated(schema: type[BaseModel], query: Select) -> Callable[[], list[BaseModel]]:
+        def endpoint() -> list[BaseModel]:
+            with Session(engine) as db:
+                return [schema.model_validate(row, from_attributes=True) for row in db.scalars(query)]
+        return endpoint
+
+    def constructed(read: Callable[[Session], list[BaseModel]]) -> Callable[[], Response]:
+        def endpoint() -> Response:
+            with Session(engine) as db:
+                return json_response(read(db))
+        return endpoint
+
+    inventory_query = (
+        select(InventoryItem)
+        .options(selectinload(InventoryItem.food_item).selectinload(FoodItem.base_unit))
+        .options(selectinload(InventoryItem.storage_location))
+        .where(InventoryItem.kitchen_id == 1)
+    )
+    recipe_query = select(Recipe).options(selectinload(Recipe.created_by_user)).limit(rows)
+
+    app.get("/inventory/validated", response_model=list[InventoryItemRead])(
+        validated(InventoryItemRead, inventory_query)
+    )
+    app.get("/inventory/constructed", response_model=list[InventoryItemRead])(
+        constructed(lambda db: crud_inventory.get_kitchen_inventory(db, kitchen_id=1))
+    )
+    app.get("/recipes/validated", response_model=list[RecipeRead])(validated(RecipeRead, recipe_query))
+    app.get("/recipes/constructed", response_model=list[RecipeRead])(
+        constructed(lambda db: crud_recipe.get_all_recipes(db, limit=rows))
+    )
+    return app
+
+
+def time_request(client: TestClient, path: str, repeat: int = 3) -> tuple[float, bytes]:
+    """Return the best of ``repeat`` timings (in ms) and the body of one request."""
+    timings = []
+    body = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        body = response.content
+    return min(timings), body
+
+
+def benchmark_serialization(rows: int) -> list[tuple[str, float, float]]:
+    """Time both serialization paths for inventory and recipe lists.
+
+    Args:
+        rows: Number of inventory items and of recipes to seed.
+
+    Returns:
+        ``(list, validated_ms, constructed_ms)`` per list.
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        click.echo(f"Seeding {rows:,} inventory items and recipes …")
+        seed(db, rows)
+
+    client = TestClient(_build_app(engine, rows))
+    results = []
+    for name in ("inventory", "recipes"):
+        validated_ms, validated_body = time_request(client, f"/{name}/validated")
+        constructed_ms, constructed_body = time_request(client, f"/{name}/constructed")
+        if len(validated_body) != len(constructed_body):
+            raise RuntimeError(f"{name} responses differ")
+        results.append((name, validated_ms, constructed_ms))
+    engine.dispose()
+    return results
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Compare validated and constructed serialization of list endpoints.")
+@click.option("--rows", type=int, default=10_000, show_default=True, help="Rows per list.")
+def _cli(rows: int) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    click.echo(f"{'list':>10}  {'validated ms':>13}  {'constructed ms':>15}  {'speed-up':>8}")
+    for name, validated_ms, constructed_ms in benchmark_serialization(rows):
+        click.echo(f"{name:>10}  {validated_ms:>13.1f}  {constructed_ms:>15.1f}  {validated_ms / constructed_ms:>7.1f}x")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
@@ -0,0 +1,62 @@
+"""Check (and optionally repair) the aggregate counters behind summary endpoints.
+
+Usage (CLI):
+    python -m backend.db.check_counters           # report drifted counters
+    python -m backend.db.check_counters --repair  # rebuild drifted scopes
+    python -m backend.db.check_counters --reset   # drop all counters; re-seeded on next read
+"""
+
+from __future__ import annotations
+
+import click
+
+from backend.crud import aggregate as crud_aggregate
+from backend.crud import ai_model_output, device, recipe  # noqa: F401  – register counter sources
+from backend.db.session import SessionLocal
+
+
+def check_counters(*, repair: bool = False, reset: bool = False) -> int:
+    """Compare stored counters with their source tables.
+
+    Args:
+        repair: Rebuild every scope that has drifted.
+        reset: Delete all counters instead of checking them.
+
+    Returns:
+        Number of mismatching counters found.
+    """
+    with SessionLocal() as db:
+        if reset:
+            crud_aggregate.reset_all_counters(db)
+            click.echo("All counters dropped – they are rebuilt on next read.")
+            return 0
+
+        mismatches = crud_aggregate.check_counters(db, repair=repair)
+
+    for mismatch in mismatches:
+        click.echo(
+            f"{mismatch.scope} {mismatch.dimension}/{mismatch.key}: "
+            f"stored {mismatch.stored}, expected {mismatch.expected}"
+        )
+    if not mismatches:
+        click.echo("All counters consistent ✔")
+    elif repair:
+        click.echo(f"Repaired {len(mismatches)} counters ✔")
+    return len(mismatches)
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Check aggregate counters against their source tables.")
+@click.option("--repair", is_flag=True, default=False, help="Rebuild drifted scopes.")
+@click.option("--reset", is_flag=True, default=False, help="Drop all counters.")
+def _cli(repair: bool, reset: bool) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    found = check_counters(repair=repair, reset=reset)
+    if found and not repair:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
@@ -20,6 +20,7 @@ from backend.models import kitchen  # noqa: F401  – ensures Kitchen model is r
 from backend.models import inventory  # noqa: F401  – ensures Inventory model is registered
 from backend.models import recipe  # noqa: F401  – ensures Recipe model is registered
 from backend.models import ai_model_output  # noqa: F401  – ensures AIModelOutput model is registered
+from backend.models import aggregate  # noqa: F401  – ensures AggregateCounter model is registered
 from backend.models import shopping  # noqa: F401  – ensures ShoppingList model is registered
 from backend.models import core  # noqa: F401  – ensures Unit models are registered
 from backend.models import food  # noqa: F401  – ensures FoodItem models are registered
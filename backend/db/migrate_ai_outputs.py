@@ -0,0 +1,156 @@
+"""Migrate legacy ``ai_model_outputs`` rows to deduplicated, compressed storage.
+
+Legacy rows keep the full prompt as a ``str(dict)`` blob in ``prompt_used``
+and the response as plain text in ``raw_output``. This script moves prompts
+into the content-addressed ``ai_prompts`` table and compresses raw outputs.
+
+Usage (CLI):
+    python -m backend.db.migrate_ai_outputs             # migrate if needed
+    python -m backend.db.migrate_ai_outputs --vacuum    # also reclaim space (SQLite)
+
+The migration is idempotent: it does nothing once the legacy columns are gone.
+"""
+
+from __future__ import annotations
+
+import ast
+from typing import Any
+
+import click
+from sqlalchemy import Engine, MetaData, Table, inspect, select, text
+from sqlalchemy.orm import Session
+
+from backend.crud.ai_model_output import encode_raw_output, get_or_create_prompt_orm
+from backend.db.session import engine as default_engine
+from backend.models import user  # noqa: F401  – ensures users table is registered for the FK
+from backend.models.ai_model_output import AIModelOutput, AIPrompt
+
+LEGACY_TABLE = "ai_model_outputs_legacy"
+
+
+def split_legacy_prompt(prompt_used: str) -> tuple[str, str | None, dict[str, Any] | None]:
+    """Split a legacy ``prompt_used`` value into its structured parts.
+
+    Args:
+        prompt_used: Either a ``str(dict)`` repr with system/user prompts or plain text.
+
+    Returns:
+        Tuple of (user prompt, system prompt or None, original request or None).
+    """
+    stripped = prompt_used.strip()
+    if stripped.startswith("{"):
+        try:
+            parsed = ast.literal_eval(stripped)
+        except (ValueError, SyntaxError):
+            parsed = None
+        if isinstance(parsed, dict) and "user_prompt" in parsed:
+            original_request = parsed.get("original_request")
+            return (
+                str(parsed["user_prompt"]),
+                parsed.get("system_prompt") or None,
+                original_request if isinstance(original_request, dict) else None,
+            )
+    return prompt_used, None, None
+
+
+def needs_migration(engine: Engine) -> bool:
+    """Return True if ``ai_model_outputs`` still has the legacy text columns."""
+    inspector = inspect(engine)
+    if not inspector.has_table(AIModelOutput.__tablename__):
+        return False
+    columns = {col["name"] for col in inspector.get_columns(AIModelOutput.__tablename__)}
+    return "prompt_used" in columns
+
+
+def migrate_ai_outputs(engine: Engine = default_engine, *, batch_size: int = 500, vacuum: bool = False) -> int:
+    """Move legacy AI outputs to the deduplicated, compressed layout.
+
+    Args:
+        engine: Engine bound to the database to migrate.
+        batch_size: Number of rows converted per transaction.
+        vacuum: Run ``VACUUM`` afterwards to return freed pages (SQLite only).
+
+    Returns:
+        Number of migrated rows.
+    """
+    if not needs_migration(engine):
+        click.echo("ai_model_outputs already uses structured storage – nothing to do.")
+        return 0
+
+    inspector = inspect(engine)
+    legacy_indexes = [ix["name"] for ix in inspector.get_indexes(AIModelOutput.__tablename__)]
+
+    click.echo("Renaming legacy table …")
+    with engine.begin() as conn:
+        # Index names are global, so free them for the new table
+        for index_name in legacy_indexes:
+            conn.execute(text(f'DROP INDEX IF EXISTS "{index_name}"'))
+        conn.execute(text(f'ALTER TABLE {AIModelOutput.__tablename__} RENAME TO {LEGACY_TABLE}'))
+
+    AIPrompt.__table__.create(bind=engine, checkfirst=True)
+    AIModelOutput.__table__.create(bind=engine)
+
+    legacy = Table(LEGACY_TABLE, MetaData(), autoload_with=engine)
+    migrated = 0
+    last_id = 0
+
+    click.echo("Converting rows …")
+    while True:
+        with engine.connect() as conn:
+            rows = conn.execute(
+                select(legacy).where(legacy.c.id > last_id).order_by(legacy.c.id).limit(batch_size)
+            ).mappings().all()
+        if not rows:
+            break
+
+        with Session(engine) as db:
+            for row in rows:
+                user_prompt, system_prompt, prompt_params = split_legacy_prompt(row["prompt_used"] or "")
+                raw_output_data, raw_output_encoding = encode_raw_output(row["raw_output"] or "")
+                db.add(AIModelOutput(
+                    id=row["id"],
+                    user_id=row["user_id"],
+                    model_version=row["model_version"],
+                    output_type=row["output_type"],
+                    output_format=row["output_format"],
+                    prompt=get_or_create_prompt_orm(db, user_prompt),
+                    system_prompt=get_or_create_prompt_orm(db, system_prompt) if system_prompt else None,
+                    prompt_params=prompt_params,
+                    raw_output_data=raw_output_data,
+                    raw_output_encoding=raw_output_encoding,
+                    extra_data=row["extra_data"],
+                    target_type=row["target_type"],
+                    target_id=row["target_id"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"],
+                ))
+            db.commit()
+
+        migrated += len(rows)
+        last_id = rows[-1]["id"]
+        click.echo(f"  {migrated} rows migrated")
+
+    legacy.drop(bind=engine)
+
+    if vacuum and engine.dialect.name == "sqlite":
+        click.echo("Vacuuming database …")
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM"))
+
+    click.echo("Done ✔")
+    return migrated
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Migrate AI outputs to deduplicated, compressed storage.")
+@click.option("--batch-size", default=500, show_default=True, help="Rows converted per transaction.")
+@click.option("--vacuum", is_flag=True, default=False, help="Reclaim freed space afterwards (SQLite).")
+def _cli(batch_size: int, vacuum: bool) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    migrate_ai_outputs(batch_size=batch_size, vacuum=vacuum)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
@@ -0,0 +1,86 @@
+"""Add and backfill the denormalized rating columns on ``recipes``.
+
+``recipes.average_rating`` and ``recipes.review_count`` are maintained by the
+review CRUD functions. Databases created before these columns existed need
+them added, indexed and filled from ``recipe_reviews`` once.
+
+Usage (CLI):
+    python -m backend.db.migrate_recipe_ratings
+
+The migration is idempotent: missing columns and indexes are added, and the
+backfill recomputes every recipe from its reviews.
+"""
+
+from __future__ import annotations
+
+import click
+from sqlalchemy import Engine, func, inspect, select, text, update
+
+from backend.db.session import engine as default_engine
+from backend.models import user  # noqa: F401  – ensures users table is registered for the FK
+from backend.models.recipe import Recipe, RecipeReview
+
+_NEW_COLUMNS = {
+    "average_rating": "FLOAT",
+    "review_count": "INTEGER NOT NULL DEFAULT 0",
+}
+_INDEXED_COLUMNS = ("average_rating", "review_count", "created_at")
+
+
+def migrate_recipe_ratings(engine: Engine = default_engine) -> int:
+    """Add missing rating columns and recompute them for every recipe.
+
+    Args:
+        engine: Engine bound to the database to migrate.
+
+    Returns:
+        Number of recipes updated by the backfill.
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table(Recipe.__tablename__):
+        click.echo("recipes table does not exist – run init_db instead.")
+        return 0
+
+    columns = {col["name"] for col in inspector.get_columns(Recipe.__tablename__)}
+    indexes = {ix["name"] for ix in inspector.get_indexes(Recipe.__tablename__)}
+
+    with engine.begin() as conn:
+        for name, ddl in _NEW_COLUMNS.items():
+            if name not in columns:
+                click.echo(f"Adding recipes.{name} …")
+                conn.execute(text(f"ALTER TABLE {Recipe.__tablename__} ADD COLUMN {name} {ddl}"))
+        for name in _INDEXED_COLUMNS:
+            index_name = f"ix_{Recipe.__tablename__}_{name}"
+            if index_name not in indexes:
+                conn.execute(text(f"CREATE INDEX {index_name} ON {Recipe.__tablename__} ({name})"))
+
+        click.echo("Backfilling rating aggregates …")
+        reviews = RecipeReview.__table__
+        result = conn.execute(
+            update(Recipe.__table__).values(
+                average_rating=select(func.avg(reviews.c.rating))
+                .where(reviews.c.recipe_id == Recipe.__table__.c.id)
+                .scalar_subquery(),
+                review_count=select(func.count(reviews.c.rating))
+                .where(reviews.c.recipe_id == Recipe.__table__.c.id)
+                .scalar_subquery(),
+                # Aggregates are not a recipe edit
+                updated_at=Recipe.__table__.c.updated_at,
+            )
+        )
+
+    click.echo("Done ✔")
+    return result.rowcount
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Add and backfill recipe rating aggregates.")
+def _cli() -> None:  # pragma: no cover
+    """CLI wrapper."""
+    migrate_recipe_ratings()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
@@ -4,9 +4,12 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from backend.core.config import settings
+from backend.core.metrics import instrument_pool
 
 engine = create_engine(
     settings.DATABASE_URL, connect_args={"check_same_thread": False}
 )
+# Connection wait time for /metrics
+instrument_pool(engine.pool)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Dict
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Response
+from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_mcp import FastApiMCP
 
+from backend.core.cache import reference_cache
+from backend.core.config import settings
+from backend.core.dependencies import require_super_admin
+from backend.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, registry
+from backend.core.pagination import NEXT_CURSOR_HEADER
+from backend.core.profiling import PROFILE_ID_HEADER, ProfilingMiddleware, profile_store
+from backend.core.query_stats import QueryStatsMiddleware, query_log
+from backend.core.serialization import FastJSONResponse
+from backend.services.ai.openai_service import close_openai_clients
+
 # v1 routers
 from backend.api.v1 import (
     auth,
@@ -26,6 +39,13 @@ from backend.api.v1 import (
 )
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Release the connection pools of the shared OpenAI clients
+    await close_openai_clients()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application instance.
 
@@ -47,6 +67,9 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         faopenapi_url="/openapi.json",
+        lifespan=_lifespan,
+        # orjson instead of the stdlib json module for all JSON responses
+        default_response_class=FastJSONResponse,
     )
 
     # CORS settings based on environment
@@ -56,8 +79,20 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "ETag", PROFILE_ID_HEADER],
     )
 
+    # Sampling profiles of requests picked by rate or X-Profile from admins
+    app.add_middleware(ProfilingMiddleware)
+
+    # Per-request SQL query count and time as a Server-Timing header
+    if settings.QUERY_STATS_ENABLED:
+        app.add_middleware(QueryStatsMiddleware)
+
+    # Per-route latency, in-flight requests and server errors for /metrics; outermost
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
     # Public routers (no auth required)
     app.include_router(auth.router, prefix="/v1")
 
@@ -92,6 +127,40 @@ def create_app() -> FastAPI:
         return {"status": "healthy"}
 
 
+    @app.get("/health/cache", tags=["Service"], dependencies=[Depends(require_super_admin)])
+    def cache_stats() -> Dict[str, Any]:
+        """Hit/miss metrics of the reference data cache (admin only)."""
+        return {"reference_cache": reference_cache.stats()}
+
+
+    @app.get("/health/queries", tags=["Service"], dependencies=[Depends(require_super_admin)])
+    def query_stats() -> Dict[str, Any]:
+        """SQL query counts, time and repeated statements of recent requests (admin only)."""
+        return {"requests": query_log.recent()}
+
+
+    @app.get("/health/profiles", tags=["Service"], dependencies=[Depends(require_super_admin)])
+    def list_profiles() -> Dict[str, Any]:
+        """Stored request profiles, newest first (admin only)."""
+        return {"profiles": profile_store.list()}
+
+
+    @app.get("/health/profiles/{name}", tags=["Service"], dependencies=[Depends(require_super_admin)])
+    def get_profile(name: str) -> FileResponse:
+        """Download one request profile in speedscope format (admin only)."""
+        path = profile_store.path(name)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return FileResponse(path, media_type="application/json", filename=name)
+
+
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", tags=["Service"], include_in_schema=False)
+        def metrics() -> Response:
+            """Process metrics in the Prometheus text exposition format."""
+            return Response(registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+
     mcp = FastApiMCP(
         app,
         include_operations=["get_service_status", "get_current_user_profile", "list_users"],
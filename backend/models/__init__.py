@@ -1,6 +1,7 @@
 """SQLAlchemy models package."""
 
 from backend.models import (
+    aggregate,
     ai_model_output,
     core,
     device,
@@ -8,6 +9,7 @@ from backend.models import (
     inventory,
     kitchen,
     recipe,
+    refresh_token,
     shopping,
     user,
     user_credentials,
@@ -15,6 +17,7 @@ from backend.models import (
 )
 
 __all__ = [
+    "aggregate",
     "ai_model_output",
     "core",
     "device",
@@ -22,6 +25,7 @@ __all__ = [
     "inventory",
     "kitchen",
     "recipe",
+    "refresh_token",
     "shopping",
     "user",
     "user_credentials",
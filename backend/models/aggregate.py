@@ -0,0 +1,46 @@
+"""SQLAlchemy ORM models for incrementally maintained aggregate counters."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.base import Base
+
+
+class AggregateCounter(Base):
+    """Represents a row in the ``aggregate_counters`` table.
+
+    Each row holds one pre-computed count, addressed by a ``scope`` (the
+    summarised entity, e.g. ``ai_outputs``), a ``dimension`` (what is grouped
+    by, e.g. ``by_user``) and a ``key`` (the group value, e.g. ``"42"``).
+    Rows are adjusted in the same transaction as the writes they count, so
+    summary endpoints read them instead of scanning the source tables.
+    """
+
+    __tablename__ = "aggregate_counters"
+
+    # ------------------------------------------------------------------ #
+    # Columns                                                             #
+    # ------------------------------------------------------------------ #
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    dimension: Mapped[str] = mapped_column(String(50), primary_key=True)
+    key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
+
+    # ------------------------------------------------------------------ #
+    # Dunder                                                               #
+    # ------------------------------------------------------------------ #
+    def __repr__(self) -> str:  # noqa: D401 – we want a short repr
+        return (
+            f"AggregateCounter(scope={self.scope!r}, dimension={self.dimension!r}, "
+            f"key={self.key!r}, value={self.value!r})"
+        )
@@ -4,13 +4,40 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Integer, String, Text, JSON, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Integer, LargeBinary, String, Text, JSON, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.core.enums import OutputFormat, OutputType
 from backend.db.base import Base
 
 
+class AIPrompt(Base):
+    """Represents a row in the ``ai_prompts`` table.
+
+    Content-addressed prompt storage: each distinct prompt text is stored once
+    and referenced by hash, so the large system prompt shared by every AI call
+    is not duplicated per output row.
+    """
+
+    __tablename__ = "ai_prompts"
+
+    # ------------------------------------------------------------------ #
+    # Columns                                                             #
+    # ------------------------------------------------------------------ #
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+    # ------------------------------------------------------------------ #
+    # Dunder                                                               #
+    # ------------------------------------------------------------------ #
+    def __repr__(self) -> str:  # noqa: D401 – we want a short repr
+        return f"AIPrompt(id={self.id!r}, content_hash={self.content_hash[:12]!r})"
+
+
 class AIModelOutput(Base):
     """Represents a row in the ``ai_model_outputs`` table.
 
@@ -20,6 +47,9 @@ class AIModelOutput(Base):
     
     Supports polymorphic targeting through target_type and target_id fields,
     allowing AI outputs to be linked to any type of entity in the system.
+
+    Prompts are referenced from ``ai_prompts`` and the raw output is stored
+    compressed; ``crud.ai_model_output`` handles encoding and decoding.
     """
 
     __tablename__ = "ai_model_outputs"
@@ -37,13 +67,26 @@ class AIModelOutput(Base):
     model_version: Mapped[str | None] = mapped_column(String(100), default=None)
     output_type: Mapped[OutputType] = mapped_column(nullable=False)
     output_format: Mapped[OutputFormat | None] = mapped_column(default=None)
-    prompt_used: Mapped[str] = mapped_column(Text, nullable=False)
-    raw_output: Mapped[str] = mapped_column(Text, nullable=False)
+    prompt_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("ai_prompts.id"),
+        nullable=False,
+        index=True
+    )
+    system_prompt_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("ai_prompts.id"),
+        default=None,
+        index=True
+    )
+    prompt_params: Mapped[dict | None] = mapped_column(JSON, default=None)
+    raw_output_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    raw_output_encoding: Mapped[str] = mapped_column(String(10), nullable=False, default="zlib")
     extra_data: Mapped[dict | None] = mapped_column(JSON, default=None)
     target_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     target_id: Mapped[int | None] = mapped_column(Integer, default=None, index=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+        DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -52,6 +95,16 @@ class AIModelOutput(Base):
         onupdate=lambda: datetime.now(timezone.utc)
     )
 
+    # ------------------------------------------------------------------ #
+    # Relationships                                                       #
+    # ------------------------------------------------------------------ #
+    prompt: Mapped[AIPrompt] = relationship(
+        "AIPrompt", foreign_keys=[prompt_id], lazy="selectin"
+    )
+    system_prompt: Mapped[AIPrompt | None] = relationship(
+        "AIPrompt", foreign_keys=[system_prompt_id], lazy="selectin"
+    )
+
     # ------------------------------------------------------------------ #
     # Dunder                                                               #
     # ------------------------------------------------------------------ #
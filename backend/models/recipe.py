@@ -42,9 +42,14 @@ class Recipe(Base):
     difficulty: Mapped[str] = mapped_column(String(10), nullable=False, default="medium")
     servings: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     tags: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    # Denormalized from recipe_reviews by the review CRUD functions; the
+    # per-rating distribution lives in the ``recipe_ratings:<id>`` counters
+    average_rating: Mapped[float | None] = mapped_column(Float, nullable=True, index=True)
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime,
         nullable=False,
+        index=True,
         default=lambda: datetime.datetime.now(datetime.timezone.utc)
     )
     updated_at: Mapped[datetime.datetime] = mapped_column(
@@ -0,0 +1,80 @@
+"""SQLAlchemy ORM models for refresh token rotation and revocation."""
+
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.base import Base
+
+
+class RefreshToken(Base):
+    """One issued refresh token, identified by its ``jti`` claim.
+
+    A token is usable while ``revoked_at`` is unset and it has not expired.
+    Refreshing revokes it and records its successor in ``replaced_by_jti``.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    # ------------------------------------------------------------------ #
+    # Columns                                                            #
+    # ------------------------------------------------------------------ #
+    jti: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="Unique token identifier (jti claim)"
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="User the token was issued to"
+    )
+    issued_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
+        comment="Timestamp when the token was issued"
+    )
+    expires_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        index=True,
+        comment="Timestamp when the token expires"
+    )
+    revoked_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="Timestamp when the token was rotated or revoked"
+    )
+    replaced_by_jti: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="Token issued in exchange for this one on refresh"
+    )
+
+
+class TokenRevocation(Base):
+    """Per-user cut-off: tokens issued before ``revoked_before`` are invalid."""
+
+    __tablename__ = "token_revocations"
+
+    # ------------------------------------------------------------------ #
+    # Columns                                                            #
+    # ------------------------------------------------------------------ #
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="User whose tokens were revoked"
+    )
+    revoked_before: Mapped[datetime.datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        index=True,
+        comment="Tokens issued before this moment are rejected"
+    )
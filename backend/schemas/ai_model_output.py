@@ -45,12 +45,29 @@ class _AIModelOutputBase(BaseModel):
 
 
 class AIModelOutputCreate(_AIModelOutputBase):
-    """Schema for creating new AI model outputs."""
-    pass
+    """Schema for creating new AI model outputs.
+
+    When ``system_prompt`` is given, ``prompt_used`` holds only the user
+    prompt; both are stored deduplicated and recombined on read.
+    """
+
+    system_prompt: str | None = Field(
+        default=None,
+        min_length=1,
+        description="System prompt sent alongside prompt_used (stored once by hash)"
+    )
+    prompt_params: dict[str, Any] | None = Field(
+        default=None,
+        description="Structured request parameters the prompt was built from"
+    )
 
 
 class AIModelOutputRead(_AIModelOutputBase):
-    """Schema for reading AI model outputs."""
+    """Schema for reading AI model outputs.
+
+    For outputs stored with a system prompt, ``prompt_used`` is a JSON object
+    with ``system_prompt``, ``user_prompt`` and ``original_request`` keys.
+    """
 
     id: int = Field(..., description="Unique identifier")
     created_at: datetime = Field(..., description="Creation timestamp")
@@ -138,4 +155,14 @@ class AIOutputSummary(BaseModel):
     outputs_by_format: dict[str, int] = Field(..., description="Count by output format")
     outputs_by_target_type: dict[str, int] = Field(..., description="Count by target type")
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class AIOutputArchiveResult(BaseModel):
+    """Schema for the result of an AI output retention run."""
+
+    dry_run: bool = Field(..., description="True if nothing was written or deleted")
+    cutoff: datetime = Field(..., description="Outputs created before this time were eligible")
+    eligible_outputs: int = Field(..., description="Number of outputs matching the retention policy")
+    archived_outputs: int = Field(0, description="Number of outputs moved to archive files")
+    deleted_prompts: int = Field(0, description="Number of prompts removed because no output uses them")
+    archive_files: list[str] = Field(default_factory=list, description="Archive files written, relative to the archive directory")
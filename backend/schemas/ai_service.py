@@ -61,9 +61,13 @@ class PromptContext(BaseModel):
         appliances = crud_device.get_kitchen_appliances(db, kitchen_id=kitchen_id)
         tools = crud_device.get_kitchen_tools(db, kitchen_id=kitchen_id)
 
+        conversions_by_food_item = crud_food.get_conversions_for_food_items(
+            db, {item.food_item.id for item in inventory_items}
+        )
+
         enhanced_inventory_items = []
         for item in inventory_items:
-            conversions = crud_food.get_conversions_for_food_item(db, item.food_item.id)
+            conversions = conversions_by_food_item[item.food_item.id]
 
             enhanced_food_item = FoodItemWithConversions(
                 **item.food_item.model_dump(),
@@ -412,4 +416,49 @@ class RecipeWithAIOutput(BaseModel):
     recipe: RecipeGenerationResponse
     ai_output: AIModelOutputRead
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# ================================================================== #
+# Kitchen Insights Schemas                                           #
+# ================================================================== #
+
+class KitchenInsightsRequest(BaseModel):
+    """API request schema for the combined kitchen insights call."""
+
+    user_id: int = Field(..., gt=0)
+    kitchen_id: int = Field(..., gt=0)
+    include_recipe: bool = Field(
+        default=False,
+        description="Also generate a full recipe alongside analysis and suggestions"
+    )
+    recipe_request: RecipeGenerationRequest | None = Field(
+        default=None,
+        description="Recipe preferences used when include_recipe is set"
+    )
+    deadline_seconds: float | None = Field(
+        default=None,
+        gt=0,
+        le=300,
+        description="Overall deadline for all parts (defaults to AI_REQUEST_DEADLINE_SECONDS)"
+    )
+
+
+class InsightPartResult(BaseModel):
+    """Outcome and timing of one part of a kitchen insights call."""
+
+    status: str = Field(..., description="ok, error, timeout or skipped")
+    duration_ms: float = Field(default=0.0, ge=0)
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class KitchenInsightsResponse(BaseModel):
+    """Combined inventory analysis, cooking suggestions and optional recipe."""
+
+    kitchen_id: int
+    context_build_ms: float = Field(..., ge=0)
+    total_duration_ms: float = Field(..., ge=0)
+    analysis: InsightPartResult
+    suggestions: InsightPartResult
+    recipe: InsightPartResult
+    ai_output: AIModelOutputRead | None = None
@@ -51,7 +51,8 @@ class StorageLocationRead(_StorageLocationBase):
     created_at: datetime.datetime
     updated_at: datetime.datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    # Hashable: keys the storage groups of get_kitchen_inventory_grouped_by_storage
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class StorageLocationUpdate(BaseModel):
@@ -255,6 +256,28 @@ class KitchenInventorySummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class KitchenInventoryStats(BaseModel):
+    """Item counts of a kitchen's inventory, without the items themselves."""
+
+    kitchen_id: int
+    total_items: int = Field(
+        ge=0,
+        description="Total number of inventory items"
+    )
+    low_stock_items: int = Field(
+        ge=0,
+        description="Number of items below min_quantity"
+    )
+    expired_items: int = Field(
+        ge=0,
+        description="Number of expired items"
+    )
+    expires_soon_items: int = Field(
+        ge=0,
+        description="Number of items expiring within the threshold days (including expired ones)"
+    )
+
+
 # ================================================================== #
 # Unit Conversion Support (Future)                                   #
 # ================================================================== #
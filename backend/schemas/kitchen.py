@@ -108,4 +108,10 @@ class UserKitchenRead(UserKitchenBase):
 class KitchenWithUsers(KitchenRead):
     """Kitchen schema that includes related users."""
 
-    user_kitchens: list[UserKitchenRead] = Field(default_factory=list)
\ No newline at end of file
+    user_kitchens: list[UserKitchenRead] = Field(default_factory=list)
+
+
+class KitchenWithRole(KitchenRead):
+    """Kitchen schema including the requesting user's role in it."""
+
+    role: KitchenRole = Field(..., description="Role of the user in the kitchen")
@@ -7,7 +7,7 @@ from typing import Self
 
 from pydantic import BaseModel, Field, field_validator, model_validator, ValidationInfo, ConfigDict
 
-from backend.core.enums import DifficultyLevel
+from backend.core.enums import DifficultyLevel, RecipeSortField, SortOrder
 from backend.schemas.user import UserRead
 
 
@@ -322,6 +322,8 @@ class RecipeRead(_RecipeBase):
     """Schema returned to the client."""
 
     id: int
+    average_rating: float | None = None
+    review_count: int = 0
     created_at: datetime
     updated_at: datetime
     created_by_user: UserRead | None = None
@@ -331,6 +333,8 @@ class RecipeWithDetails(_RecipeBase):
     """Schema returned with full recipe details."""
 
     id: int
+    average_rating: float | None = None
+    review_count: int = 0
     created_at: datetime
     updated_at: datetime
     created_by_user: UserRead | None = None
@@ -405,6 +409,10 @@ class RecipeSearchParams(BaseModel):
     max_kcal: float | None = Field(default=None, gt=0)
     min_protein_g: float | None = Field(default=None, ge=0)
     tags_contains: list[str] | None = Field(default=None)
+    min_average_rating: float | None = Field(default=None, ge=1, le=5)
+    min_review_count: int | None = Field(default=None, ge=0)
+    sort_by: RecipeSortField | None = None
+    sort_order: SortOrder = SortOrder.DESC
 
     model_config = ConfigDict(
         str_strip_whitespace=True,
@@ -429,6 +437,12 @@ class RecipeSummary(BaseModel):
     )
 
 
+class RecipeCount(BaseModel):
+    """Number of recipes matching a filter."""
+
+    count: int = Field(..., ge=0)
+
+
 # ================================================================== #
 # Recipe Review Schemas                                              #
 # ================================================================== #
@@ -514,6 +528,19 @@ class RecipeRatingSummary(BaseModel):
     )
 
 
+class RecipePage(BaseModel):
+    """Everything needed to render one recipe, fetched in a single request.
+
+    Parts that were not requested are ``None``.
+    """
+
+    recipe_id: int
+    details: RecipeWithDetails | None = None
+    reviews: list[RecipeReviewRead] | None = None
+    next_reviews_cursor: str | None = None
+    rating_summary: RecipeRatingSummary | None = None
+
+
 # ================================================================== #
 # AI Integration Schemas                                             #
 # ================================================================== #
@@ -7,6 +7,8 @@ from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, EmailStr
 
+from backend.schemas.inventory import KitchenInventoryStats
+
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
@@ -129,3 +131,15 @@ class UserSummary(BaseModel):
     users_with_preferences: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserDashboardStats(BaseModel):
+    """Counts shown on the current user's dashboard, served in one request."""
+
+    my_recipes: int = Field(ge=0, description="Recipes created by the user")
+    ai_recipes: int = Field(ge=0, description="AI generated recipes overall")
+    total_recipes: int = Field(ge=0, description="All recipes")
+    inventory: KitchenInventoryStats | None = Field(
+        None,
+        description="Inventory counts of the requested kitchen, if any"
+    )
@@ -6,6 +6,7 @@ from .tokens import (
     create_refresh_token,
     decode_token,
     create_token,
+    token_cache,
 )
 
 __all__ = [
@@ -13,4 +14,5 @@ __all__ = [
     "create_refresh_token",
     "decode_token",
     "create_token",
+    "token_cache",
 ]
\ No newline at end of file
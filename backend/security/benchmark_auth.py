@@ -0,0 +1,108 @@
+"""Benchmark the per-request cost of bearer token authentication.
+
+Times, per call:
+
+* ``jwt.decode`` – full signature check and claims validation (python-jose);
+* ``decode_token`` with a warm ``token_cache``;
+* a request through an in-process app whose route stacks
+  ``require_super_admin`` and ``get_current_user_id`` – once with the token
+  cache cleared before every request and once warm. Both decode the token
+  once per request thanks to the shared ``get_token_payload`` dependency.
+
+Usage (CLI):
+    python -m backend.security.benchmark_auth
+    python -m backend.security.benchmark_auth --iterations 50000 --requests 2000
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Annotated
+
+import click
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.config import settings
+from backend.core.dependencies import get_current_user_id, get_db, require_super_admin
+from backend.db.base import Base
+from backend.security.tokens import create_access_token, decode_token, token_cache
+
+
+def time_per_call(fn: Callable[[], object], iterations: int) -> float:
+    """Return the mean duration of ``fn`` in microseconds."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def _build_app() -> FastAPI:
+    # Empty in-memory database for the per-user revocation check
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = lambda: Session(engine)
+
+    @app.get("/protected", dependencies=[Depends(require_super_admin)])
+    def protected(user_id: Annotated[int, Depends(get_current_user_id)]) -> int:
+        return user_id
+
+    return app
+
+
+def benchmark_auth(iterations: int, requests: int) -> list[tuple[str, float]]:
+    """Time token verification alone and as part of a request.
+
+    Args:
+        iterations: Calls per decode measurement.
+        requests: Requests per endpoint measurement.
+
+    Returns:
+        ``(label, microseconds per call)`` per measurement.
+    """
+    token = create_access_token(user_id=1, extra_claims={"is_admin": True})
+    headers = {"Authorization": f"Bearer {token}"}
+    client = TestClient(_build_app())
+
+    def cold_request() -> None:
+        token_cache.clear()
+        client.get("/protected", headers=headers).raise_for_status()
+
+    def warm_request() -> None:
+        client.get("/protected", headers=headers).raise_for_status()
+
+    decode_token(token)
+    warm_request()
+    return [
+        ("jwt.decode", time_per_call(
+            lambda: jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]), iterations
+        )),
+        ("decode_token (cached)", time_per_call(lambda: decode_token(token), iterations)),
+        ("request (cold cache)", time_per_call(cold_request, requests)),
+        ("request (warm cache)", time_per_call(warm_request, requests)),
+    ]
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Measure JWT verification overhead per request.")
+@click.option("--iterations", type=int, default=20_000, show_default=True, help="Calls per decode timing.")
+@click.option("--requests", type=int, default=1_000, show_default=True, help="Requests per endpoint timing.")
+def _cli(iterations: int, requests: int) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    click.echo(f"{'measurement':<24}  {'µs/call':>10}")
+    for label, micros in benchmark_auth(iterations, requests):
+        click.echo(f"{label:<24}  {micros:>10.1f}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
@@ -0,0 +1,156 @@
+"""Benchmark login throughput and how other requests fare during a login burst.
+
+Seeds a throw-away SQLite database with one user, then fires ``--logins``
+``POST /v1/auth/login`` requests at most ``--concurrency`` at a time against
+the in-process app while a probe keeps calling ``GET /health``. Reports login
+throughput and latency percentiles for both, so the effect of
+``BCRYPT_ROUNDS`` and ``PASSWORD_HASH_WORKERS`` can be compared – set them in
+the environment before running.
+
+Usage (CLI):
+    python -m backend.security.benchmark_login
+    BCRYPT_ROUNDS=10 PASSWORD_HASH_WORKERS=4 python -m backend.security.benchmark_login --logins 200
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import click
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.config import settings
+from backend.core.dependencies import get_db
+from backend.db.base import Base
+from backend.main import create_app
+from backend.models.user import User
+from backend.models.user_credentials import UserCredentials
+from backend.security.passwords import hash_password, shutdown_hash_executor
+
+_EMAIL = "benchmark@example.com"
+_PASSWORD = "benchmark-password"
+
+
+@dataclass
+class LoginBenchmark:
+    """Timings of one benchmark run, in milliseconds."""
+
+    logins: int
+    seconds: float
+    login_ms: list[float]
+    probe_ms: list[float]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return throughput and latency percentiles."""
+        return {
+            "logins_per_second": round(self.logins / self.seconds, 1) if self.seconds else 0.0,
+            "login_p50_ms": _percentile(self.login_ms, 50),
+            "login_p95_ms": _percentile(self.login_ms, 95),
+            "probe_requests": len(self.probe_ms),
+            "probe_p50_ms": _percentile(self.probe_ms, 50),
+            "probe_p95_ms": _percentile(self.probe_ms, 95),
+        }
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    if len(values) < 2:
+        return round(values[0], 2) if values else 0.0
+    return round(statistics.quantiles(values, n=100)[pct - 1], 2)
+
+
+async def _run(app: Any, logins: int, concurrency: int) -> LoginBenchmark:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+        login_ms: list[float] = []
+        probe_ms: list[float] = []
+        done = asyncio.Event()
+
+        async def login() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/v1/auth/login", json={"email": _EMAIL, "password": _PASSWORD})
+                response.raise_for_status()
+                login_ms.append((time.perf_counter() - started) * 1000)
+
+        async def probe() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/health")
+                probe_ms.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        seconds = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return LoginBenchmark(logins=logins, seconds=seconds, login_ms=login_ms, probe_ms=probe_ms)
+
+
+def benchmark_login(logins: int, concurrency: int) -> LoginBenchmark:
+    """Time ``logins`` concurrent logins against the in-process app.
+
+    Args:
+        logins: Number of login requests.
+        concurrency: Maximum requests in flight.
+
+    Returns:
+        LoginBenchmark: Login and ``/health`` probe timings.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{Path(tmp) / 'benchmark.sqlite'}", connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+        with session_factory() as db:
+            user = User(name="Benchmark", email=_EMAIL)
+            db.add(user)
+            db.flush()
+            db.add(UserCredentials(user_id=user.id, password_hash=hash_password(_PASSWORD)))
+            db.commit()
+
+        def override_get_db() -> Iterator[Session]:
+            with session_factory() as session:
+                yield session
+
+        app = create_app()
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            return asyncio.run(_run(app, logins, concurrency))
+        finally:
+            shutdown_hash_executor()
+            engine.dispose()
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Measure login throughput and /health latency during a login burst.")
+@click.option("--logins", type=int, default=100, show_default=True, help="Login requests to send.")
+@click.option("--concurrency", type=int, default=20, show_default=True, help="Requests in flight.")
+def _cli(logins: int, concurrency: int) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    click.echo(
+        f"BCRYPT_ROUNDS={settings.BCRYPT_ROUNDS} PASSWORD_HASH_WORKERS={settings.PASSWORD_HASH_WORKERS} "
+        f"PASSWORD_HASH_USE_PROCESSES={settings.PASSWORD_HASH_USE_PROCESSES}"
+    )
+    for name, value in benchmark_login(logins, concurrency).as_dict().items():
+        click.echo(f"{name:>20}  {value}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
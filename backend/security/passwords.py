@@ -1,9 +1,35 @@
+"""Password hashing with bcrypt.
+
+bcrypt is deliberately slow (~100-300 ms per call at the default cost), so the
+async variants run it on a dedicated, bounded worker pool instead of the event
+loop or the shared request threadpool. At most ``PASSWORD_HASH_WORKERS``
+hashes run at once; further calls queue up without blocking other requests.
+
+The cost is set by ``BCRYPT_ROUNDS``. Hashes stored with a different cost are
+flagged by ``verify_and_update``, so they can be rehashed on the next login.
+"""
+
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
+from backend.core.config import settings
+
+_pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    # Pinning the accepted range makes hashes with any other cost "need update"
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
 
 
 def hash_password(plain_password: str) -> str:
@@ -31,6 +57,61 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return _pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a password and rehash it if the stored cost is outdated.
+
+    Args:
+        plain_password: Raw user password.
+        hashed_password: Stored bcrypt hash.
+
+    Returns:
+        tuple[bool, str | None]: Whether the password matches, and a new hash
+        with the configured rounds if the stored one should be replaced.
+    """
+    return _pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Return True if a stored hash does not use the configured bcrypt rounds."""
+    return _pwd_context.needs_update(hashed_password)
+
+
+def get_hash_executor() -> Executor:
+    """Return the shared password hashing pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = max(1, settings.PASSWORD_HASH_WORKERS)
+            if settings.PASSWORD_HASH_USE_PROCESSES:
+                _executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                # The 'bcrypt' package releases the GIL while hashing; backends
+                # that do not (e.g. os_crypt) need PASSWORD_HASH_USE_PROCESSES
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        return _executor
+
+
+def shutdown_hash_executor() -> None:
+    """Stop the password hashing pool; it is recreated on the next call."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def hash_password_async(plain_password: str) -> str:
+    """Hash a password on the hashing pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_executor(), hash_password, plain_password)
+
+
+async def verify_and_update_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Run ``verify_and_update`` on the hashing pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_executor(), verify_and_update, plain_password, hashed_password)
+
+
 def is_password_hashed(value: str | None) -> bool:
     """Heuristically check if a given value looks like a bcrypt hash.
 
@@ -0,0 +1,102 @@
+"""In-memory index of per-user token revocations.
+
+Revoking a user (logout everywhere, admin action, refresh token reuse) stores
+a cut-off in ``token_revocations``: access tokens issued before it, or in
+the same second, are rejected (``iat`` has whole-second resolution). Checking that on every authenticated request must not cost a query,
+so the recent cut-offs are mirrored in a dict and looked up in O(1).
+
+The dict is updated immediately by revocations in this process and reloaded
+from the database at most every ``REVOCATION_INDEX_REFRESH_SECONDS`` to pick
+up revocations made by other worker processes. Only cut-offs younger than the
+access token lifetime are loaded; older ones cannot match a live token.
+A reload queries on its own short-lived session, outside the lock; if it
+fails, the last cut-offs are kept and the reload is retried later.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.crud import refresh_token as crud_refresh_token
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationIndex:
+    """Thread-safe map of user id to token cut-off (epoch seconds)."""
+
+    def __init__(self, refresh_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cutoffs: dict[int, float] = {}
+        self._loaded_at: float | None = None
+        self._reloading = False
+
+    def is_revoked(self, db: Session, user_id: int, issued_at: float | None) -> bool:
+        """Return True if a token of ``user_id`` issued at ``issued_at`` was revoked."""
+        self._reload_if_stale(db)
+        cutoff = self._cutoffs.get(user_id)
+        if cutoff is None:
+            return False
+        return issued_at is None or issued_at <= cutoff
+
+    def revoke_user(self, user_id: int, revoked_before: datetime.datetime) -> None:
+        """Record a cut-off written by this process without waiting for a reload."""
+        with self._lock:
+            cutoff = float(math.floor(revoked_before.timestamp()))
+            self._cutoffs[user_id] = max(self._cutoffs.get(user_id, 0.0), cutoff)
+
+    def clear(self) -> None:
+        """Forget all cut-offs; the next check reloads them."""
+        with self._lock:
+            self._cutoffs = {}
+            self._loaded_at = None
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or self._clock() - self._loaded_at >= self.refresh_seconds
+
+    def _reload_if_stale(self, db: Session) -> None:
+        if not self._is_stale():
+            return
+        with self._lock:
+            # One reload at a time; the others keep serving the current cut-offs
+            if not self._is_stale() or (self._reloading and self._loaded_at is not None):
+                return
+            self._reloading = True
+
+        since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        )
+        loaded: dict[int, float] | None = None
+        try:
+            # Not the request's session: leave its transaction state alone
+            with Session(db.get_bind()) as reload_db:
+                cutoffs = crud_refresh_token.get_revocation_cutoffs(reload_db, since)
+            loaded = {user_id: revoked_before.timestamp() for user_id, revoked_before in cutoffs.items()}
+        except SQLAlchemyError:
+            logger.warning("Could not reload token revocations; keeping the last cut-offs", exc_info=True)
+
+        with self._lock:
+            self._reloading = False
+            self._loaded_at = self._clock()
+            if loaded is None:
+                return
+            # Keep cut-offs recorded by this process while the query ran
+            oldest = since.timestamp()
+            for user_id, cutoff in self._cutoffs.items():
+                if cutoff > max(loaded.get(user_id, 0.0), oldest):
+                    loaded[user_id] = cutoff
+            self._cutoffs = loaded
+
+
+revocation_index = RevocationIndex(refresh_seconds=settings.REVOCATION_INDEX_REFRESH_SECONDS)
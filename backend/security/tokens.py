@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import datetime
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from jose import jwt
@@ -97,9 +101,58 @@ def create_refresh_token(
     )
 
 
+class VerifiedTokenCache:
+    """Thread-safe LRU of successfully verified tokens, keyed on the raw token.
+
+    Entries are dropped once the token's ``exp`` has passed, so an expired
+    token is always re-verified (and rejected). Tokens without ``exp`` and
+    tokens that failed verification are never cached.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.time):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Return a copy of the cached payload, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            if self._clock() >= entry[0]:
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return dict(entry[1])
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        """Remember a verified payload until its ``exp``."""
+        exp = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self._entries[token] = (float(exp), dict(payload))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all verified tokens."""
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = VerifiedTokenCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
+
+
 def decode_token(token: str) -> dict[str, Any]:
     """Decode a JWT and return its payload.
 
+    Tokens verified before are served from ``token_cache`` until they expire,
+    skipping the signature check and claims validation.
+
     Args:
         token: The encoded JWT.
 
@@ -109,4 +162,8 @@ def decode_token(token: str) -> dict[str, Any]:
     Raises:
         jose.exceptions.JWTError and its subclasses for invalid/expired tokens.
     """
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
\ No newline at end of file
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        token_cache.put(token, payload)
+    return payload
\ No newline at end of file
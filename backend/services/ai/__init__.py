@@ -1,12 +1,16 @@
 """AI services package for NUGAMOTO smart kitchen assistant."""
 
-from backend.services.ai import base, factory, inventory_prompt_service, openai_service, prompt_builder, prompt_templates
+from backend.services.ai import base, factory, inventory_prompt_service, kitchen_insights, openai_service, output_retention, \
+    prompt_builder, prompt_templates, resilience
 
 __all__ = [
     "base",
     "factory",
     "inventory_prompt_service",
+    "kitchen_insights",
     "openai_service",
+    "output_retention",
     "prompt_builder",
-    "prompt_templates"
+    "prompt_templates",
+    "resilience"
 ]
@@ -4,11 +4,15 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from backend.schemas.ai_service import RecipeGenerationRequest, RecipeGenerationResponse
 
+# HTTP status codes that indicate a transient provider problem
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
 
 class AIService(abc.ABC):
     """Abstract base class for AI services.
@@ -81,4 +85,29 @@ class AIService(abc.ABC):
         Raises:
             Exception: If suggestion generation fails.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def is_retryable_error(self, error: BaseException) -> bool:
+        """Return whether a failed call is worth retrying.
+
+        Walks the exception chain so provider errors wrapped in a
+        service-specific exception are still recognised. Providers may
+        override this to add their own transient error types.
+
+        Args:
+            error: Exception raised by one of the service methods.
+
+        Returns:
+            True if the error looks transient (timeout, connection, 429/5xx).
+        """
+        seen: set[int] = set()
+        current: BaseException | None = error
+        while current is not None and id(current) not in seen:
+            seen.add(id(current))
+            if isinstance(current, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+                return True
+            status_code = getattr(current, "status_code", None)
+            if isinstance(status_code, int) and status_code in RETRYABLE_STATUS_CODES:
+                return True
+            current = current.__cause__ or current.__context__
+        return False
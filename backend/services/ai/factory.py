@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from backend.core.config import settings
 from backend.services.ai.base import AIService
 from backend.services.ai.openai_service import OpenAIService
+from backend.services.ai.resilience import ResilientAIService
 
 
 class AIServiceFactory:
@@ -21,21 +22,27 @@ class AIServiceFactory:
             provider: AI service provider (default: "openai").
 
         Returns:
-            AI service instance.
+            AI service instance, wrapped in ResilientAIService unless
+            AI_RESILIENCE_ENABLED is turned off.
 
         Raises:
             ValueError: If provider is not supported.
         """
-        if provider.lower() == "openai":
-            return OpenAIService(db)
+        provider_key = provider.lower()
+        if provider_key == "openai":
+            service: AIService = OpenAIService(db)
         # Future providers can be added here:
-        # elif provider.lower() == "groq":
-        #     return GroqService(db)
-        # elif provider.lower() == "gemini":
-        #     return GeminiService(db)
+        # elif provider_key == "groq":
+        #     service = GroqService(db)
+        # elif provider_key == "gemini":
+        #     service = GeminiService(db)
         else:
             raise ValueError(f"Unsupported AI provider: {provider}")
 
+        if settings.AI_RESILIENCE_ENABLED:
+            return ResilientAIService(service, provider=provider_key)
+        return service
+
     @staticmethod
     def get_default_service(db: Session) -> AIService:
         """Get the default AI service.
@@ -46,5 +53,5 @@ class AIServiceFactory:
         Returns:
             Default AI service instance.
         """
-        default_provider = getattr(settings, 'DEFAULT_AI_PROVIDER', 'openai')
+        default_provider = settings.DEFAULT_AI_PROVIDER
         return AIServiceFactory.create_ai_service(db, default_provider)
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""Concurrent kitchen insights built from a single prompt context."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, TYPE_CHECKING
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.core.config import settings
+from backend.services.ai.base import AIService
+from backend.services.ai.prompt_builder import PromptBuilder
+from backend.services.ai.resilience import AIServiceTimeoutError
+
+if TYPE_CHECKING:
+    from backend.schemas.ai_service import (
+        InsightPartResult,
+        KitchenInsightsResponse,
+        PromptContext,
+        RecipeGenerationRequest,
+        RecipeGenerationResponse,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class KitchenInsightsResult:
+    """Result of a kitchen insights fan-out."""
+
+    response: "KitchenInsightsResponse"
+    context: "PromptContext"
+    recipe: "RecipeGenerationResponse | None" = None
+
+
+class KitchenInsightsService:
+    """Fan out inventory analysis, suggestions and recipe generation.
+
+    The prompt context (user, inventory, equipment) is loaded once and shared
+    by all parts, which then run concurrently under one overall deadline. A
+    failing or slow part does not cancel the others; its outcome is reported
+    in the corresponding ``InsightPartResult``.
+    """
+
+    def __init__(self, ai_service: AIService, prompt_builder: PromptBuilder):
+        self.ai_service = ai_service
+        self.prompt_builder = prompt_builder
+
+    async def gather(
+            self,
+            user_id: int,
+            kitchen_id: int,
+            include_recipe: bool = False,
+            recipe_request: "RecipeGenerationRequest | None" = None,
+            deadline: float | None = None,
+            started: float | None = None,
+    ) -> KitchenInsightsResult:
+        """Run all requested parts concurrently.
+
+        Args:
+            user_id: ID of the requesting user.
+            kitchen_id: ID of the kitchen to analyze.
+            include_recipe: Whether to generate a full recipe as well.
+            recipe_request: Preferences for the recipe part.
+            deadline: Overall budget in seconds, including context loading.
+            started: ``time.monotonic()`` at which the budget started, so
+                work done before this call counts against it (default: now).
+
+        Returns:
+            Insights response plus the shared context and generated recipe.
+        """
+        from backend.schemas.ai_service import (
+            InsightPartResult,
+            KitchenInsightsResponse,
+            RecipeGenerationRequest,
+        )
+
+        budget = settings.AI_REQUEST_DEADLINE_SECONDS if deadline is None else deadline
+        started = time.monotonic() if started is None else started
+
+        request = recipe_request or RecipeGenerationRequest()
+        # Sync database queries; keep them off the event loop
+        context_started = time.monotonic()
+        context = await run_in_threadpool(
+            self.prompt_builder.build_context,
+            user_id=user_id,
+            kitchen_id=kitchen_id,
+            request=request
+        )
+        context_build_ms = (time.monotonic() - context_started) * 1000
+        remaining = max(0.0, budget - (time.monotonic() - started))
+
+        parts: list[Awaitable[tuple[InsightPartResult, Any]]] = [
+            self._run_part(
+                "analysis",
+                self.ai_service.analyze_inventory(
+                    kitchen_id, context=context, deadline=remaining
+                ),
+                remaining,
+            ),
+            self._run_part(
+                "suggestions",
+                self.ai_service.get_cooking_suggestions(
+                    kitchen_id, user_id, context=context, deadline=remaining
+                ),
+                remaining,
+            ),
+        ]
+        if include_recipe:
+            parts.append(
+                self._run_part(
+                    "recipe",
+                    self.ai_service.generate_recipe(
+                        request, user_id, kitchen_id, context=context, deadline=remaining
+                    ),
+                    remaining,
+                )
+            )
+
+        results = await asyncio.gather(*parts)
+        (analysis, _), (suggestions, _) = results[0], results[1]
+        recipe_part, recipe_response = (
+            results[2] if include_recipe else (InsightPartResult(status="skipped"), None)
+        )
+
+        response = KitchenInsightsResponse(
+            kitchen_id=kitchen_id,
+            context_build_ms=round(context_build_ms, 2),
+            total_duration_ms=round((time.monotonic() - started) * 1000, 2),
+            analysis=analysis,
+            suggestions=suggestions,
+            recipe=recipe_part,
+        )
+        return KitchenInsightsResult(response=response, context=context, recipe=recipe_response)
+
+    @staticmethod
+    async def _run_part(
+            name: str,
+            awaitable: Awaitable[Any],
+            timeout: float,
+    ) -> tuple["InsightPartResult", Any]:
+        """Await one part, capturing its timing and any failure."""
+        from backend.schemas.ai_service import InsightPartResult
+
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError:
+            return InsightPartResult(
+                status="timeout",
+                duration_ms=round((time.monotonic() - started) * 1000, 2),
+                error=f"{name} did not finish within the deadline",
+            ), None
+        except Exception as e:
+            logger.warning(f"Kitchen insights part '{name}' failed: {str(e)}")
+            status = "timeout" if isinstance(e, AIServiceTimeoutError) else "error"
+            return InsightPartResult(
+                status=status,
+                duration_ms=round((time.monotonic() - started) * 1000, 2),
+                error=str(e),
+            ), None
+
+        data = result.model_dump(mode="json") if hasattr(result, "model_dump") else result
+        return InsightPartResult(
+            status="ok",
+            duration_ms=round((time.monotonic() - started) * 1000, 2),
+            data=data,
+        ), result
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
 from typing import Any, TypeVar, TYPE_CHECKING
 
-from openai import OpenAI
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
 from openai.types.chat import (
     ChatCompletionSystemMessageParam,
     ChatCompletionUserMessageParam
@@ -16,6 +18,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from backend.core.config import settings
+from backend.core.metrics import AI_REQUEST_DURATION, AI_TOKENS
 
 if TYPE_CHECKING:
     from backend.schemas.ai_service import RecipeGenerationRequest, RecipeGenerationResponse
@@ -33,6 +36,35 @@ class OpenAIServiceError(Exception):
     pass
 
 
+# One client, and so one httpx connection pool, per API key for the process
+_clients: dict[str, AsyncOpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared ``AsyncOpenAI`` client for ``api_key``."""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            # Retries and deadlines are handled by ResilientAIService, so the SDK
+            # must not retry on its own and multiply the worst-case latency.
+            client = _clients[api_key] = AsyncOpenAI(
+                api_key=api_key,
+                timeout=settings.AI_ATTEMPT_TIMEOUT_SECONDS,
+                max_retries=0,
+            )
+        return client
+
+
+async def close_openai_clients() -> None:
+    """Close the shared clients and their connection pools (on app shutdown)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        await client.close()
+
+
 class OpenAIService(AIService):
     """OpenAI service implementation for AI features."""
 
@@ -54,11 +86,20 @@ class OpenAIService(AIService):
         if not self.api_key:
             raise OpenAIServiceError("OpenAI API key is required")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.model = model
         self.prompt_builder = PromptBuilder(db)
         logger.debug(f"Initialized OpenAIService with model: {model}")
 
+    def is_retryable_error(self, error: BaseException) -> bool:
+        """Treat OpenAI connection, rate-limit and server errors as transient."""
+        current: BaseException | None = error
+        while current is not None:
+            if isinstance(current, (APIConnectionError, RateLimitError, InternalServerError)):
+                return True
+            current = current.__cause__
+        return super().is_retryable_error(error)
+
     async def generate_recipe(
             self,
             request: "RecipeGenerationRequest",
@@ -72,7 +113,7 @@ class OpenAIService(AIService):
             request: Recipe generation request with preferences.
             user_id: ID of the requesting user.
             kitchen_id: ID of the kitchen.
-            **kwargs: Additional parameters.
+            **kwargs: Additional parameters (``context`` reuses a prebuilt PromptContext).
 
         Returns:
             Structured recipe response.
@@ -87,7 +128,8 @@ class OpenAIService(AIService):
             system_prompt, user_prompt = self.prompt_builder.build_recipe_prompt(
                 request=request,
                 user_id=user_id,
-                kitchen_id=kitchen_id
+                kitchen_id=kitchen_id,
+                context=kwargs.get('context')
             )
 
             # Generate recipe using structured output with existing schemas
@@ -104,7 +146,7 @@ class OpenAIService(AIService):
 
         except Exception as e:
             logger.error(f"Recipe generation failed for user {user_id}: {str(e)}")
-            raise OpenAIServiceError(f"Recipe generation failed: {str(e)}")
+            raise OpenAIServiceError(f"Recipe generation failed: {str(e)}") from e
 
     async def analyze_inventory(
             self,
@@ -115,7 +157,7 @@ class OpenAIService(AIService):
 
         Args:
             kitchen_id: ID of the kitchen to analyze.
-            **kwargs: Additional parameters.
+            **kwargs: Additional parameters (``context`` reuses a prebuilt PromptContext).
 
         Returns:
             Analysis and recommendations.
@@ -126,7 +168,8 @@ class OpenAIService(AIService):
         try:
             # Build dynamic prompts
             system_prompt, user_prompt = self.prompt_builder.build_inventory_analysis_prompt(
-                kitchen_id=kitchen_id
+                kitchen_id=kitchen_id,
+                context=kwargs.get('context')
             )
 
             # Generate analysis using structured output
@@ -142,7 +185,7 @@ class OpenAIService(AIService):
 
         except Exception as e:
             logger.error(f"Inventory analysis failed for kitchen {kitchen_id}: {str(e)}")
-            raise OpenAIServiceError(f"Inventory analysis failed: {str(e)}")
+            raise OpenAIServiceError(f"Inventory analysis failed: {str(e)}") from e
 
     async def get_cooking_suggestions(
             self,
@@ -155,7 +198,7 @@ class OpenAIService(AIService):
         Args:
             kitchen_id: ID of the kitchen.
             user_id: ID of the user requesting suggestions.
-            **kwargs: Additional parameters.
+            **kwargs: Additional parameters (``context`` reuses a prebuilt PromptContext).
 
         Returns:
             Dictionary containing personalized cooking suggestions.
@@ -175,7 +218,8 @@ class OpenAIService(AIService):
             system_prompt, user_prompt = self.prompt_builder.build_recipe_prompt(
                 request=suggestion_request,
                 user_id=user_id,
-                kitchen_id=kitchen_id
+                kitchen_id=kitchen_id,
+                context=kwargs.get('context')
             )
 
             # Modify system prompt for suggestions
@@ -208,7 +252,15 @@ class OpenAIService(AIService):
 
         except Exception as e:
             logger.error(f"Cooking suggestions failed for user {user_id}: {str(e)}")
-            raise OpenAIServiceError(f"Cooking suggestions failed: {str(e)}")
+            raise OpenAIServiceError(f"Cooking suggestions failed: {str(e)}") from e
+
+    def _record_usage(self, completion: Any) -> None:
+        """Add the token usage reported with ``completion`` to ``AI_TOKENS``."""
+        usage = completion.usage
+        if usage is None:
+            return
+        AI_TOKENS.inc(self.model, "prompt", amount=usage.prompt_tokens)
+        AI_TOKENS.inc(self.model, "completion", amount=usage.completion_tokens)
 
     async def _create_structured_completion(
             self,
@@ -245,13 +297,18 @@ class OpenAIService(AIService):
             logger.debug(f"Max tokens: {max_tokens}")
 
             # Use beta.chat.completions.parse with existing recipe schemas
-            completion = self.client.beta.chat.completions.parse(
-                model=self.model,
-                messages=messages,
-                response_format=response_model,
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
+            started = time.perf_counter()
+            try:
+                completion = await self.client.beta.chat.completions.parse(
+                    model=self.model,
+                    messages=messages,
+                    response_format=response_model,
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            finally:
+                AI_REQUEST_DURATION.observe(time.perf_counter() - started, self.model, "structured_completion")
+            self._record_usage(completion)
 
             logger.info("Received structured response from OpenAI")
             logger.debug(f"Response ID: {completion.id}")
@@ -266,7 +323,7 @@ class OpenAIService(AIService):
 
         except Exception as e:
             logger.error(f"Structured completion failed: {str(e)}")
-            raise OpenAIServiceError(f"Structured completion failed: {str(e)}")
+            raise OpenAIServiceError(f"Structured completion failed: {str(e)}") from e
 
     async def _create_json_completion(
             self,
@@ -303,13 +360,18 @@ class OpenAIService(AIService):
             logger.debug(f"Temperature: {temperature}")
             logger.debug(f"Max tokens: {max_tokens}")
 
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                response_format=ResponseFormatJSONObject(type="json_object"),
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
+            started = time.perf_counter()
+            try:
+                completion = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    response_format=ResponseFormatJSONObject(type="json_object"),
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            finally:
+                AI_REQUEST_DURATION.observe(time.perf_counter() - started, self.model, "json_completion")
+            self._record_usage(completion)
 
             logger.info("Received JSON response from OpenAI")
             logger.debug(f"Response ID: {completion.id}")
@@ -328,7 +390,7 @@ class OpenAIService(AIService):
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {str(e)}")
-            raise OpenAIServiceError(f"Invalid JSON response: {str(e)}")
+            raise OpenAIServiceError(f"Invalid JSON response: {str(e)}") from e
         except Exception as e:
             logger.error(f"JSON completion failed: {str(e)}")
-            raise OpenAIServiceError(f"JSON completion failed: {str(e)}")
\ No newline at end of file
+            raise OpenAIServiceError(f"JSON completion failed: {str(e)}") from e
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""Retention and archival of stored AI model outputs.
+
+Outputs matching the retention policy (older than ``AI_OUTPUT_RETENTION_DAYS``
+and, optionally, in one of the ``AI_OUTPUT_RETENTION_STATUSES``) are written
+to gzip-compressed NDJSON files, partitioned by creation month, and then
+removed from ``ai_model_outputs``. Every archive file is listed in
+``index.jsonl`` with its id and date range so single outputs can be found
+again without decompressing the whole archive. A retention days value of
+zero or less disables archiving.
+
+Usage (CLI):
+    python -m backend.services.ai.output_retention             # archive old outputs
+    python -m backend.services.ai.output_retention --dry-run   # only count them
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+import click
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.crud import ai_model_output as crud_ai
+from backend.models.ai_model_output import AIModelOutput
+from backend.schemas.ai_model_output import AIOutputArchiveResult
+
+INDEX_FILE = "index.jsonl"
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which AI outputs are moved out of the live table."""
+
+    max_age_days: int
+    statuses: tuple[str, ...] = ()
+
+    @classmethod
+    def from_settings(cls) -> RetentionPolicy:
+        """Build a policy from application settings."""
+        statuses = tuple(
+            status.strip()
+            for status in settings.AI_OUTPUT_RETENTION_STATUSES.split(",")
+            if status.strip()
+        )
+        return cls(max_age_days=settings.AI_OUTPUT_RETENTION_DAYS, statuses=statuses)
+
+    def cutoff(self, now: datetime) -> datetime:
+        """Return the creation time before which outputs are eligible."""
+        return now - timedelta(days=self.max_age_days)
+
+    def eligible(self, cutoff: datetime) -> Select:
+        """Return a query selecting the ids of eligible outputs."""
+        # created_at is stored naive (UTC) by SQLite
+        query = select(AIModelOutput.id).where(AIModelOutput.created_at < cutoff.replace(tzinfo=None))
+        if self.statuses:
+            query = query.where(AIModelOutput.extra_data["status"].as_string().in_(self.statuses))
+        return query
+
+
+class AIOutputArchiver:
+    """Move AI outputs matching a retention policy into archive files."""
+
+    def __init__(
+            self,
+            policy: RetentionPolicy | None = None,
+            archive_dir: str | Path | None = None,
+            batch_size: int | None = None,
+    ):
+        self.policy = policy or RetentionPolicy.from_settings()
+        self.archive_dir = Path(archive_dir or settings.AI_OUTPUT_ARCHIVE_DIR)
+        self.batch_size = batch_size or settings.AI_OUTPUT_ARCHIVE_BATCH_SIZE
+
+    def run(self, db: Session, *, now: datetime | None = None, dry_run: bool = False) -> AIOutputArchiveResult:
+        """Archive all eligible outputs in batches.
+
+        Each batch is written and fsynced to its archive files before the
+        rows are deleted and the summary counters adjusted in one commit.
+
+        Args:
+            db: Database session.
+            now: Reference time for the age policy (defaults to current UTC time).
+            dry_run: Only count eligible outputs.
+
+        Returns:
+            Summary of the run.
+        """
+        cutoff = self.policy.cutoff(now or datetime.now(timezone.utc))
+        if self.policy.max_age_days <= 0:
+            # Retention disabled
+            return AIOutputArchiveResult(dry_run=dry_run, cutoff=cutoff, eligible_outputs=0)
+
+        eligible = self.policy.eligible(cutoff)
+        eligible_count = db.scalar(select(func.count()).select_from(eligible.subquery())) or 0
+
+        result = AIOutputArchiveResult(dry_run=dry_run, cutoff=cutoff, eligible_outputs=eligible_count)
+        if dry_run or not eligible_count:
+            return result
+
+        last_id = 0
+        while True:
+            ids = db.scalars(
+                eligible.where(AIModelOutput.id > last_id).order_by(AIModelOutput.id).limit(self.batch_size)
+            ).all()
+            if not ids:
+                break
+
+            outputs = db.scalars(
+                select(AIModelOutput).where(AIModelOutput.id.in_(ids)).order_by(AIModelOutput.id)
+            ).all()
+            result.archive_files.extend(self._write_batch(outputs))
+
+            crud_ai.delete_ai_outputs_orm(db, list(outputs))
+            db.commit()
+
+            result.archived_outputs += len(outputs)
+            last_id = ids[-1]
+
+        result.deleted_prompts = crud_ai.delete_orphan_prompts(db)
+        db.commit()
+        return result
+
+    def find(self, output_id: int) -> dict[str, Any] | None:
+        """Return an archived output by id, or None if it is not archived."""
+        for entry in self.read_index():
+            if entry["min_id"] <= output_id <= entry["max_id"]:
+                for record in self._read_file(self.archive_dir / entry["file"]):
+                    if record["id"] == output_id:
+                        return record
+        return None
+
+    def read_index(self) -> list[dict[str, Any]]:
+        """Return all entries of the archive index."""
+        index_path = self.archive_dir / INDEX_FILE
+        if not index_path.exists():
+            return []
+        with index_path.open(encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    # ------------------------------------------------------------------ #
+    # Internals                                                           #
+    # ------------------------------------------------------------------ #
+    def _write_batch(self, outputs: list[AIModelOutput]) -> list[str]:
+        partitions: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for output in outputs:
+            record = crud_ai.build_ai_model_output_read(output).model_dump(mode="json")
+            partitions[output.created_at.strftime("%Y-%m")].append(record)
+
+        written = []
+        for partition, records in sorted(partitions.items()):
+            written.append(self._write_file(partition, records))
+        return written
+
+    def _write_file(self, partition: str, records: list[dict[str, Any]]) -> str:
+        year, month = partition.split("-")
+        relative = Path(year) / month / f"ai_outputs_{records[0]['id']}-{records[-1]['id']}.ndjson.gz"
+        path = self.archive_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        _fsync(tmp_path)
+        os.replace(tmp_path, path)
+
+        entry = {
+            "file": relative.as_posix(),
+            "partition": partition,
+            "count": len(records),
+            "min_id": records[0]["id"],
+            "max_id": records[-1]["id"],
+            "min_created_at": min(r["created_at"] for r in records),
+            "max_created_at": max(r["created_at"] for r in records),
+            "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+            "archived_at": datetime.now(timezone.utc).isoformat(),
+        }
+        index_path = self.archive_dir / INDEX_FILE
+        with index_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        _fsync(index_path)
+
+        return relative.as_posix()
+
+    @staticmethod
+    def _read_file(path: Path) -> Iterator[dict[str, Any]]:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def _fsync(path: Path) -> None:
+    with path.open("rb") as f:
+        os.fsync(f.fileno())
+
+
+# ------------------------------------------------------------------------- #
+# Optional command-line interface using `click`                             #
+# ------------------------------------------------------------------------- #
+@click.command(help="Archive AI outputs that fall under the retention policy.")
+@click.option("--dry-run", is_flag=True, default=False, help="Only count eligible outputs.")
+@click.option("--days", type=int, default=None, help="Override AI_OUTPUT_RETENTION_DAYS.")
+def _cli(dry_run: bool, days: int | None) -> None:  # pragma: no cover
+    """CLI wrapper."""
+    from backend.db.session import SessionLocal
+
+    policy = RetentionPolicy.from_settings()
+    if days is not None:
+        policy = RetentionPolicy(max_age_days=days, statuses=policy.statuses)
+
+    with SessionLocal() as db:
+        result = AIOutputArchiver(policy=policy).run(db, dry_run=dry_run)
+    click.echo(
+        f"{result.eligible_outputs} eligible, {result.archived_outputs} archived "
+        f"into {len(result.archive_files)} files, {result.deleted_prompts} prompts removed"
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    _cli()
@@ -195,32 +195,58 @@ class PromptBuilder:
         self.section_builder = PromptSectionBuilder(db)
 
 
-    def build_recipe_prompt(
+    def build_context(
             self,
-            request: "RecipeGenerationRequest",
             user_id: int,
-            kitchen_id: int
-    ) -> tuple[str, str]:
-        """Build recipe generation prompt using templates.
+            kitchen_id: int,
+            request: "RecipeGenerationRequest"
+    ) -> "PromptContext":
+        """Load the user, inventory and equipment context once.
+
+        The result can be passed to the ``build_*_prompt`` methods (and via
+        ``context=`` to the AI services) to avoid reloading it per prompt.
 
         Args:
-            request: Recipe generation request
             user_id: User ID
             kitchen_id: Kitchen ID
+            request: Recipe generation request stored on the context
 
         Returns:
-            Tuple of (system_prompt, user_prompt)
+            Prompt context built from the database
         """
         from backend.schemas.ai_service import PromptContext
 
-        # Build context from database
-        context = PromptContext.build_from_ids(
+        return PromptContext.build_from_ids(
             db=self.db,
             user_id=user_id,
             kitchen_id=kitchen_id,
             request=request
         )
 
+
+    def build_recipe_prompt(
+            self,
+            request: "RecipeGenerationRequest",
+            user_id: int,
+            kitchen_id: int,
+            context: "PromptContext | None" = None
+    ) -> tuple[str, str]:
+        """Build recipe generation prompt using templates.
+
+        Args:
+            request: Recipe generation request
+            user_id: User ID
+            kitchen_id: Kitchen ID
+            context: Optional prebuilt context; its request is replaced by ``request``
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
+        if context is None:
+            context = self.build_context(user_id, kitchen_id, request)
+        elif context.request is not request:
+            context = context.model_copy(update={"request": request})
+
         # Build individual sections
         user_context = self.section_builder.build_user_section(context.user)
         inventory_context = self.section_builder.build_inventory_section(context)
@@ -255,29 +281,32 @@ class PromptBuilder:
         return NUGAMOTO_RECIPE_SYSTEM_PROMPT, user_prompt
 
 
-    def build_inventory_analysis_prompt(self, kitchen_id: int) -> tuple[str, str]:
+    def build_inventory_analysis_prompt(
+            self,
+            kitchen_id: int,
+            context: "PromptContext | None" = None
+    ) -> tuple[str, str]:
         """Build inventory analysis prompt using templates.
 
         Args:
             kitchen_id: Kitchen ID
+            context: Optional prebuilt context for the same kitchen
 
         Returns:
             Tuple of (system_prompt, user_prompt)
         """
-        from backend.schemas.ai_service import RecipeGenerationRequest, PromptContext
-
-        # Create basic request for inventory analysis
-        analysis_request = RecipeGenerationRequest(
-            special_requests="Analyze inventory for insights and recommendations"
-        )
+        from backend.schemas.ai_service import RecipeGenerationRequest
 
-        # Build context
-        context = PromptContext.build_from_ids(
-            db=self.db,
-            user_id=1,  # Default user for analysis
-            kitchen_id=kitchen_id,
-            request=analysis_request
-        )
+        if context is None:
+            # Create basic request for inventory analysis
+            analysis_request = RecipeGenerationRequest(
+                special_requests="Analyze inventory for insights and recommendations"
+            )
+            context = self.build_context(
+                user_id=1,  # Default user for analysis
+                kitchen_id=kitchen_id,
+                request=analysis_request
+            )
 
         # Build analysis sections
         analysis_sections = []
@@ -0,0 +1,407 @@
+"""Retry, deadline and circuit breaker layer for AI service providers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, TypeVar, TYPE_CHECKING
+
+from backend.core.config import settings
+from backend.core.metrics import Counter, Gauge, Metric, registry
+from backend.services.ai.base import AIService
+
+if TYPE_CHECKING:
+    from backend.schemas.ai_service import RecipeGenerationRequest, RecipeGenerationResponse
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# ================================================================== #
+# Exceptions                                                         #
+# ================================================================== #
+
+class AIServiceUnavailableError(Exception):
+    """Raised when the AI provider cannot be used right now."""
+    pass
+
+
+class AIServiceTimeoutError(AIServiceUnavailableError):
+    """Raised when an AI call does not finish within its deadline."""
+    pass
+
+
+class CircuitOpenError(AIServiceUnavailableError):
+    """Raised when the circuit breaker rejects a call without trying it."""
+    pass
+
+
+# ================================================================== #
+# Circuit Breaker                                                    #
+# ================================================================== #
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker.
+
+    States:
+        - closed: calls pass through, failures are counted
+        - open: calls are rejected until ``reset_timeout`` has elapsed
+        - half_open: a single trial call is allowed; success closes the
+          circuit, failure opens it again
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+            self,
+            failure_threshold: int,
+            reset_timeout: float,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current breaker state, promoting open to half-open when due."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted now."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a provider failure and open the circuit if needed."""
+        with self._lock:
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """Release a half-open trial slot without judging provider health."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _maybe_half_open(self) -> None:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+
+# ================================================================== #
+# Metrics                                                            #
+# ================================================================== #
+
+@dataclass
+class OperationMetrics:
+    """Counters and latency totals for one provider operation."""
+
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    successes: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    short_circuited: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters plus the derived average latency."""
+        finished = self.successes + self.failures
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "successes": self.successes,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "short_circuited": self.short_circuited,
+            "avg_latency_ms": round(self.total_latency_ms / finished, 2) if finished else 0.0,
+            "max_latency_ms": round(self.max_latency_ms, 2),
+        }
+
+
+@dataclass
+class AIServiceMetrics:
+    """Thread-safe per-operation metrics for a provider."""
+
+    operations: dict[str, OperationMetrics] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, operation: str, **increments: float) -> None:
+        """Add ``increments`` to the counters of ``operation``."""
+        with self._lock:
+            metrics = self.operations.setdefault(operation, OperationMetrics())
+            for name, value in increments.items():
+                setattr(metrics, name, getattr(metrics, name) + value)
+
+    def record_latency(self, operation: str, latency_ms: float) -> None:
+        """Record the wall-clock latency of one finished call."""
+        with self._lock:
+            metrics = self.operations.setdefault(operation, OperationMetrics())
+            metrics.total_latency_ms += latency_ms
+            metrics.max_latency_ms = max(metrics.max_latency_ms, latency_ms)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of all operation metrics."""
+        with self._lock:
+            return {name: metrics.as_dict() for name, metrics in self.operations.items()}
+
+
+# Breakers and metrics are process-wide so state survives the per-request
+# service instances created by AIServiceFactory.
+_breakers: dict[str, CircuitBreaker] = {}
+_metrics: dict[str, AIServiceMetrics] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Return the shared circuit breaker for ``provider``."""
+    with _registry_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(
+                failure_threshold=settings.AI_CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=settings.AI_CIRCUIT_RESET_SECONDS,
+            )
+        return _breakers[provider]
+
+
+def get_metrics(provider: str) -> AIServiceMetrics:
+    """Return the shared metrics collector for ``provider``."""
+    with _registry_lock:
+        return _metrics.setdefault(provider, AIServiceMetrics())
+
+
+def get_resilience_status() -> dict[str, dict[str, Any]]:
+    """Return breaker state and metrics for every provider seen so far."""
+    with _registry_lock:
+        providers = set(_breakers) | set(_metrics)
+    return {
+        provider: {
+            "circuit_state": get_circuit_breaker(provider).state,
+            "operations": get_metrics(provider).snapshot(),
+        }
+        for provider in sorted(providers)
+    }
+
+
+@registry.collect
+def _resilience_metrics() -> list[Metric]:
+    events = Counter(
+        "ai_operation_events_total",
+        "AI provider calls, attempts and their outcomes per operation.",
+        ("provider", "operation", "event"),
+    )
+    circuit_open = Gauge("ai_circuit_open", "1 while the provider's circuit breaker rejects calls.", ("provider",))
+    for provider, status in get_resilience_status().items():
+        circuit_open.set(provider, value=status["circuit_state"] == CircuitBreaker.OPEN)
+        for operation, metrics in status["operations"].items():
+            for event in ("calls", "attempts", "retries", "successes", "failures", "timeouts", "short_circuited"):
+                events.inc(provider, operation, event, amount=metrics[event])
+    return [events, circuit_open]
+
+
+# ================================================================== #
+# Resilient Service Wrapper                                          #
+# ================================================================== #
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry and deadline configuration for AI calls."""
+
+    max_retries: int
+    base_delay: float
+    max_delay: float
+    attempt_timeout: float
+    deadline: float
+
+    @classmethod
+    def from_settings(cls) -> RetryPolicy:
+        """Build a policy from application settings."""
+        return cls(
+            max_retries=settings.AI_MAX_RETRIES,
+            base_delay=settings.AI_RETRY_BASE_DELAY_SECONDS,
+            max_delay=settings.AI_RETRY_MAX_DELAY_SECONDS,
+            attempt_timeout=settings.AI_ATTEMPT_TIMEOUT_SECONDS,
+            deadline=settings.AI_REQUEST_DEADLINE_SECONDS,
+        )
+
+    def backoff(self, retry_number: int) -> float:
+        """Return a full-jitter exponential delay for the given retry."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** retry_number))
+        return random.uniform(0, ceiling)
+
+
+class ResilientAIService(AIService):
+    """Wrap an AIService with deadlines, retries and a circuit breaker.
+
+    Every public operation accepts an optional ``deadline`` keyword (seconds)
+    overriding the configured request deadline for that call. Attributes not
+    defined here (``model``, ``prompt_builder``, ...) are delegated to the
+    wrapped service.
+    """
+
+    def __init__(
+            self,
+            inner: AIService,
+            provider: str,
+            policy: RetryPolicy | None = None,
+            breaker: CircuitBreaker | None = None,
+            metrics: AIServiceMetrics | None = None,
+    ):
+        self.inner = inner
+        self.provider = provider
+        self.policy = policy or RetryPolicy.from_settings()
+        self.breaker = breaker or get_circuit_breaker(provider)
+        self.metrics = metrics or get_metrics(provider)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    async def generate_recipe(
+            self,
+            request: "RecipeGenerationRequest",
+            user_id: int,
+            kitchen_id: int,
+            **kwargs: Any
+    ) -> "RecipeGenerationResponse":
+        """Generate a recipe through the wrapped service."""
+        deadline = kwargs.pop("deadline", None)
+        return await self._call(
+            "generate_recipe",
+            lambda: self.inner.generate_recipe(request, user_id, kitchen_id, **kwargs),
+            deadline,
+        )
+
+    async def analyze_inventory(self, kitchen_id: int, **kwargs: Any) -> dict[str, Any]:
+        """Analyze inventory through the wrapped service."""
+        deadline = kwargs.pop("deadline", None)
+        return await self._call(
+            "analyze_inventory",
+            lambda: self.inner.analyze_inventory(kitchen_id, **kwargs),
+            deadline,
+        )
+
+    async def get_cooking_suggestions(self, kitchen_id: int, user_id: int, **kwargs: Any) -> dict[str, Any]:
+        """Get cooking suggestions through the wrapped service."""
+        deadline = kwargs.pop("deadline", None)
+        return await self._call(
+            "get_cooking_suggestions",
+            lambda: self.inner.get_cooking_suggestions(kitchen_id, user_id, **kwargs),
+            deadline,
+        )
+
+    def is_retryable_error(self, error: BaseException) -> bool:
+        """Delegate error classification to the wrapped provider."""
+        return self.inner.is_retryable_error(error)
+
+    async def _call(
+            self,
+            operation: str,
+            factory: Callable[[], Awaitable[T]],
+            deadline: float | None = None,
+    ) -> T:
+        """Run ``factory`` with retries until it succeeds or the deadline passes.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call.
+            AIServiceTimeoutError: If the deadline is exhausted.
+            Exception: The last provider error if it is not retryable or
+                retries are exhausted.
+        """
+        budget = self.policy.deadline if deadline is None else deadline
+        started = time.monotonic()
+        expires_at = started + budget
+        self.metrics.record(operation, calls=1)
+
+        attempt = 0
+        try:
+            while True:
+                if not self.breaker.allow_request():
+                    self.metrics.record(operation, short_circuited=1)
+                    raise CircuitOpenError(
+                        f"AI provider '{self.provider}' is temporarily unavailable"
+                    )
+
+                remaining = expires_at - time.monotonic()
+                if remaining <= 0:
+                    self.breaker.release()
+                    self.metrics.record(operation, timeouts=1)
+                    raise AIServiceTimeoutError(f"{operation} exceeded its {budget:.1f}s deadline")
+
+                attempt += 1
+                self.metrics.record(operation, attempts=1)
+                try:
+                    result = await asyncio.wait_for(
+                        factory(), timeout=min(self.policy.attempt_timeout, remaining)
+                    )
+                except asyncio.TimeoutError as exc:
+                    self.breaker.record_failure()
+                    self.metrics.record(operation, timeouts=1)
+                    error: BaseException = AIServiceTimeoutError(
+                        f"{operation} attempt {attempt} timed out"
+                    )
+                    error.__cause__ = exc
+                except Exception as exc:
+                    if not self.is_retryable_error(exc):
+                        # Caller or data problem, not a provider health signal
+                        self.breaker.release()
+                        raise
+                    self.breaker.record_failure()
+                    error = exc
+                else:
+                    self.breaker.record_success()
+                    self.metrics.record(operation, successes=1)
+                    self.metrics.record_latency(operation, (time.monotonic() - started) * 1000)
+                    return result
+
+                if attempt > self.policy.max_retries:
+                    raise error
+
+                delay = self.policy.backoff(attempt - 1)
+                if time.monotonic() + delay >= expires_at:
+                    raise error
+
+                logger.warning(
+                    f"AI {operation} attempt {attempt} failed ({error}); retrying in {delay:.2f}s"
+                )
+                self.metrics.record(operation, retries=1)
+                await asyncio.sleep(delay)
+        except CircuitOpenError:
+            raise
+        except Exception:
+            self.metrics.record(operation, failures=1)
+            self.metrics.record_latency(operation, (time.monotonic() - started) * 1000)
+            raise
@@ -13,8 +13,7 @@ from frontend.utils.path import ensure_frontend_on_sys_path
 
 ensure_frontend_on_sys_path(__file__)
 
-from frontend.clients.recipes_client import RecipesClient
-from frontend.clients.inventory_items_client import InventoryItemsClient
+from frontend.clients.users_client import UsersClient
 from frontend.clients.base import APIException
 from frontend.utils.layout import render_sidebar
 
@@ -31,52 +30,35 @@ def show_dashboard() -> None:
         st.warning("Login required.")
         st.switch_page("pages/login.py")
 
-    recipes_client = RecipesClient()
-    inventory_client = InventoryItemsClient()
+    users_client = UsersClient()
     access = getattr(st.session_state, "auth_access_token", None)
     refresh = getattr(st.session_state, "auth_refresh_token", None)
     if access:
-        for c in (recipes_client, inventory_client):
-            c.set_tokens(access, refresh)
+        users_client.set_tokens(access, refresh)
 
     @st.cache_data(show_spinner=False, ttl=15)
-    def _count_my_recipes(_uid: int) -> int:
+    def _load_dashboard_stats(_uid: int, kid: int | None) -> dict:
+        # _uid only keys the cache per user; the API uses the token
         try:
-            rows = recipes_client.get_all_recipes(created_by_user_id=_uid, limit=1000)
-            return len(rows or [])
+            return users_client.get_my_dashboard(kid) or {}
         except APIException:
-            return 0
+            return {}
 
-    @st.cache_data(show_spinner=False, ttl=15)
-    def _count_ai_recipes() -> int:
-        try:
-            rows = recipes_client.get_ai_generated_recipes(skip=0, limit=1000)
-            return len(rows or [])
-        except APIException:
-            return 0
-
-    @st.cache_data(show_spinner=False, ttl=15)
-    def _count_inventory_items_for_kitchen(kid: int | None) -> int:
-        if not kid:
-            return 0
-        try:
-            rows = inventory_client.list_inventory_items(kid)
-            return len(rows or [])
-        except APIException:
-            return 0
-
-    my_recipes = _count_my_recipes(int(user_id))
-    ai_recipes = _count_ai_recipes()
-    inv_items = _count_inventory_items_for_kitchen(st.session_state.get("selected_kitchen_id"))
+    stats = _load_dashboard_stats(int(user_id), st.session_state.get("selected_kitchen_id"))
+    inventory = stats.get("inventory") or {}
 
     st.markdown("---")
-    c1, c2, c3 = st.columns(3)
+    c1, c2, c3, c4, c5 = st.columns(5)
     with c1:
-        st.metric("📖 My Recipes", f"{my_recipes}")
+        st.metric("📖 My Recipes", f"{stats.get('my_recipes', 0)}")
     with c2:
-        st.metric("🤖 AI Recipes", f"{ai_recipes}")
+        st.metric("🤖 AI Recipes", f"{stats.get('ai_recipes', 0)}")
     with c3:
-        st.metric("📦 Inventory Items", f"{inv_items}")
+        st.metric("📦 Inventory Items", f"{inventory.get('total_items', 0)}")
+    with c4:
+        st.metric("⏰ Expiring Soon", f"{inventory.get('expires_soon_items', 0)}")
+    with c5:
+        st.metric("📉 Low Stock", f"{inventory.get('low_stock_items', 0)}")
 
     st.markdown("---")
     st.subheader("🚀 Quick Actions")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from .base import BaseClient
@@ -23,6 +24,28 @@ class AIRecipesClient(BaseClient):
         return self.post(f"{self.BASE_PATH}/recipes", json_data=payload)
 
 
+    def get_kitchen_insights(
+            self,
+            user_id: int,
+            kitchen_id: int,
+            *,
+            include_recipe: bool = False,
+            recipe_request: dict[str, Any] | None = None,
+            deadline_seconds: float | None = None,
+    ) -> dict[str, Any]:
+        """Get inventory analysis, cooking suggestions and an optional recipe in one call."""
+        payload: dict[str, Any] = {
+            "user_id": user_id,
+            "kitchen_id": kitchen_id,
+            "include_recipe": include_recipe,
+        }
+        if recipe_request is not None:
+            payload["recipe_request"] = recipe_request
+        if deadline_seconds is not None:
+            payload["deadline_seconds"] = deadline_seconds
+        return self.post(f"{self.BASE_PATH}/kitchen-insights", json_data=payload)
+
+
     def convert_ai_recipe_to_create(self, ai_output_id: int, user_id: int) -> dict[str, Any]:
         """Convert AI recipe response to RecipeCreate format for saving."""
         params = {"user_id": user_id}
@@ -57,6 +80,21 @@ class AIRecipesClient(BaseClient):
         return self.get(f"{self.BASE_PATH}/outputs/", params=params)
 
 
+    def export_outputs(
+            self,
+            *,
+            user_id: int | None = None,
+            output_type: str | None = None,
+            target_type: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream AIModelOutput entries (newest first) without loading them all at once."""
+        params = {"user_id": user_id, "output_type": output_type, "target_type": target_type}
+        return self.iter_ndjson(
+            f"{self.BASE_PATH}/outputs/export",
+            params={key: value for key, value in params.items() if value is not None},
+        )
+
+
     def delete_recipe_output(self, ai_output_id: int, user_id: int) -> None:
         """Delete a generated AI recipe output (owner-only)."""
         self.delete(f"{self.BASE_PATH}/outputs/{ai_output_id}?user_id={user_id}")
@@ -24,11 +24,20 @@ class AuthClient(BaseClient):
 
 
     def refresh(self, refresh_token: str) -> dict[str, Any]:
-        """Refresh access token using the refresh token."""
-        # For simplicity we send raw refresh token in body (as implemented in backend)
-        return self.post(f"{self.BASE_PATH}/refresh", data=refresh_token)
+        """Exchange the refresh token for a new token pair.
 
+        The backend rotates refresh tokens: the old one is revoked, so the
+        returned ``refresh_token`` must replace it.
+        """
+        return self.post(f"{self.BASE_PATH}/refresh", params={"refresh_token": refresh_token})
 
-    def logout(self) -> None:
-        """Stateless logout endpoint (client should clear tokens locally)."""
-        self.post(f"{self.BASE_PATH}/logout")
+
+    def logout(self, refresh_token: str | None = None) -> None:
+        """Revoke the refresh token (client should clear tokens locally)."""
+        params = {"refresh_token": refresh_token} if refresh_token else None
+        self.post(f"{self.BASE_PATH}/logout", params=params)
+
+
+    def logout_all(self) -> None:
+        """Revoke all tokens of the current user on every device."""
+        self.post(f"{self.BASE_PATH}/logout-all")
@@ -2,11 +2,167 @@
 
 from __future__ import annotations
 
+import base64
 import json
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Response header carrying the cursor of the next page on list endpoints
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Connection pooling and retries of the shared HTTP session
+POOL_MAXSIZE = 20
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (502, 503, 504)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+REQUEST_TIMEOUT_SECONDS = 30
+
+# Threads issuing concurrent requests for ``gather``; below the pool size
+GATHER_MAX_WORKERS = 8
+
+# GET responses kept for conditional requests (If-None-Match)
+CONDITIONAL_CACHE_MAX_ENTRIES = 256
+
+# Refresh token exchanges remembered so concurrent and later callers reuse the result
+ROTATED_TOKENS_MAX_ENTRIES = 256
+
+TimingHook = Callable[[str, str, int, float], None]
+"""Called after every request with ``(method, url, status_code, elapsed_seconds)``."""
+
+_session: requests.Session | None = None
+_init_lock = threading.Lock()
+_timing_hooks: list[TimingHook] = []
+_executor: ThreadPoolExecutor | None = None
+_conditional_cache: OrderedDict[tuple[Any, ...], tuple[str, requests.Response]] = OrderedDict()
+_conditional_lock = threading.Lock()
+_rotations: OrderedDict[str, _Rotation] = OrderedDict()
+_rotations_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide HTTP session shared by all clients.
+
+    Keeps connections to the API alive in a pool, retries idempotent
+    requests with exponential backoff on connection errors and 502/503/504,
+    and accepts gzip-compressed responses.
+    """
+    global _session
+    if _session is None:
+        with _init_lock:
+            if _session is None:
+                retry = Retry(
+                    total=RETRY_TOTAL,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    allowed_methods=IDEMPOTENT_METHODS,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"Accept-Encoding": "gzip, deflate"})
+                _session = session
+    return _session
+
+
+def gather(calls: Sequence[Callable[[], Any]], *, return_exceptions: bool = False) -> list[Any]:
+    """Run independent API calls concurrently and return their results in order.
+
+    Total latency is that of the slowest call instead of the sum. The calls
+    run on worker threads, so they must not touch Streamlit state; tokens
+    they refresh are written to the session once all calls are done.
+
+    Args:
+        calls: Zero-argument callables, e.g. ``lambda: client.get_recipe(1)``.
+        return_exceptions: Return raised exceptions in place of results
+            instead of re-raising the first one.
+
+    Example:
+        >>> recipe, reviews = gather([
+        ...     lambda: client.get_recipe_with_details(1),
+        ...     lambda: client.get_recipe_reviews(1),
+        ... ])
+    """
+    global _executor
+    if _executor is None:
+        with _init_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=GATHER_MAX_WORKERS, thread_name_prefix="api-gather")
+
+    futures = [_executor.submit(call) for call in calls]
+    # Workers cannot write the session; persist tokens they rotated from here
+    try:
+        results: list[Any] = []
+        for future in futures:
+            exc = future.exception()
+            if exc is None:
+                results.append(future.result())
+            elif return_exceptions and isinstance(exc, Exception):
+                results.append(exc)
+            else:
+                raise exc
+        return results
+    finally:
+        sync_session_tokens()
+
+
+def add_timing_hook(hook: TimingHook) -> None:
+    """Register ``hook`` to be called with the timing of every API request."""
+    _timing_hooks.append(hook)
+
+
+def remove_timing_hook(hook: TimingHook) -> None:
+    """Unregister a hook added with ``add_timing_hook``."""
+    if hook in _timing_hooks:
+        _timing_hooks.remove(hook)
+
+
+def _report_timing(method: str, url: str, status_code: int, elapsed: float) -> None:
+    logger.debug("%s %s -> %s in %.1f ms", method, url, status_code, elapsed * 1000)
+    for hook in list(_timing_hooks):
+        try:
+            hook(method, url, status_code, elapsed)
+        except Exception:
+            logger.exception("Timing hook failed")
+
+
+def _cached_response(key: tuple[Any, ...]) -> tuple[str, requests.Response] | None:
+    with _conditional_lock:
+        entry = _conditional_cache.get(key)
+        if entry is not None:
+            _conditional_cache.move_to_end(key)
+        return entry
+
+
+def _store_response(key: tuple[Any, ...], resp: requests.Response) -> None:
+    etag = resp.headers.get("ETag")
+    if resp.status_code != 200 or not etag:
+        return
+    with _conditional_lock:
+        _conditional_cache[key] = (etag, resp)
+        _conditional_cache.move_to_end(key)
+        while len(_conditional_cache) > CONDITIONAL_CACHE_MAX_ENTRIES:
+            _conditional_cache.popitem(last=False)
+
+
+def clear_conditional_cache() -> None:
+    """Forget all responses kept for conditional GETs."""
+    with _conditional_lock:
+        _conditional_cache.clear()
 
 
 class APIException(Exception):
@@ -20,9 +176,105 @@ class APIException(Exception):
         return self.message
 
 
+class _Rotation:
+    """One refresh token exchange; the lock makes concurrent callers share it."""
+
+    __slots__ = ("lock", "tokens")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.tokens: tuple[str, str | None] | None = None
+
+
+def _rotation_for(refresh_token: str) -> _Rotation:
+    with _rotations_lock:
+        rotation = _rotations.get(refresh_token)
+        if rotation is None:
+            rotation = _rotations[refresh_token] = _Rotation()
+        _rotations.move_to_end(refresh_token)
+        while len(_rotations) > ROTATED_TOKENS_MAX_ENTRIES:
+            _rotations.popitem(last=False)
+        return rotation
+
+
+def rotate_refresh_token(refresh_token: str, exchange: Callable[[str], dict[str, Any]]) -> tuple[str, str | None]:
+    """Exchange ``refresh_token`` for new tokens exactly once per process.
+
+    Refresh tokens are single-use: the backend rejects, and eventually
+    treats as theft, a second exchange of the same token. Callers racing on
+    one token (``gather`` workers, several clients of a page) wait for the
+    first exchange and receive its result; later callers still holding the
+    old token get it from memory.
+
+    Args:
+        refresh_token: The token to exchange.
+        exchange: Performs the request, e.g. ``AuthClient.refresh``.
+
+    Returns:
+        ``(access_token, refresh_token)``; the refresh token is None if the
+        backend did not rotate it.
+
+    Raises:
+        APIException: If the exchange fails; nothing is remembered then.
+    """
+    rotation = _rotation_for(refresh_token)
+    with rotation.lock:
+        if rotation.tokens is None:
+            tokens = exchange(refresh_token)
+            access_token = tokens.get("access_token")
+            if not access_token:
+                raise APIException("Token refresh returned no access token")
+            rotation.tokens = (access_token, tokens.get("refresh_token"))
+    # The new pair may itself have been rotated since
+    return _latest_tokens(refresh_token) or rotation.tokens
+
+
+def _latest_tokens(refresh_token: str | None) -> tuple[str, str | None] | None:
+    """Follow the rotations of ``refresh_token`` to the newest token pair."""
+    latest = None
+    seen: set[str] = set()
+    while refresh_token and refresh_token not in seen:
+        seen.add(refresh_token)
+        with _rotations_lock:
+            rotation = _rotations.get(refresh_token)
+        if rotation is None or rotation.tokens is None:
+            break
+        latest = rotation.tokens
+        refresh_token = latest[1]
+    return latest
+
+
+def sync_session_tokens() -> None:
+    """Write tokens rotated by any client back to the Streamlit session.
+
+    Only the script thread has a session; on other threads (``gather``
+    workers) and outside Streamlit this does nothing, and the rotation is
+    picked up by the next call on the script thread.
+    """
+    try:
+        import streamlit as st  # type: ignore
+        from streamlit.runtime.scriptrunner import get_script_run_ctx  # type: ignore
+    except ImportError:
+        return
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return
+
+    latest = _latest_tokens(st.session_state.get("auth_refresh_token"))
+    if latest is not None:
+        access_token, refresh_token = latest
+        st.session_state.auth_access_token = access_token
+        if refresh_token:
+            st.session_state.auth_refresh_token = refresh_token
+
+
 class BaseClient:
     """Base HTTP client with optional JWT bearer handling and auto-refresh.
 
+    All instances send their requests through the pooled session returned
+    by ``get_http_session``, so creating several clients per page is cheap.
+    GET responses with an ``ETag`` are kept and revalidated with
+    ``If-None-Match``; on ``304 Not Modified`` the kept response is reused.
+
     Usage:
         client.set_tokens(access_token, refresh_token)
         client.clear_tokens()
@@ -65,7 +317,25 @@ class BaseClient:
         self._access_token = None
         self._refresh_token = None
 
+    @property
+    def token_subject(self) -> str | None:
+        """``sub`` claim of the access token, used to key per-user caches.
+
+        The token is not verified here; the backend does that on every request.
+        """
+        if not self._access_token:
+            return None
+        try:
+            payload = self._access_token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            return str(claims["sub"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
     # ------------------------- core http methods ------------------------ #
+    def _conditional_key(self, path: str, params: dict[str, Any] | None) -> tuple[Any, ...]:
+        return self.base_url, path, repr(sorted((params or {}).items())), self.token_subject
+
     def _headers(self, extra: dict[str, str] | None = None) -> dict[str, str]:
         headers: dict[str, str] = {"Content-Type": "application/json"}
         if self._access_token:
@@ -87,6 +357,47 @@ class BaseClient:
     def delete(self, path: str) -> Any:
         return self._request("DELETE", path)
 
+    @staticmethod
+    def gather(calls: Sequence[Callable[[], Any]], *, return_exceptions: bool = False) -> list[Any]:
+        """Run independent API calls concurrently; see the module-level ``gather``."""
+        return gather(calls, return_exceptions=return_exceptions)
+
+    def get_all_pages(self, path: str, params: dict[str, Any] | None = None, page_size: int = 200) -> list[Any]:
+        """GET every page of a cursor-paginated list endpoint.
+
+        Follows the ``X-Next-Cursor`` response header until the last page, so
+        callers no longer need to guess a large enough ``limit``.
+        """
+        page_params: dict[str, Any] = {**(params or {}), "limit": page_size}
+        page_params.pop("skip", None)
+
+        rows: list[Any] = []
+        while True:
+            resp = self._send("GET", path, params=page_params)
+            rows.extend(self._parse(resp) or [])
+            cursor = resp.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                return rows
+            page_params["cursor"] = cursor
+
+    def iter_ndjson(self, path: str, params: dict[str, Any] | None = None) -> Iterator[Any]:
+        """Stream an NDJSON export endpoint, yielding one parsed row at a time.
+
+        The body is read incrementally (and gunzipped by ``requests``), so
+        exports of any size are processed in constant memory.
+
+        Example:
+            >>> for item in client.iter_ndjson("/v1/items/export", {"kitchen_id": 1}):
+            ...     writer.writerow(item)
+        """
+        resp = self._send("GET", path, params=params, stream=True)
+        with resp:
+            if not 200 <= resp.status_code < 300:
+                self._parse(resp)
+            for line in resp.iter_lines():
+                if line:
+                    yield json.loads(line)
+
     def _request(
             self,
             method: str,
@@ -95,18 +406,44 @@ class BaseClient:
             params: dict[str, Any] | None = None,
             json_data: dict[str, Any] | None = None,
             data: Any = None,
-            retry_on_401: bool = True,
     ) -> Any:
+        resp = self._send(method, path, params=params, json_data=json_data, data=data)
+        return self._parse(resp)
+
+    def _send(
+            self,
+            method: str,
+            path: str,
+            *,
+            params: dict[str, Any] | None = None,
+            json_data: dict[str, Any] | None = None,
+            data: Any = None,
+            retry_on_401: bool = True,
+            stream: bool = False,
+    ) -> requests.Response:
         url = f"{self.base_url}{path}"
-        resp = requests.request(
+        # GETs revalidate a previously received ETag; a 304 reuses that response
+        conditional_key = self._conditional_key(path, params) if method == "GET" and not stream else None
+        cached = _cached_response(conditional_key) if conditional_key else None
+        extra_headers = {"If-None-Match": cached[0]} if cached else None
+
+        started = time.perf_counter()
+        resp = get_http_session().request(
             method=method,
             url=url,
-            headers=self._headers(),
+            headers=self._headers(extra_headers),
             params=params,
             json=json_data,
             data=data,
-            timeout=30,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            stream=stream,
         )
+        _report_timing(method, url, resp.status_code, time.perf_counter() - started)
+
+        if conditional_key:
+            if resp.status_code == 304 and cached:
+                return cached[1]
+            _store_response(conditional_key, resp)
 
         if resp.status_code == 401 and retry_on_401 and self._refresh_token:
             # Try refresh once
@@ -115,19 +452,24 @@ class BaseClient:
                 self._auth_client = AuthClient(base_url=self.base_url)
 
             try:
-                tokens = self._auth_client.refresh(self._refresh_token)
-                new_access = tokens.get("access_token")
-                new_refresh = tokens.get("refresh_token")
-                if new_access:
-                    self.set_tokens(new_access, new_refresh)
-                    # Retry original request once without another refresh attempt
-                    return self._request(
-                        method, path, params=params, json_data=json_data, data=data, retry_on_401=False
-                    )
-            except Exception:
+                new_access, new_refresh = rotate_refresh_token(self._refresh_token, self._auth_client.refresh)
+            except Exception as exc:
                 # Fall through and raise original 401 as APIException
-                pass
+                logger.warning("Token refresh failed: %s", exc)
+            else:
+                self.set_tokens(new_access, new_refresh)
+                sync_session_tokens()
+                # Retry original request once without another refresh attempt
+                resp.close()
+                return self._send(
+                    method, path, params=params, json_data=json_data, data=data, retry_on_401=False,
+                    stream=stream,
+                )
+
+        return resp
 
+    @staticmethod
+    def _parse(resp: requests.Response) -> Any:
         if 200 <= resp.status_code < 300:
             if resp.content:
                 try:
@@ -2,6 +2,7 @@
 from typing import Any
 
 from .base import BaseClient
+from .master_data import FOOD_ITEMS, invalidate_master_data
 
 
 class FoodItemsClient(BaseClient):
@@ -20,6 +21,12 @@ class FoodItemsClient(BaseClient):
         return self.get(self.BASE_PATH + "/", params=params)
 
 
+    def list_all_food_items(self, category: str | None = None) -> list[dict[str, Any]]:
+        """Get every food item, following the pagination cursor."""
+        params: dict[str, Any] = {"category": category} if category else {}
+        return self.get_all_pages(self.BASE_PATH + "/", params=params)
+
+
     def get_food_item(self, food_item_id: int) -> dict[str, Any]:
         """Get single food item by ID."""
         return self.get(f"{self.BASE_PATH}/{food_item_id}")
@@ -27,17 +34,22 @@ class FoodItemsClient(BaseClient):
 
     def create_food_item(self, food_item_data: dict[str, Any]) -> dict[str, Any]:
         """Create new food item."""
-        return self.post(self.BASE_PATH + "/", food_item_data)
+        created = self.post(self.BASE_PATH + "/", food_item_data)
+        invalidate_master_data(FOOD_ITEMS)
+        return created
 
 
     def update_food_item(self, food_item_id: int, food_item_data: dict[str, Any]) -> dict[str, Any]:
         """Update existing food item."""
-        return self.patch(f"{self.BASE_PATH}/{food_item_id}", food_item_data)
+        updated = self.patch(f"{self.BASE_PATH}/{food_item_id}", food_item_data)
+        invalidate_master_data(FOOD_ITEMS)
+        return updated
 
 
     def delete_food_item(self, food_item_id: int) -> None:
         """Delete food item."""
-        return self.delete(f"{self.BASE_PATH}/{food_item_id}")
+        self.delete(f"{self.BASE_PATH}/{food_item_id}")
+        invalidate_master_data(FOOD_ITEMS)
 
 
     def get_food_item_with_conversions(self, food_item_id: int) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from .base import BaseClient
@@ -15,6 +16,10 @@ class InventoryItemsClient(BaseClient):
         """List all inventory items for a given kitchen."""
         return self.get(self.BASE_PATH + "/", params={"kitchen_id": kitchen_id})
 
+    def export_inventory_items(self, kitchen_id: int) -> Iterator[dict[str, Any]]:
+        """Stream all inventory items of a kitchen without loading them all at once."""
+        return self.iter_ndjson(f"{self.BASE_PATH}/export", params={"kitchen_id": kitchen_id})
+
     def get_inventory_item(self, item_id: int) -> dict[str, Any]:
         """Get a single inventory item by its ID."""
         return self.get(f"{self.BASE_PATH}/{item_id}")
@@ -0,0 +1,121 @@
+"""Shared TTL cache for master data: units, food items and storage locations.
+
+Master data changes rarely but is needed on almost every page, usually only
+to turn ids into names. Each kind is loaded in bulk once and kept for
+``MASTER_DATA_TTL_SECONDS``, keyed by API base URL and user (plus the kitchen
+for storage locations). The clients' write methods invalidate the affected
+kind, so edits show up on the next rerun.
+
+The cache lives at module level, so it is shared by all pages and Streamlit
+sessions of the process and by ``gather`` worker threads. Returned rows must
+be treated as read-only.
+
+Usage:
+    >>> units = get_units(units_client)
+    >>> food_item_names(food_client).get(42, "#42")
+    >>> invalidate_master_data(FOOD_ITEMS)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseClient
+    from .food_items_client import FoodItemsClient
+    from .storage_locations_client import StorageLocationsClient
+    from .units_client import UnitsClient
+
+MASTER_DATA_TTL_SECONDS = 300
+
+UNITS = "units"
+FOOD_ITEMS = "food_items"
+STORAGE_LOCATIONS = "storage_locations"
+
+CacheKey = tuple[Any, ...]
+
+
+class MasterDataCache:
+    """Thread-safe TTL cache of bulk-loaded row lists.
+
+    Keys start with the master data kind so a kind can be invalidated for
+    every user at once.
+    """
+
+    def __init__(self, ttl_seconds: float = MASTER_DATA_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[CacheKey, tuple[float, list[dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: CacheKey, loader: Callable[[], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Return the cached rows for ``key``, calling ``loader`` when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            return list(entry[1])
+
+        rows = list(loader() or [])
+        with self._lock:
+            self._entries[key] = (time.monotonic(), rows)
+        return list(rows)
+
+    def invalidate(self, kind: str | None = None) -> None:
+        """Drop all entries of ``kind``, or everything when no kind is given."""
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == kind]:
+                    del self._entries[key]
+
+
+master_data_cache = MasterDataCache()
+
+
+def invalidate_master_data(kind: str | None = None) -> None:
+    """Forget cached master data of ``kind`` (all kinds when None) after a write."""
+    master_data_cache.invalidate(kind)
+
+
+def _cache_key(kind: str, client: BaseClient, *scope: Any) -> CacheKey:
+    return (kind, client.base_url, client.token_subject, *scope)
+
+
+def get_units(client: UnitsClient) -> list[dict[str, Any]]:
+    """Return all units."""
+    return master_data_cache.get_or_load(_cache_key(UNITS, client), client.list_units)
+
+
+def get_food_items(client: FoodItemsClient) -> list[dict[str, Any]]:
+    """Return all food items, following the pagination cursor on a miss."""
+    return master_data_cache.get_or_load(_cache_key(FOOD_ITEMS, client), client.list_all_food_items)
+
+
+def get_storage_locations(client: StorageLocationsClient, kitchen_id: int) -> list[dict[str, Any]]:
+    """Return all storage locations of one kitchen."""
+    return master_data_cache.get_or_load(
+        _cache_key(STORAGE_LOCATIONS, client, int(kitchen_id)),
+        lambda: client.list_storage_locations(kitchen_id),
+    )
+
+
+def unit_names(client: UnitsClient) -> dict[int, str]:
+    """Map unit ids to names."""
+    return _names(get_units(client))
+
+
+def food_item_names(client: FoodItemsClient) -> dict[int, str]:
+    """Map food item ids to names."""
+    return _names(get_food_items(client))
+
+
+def storage_location_names(client: StorageLocationsClient, kitchen_id: int) -> dict[int, str]:
+    """Map the storage location ids of one kitchen to names."""
+    return _names(get_storage_locations(client, kitchen_id))
+
+
+def _names(rows: list[dict[str, Any]]) -> dict[int, str]:
+    return {int(row["id"]): str(row.get("name") or f"#{row['id']}") for row in rows}
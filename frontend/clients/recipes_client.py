@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from .base import BaseClient
@@ -27,10 +28,18 @@ class RecipesClient(BaseClient):
             max_kcal: int | None = None,
             min_protein_g: float | None = None,
             tags_contains: list[str] | str | None = None,
+            min_average_rating: float | None = None,
+            min_review_count: int | None = None,
+            sort_by: str | None = None,
+            sort_order: str = "desc",
             skip: int = 0,
             limit: int = 100
     ) -> list[dict[str, Any]]:
-        """Get all recipes with optional filtering."""
+        """Get all recipes with optional filtering and sorting.
+
+        ``sort_by`` accepts ``title``, ``created_at``, ``average_rating`` or
+        ``review_count``.
+        """
         params: dict[str, Any] = {
             "skip": skip,
             "limit": limit
@@ -51,6 +60,13 @@ class RecipesClient(BaseClient):
             params["max_kcal"] = max_kcal
         if min_protein_g:
             params["min_protein_g"] = min_protein_g
+        if min_average_rating is not None:
+            params["min_average_rating"] = min_average_rating
+        if min_review_count is not None:
+            params["min_review_count"] = min_review_count
+        if sort_by:
+            params["sort_by"] = sort_by
+            params["sort_order"] = sort_order
 
         # Normalize tags_contains:
         if tags_contains:
@@ -75,6 +91,11 @@ class RecipesClient(BaseClient):
         return self.get(self.BASE_PATH + "/", params=params)
 
 
+    def export_recipes(self) -> Iterator[dict[str, Any]]:
+        """Stream all recipes with details without loading them all at once."""
+        return self.iter_ndjson(f"{self.BASE_PATH}/export")
+
+
     def get_recipe_by_id(self, recipe_id: int) -> dict[str, Any]:
         """Get a recipe by ID."""
         return self.get(f"{self.BASE_PATH}/{recipe_id}")
@@ -85,6 +106,26 @@ class RecipesClient(BaseClient):
         return self.get(f"{self.BASE_PATH}/{recipe_id}/details")
 
 
+    def get_recipe_page(
+            self,
+            recipe_id: int,
+            include: list[str] | None = None,
+            review_limit: int = 100,
+            review_cursor: str | None = None
+    ) -> dict[str, Any]:
+        """Get recipe details, reviews and rating summary in one request.
+
+        ``include`` selects parts (``details``, ``reviews``, ``rating_summary``);
+        all parts are returned when omitted.
+        """
+        params: dict[str, Any] = {"review_limit": review_limit}
+        if include:
+            params["include"] = include
+        if review_cursor:
+            params["review_cursor"] = review_cursor
+        return self.get(f"{self.BASE_PATH}/{recipe_id}/page", params=params)
+
+
     def create_recipe(self, recipe_data: dict[str, Any]) -> dict[str, Any]:
         """Create a new recipe."""
         return self.post(self.BASE_PATH + "/", json_data=recipe_data)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from .base import BaseClient
+from .master_data import STORAGE_LOCATIONS, invalidate_master_data
 
 
 class StorageLocationsClient(BaseClient):
@@ -28,16 +29,21 @@ class StorageLocationsClient(BaseClient):
         """Create a new storage location."""
         endpoint_with_params = f"{self.BASE_PATH}/?kitchen_id={kitchen_id}"
         location_data = {"name": name}
-        return self.post(endpoint_with_params, json_data=location_data)
+        created = self.post(endpoint_with_params, json_data=location_data)
+        invalidate_master_data(STORAGE_LOCATIONS)
+        return created
 
 
     def update_storage_location(
             self, location_id: int, location_data: dict[str, Any]
     ) -> dict[str, Any]:
         """Update an existing storage location."""
-        return self.patch(f"{self.BASE_PATH}/{location_id}", location_data)
+        updated = self.patch(f"{self.BASE_PATH}/{location_id}", location_data)
+        invalidate_master_data(STORAGE_LOCATIONS)
+        return updated
 
 
     def delete_storage_location(self, location_id: int) -> None:
         """Delete a storage location."""
         self.delete(f"{self.BASE_PATH}/{location_id}")
+        invalidate_master_data(STORAGE_LOCATIONS)
@@ -1,6 +1,7 @@
 from typing import Any
 
 from .base import BaseClient
+from .master_data import UNITS, invalidate_master_data
 
 
 class UnitsClient(BaseClient):
@@ -25,17 +26,22 @@ class UnitsClient(BaseClient):
 
     def create_unit(self, unit_data: dict[str, Any]) -> dict[str, Any]:
         """Create new unit."""
-        return self.post(self.BASE_PATH + "/", unit_data)
+        created = self.post(self.BASE_PATH + "/", unit_data)
+        invalidate_master_data(UNITS)
+        return created
 
 
     def update_unit(self, unit_id: int, unit_data: dict[str, Any]) -> dict[str, Any]:
         """Update existing unit."""
-        return self.patch(f"{self.BASE_PATH}/{unit_id}", unit_data)
+        updated = self.patch(f"{self.BASE_PATH}/{unit_id}", unit_data)
+        invalidate_master_data(UNITS)
+        return updated
 
 
     def delete_unit(self, unit_id: int) -> None:
         """Delete unit."""
-        return self.delete(f"{self.BASE_PATH}/{unit_id}")
+        self.delete(f"{self.BASE_PATH}/{unit_id}")
+        invalidate_master_data(UNITS)
 
 
     def get_unit_conversions(self, unit_id: int) -> dict[str, Any]:
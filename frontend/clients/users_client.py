@@ -39,4 +39,14 @@ class UsersClient(BaseClient):
         return self.post(f"{self.BASE_PATH}/{user_id}/deactivate")
 
     def reset_password(self, user_id: int) -> dict[str, Any]:
-        return self.post(f"{self.BASE_PATH}/{user_id}/reset-password")
\ No newline at end of file
+        return self.post(f"{self.BASE_PATH}/{user_id}/reset-password")
+
+    # ---------- Current User ----------------------------------------
+    def get_my_kitchens(self) -> list[dict[str, Any]]:
+        """Kitchens the current user belongs to, each with the user's role."""
+        return self.get(f"{self.BASE_PATH}/me/kitchens")
+
+    def get_my_dashboard(self, kitchen_id: int | None = None) -> dict[str, Any]:
+        """Recipe and inventory counts for the dashboard in one request."""
+        params = {"kitchen_id": kitchen_id} if kitchen_id else None
+        return self.get(f"{self.BASE_PATH}/me/dashboard", params=params)
\ No newline at end of file
@@ -12,7 +12,8 @@ from frontend.utils.path import ensure_frontend_on_sys_path
 
 ensure_frontend_on_sys_path(__file__)
 
-from frontend.clients import AIRecipesClient, RecipesClient, APIException
+from frontend.clients import AIRecipesClient, FoodItemsClient, RecipesClient, UnitsClient, APIException
+from frontend.clients.master_data import food_item_names, unit_names
 from frontend.components.recipe_components import (
     display_ai_recipe_generation_form,
     display_recipe_ingredients,
@@ -62,46 +63,40 @@ class AIRecipesPageController:
         st.session_state.ai_generated_recipe = ai_result
         st.rerun()
 
-    @staticmethod
-    def _ensure_preview_caches() -> None:
-        st.session_state.setdefault("_ai_preview_food_names", {})
-        st.session_state.setdefault("_ai_preview_unit_names", {})
-
-    def _resolve_food_name(self, food_item_id: int) -> str:
-        cache: dict[int, str] = st.session_state._ai_preview_food_names
-        if food_item_id in cache:
-            return cache[food_item_id]
-        try:
-            data = self.ai_client.get(f"/v1/food-items/{food_item_id}")
-            name = str(data.get("name") or f"#{food_item_id}")
-        except Exception:
-            name = f"#{food_item_id}"
-        cache[food_item_id] = name
-        return name
-
-    def _resolve_unit_name(self, unit_id: int) -> str:
-        cache: dict[int, str] = st.session_state._ai_preview_unit_names
-        if unit_id in cache:
-            return cache[unit_id]
+    def _load_name_maps(self) -> tuple[dict[int, str], dict[int, str]]:
+        """Return id→name maps for food items and units from the master data cache."""
+        food_client, units_client = FoodItemsClient(self.ai_client.base_url), UnitsClient(self.ai_client.base_url)
+        access = getattr(st.session_state, "auth_access_token", None)
+        if access:
+            refresh = getattr(st.session_state, "auth_refresh_token", None)
+            food_client.set_tokens(access, refresh)
+            units_client.set_tokens(access, refresh)
         try:
-            data = self.ai_client.get(f"/v1/units/{unit_id}")
-            name = str(data.get("name") or f"#{unit_id}")
+            food_names, units = self.ai_client.gather([
+                lambda: food_item_names(food_client),
+                lambda: unit_names(units_client),
+            ])
         except Exception:
-            name = f"#{unit_id}"
-        cache[unit_id] = name
-        return name
+            # Unresolved ids are shown as "#id"
+            return {}, {}
+        return food_names, units
 
     def _normalize_ingredients_for_preview(self, raw_ingredients: list[dict[str, Any]] | None) -> list[dict[str, Any]]:
-        self._ensure_preview_caches()
         if not raw_ingredients:
             return []
+        food_names, unit_names_by_id = self._load_name_maps()
         normalized: list[dict[str, Any]] = []
         for ing in raw_ingredients:
             food_item_id = ing.get("food_item_id")
             original_amount = ing.get("original_amount")
             original_unit_id = ing.get("original_unit_id")
-            food_name = self._resolve_food_name(int(food_item_id)) if food_item_id is not None else "Unknown"
-            unit_name = self._resolve_unit_name(int(original_unit_id)) if original_unit_id is not None else None
+            food_name = (
+                food_names.get(int(food_item_id), f"#{food_item_id}") if food_item_id is not None else "Unknown"
+            )
+            unit_name = (
+                unit_names_by_id.get(int(original_unit_id), f"#{original_unit_id}")
+                if original_unit_id is not None else None
+            )
             display_amount = original_amount if isinstance(original_amount, (int, float)) else None
             normalized.append(
                 {
@@ -14,6 +14,7 @@ ensure_frontend_on_sys_path(__file__)
 
 from frontend.clients.food_items_client import FoodItemsClient
 from frontend.clients.units_client import UnitsClient
+from frontend.clients.master_data import get_units
 from frontend.clients.base import APIException
 
 
@@ -71,7 +72,7 @@ class FoodItemsPageController:
     def load_units(self) -> list[dict[str, Any]]:
         """Load units for dropdown selection."""
         try:
-            units = self.units_client.list_units()
+            units = get_units(self.units_client)
             st.session_state.units_data = units
             return units
         except APIException as e:
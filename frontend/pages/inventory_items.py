@@ -17,6 +17,7 @@ from frontend.clients import (
     StorageLocationsClient,
     APIException,
 )
+from frontend.clients.master_data import get_food_items, get_storage_locations
 
 
 class InventoryController:
@@ -54,42 +55,59 @@ class InventoryController:
         for key, val in defaults.items():
             st.session_state.setdefault(key, val)
 
-    def _load_master_data(self, kitchen_id: int) -> None:
-        """Load master data for the given kitchen, with friendly 403 handling."""
+    def _load_page_data(self, kitchen_id: int) -> list[dict[str, Any]]:
+        """Load master data and inventory rows concurrently; return the rows."""
         self.current_kitchen_id = int(kitchen_id)
-        try:
-            st.session_state.food_master = self.food_client.list_food_items(limit=1000)
-            st.session_state.loc_master = self.loc_client.list_storage_locations(kitchen_id)
-        except APIException as exc:
-            if getattr(exc, "status_code", None) == 403:
-                st.warning(
-                    "You don't have access to this kitchen yet. "
-                    "Open Kitchens to create your own kitchen or request to join one."
-                )
-                go = st.button("Go to Kitchens", key="inv_go_kitchens")
-                if go:
-                    st.switch_page("pages/kitchens.py")
-            else:
-                st.error(f"Failed to load master data: {exc.message}")
+        food, locations, rows = self.inv_client.gather([
+            lambda: get_food_items(self.food_client),
+            lambda: get_storage_locations(self.loc_client, kitchen_id),
+            lambda: self.inv_client.list_inventory_items(kitchen_id),
+        ], return_exceptions=True)
+
+        master_error = next((r for r in (food, locations) if isinstance(r, Exception)), None)
+        if master_error is None:
+            st.session_state.food_master = food
+            st.session_state.loc_master = locations
+        else:
+            self._show_master_data_error(master_error)
 
-    def _load_inventory(self, kitchen_id: int) -> list[dict[str, Any]]:
-        """Load inventory rows for a kitchen, returning [] on 403 with guidance."""
-        try:
-            rows = self.inv_client.list_inventory_items(kitchen_id)
-            st.session_state.inv_rows = sorted(rows, key=lambda x: x["id"])
-            return st.session_state.inv_rows
-        except APIException as exc:
-            if getattr(exc, "status_code", None) == 403:
-                st.warning(
-                    "You don't have permission to view inventory for this kitchen. "
-                    "Go to Kitchens to create/select a kitchen you belong to."
-                )
-                go = st.button("Go to Kitchens", key="inv_go_kitchens2")
-                if go:
-                    st.switch_page("pages/kitchens.py")
-                return []
-            st.error(f"Failed to load inventory: {exc.message}")
+        if isinstance(rows, Exception):
+            return self._show_inventory_error(rows)
+        st.session_state.inv_rows = sorted(rows, key=lambda x: x["id"])
+        return st.session_state.inv_rows
+
+    @staticmethod
+    def _show_master_data_error(exc: Exception) -> None:
+        """Explain failed master data loading, with friendly 403 handling."""
+        if not isinstance(exc, APIException):
+            raise exc
+        if getattr(exc, "status_code", None) == 403:
+            st.warning(
+                "You don't have access to this kitchen yet. "
+                "Open Kitchens to create your own kitchen or request to join one."
+            )
+            go = st.button("Go to Kitchens", key="inv_go_kitchens")
+            if go:
+                st.switch_page("pages/kitchens.py")
+        else:
+            st.error(f"Failed to load master data: {exc.message}")
+
+    @staticmethod
+    def _show_inventory_error(exc: Exception) -> list[dict[str, Any]]:
+        """Explain failed inventory loading and return no rows, with guidance on 403."""
+        if not isinstance(exc, APIException):
+            raise exc
+        if getattr(exc, "status_code", None) == 403:
+            st.warning(
+                "You don't have permission to view inventory for this kitchen. "
+                "Go to Kitchens to create/select a kitchen you belong to."
+            )
+            go = st.button("Go to Kitchens", key="inv_go_kitchens2")
+            if go:
+                st.switch_page("pages/kitchens.py")
             return []
+        st.error(f"Failed to load inventory: {exc.message}")
+        return []
 
     @staticmethod
     def _unit_cell(item: dict[str, Any]) -> str:
@@ -245,11 +263,11 @@ class InventoryController:
             return
 
         self.current_kitchen_id = int(st.session_state["selected_kitchen_id"])
-        self._load_master_data(self.current_kitchen_id)
+        all_rows = self._load_page_data(self.current_kitchen_id)
 
         col_ref, col_add, _ = st.columns([1, 1, 6])
-        if col_ref.button("Refresh"):
-            self._load_inventory(self.current_kitchen_id)
+        # Clicking re-runs the page, which reloads all data above
+        col_ref.button("Refresh")
         if col_add.button("Add Item"):
             st.session_state.show_add = True
 
@@ -282,7 +300,6 @@ class InventoryController:
                 defaults=st.session_state.row_for_edit,
             )
 
-        all_rows = self._load_inventory(self.current_kitchen_id)
         filtered_rows = self._apply_filter(all_rows)
         self.render_table(filtered_rows)
 
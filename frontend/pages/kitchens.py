@@ -7,13 +7,14 @@ from typing import Any
 import pandas as pd
 import streamlit as st
 
-from frontend.utils.layout import render_sidebar
+from frontend.utils.layout import invalidate_kitchens_cache, render_sidebar
 from frontend.utils.path import ensure_frontend_on_sys_path
 
 ensure_frontend_on_sys_path(__file__)
 
 from frontend.clients import KitchensClient, APIException
 from frontend.clients.inventory_items_client import InventoryItemsClient
+from frontend.clients.master_data import get_storage_locations
 from frontend.clients.storage_locations_client import StorageLocationsClient
 
 
@@ -176,6 +177,7 @@ class KitchensController:
                         else:
                             assert defaults is not None
                             self.client.update_kitchen(int(defaults["id"]), {"name": name.strip()})
+                        invalidate_kitchens_cache()
                         st.success("Saved")
                         st.session_state.show_add_kitchen = False
                         st.session_state.show_edit_kitchen = False
@@ -223,6 +225,7 @@ class KitchensController:
                         KitchensClient().delete_kitchen(int(r["id"]))
                     except APIException as exc:
                         st.error(exc.message)
+                invalidate_kitchens_cache()
                 st.rerun()
 
         if len(sel) == 1:
@@ -258,6 +261,7 @@ class KitchensController:
             if b1.button("Confirm Delete", key="btn_hdr_conf_del", type="primary"):
                 try:
                     self.client.delete_kitchen(kitchen_id)
+                    invalidate_kitchens_cache()
                     st.session_state._confirm_delete_kitchen = False
                     st.session_state.view_kitchen_id = None
                     st.session_state.view_kitchen_name = None
@@ -292,7 +296,7 @@ class KitchensController:
             @st.cache_data(show_spinner=False, ttl=20)
             def _count_storage_locations(kid: int) -> int:
                 try:
-                    return len(self.sl_client.list_storage_locations(kid) or [])
+                    return len(get_storage_locations(self.sl_client, kid))
                 except APIException:
                     return 0
 
@@ -329,7 +333,7 @@ class KitchensController:
 
             def _load_storage() -> list[dict[str, Any]]:
                 try:
-                    return self.sl_client.list_storage_locations(kitchen_id) or []
+                    return get_storage_locations(self.sl_client, kitchen_id)
                 except APIException as exc:
                     st.error(f"Failed to load storage locations: {exc.message}")
                     return []
@@ -387,7 +391,7 @@ class KitchensController:
 
             def _load_storage_i() -> list[dict[str, Any]]:
                 try:
-                    return self.sl_client.list_storage_locations(kitchen_id) or []
+                    return get_storage_locations(self.sl_client, kitchen_id)
                 except APIException:
                     return []
 
@@ -168,7 +168,10 @@ class RecipesPageController:
     def _show_recipe_details(self, recipe_id: int) -> None:
         try:
             with st.spinner("Loading recipe..."):
-                recipe = self.client.get_recipe_with_details(recipe_id)
+                page = self.client.get_recipe_page(recipe_id)
+            recipe = page["details"]
+            reviews = page.get("reviews") or []
+            rating_summary = page.get("rating_summary")
             if st.button("← Back to Recipe List"):
                 if "selected_recipe_id" in st.session_state:
                     del st.session_state.selected_recipe_id
@@ -206,16 +209,10 @@ class RecipesPageController:
                 display_recipe_nutrition(recipe.get("nutrition"))
             with tab4:
                 try:
-                    reviews = self.client.get_recipe_reviews(recipe_id)
                     if not reviews:
                         rating_summary = None
-                    else:
-                        try:
-                            rating_summary = self.client.get_recipe_rating_summary(recipe_id)
-                        except APIException:
-                            rating_summary = self._compute_rating_summary_from_reviews(reviews)
-                        except Exception:
-                            rating_summary = self._compute_rating_summary_from_reviews(reviews)
+                    elif not rating_summary:
+                        rating_summary = self._compute_rating_summary_from_reviews(reviews)
                     if rating_summary and "rating_distribution" in rating_summary:
                         rating_summary["rating_distribution"] = {
                             str(k): v for k, v in rating_summary["rating_distribution"].items()
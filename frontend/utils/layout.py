@@ -4,8 +4,9 @@ import os
 
 import streamlit as st
 
+from frontend.clients.auth_client import AuthClient
 from frontend.clients.base import APIException
-from frontend.clients.kitchens_client import KitchensClient
+from frontend.clients.users_client import UsersClient
 
 
 def hide_native_pages_nav() -> None:
@@ -96,61 +97,58 @@ def _logo_path() -> str:
 
 
 def _perform_logout() -> None:
+    refresh = st.session_state.get("auth_refresh_token")
+    if refresh:
+        try:
+            AuthClient().logout(refresh)
+        except Exception:
+            # Tokens are dropped locally either way
+            pass
     st.session_state.auth_access_token = None
     st.session_state.auth_refresh_token = None
     st.session_state.auth_email = None
     st.session_state.is_admin = False
     st.session_state.current_user = None
     st.session_state._layout_needs_rerun = True
+    invalidate_kitchens_cache()
+
+
+_KITCHENS_CACHE_KEY = "_my_kitchens_cache"
+
+
+def invalidate_kitchens_cache() -> None:
+    """Forget the cached kitchen list, e.g. after creating or deleting a kitchen."""
+    st.session_state.pop(_KITCHENS_CACHE_KEY, None)
 
 
 def _load_kitchens_for_user() -> list[dict]:
+    """Return the current user's kitchens with roles, cached for the session."""
     user = st.session_state.get("current_user") or {}
     user_id = user.get("id")
     if not user_id:
         return []
 
-    client = KitchensClient()
+    cached = st.session_state.get(_KITCHENS_CACHE_KEY)
+    if cached and cached.get("user_id") == user_id:
+        return cached["rows"]
+
+    client = UsersClient()
     access = st.session_state.get("auth_access_token")
     refresh = st.session_state.get("auth_refresh_token")
     if access:
         client.set_tokens(access, refresh)
 
     try:
-        all_k = client.list_kitchens(limit=1000) or []
-        rows: list[dict] = []
-        for k in all_k:
-            kid = k.get("id")
-            nm = k.get("name", f"Kitchen {kid}")
-            if not kid:
-                continue
-            try:
-                details = client.get_kitchen(kid)
-                role = None
-                for key in ("users", "user_kitchens", "members"):
-                    lst = details.get(key) or []
-                    for it in lst:
-                        if isinstance(it, dict):
-                            if it.get("id") == user_id and it.get("role"):
-                                role = it.get("role")
-                                break
-                            if it.get("user_id") == user_id and it.get("role"):
-                                role = it.get("role")
-                                break
-                            if isinstance(it.get("user"), dict) and it["user"].get("id") == user_id and it.get("role"):
-                                role = it.get("role")
-                                break
-                    if role:
-                        break
-                if role:
-                    rows.append({"id": kid, "name": nm, "role": role})
-            except APIException:
-                continue
-        rows.sort(key=lambda r: str(r.get("name", "")).lower())
-        return rows
+        rows = [
+            {"id": k["id"], "name": k.get("name", f"Kitchen {k['id']}"), "role": k["role"]}
+            for k in client.get_my_kitchens() or []
+        ]
     except APIException:
         return []
 
+    rows.sort(key=lambda r: str(r.get("name", "")).lower())
+    st.session_state[_KITCHENS_CACHE_KEY] = {"user_id": user_id, "rows": rows}
+    return rows
 
 
 def _render_topbar() -> None:
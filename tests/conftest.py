@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.cache import reference_cache
+from backend.crud.aggregate import counter_cache
+from backend.db.base import Base
+from backend.security.revocation import revocation_index
+
+# Query budgets: @pytest.mark.query_budget(n) and the query_budget fixture
+pytest_plugins = ["tests.query_budget"]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_reference_cache():
+    # Tests create a new in-memory database each time; never serve a previous one's rows
+    reference_cache.invalidate()
+    counter_cache.invalidate()
+    revocation_index.clear()
+    yield
+
+
+@pytest.fixture
+def engine():
+    """Empty in-memory database, shared by the test and the app's threads."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    """Session on ``engine``; modules seed their rows by overriding ``db(db)``."""
+    with Session(engine) as session:
+        yield session
@@ -0,0 +1,151 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.crud import aggregate as crud_aggregate
+from backend.crud import device as crud_device
+from backend.crud import recipe as crud_recipe
+from backend.db.base import Base
+from backend.models.aggregate import AggregateCounter
+from backend.models.device import DeviceType
+from backend.models.kitchen import Kitchen
+from backend.models.recipe import Recipe
+from backend.models.user import User
+from backend.schemas.device import ApplianceCreate, ApplianceUpdate, KitchenToolCreate
+from backend.schemas.recipe import RecipeReviewUpdate, RecipeReviewUpsert, RecipeUpdate
+
+
+@pytest.fixture
+def db(db):
+    db.add_all([
+        User(id=1, name="Tester", email="tester@example.com"),
+        User(id=2, name="Other", email="other@example.com"),
+        Kitchen(id=1, name="Home"),
+        DeviceType(id=1, name="Oven", category="appliance"),
+        DeviceType(id=2, name="Knife", category="tool"),
+        Recipe(id=1, title="Soup", difficulty="easy"),
+        Recipe(id=2, title="Cake", difficulty="hard", is_ai_generated=True),
+    ])
+    db.commit()
+    return db
+
+
+def test_recipe_summary_follows_updates(db):
+    assert crud_recipe.get_recipe_summary(db).total_recipes == 2
+
+    crud_recipe.update_recipe(db, 1, RecipeUpdate(difficulty="hard", is_ai_generated=True))
+    crud_recipe.delete_recipe(db, 2)
+
+    summary = crud_recipe.get_recipe_summary(db)
+    assert summary.total_recipes == 1
+    assert summary.ai_generated_count == 1
+    assert summary.manual_count == 0
+    assert summary.by_difficulty == {"hard": 1}
+    assert crud_aggregate.check_counters(db) == []
+
+
+def test_rating_summary_follows_reviews(db):
+    crud_recipe.create_or_update_recipe_review(db, 1, 1, RecipeReviewUpsert(rating=5))
+    crud_recipe.create_or_update_recipe_review(db, 2, 1, RecipeReviewUpsert(rating=2))
+    assert crud_recipe.get_recipe_rating_summary(db, 1).average_rating == 3.5
+
+    crud_recipe.update_recipe_review(db, 2, 1, RecipeReviewUpdate(rating=4))
+    crud_recipe.create_or_update_recipe_review(db, 1, 1, RecipeReviewUpsert(rating=3))
+    summary = crud_recipe.get_recipe_rating_summary(db, 1)
+    assert (summary.total_reviews, summary.average_rating) == (2, 3.5)
+    assert summary.rating_distribution == {"1": 0, "2": 0, "3": 1, "4": 1, "5": 0}
+    recipe = db.get(Recipe, 1)  # the summary reads the recipe's own rating columns
+    assert (recipe.review_count, recipe.average_rating) == (2, 3.5)
+
+    crud_recipe.delete_recipe_review(db, 1, 1)
+    crud_recipe.delete_recipe_review(db, 2, 1)
+    summary = crud_recipe.get_recipe_rating_summary(db, 1)
+    assert (summary.total_reviews, summary.average_rating) == (0, None)
+
+
+def test_device_summary_follows_writes(db):
+    oven = crud_device.create_appliance(db, 1, ApplianceCreate(name="Oven", device_type_id=1, smart=True))
+    crud_device.create_kitchen_tool(db, 1, KitchenToolCreate(name="Chef knife", device_type_id=2))
+    crud_device.update_appliance(db, oven.id, ApplianceUpdate(available=False))
+
+    summary = crud_device.get_kitchen_device_summary(db, 1)
+    assert (summary.total_appliances, summary.available_appliances, summary.smart_appliances) == (1, 0, 1)
+    assert (summary.total_tools, summary.available_tools, summary.device_types_used) == (1, 1, 2)
+
+    crud_device.delete_appliance(db, oven.id)
+    assert crud_device.get_kitchen_device_summary(db, 1).device_types_used == 1
+    assert crud_aggregate.check_counters(db) == []
+
+
+def test_check_counters_repairs_drift(db):
+    crud_recipe.get_recipe_summary(db)
+    db.add(Recipe(id=3, title="Bypassed CRUD", difficulty="easy"))
+    db.commit()
+
+    mismatches = crud_aggregate.check_counters(db, repair=True)
+    assert {(m.dimension, m.key, m.stored, m.expected) for m in mismatches} == {
+        ("total", "all", 2, 3),
+        ("ai_generated", "false", 1, 2),
+        ("by_difficulty", "easy", 1, 2),
+    }
+    assert crud_aggregate.check_counters(db) == []
+    assert crud_recipe.get_recipe_summary(db).total_recipes == 3
+
+
+def test_rating_summary_of_unknown_recipe_stores_nothing(db):
+    assert crud_recipe.get_recipe_rating_summary(db, 99) is None
+    assert db.scalars(select(AggregateCounter.scope)).all() == []
+
+
+def test_read_during_uncommitted_counter_writes_is_not_stored(db):
+    scope = crud_aggregate.counter_scope(crud_recipe.RECIPE_RATING_COUNTER_PREFIX, 1)
+    crud_aggregate.increment_counters(db, scope, {("reviews", "count"): 1})
+
+    assert crud_aggregate.read_counters(db, scope) == {}  # computed from the (empty) reviews
+    db.rollback()
+    assert not crud_aggregate.is_initialized(db, scope)
+
+    assert crud_aggregate.read_counters(db, scope) == {}
+    db.rollback()
+    assert crud_aggregate.is_initialized(db, scope)  # seeded in its own transaction
+
+
+def test_increment_committed_during_a_seed_is_counted_once(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'counters.sqlite'}", connect_args={"timeout": 10})
+    Base.metadata.create_all(engine)
+    with Session(engine) as setup:
+        setup.add_all([
+            User(id=1, name="Tester", email="tester@example.com"),
+            User(id=2, name="Other", email="other@example.com"),
+            Recipe(id=1, title="Soup"),
+        ])
+        setup.commit()
+        crud_recipe.create_or_update_recipe_review(setup, 1, 1, RecipeReviewUpsert(rating=5))
+        crud_aggregate.reset_all_counters(setup)
+
+    def review_from_another_request():
+        with Session(engine) as other:
+            crud_recipe.create_or_update_recipe_review(other, 2, 1, RecipeReviewUpsert(rating=3))
+
+    source = crud_aggregate._sources[crud_recipe.RECIPE_RATING_COUNTER_PREFIX]
+    writer = threading.Thread(target=review_from_another_request)
+
+    def counting_then_racing(db, recipe_id):
+        counts = source(db, recipe_id)
+        writer.start()
+        writer.join(timeout=0.5)  # previously committed here, then dropped by the seed
+        return counts
+
+    monkeypatch.setitem(crud_aggregate._sources, crud_recipe.RECIPE_RATING_COUNTER_PREFIX, counting_then_racing)
+    with Session(engine) as db:
+        crud_recipe.get_recipe_rating_summary(db, 1)
+        writer.join()
+
+        monkeypatch.setitem(crud_aggregate._sources, crud_recipe.RECIPE_RATING_COUNTER_PREFIX, source)
+        crud_aggregate.counter_cache.invalidate()
+        summary = crud_recipe.get_recipe_rating_summary(db, 1)
+        assert summary.rating_distribution == {"1": 0, "2": 0, "3": 1, "4": 0, "5": 1}
+        assert crud_aggregate.check_counters(db) == []
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.enums import AIOutputTargetType, OutputFormat, OutputType
+from backend.crud import ai_model_output as crud_ai
+from backend.models.ai_model_output import AIPrompt
+from backend.models.user import User
+from backend.schemas.ai_model_output import AIModelOutputCreate, AIModelOutputUpdate, AIOutputSearchParams
+
+
+@pytest.fixture
+def db(db):
+    db.add(User(id=1, name="Tester", email="tester@example.com"))
+    db.commit()
+    return db
+
+
+def _create(db, user_prompt, system_prompt="You are NUGAMOTO.", raw_output='{"title": "Pasta"}'):
+    return crud_ai.create_ai_output(db, AIModelOutputCreate(
+        user_id=1,
+        model_version="gpt-4o-mini",
+        output_type=OutputType.RECIPE,
+        output_format=OutputFormat.JSON,
+        prompt_used=user_prompt,
+        system_prompt=system_prompt,
+        prompt_params={"servings": 2},
+        raw_output=raw_output,
+        target_type=AIOutputTargetType.RECIPE,
+    ))
+
+
+def test_raw_output_roundtrip():
+    data, encoding = crud_ai.encode_raw_output("äöü" * 100)
+    assert len(data) < len("äöü".encode() * 100)
+    assert crud_ai.decode_raw_output(data, encoding) == "äöü" * 100
+
+
+def test_system_prompt_is_stored_once(db):
+    first = _create(db, "pasta please")
+    _create(db, "soup please")
+
+    assert db.scalar(select(func.count(AIPrompt.id))) == 3
+    prompt = json.loads(first.prompt_used)
+    assert prompt["system_prompt"] == "You are NUGAMOTO."
+    assert prompt["user_prompt"] == "pasta please"
+    assert prompt["original_request"] == {"servings": 2}
+    assert first.raw_output == '{"title": "Pasta"}'
+
+
+def test_plain_prompt_and_prompt_search(db):
+    plain = _create(db, "just a prompt", system_prompt=None)
+    _create(db, "soup please")
+
+    assert crud_ai.get_ai_output_by_id(db, plain.id).prompt_used == "just a prompt"
+    found = crud_ai.get_all_ai_outputs(db, AIOutputSearchParams(prompt_contains="soup"))
+    assert [o.prompt_used.count("soup") for o in found] == [1]
+    assert len(crud_ai.get_all_ai_outputs(db, AIOutputSearchParams(prompt_contains="NUGAMOTO"))) == 1
+
+
+def test_summary_counters_follow_writes(db):
+    first = _create(db, "pasta please")
+    _create(db, "soup please")
+    assert crud_ai.get_ai_output_summary(db).total_outputs == 2
+
+    crud_ai.update_ai_output(db, first.id, AIModelOutputUpdate(model_version="gpt-4o"))
+    _create(db, "salad please")
+    crud_ai.delete_ai_output(db, first.id)
+
+    summary = crud_ai.get_ai_output_summary(db)
+    assert summary.total_outputs == 2
+    assert summary.outputs_by_model == {"gpt-4o-mini": 2}
+    assert summary.outputs_by_type == {"recipe": 2}
+    assert summary.outputs_by_target_type == {"Recipe": 2}
+    assert crud_ai.compute_ai_output_counts(db)["by_user"] == summary.outputs_by_user == {"1": 2}
@@ -0,0 +1,62 @@
+import datetime
+
+import pytest
+from sqlalchemy import select
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.enums import UnitType
+from backend.crud import inventory as crud_inventory
+from backend.models.core import Unit
+from backend.models.food import FoodItem
+from backend.models.inventory import InventoryItem, StorageLocation
+from backend.models.kitchen import Kitchen
+from backend.schemas.inventory import InventoryItemRead
+
+
+@pytest.fixture
+def db(db):
+    today = datetime.date.today()
+    db.add_all([
+        Kitchen(id=1, name="Home"),
+        Kitchen(id=2, name="Office"),
+        Unit(id=1, name="g", type=UnitType.WEIGHT, to_base_factor=1.0),
+        StorageLocation(id=1, kitchen_id=1, name="Fridge"),
+        StorageLocation(id=2, kitchen_id=2, name="Shelf"),
+        *(FoodItem(id=i, name=f"Food {i}", base_unit_id=1) for i in range(1, 6)),
+    ])
+    db.add_all([
+        InventoryItem(kitchen_id=1, food_item_id=1, storage_location_id=1, quantity=1, min_quantity=5),
+        InventoryItem(kitchen_id=1, food_item_id=2, storage_location_id=1, quantity=9, min_quantity=5,
+                      expiration_date=today - datetime.timedelta(days=1)),
+        InventoryItem(kitchen_id=1, food_item_id=3, storage_location_id=1, quantity=1,
+                      expiration_date=today + datetime.timedelta(days=3)),
+        InventoryItem(kitchen_id=1, food_item_id=4, storage_location_id=1, quantity=1,
+                      expiration_date=today + datetime.timedelta(days=30)),
+        InventoryItem(kitchen_id=2, food_item_id=5, storage_location_id=2, quantity=0, min_quantity=1),
+    ])
+    db.commit()
+    return db
+
+
+def test_kitchen_inventory_stats_match_analysis_lists(db):
+    stats = crud_inventory.get_kitchen_inventory_stats(db, 1, threshold_days=7)
+
+    assert (stats.total_items, stats.low_stock_items, stats.expired_items, stats.expires_soon_items) == (4, 1, 1, 2)
+    assert stats.total_items == len(crud_inventory.get_kitchen_inventory(db, 1))
+    assert stats.low_stock_items == len(crud_inventory.get_low_stock_items(db, 1))
+    assert stats.expired_items == len(crud_inventory.get_expired_items(db, 1))
+    assert stats.expires_soon_items == len(crud_inventory.get_expiring_items(db, 1, 7))
+    assert crud_inventory.get_kitchen_inventory_stats(db, 3).total_items == 0
+
+
+def test_inventory_lists_match_validated_schemas(db):
+    items = crud_inventory.get_kitchen_inventory(db, 1)
+    expected = [
+        InventoryItemRead.model_validate(item, from_attributes=True)
+        for item in db.scalars(select(InventoryItem).where(InventoryItem.kitchen_id == 1))
+    ]
+
+    assert [item.model_dump(mode="json") for item in items] == [item.model_dump(mode="json") for item in expected]
+    # Enums are coerced and shared nested schemas are built once
+    assert items[0].food_item.base_unit.type is UnitType.WEIGHT
+    assert items[0].food_item.base_unit is items[1].food_item.base_unit
@@ -0,0 +1,33 @@
+import pytest
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.enums import KitchenRole
+from backend.crud import kitchen as crud_kitchen
+from backend.models.kitchen import Kitchen, UserKitchen
+from backend.models.user import User
+
+
+@pytest.fixture
+def db(db):
+    db.add_all([
+        User(id=1, name="Tester", email="tester@example.com"),
+        User(id=2, name="Other", email="other@example.com"),
+        Kitchen(id=1, name="Office"),
+        Kitchen(id=2, name="Home"),
+        Kitchen(id=3, name="Cabin"),
+        UserKitchen(user_id=1, kitchen_id=1, role=KitchenRole.MEMBER),
+        UserKitchen(user_id=1, kitchen_id=2, role=KitchenRole.OWNER),
+        UserKitchen(user_id=2, kitchen_id=3, role=KitchenRole.OWNER),
+    ])
+    db.commit()
+    return db
+
+
+def test_user_kitchens_with_roles(db):
+    kitchens = crud_kitchen.get_user_kitchens_with_roles(db, 1)
+
+    assert [(k.id, k.name, k.role) for k in kitchens] == [
+        (2, "Home", KitchenRole.OWNER),
+        (1, "Office", KitchenRole.MEMBER),
+    ]
+    assert crud_kitchen.get_user_kitchens_with_roles(db, 99) == []
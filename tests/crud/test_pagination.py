@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.enums import RecipeSortField, SortOrder, UnitType
+from backend.core.pagination import InvalidCursorError
+from backend.crud import food as crud_food
+from backend.crud import recipe as crud_recipe
+from backend.models.core import Unit
+from backend.models.food import FoodItem
+from backend.models.recipe import Recipe
+from backend.schemas.recipe import RecipeSearchParams
+
+
+@pytest.fixture
+def db(db):
+    created = datetime.datetime(2024, 1, 1)
+    db.add(Unit(id=1, name="g", type=UnitType.WEIGHT, to_base_factor=1.0))
+    db.add_all([
+        FoodItem(id=i, name=f"Food {i}", category=["Fruit", None, "Dairy"][i % 3], base_unit_id=1)
+        for i in range(1, 11)
+    ])
+    db.add_all([
+        # Pairs of recipes share a creation time and rating
+        Recipe(id=i, title=f"Recipe {i}", created_at=created + datetime.timedelta(days=i // 2),
+               average_rating=None if i % 4 == 0 else float(i % 5))
+        for i in range(1, 14)
+    ])
+    db.commit()
+    return db
+
+
+def _all_pages(fetch, keyset, page_size=3):
+    items, cursor = [], None
+    while True:
+        page = fetch(cursor=cursor, limit=page_size)
+        items.extend(page)
+        cursor = keyset.next_cursor(page, page_size)
+        if cursor is None:
+            return items
+
+
+@pytest.mark.parametrize("sort_by", [None, *RecipeSortField])
+@pytest.mark.parametrize("sort_order", list(SortOrder))
+def test_recipe_cursor_pages_match_offset_listing(db, sort_by, sort_order):
+    params = RecipeSearchParams(sort_by=sort_by, sort_order=sort_order)
+    expected = [r.id for r in crud_recipe.get_all_recipes(db, params, limit=100)]
+
+    paged = _all_pages(
+        lambda **page: crud_recipe.get_all_recipes(db, params, **page),
+        crud_recipe.recipe_keyset(params),
+    )
+    assert [r.id for r in paged] == expected
+    assert sorted(expected) == list(range(1, 14))
+
+
+def test_food_cursor_pages_keep_uncategorised_items_last(db):
+    paged = _all_pages(lambda **page: crud_food.get_all_food_items(db, **page), crud_food.FOOD_ITEM_KEYSET)
+
+    assert [f.category for f in paged] == ["Dairy"] * 3 + ["Fruit"] * 3 + [None] * 4
+    assert len({f.id for f in paged}) == 10
+
+
+def test_cursor_from_other_ordering_is_rejected(db):
+    by_title = RecipeSearchParams(sort_by=RecipeSortField.TITLE)
+    page = crud_recipe.get_all_recipes(db, by_title, limit=2)
+    cursor = crud_recipe.recipe_keyset(by_title).next_cursor(page, 2)
+
+    with pytest.raises(InvalidCursorError):
+        crud_recipe.get_all_recipes(db, RecipeSearchParams(sort_by=RecipeSortField.CREATED_AT), cursor=cursor)
+    with pytest.raises(InvalidCursorError):
+        crud_recipe.get_all_recipes(db, by_title, cursor="not-a-cursor")
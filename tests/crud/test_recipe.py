@@ -0,0 +1,105 @@
+import pytest
+from sqlalchemy import select
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.enums import RecipePagePart, RecipeSortField, SortOrder
+from backend.crud import recipe as crud_recipe
+from backend.models.recipe import Recipe
+from backend.models.user import User
+from backend.schemas.recipe import RecipeRead, RecipeReviewUpdate, RecipeReviewUpsert, RecipeSearchParams
+
+
+@pytest.fixture
+def db(db):
+    db.add_all([
+        User(id=1, name="Tester", email="tester@example.com"),
+        User(id=2, name="Other", email="other@example.com"),
+        Recipe(id=1, title="Soup"),
+        Recipe(id=2, title="Cake"),
+        Recipe(id=3, title="Salad"),
+    ])
+    db.commit()
+    return db
+
+
+def _titles(db, **params):
+    return [r.title for r in crud_recipe.get_all_recipes(db, RecipeSearchParams(**params))]
+
+
+def test_review_writes_maintain_recipe_rating_columns(db):
+    crud_recipe.create_or_update_recipe_review(db, 1, 1, RecipeReviewUpsert(rating=2))
+    crud_recipe.create_or_update_recipe_review(db, 2, 1, RecipeReviewUpsert(rating=4))
+    crud_recipe.create_or_update_recipe_review(db, 1, 2, RecipeReviewUpsert(rating=5))
+
+    soup = crud_recipe.get_recipe_by_id(db, 1)
+    assert (soup.average_rating, soup.review_count) == (3.0, 2)
+
+    crud_recipe.update_recipe_review(db, 1, 1, RecipeReviewUpdate(rating=5))
+    crud_recipe.delete_recipe_review(db, 2, 1)
+    soup = crud_recipe.get_recipe_by_id(db, 1)
+    assert (soup.average_rating, soup.review_count) == (5.0, 1)
+
+    crud_recipe.delete_recipe_review(db, 1, 1)
+    soup = crud_recipe.get_recipe_by_id(db, 1)
+    assert (soup.average_rating, soup.review_count) == (None, 0)
+
+
+def test_top_rated_listing(db):
+    crud_recipe.create_or_update_recipe_review(db, 1, 1, RecipeReviewUpsert(rating=3))
+    crud_recipe.create_or_update_recipe_review(db, 2, 1, RecipeReviewUpsert(rating=4))
+    crud_recipe.create_or_update_recipe_review(db, 1, 2, RecipeReviewUpsert(rating=5))
+
+    assert _titles(db, sort_by=RecipeSortField.AVERAGE_RATING) == ["Cake", "Soup", "Salad"]
+    assert _titles(db, sort_by=RecipeSortField.AVERAGE_RATING, sort_order=SortOrder.ASC) == [
+        "Soup", "Cake", "Salad"
+    ]
+    assert _titles(db, sort_by=RecipeSortField.REVIEW_COUNT, min_review_count=1) == ["Soup", "Cake"]
+    assert _titles(db, min_average_rating=4) == ["Cake"]
+
+
+def test_count_recipes(db):
+    db.add_all([
+        Recipe(id=4, title="Stew", created_by_user_id=1),
+        Recipe(id=5, title="Bread", created_by_user_id=1, is_ai_generated=True),
+    ])
+    db.commit()
+
+    assert crud_recipe.count_recipes(db).count == 5
+    assert crud_recipe.count_recipes(db, is_ai_generated=True).count == 1
+    assert crud_recipe.count_recipes(db, created_by_user_id=1).count == 2
+    assert crud_recipe.count_recipes(db, created_by_user_id=1, is_ai_generated=False).count == 1
+    assert crud_recipe.count_recipes(db, created_by_user_id=2).count == 0
+
+
+def test_recipe_page_returns_requested_parts(db):
+    crud_recipe.create_or_update_recipe_review(db, 1, 1, RecipeReviewUpsert(rating=2))
+    crud_recipe.create_or_update_recipe_review(db, 2, 1, RecipeReviewUpsert(rating=4))
+
+    page = crud_recipe.get_recipe_page(db, 1, review_limit=1)
+    assert page.details.title == "Soup"
+    assert len(page.reviews) == 1 and page.next_reviews_cursor is not None
+    assert page.rating_summary.average_rating == 3.0
+
+    rest = crud_recipe.get_recipe_page(
+        db, 1, include={RecipePagePart.REVIEWS}, review_limit=1, review_cursor=page.next_reviews_cursor
+    )
+    assert rest.details is None and rest.rating_summary is None
+    assert {r.user_id for r in page.reviews + rest.reviews} == {1, 2}
+
+    assert crud_recipe.get_recipe_page(db, 99) is None
+    assert crud_recipe.get_recipe_page(db, 99, include={RecipePagePart.RATING_SUMMARY}) is None
+
+
+def test_recipe_list_matches_validated_schemas(db):
+    db.get(Recipe, 1).created_by_user_id = 2
+    db.get(Recipe, 2).difficulty = "hard"
+    db.commit()
+
+    recipes = crud_recipe.get_all_recipes(db, RecipeSearchParams(sort_by=RecipeSortField.TITLE))
+    expected = [
+        RecipeRead.model_validate(recipe, from_attributes=True)
+        for recipe in db.scalars(select(Recipe).order_by(Recipe.title.desc(), Recipe.id.desc()))
+    ]
+
+    assert [r.model_dump(mode="json") for r in recipes] == [r.model_dump(mode="json") for r in expected]
+    assert recipes[0].created_by_user.name == "Other"
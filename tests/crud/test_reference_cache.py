@@ -0,0 +1,55 @@
+import pytest
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.cache import reference_cache
+from backend.core.enums import UnitType
+from backend.crud import core as crud_core
+from backend.crud import food as crud_food
+from backend.models.core import Unit
+from backend.models.food import FoodItem
+from backend.schemas.core import UnitCreate, UnitUpdate
+
+
+@pytest.fixture
+def db(db):
+    db.add(Unit(id=1, name="g", type=UnitType.WEIGHT, to_base_factor=1.0))
+    db.add(FoodItem(id=1, name="Flour", base_unit_id=1))
+    db.commit()
+    return db
+
+
+def _stats(namespace):
+    return reference_cache.stats().get(namespace, {"hits": 0, "misses": 0})
+
+
+def test_reads_are_served_from_cache_until_a_write_commits(db):
+    before = _stats(crud_core.UNIT_CACHE_NAMESPACE)
+    assert [u.name for u in crud_core.get_all_units(db)] == ["g"]
+    assert [u.name for u in crud_core.get_all_units(db=db, unit_type=None)] == ["g"]
+    after = _stats(crud_core.UNIT_CACHE_NAMESPACE)
+    assert (after["misses"] - before["misses"], after["hits"] - before["hits"]) == (1, 1)
+
+    crud_core.create_unit(db, UnitCreate(name="kg", type=UnitType.WEIGHT, to_base_factor=1000.0))
+    assert [u.name for u in crud_core.get_all_units(db)] == ["g", "kg"]
+
+
+def test_unit_writes_invalidate_dependent_food_reads(db):
+    assert crud_food.get_food_item_by_id(db, 1).base_unit.name == "g"
+
+    crud_core.update_unit(db, 1, UnitUpdate(name="gram"))
+    assert crud_food.get_food_item_by_id(db, 1).base_unit.name == "gram"
+
+
+def test_uncommitted_writes_bypass_cache(db):
+    assert len(crud_food.get_all_food_items(db)) == 1
+
+    db.add(FoodItem(id=2, name="Sugar", base_unit_id=1))
+    assert len(crud_food.get_all_food_items(db)) == 2
+
+    db.rollback()
+    assert len(crud_food.get_all_food_items(db)) == 1
+
+
+def test_cached_results_are_copies(db):
+    crud_core.get_all_units(db)[0].name = "changed"
+    assert crud_core.get_all_units(db)[0].name == "g"
@@ -0,0 +1,57 @@
+import datetime
+
+import pytest
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.enums import ShoppingListType, UnitType
+from backend.crud import shopping as crud_shopping
+from backend.models.core import Unit
+from backend.models.food import FoodItem
+from backend.models.kitchen import Kitchen
+from backend.models.shopping import ShoppingList, ShoppingProduct, ShoppingProductAssignment
+from backend.schemas.shopping import ShoppingProductAssignmentSearchParams
+
+
+@pytest.fixture
+def db(db):
+    created = datetime.datetime(2025, 1, 1)
+    db.add_all([
+        Kitchen(id=1, name="Home"),
+        Unit(id=1, name="g", type=UnitType.WEIGHT, to_base_factor=1.0),
+        Unit(id=2, name="kg", type=UnitType.WEIGHT, to_base_factor=1000.0),
+        FoodItem(id=1, name="Rice", base_unit_id=1),
+        FoodItem(id=2, name="Flour", base_unit_id=1),
+        ShoppingList(id=1, kitchen_id=1, name="Weekly", type=ShoppingListType.SUPERMARKET),
+        ShoppingProduct(id=1, food_item_id=1, package_unit_id=2, package_quantity=1,
+                        quantity_in_base_unit=1000, package_type="1 kg bag", estimated_price=2.5),
+        ShoppingProduct(id=2, food_item_id=2, package_unit_id=1, package_quantity=500,
+                        quantity_in_base_unit=500, package_type="500 g pack"),
+    ])
+    db.add_all([
+        ShoppingProductAssignment(shopping_list_id=1, shopping_product_id=product_id, note=note,
+                                  created_at=created + datetime.timedelta(days=product_id))
+        for product_id, note in ((1, "organic"), (2, None))
+    ])
+    db.commit()
+    return db
+
+
+def test_assignment_list_matches_orm_builder(db):
+    assignments = crud_shopping.get_shopping_list_product_assignments(db, 1)
+    expected = [
+        crud_shopping.build_shopping_product_assignment_read(
+            crud_shopping.get_product_assignment_orm_with_relationships(db, 1, product_id)
+        )
+        for product_id in (2, 1)
+    ]
+
+    assert [a.model_dump() for a in assignments] == [a.model_dump() for a in expected]
+    assert assignments[1].shopping_product.unit_price == 0.0025
+    assert assignments[1].shopping_product.package_unit_name == "kg"
+
+
+def test_assignment_list_filters_by_food_item(db):
+    assignments = crud_shopping.get_shopping_list_product_assignments(
+        db, 1, ShoppingProductAssignmentSearchParams(food_item_id=2)
+    )
+    assert [a.shopping_product.food_item_name for a in assignments] == ["Flour"]
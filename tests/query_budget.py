@@ -0,0 +1,62 @@
+"""Pytest plugin failing tests that run more SQL statements than declared.
+
+Mark a test with ``@pytest.mark.query_budget(n)`` to fail it when its body
+(fixture setup excluded) executes more than ``n`` statements, or bound a
+single block with the ``query_budget`` fixture:
+
+    def test_units(client, query_budget):
+        with query_budget(1):
+            client.get("/v1/units/")
+
+Failures list the statements repeated within the test, which usually points
+straight at the N+1 loop.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+
+from backend.core.query_stats import QueryStats, track_queries
+
+
+def _check(stats: QueryStats, max_queries: int, label: str) -> None:
+    if stats.count <= max_queries:
+        return
+    lines = [f"{label} ran {stats.count} SQL statements, budget is {max_queries}"]
+    lines += [f"  {count}x {statement}" for statement, count in stats.repeated(threshold=1).items()]
+    pytest.fail("\n".join(lines), pytrace=False)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "query_budget(max_queries): fail if the test body runs more SQL statements"
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Iterator[None]:
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+
+    # A failing test body raises out of the yield; only passing tests are checked
+    with track_queries() as stats:
+        result = yield
+    _check(stats, marker.args[0], item.name)
+    return result
+
+
+@pytest.fixture
+def query_budget() -> Callable[[int], AbstractContextManager[QueryStats]]:
+    """Context manager factory failing the test when its block exceeds ``max_queries``."""
+
+    @contextmanager
+    def budget(max_queries: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        _check(stats, max_queries, "Block")
+
+    return budget
@@ -1,6 +1,17 @@
+import asyncio
+
 import pytest
+from passlib.context import CryptContext
 
-from backend.security.passwords import hash_password, verify_password, is_password_hashed
+from backend.security.passwords import (
+    hash_password,
+    hash_password_async,
+    is_password_hashed,
+    needs_rehash,
+    verify_and_update,
+    verify_and_update_async,
+    verify_password,
+)
 
 
 @pytest.mark.parametrize("password", [
@@ -22,3 +33,23 @@ def test_hash_and_verify_password(password):
 ])
 def test_is_password_hashed(value, expected):
     assert is_password_hashed(value) is expected
+
+
+def test_verify_and_update_rehashes_outdated_rounds():
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret")
+    assert needs_rehash(old_hash) is True
+
+    assert verify_and_update("wrong", old_hash) == (False, None)
+    valid, new_hash = verify_and_update("secret", old_hash)
+    assert valid is True
+    assert verify_password("secret", new_hash) is True
+    assert needs_rehash(new_hash) is False
+    assert verify_and_update("secret", new_hash) == (True, None)
+
+
+def test_async_helpers_run_on_hash_pool():
+    async def roundtrip():
+        hashed = await hash_password_async("secret")
+        return await verify_and_update_async("secret", hashed)
+
+    assert asyncio.run(roundtrip()) == (True, None)
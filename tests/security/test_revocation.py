@@ -0,0 +1,51 @@
+import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from backend.crud import refresh_token as crud_refresh_token
+from backend.security.revocation import RevocationIndex
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+
+
+def test_reload_uses_its_own_session_outside_the_lock(db, monkeypatch):
+    index = RevocationIndex(refresh_seconds=60)
+    revoked_before = _now()
+
+    def get_revocation_cutoffs(session, since):
+        assert session is not db
+        assert not index._lock.locked()
+        return {1: revoked_before}
+
+    monkeypatch.setattr(crud_refresh_token, "get_revocation_cutoffs", get_revocation_cutoffs)
+
+    assert index.is_revoked(db, 1, revoked_before.timestamp() - 10)
+    assert not db.in_transaction()
+
+
+def test_failed_reload_keeps_the_last_cutoffs(caplog):
+    now = [0.0]
+    index = RevocationIndex(refresh_seconds=60, clock=lambda: now[0])
+    index.revoke_user(1, _now())
+    issued_at = _now().timestamp() - 10
+
+    # No tables: every reload fails
+    with Session(create_engine("sqlite://")) as db:
+        assert index.is_revoked(db, 1, issued_at)
+        assert "Could not reload token revocations" in caplog.text
+
+        now[0] = 120.0
+        assert index.is_revoked(db, 1, issued_at)
+        assert not index.is_revoked(db, 2, issued_at)
+
+
+def test_tokens_issued_in_the_revocation_second_are_revoked(db):
+    index = RevocationIndex(refresh_seconds=60)
+    issued_at = _now().timestamp()
+    index.revoke_user(1, datetime.datetime.fromtimestamp(issued_at + 0.5, datetime.timezone.utc))
+
+    assert index.is_revoked(db, 1, issued_at)
+    assert not index.is_revoked(db, 1, issued_at + 1)
@@ -0,0 +1,85 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from jose import JWTError
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core import dependencies
+from backend.core.dependencies import get_current_user_id, get_db, require_super_admin
+from backend.db.base import Base
+from backend.security import tokens
+from backend.security.tokens import VerifiedTokenCache, create_access_token, decode_token
+
+
+@pytest.fixture
+def jose_calls(monkeypatch):
+    tokens.token_cache.clear()
+    calls = []
+    real_decode = tokens.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(tokens.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_verified_tokens_are_decoded_once(jose_calls):
+    token = create_access_token(user_id=7)
+    assert decode_token(token)["sub"] == "7"
+    decode_token(token)["sub"] = "changed"
+    assert decode_token(token)["sub"] == "7"
+    assert len(jose_calls) == 1
+
+
+def test_invalid_tokens_are_not_cached(jose_calls):
+    for _ in range(2):
+        with pytest.raises(JWTError):
+            decode_token("not-a-token")
+    assert len(jose_calls) == 2
+
+
+def test_cache_honors_expiry_and_size():
+    now = [1000.0]
+    cache = VerifiedTokenCache(max_entries=2, clock=lambda: now[0])
+    cache.put("a", {"exp": 1010})
+    cache.put("b", {"exp": 2000})
+    cache.put("c", {"exp": 2000})
+    cache.put("d", {"sub": "no-exp"})
+
+    assert cache.get("a") is None  # evicted
+    assert cache.get("d") is None  # never cached
+    assert cache.get("b") == {"exp": 2000}
+
+    now[0] = 2000.0
+    assert cache.get("b") is None
+
+
+def test_stacked_dependencies_decode_token_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dependencies, "decode_token", lambda token: calls.append(token) or decode_token(token))
+
+    app = FastAPI()
+
+    @app.get("/admin", dependencies=[Depends(require_super_admin)])
+    def admin(user_id: Annotated[int, Depends(get_current_user_id)]) -> int:
+        return user_id
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    app.dependency_overrides[get_db] = lambda: Session(engine)
+
+    client = TestClient(app)
+    admin_token = create_access_token(user_id=3, extra_claims={"is_admin": True})
+    response = client.get("/admin", headers={"Authorization": f"Bearer {admin_token}"})
+    assert response.json() == 3
+    assert calls == [admin_token]
+
+    user_token = create_access_token(user_id=4)
+    assert client.get("/admin", headers={"Authorization": f"Bearer {user_token}"}).status_code == 403
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.enums import AIOutputTargetType, OutputFormat, OutputType
+from backend.crud import ai_model_output as crud_ai
+from backend.models.ai_model_output import AIModelOutput, AIPrompt
+from backend.models.user import User
+from backend.schemas.ai_model_output import AIModelOutputCreate
+from backend.services.ai.output_retention import AIOutputArchiver, RetentionPolicy
+
+NOW = datetime(2026, 6, 1)
+
+
+@pytest.fixture
+def db(db):
+    db.add(User(id=1, name="Tester", email="tester@example.com"))
+    db.commit()
+    return db
+
+
+def _create(db, prompt, age_days, status="generated"):
+    output = crud_ai.create_ai_output(db, AIModelOutputCreate(
+        user_id=1,
+        output_type=OutputType.RECIPE,
+        output_format=OutputFormat.JSON,
+        prompt_used=prompt,
+        raw_output=f'{{"title": "{prompt}"}}',
+        target_type=AIOutputTargetType.RECIPE,
+        extra_data={"status": status},
+    ))
+    db.get(AIModelOutput, output.id).created_at = NOW - timedelta(days=age_days)
+    db.commit()
+    return output
+
+
+def test_archive_moves_old_outputs_and_updates_counters(db, tmp_path):
+    old = _create(db, "old", age_days=400)
+    _create(db, "old but saved", age_days=400, status="saved")
+    _create(db, "recent", age_days=10)
+    archiver = AIOutputArchiver(RetentionPolicy(max_age_days=180, statuses=("generated",)), archive_dir=tmp_path)
+
+    assert archiver.run(db, now=NOW, dry_run=True).eligible_outputs == 1
+    result = archiver.run(db, now=NOW)
+
+    assert result.archived_outputs == 1
+    assert result.deleted_prompts == 1
+    assert result.archive_files == [f"2025/04/ai_outputs_{old.id}-{old.id}.ndjson.gz"]
+    assert db.scalar(select(func.count(AIModelOutput.id))) == 2
+    assert db.scalar(select(func.count(AIPrompt.id))) == 2
+    assert crud_ai.get_ai_output_summary(db).total_outputs == 2
+
+    archived = archiver.find(old.id)
+    assert archived["prompt_used"] == "old"
+    assert archived["raw_output"] == '{"title": "old"}'
+    assert archiver.read_index()[0]["count"] == 1
+
+
+def test_zero_retention_days_disables_archiving(db, tmp_path):
+    _create(db, "old", age_days=400)
+    result = AIOutputArchiver(RetentionPolicy(max_age_days=0), archive_dir=tmp_path).run(db, now=NOW)
+
+    assert result.archived_outputs == 0
+    assert db.scalar(select(func.count(AIModelOutput.id))) == 1
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from backend.services.ai.base import AIService
+from backend.services.ai.resilience import (
+    AIServiceMetrics,
+    AIServiceTimeoutError,
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientAIService,
+    RetryPolicy,
+)
+
+
+class _ProviderError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class _FakeService(AIService):
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.model = "fake-model"
+
+    async def _next(self):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if outcome == "hang":
+            await asyncio.sleep(10)
+        return outcome
+
+    async def generate_recipe(self, request, user_id, kitchen_id, **kwargs):
+        return await self._next()
+
+    async def analyze_inventory(self, kitchen_id, **kwargs):
+        return await self._next()
+
+    async def get_cooking_suggestions(self, kitchen_id, user_id, **kwargs):
+        return await self._next()
+
+
+def _wrap(service, *, max_retries=2, attempt_timeout=1.0, deadline=5.0, threshold=5):
+    policy = RetryPolicy(
+        max_retries=max_retries,
+        base_delay=0.0,
+        max_delay=0.0,
+        attempt_timeout=attempt_timeout,
+        deadline=deadline,
+    )
+    breaker = CircuitBreaker(failure_threshold=threshold, reset_timeout=60)
+    return ResilientAIService(service, "fake", policy=policy, breaker=breaker, metrics=AIServiceMetrics())
+
+
+def test_retries_transient_errors_then_succeeds():
+    service = _FakeService([_ProviderError(503), _ProviderError(429), {"ok": True}])
+    wrapped = _wrap(service)
+
+    assert asyncio.run(wrapped.analyze_inventory(1)) == {"ok": True}
+    assert service.calls == 3
+    stats = wrapped.metrics.snapshot()["analyze_inventory"]
+    assert stats["attempts"] == 3
+    assert stats["retries"] == 2
+    assert stats["successes"] == 1
+
+
+def test_non_retryable_error_is_raised_immediately():
+    service = _FakeService([_ProviderError(400), {"ok": True}])
+    wrapped = _wrap(service)
+
+    with pytest.raises(_ProviderError):
+        asyncio.run(wrapped.analyze_inventory(1))
+    assert service.calls == 1
+    assert wrapped.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_attempt_timeout_raises_timeout_error():
+    service = _FakeService(["hang"])
+    wrapped = _wrap(service, max_retries=0, attempt_timeout=0.05)
+
+    with pytest.raises(AIServiceTimeoutError):
+        asyncio.run(wrapped.get_cooking_suggestions(1, 1))
+    assert wrapped.metrics.snapshot()["get_cooking_suggestions"]["timeouts"] == 1
+
+
+def test_circuit_opens_and_fails_fast():
+    service = _FakeService([_ProviderError(500), _ProviderError(500), {"ok": True}])
+    wrapped = _wrap(service, max_retries=0, threshold=2)
+
+    for _ in range(2):
+        with pytest.raises(_ProviderError):
+            asyncio.run(wrapped.analyze_inventory(1))
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(wrapped.analyze_inventory(1))
+    assert service.calls == 2
+
+
+def test_circuit_half_opens_after_reset_timeout():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.allow_request() is False
+
+    now[0] = 10.0
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False  # only one trial call
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_attributes_are_delegated_to_inner_service():
+    wrapped = _wrap(_FakeService([]))
+    assert wrapped.model == "fake-model"
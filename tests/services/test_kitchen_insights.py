@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+
+from backend.services.ai.kitchen_insights import KitchenInsightsService
+
+
+class _FakePromptBuilder:
+    def __init__(self):
+        self.context_builds = 0
+        self.threads = []
+
+    def build_context(self, user_id, kitchen_id, request):
+        self.context_builds += 1
+        self.threads.append(threading.get_ident())
+        return type("Context", (), {"request": request})()
+
+
+class _FakeAIService:
+    def __init__(self, delay=0.1, fail_suggestions=False):
+        self.delay = delay
+        self.fail_suggestions = fail_suggestions
+        self.contexts = []
+
+    async def analyze_inventory(self, kitchen_id, **kwargs):
+        self.contexts.append(kwargs["context"])
+        await asyncio.sleep(self.delay)
+        return {"insights": []}
+
+    async def get_cooking_suggestions(self, kitchen_id, user_id, **kwargs):
+        self.contexts.append(kwargs["context"])
+        await asyncio.sleep(self.delay)
+        if self.fail_suggestions:
+            raise RuntimeError("provider exploded")
+        return {"suggestions": []}
+
+    async def generate_recipe(self, request, user_id, kitchen_id, **kwargs):
+        self.contexts.append(kwargs["context"])
+        await asyncio.sleep(self.delay * 5)
+        return {"title": "slow"}
+
+
+def test_parts_share_one_context_and_run_concurrently():
+    builder = _FakePromptBuilder()
+    ai = _FakeAIService(delay=0.2)
+    service = KitchenInsightsService(ai, builder)
+
+    started = time.monotonic()
+    result = asyncio.run(service.gather(user_id=1, kitchen_id=2))
+    elapsed = time.monotonic() - started
+
+    assert builder.context_builds == 1
+    assert len({id(c) for c in ai.contexts}) == 1
+    assert elapsed < 0.35
+    assert result.response.analysis.status == "ok"
+    assert result.response.suggestions.data == {"suggestions": []}
+    assert result.response.recipe.status == "skipped"
+
+
+def test_failing_and_slow_parts_do_not_hide_others():
+    ai = _FakeAIService(delay=0.05, fail_suggestions=True)
+    service = KitchenInsightsService(ai, _FakePromptBuilder())
+
+    result = asyncio.run(service.gather(user_id=1, kitchen_id=2, include_recipe=True, deadline=0.15))
+
+    assert result.response.analysis.status == "ok"
+    assert result.response.suggestions.status == "error"
+    assert result.response.recipe.status == "timeout"
+    assert result.recipe is None
+
+
+def test_context_loads_off_the_event_loop():
+    builder = _FakePromptBuilder()
+    service = KitchenInsightsService(_FakeAIService(delay=0), builder)
+
+    async def run():
+        await service.gather(user_id=1, kitchen_id=2)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert builder.threads and builder.threads[0] != loop_thread
+
+
+def test_deadline_counts_from_started_and_zero_is_not_the_default():
+    service = KitchenInsightsService(_FakeAIService(delay=0.05), _FakePromptBuilder())
+
+    spent = asyncio.run(service.gather(user_id=1, kitchen_id=2, deadline=0.15, started=time.monotonic() - 1))
+    assert spent.response.analysis.status == "timeout"
+
+    zero = asyncio.run(service.gather(user_id=1, kitchen_id=2, deadline=0))
+    assert zero.response.suggestions.status == "timeout"
@@ -0,0 +1,19 @@
+import asyncio
+
+from backend.services.ai import openai_service
+from backend.services.ai.openai_service import OpenAIService, close_openai_clients
+
+
+def test_services_share_one_client_per_api_key():
+    first = OpenAIService(db=None, api_key="key-a")
+    second = OpenAIService(db=None, api_key="key-a")
+    other = OpenAIService(db=None, api_key="key-b")
+
+    assert first.client is second.client
+    assert other.client is not first.client
+
+    asyncio.run(close_openai_clients())
+    assert first.client.is_closed()
+    assert openai_service._clients == {}
+    assert OpenAIService(db=None, api_key="key-a").client is not first.client
+    asyncio.run(close_openai_clients())
@@ -0,0 +1,130 @@
+"""Tests for the async login and register endpoints."""
+
+import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.api.v1 import auth
+from backend.core.dependencies import get_db
+from backend.crud import refresh_token as crud_refresh_token
+from backend.main import create_app
+from backend.models.user import User
+from backend.models.user_credentials import UserCredentials
+from backend.security.passwords import needs_rehash
+from backend.security.revocation import revocation_index
+from backend.security.tokens import decode_token
+
+
+@pytest.fixture
+def client(db):
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def test_register_then_login(client):
+    registered = client.post(
+        "/v1/auth/register", json={"name": "Ada", "email": "ada@example.com", "password": "secret123"}
+    )
+    assert registered.status_code == 201
+
+    assert client.post("/v1/auth/login", json={"email": "ada@example.com", "password": "secret123"}).status_code == 200
+    assert client.post("/v1/auth/login", json={"email": "ada@example.com", "password": "wrong"}).status_code == 401
+    assert client.post("/v1/auth/login", json={"email": "bob@example.com", "password": "secret123"}).status_code == 401
+
+
+def test_login_rehashes_password_with_outdated_rounds(client, db):
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret123")
+    user = User(name="Ada", email="ada@example.com")
+    db.add(user)
+    db.flush()
+    db.add(UserCredentials(user_id=user.id, password_hash=old_hash))
+    db.commit()
+
+    response = client.post("/v1/auth/login", json={"email": "ada@example.com", "password": "secret123"})
+    assert response.status_code == 200
+
+    stored = db.get(UserCredentials, user.id).password_hash
+    assert stored != old_hash
+    assert needs_rehash(stored) is False
+
+
+def _register(client):
+    response = client.post(
+        "/v1/auth/register", json={"name": "Ada", "email": "ada@example.com", "password": "secret123"}
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_duplicate_registration_is_rejected_before_hashing(client, monkeypatch):
+    _register(client)
+
+    async def no_hash(password):
+        raise AssertionError("hashed the password of a duplicate signup")
+
+    monkeypatch.setattr(auth, "hash_password_async", no_hash)
+    response = client.post(
+        "/v1/auth/register", json={"name": "Ada", "email": "ADA@example.com", "password": "secret123"}
+    )
+    assert (response.status_code, response.json()["detail"]) == (400, "Email already registered")
+
+
+def test_registration_racing_past_the_email_check_is_rejected(client, monkeypatch):
+    _register(client)
+
+    monkeypatch.setattr(auth.crud_user, "get_user_orm_by_email", lambda db, email: None)
+    response = client.post(
+        "/v1/auth/register", json={"name": "Ada", "email": "ada@example.com", "password": "secret123"}
+    )
+    assert (response.status_code, response.json()["detail"]) == (400, "Email already registered")
+
+
+def test_refresh_rotates_refresh_token(client):
+    first = _register(client)
+
+    rotated = client.post("/v1/auth/refresh", params={"refresh_token": first["refresh_token"]})
+    assert rotated.status_code == 200
+    second = rotated.json()
+    assert second["refresh_token"] != first["refresh_token"]
+
+    # The exchanged token is single-use; reuse within the grace period is only rejected
+    assert client.post("/v1/auth/refresh", params={"refresh_token": first["refresh_token"]}).status_code == 401
+    assert client.post("/v1/auth/refresh", params={"refresh_token": second["refresh_token"]}).status_code == 200
+
+
+def test_refresh_token_reuse_after_grace_revokes_user(client, monkeypatch):
+    monkeypatch.setattr(auth.settings, "REFRESH_TOKEN_REUSE_GRACE_SECONDS", -1)
+    first = _register(client)
+    second = client.post("/v1/auth/refresh", params={"refresh_token": first["refresh_token"]}).json()
+
+    assert client.post("/v1/auth/refresh", params={"refresh_token": first["refresh_token"]}).status_code == 401
+    assert client.post("/v1/auth/refresh", params={"refresh_token": second["refresh_token"]}).status_code == 401
+
+
+def test_logout_revokes_refresh_token(client):
+    tokens = _register(client)
+    assert client.post("/v1/auth/logout", params={"refresh_token": tokens["refresh_token"]}).status_code == 204
+    assert client.post("/v1/auth/refresh", params={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+
+def test_logout_all_revokes_access_and_refresh_tokens(client, monkeypatch):
+    tokens = _register(client)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("/v1/users/me", headers=headers).status_code == 200
+
+    # Revoke within the second the access token was issued in
+    issued_at = decode_token(tokens["access_token"])["iat"]
+    same_second = datetime.datetime.fromtimestamp(issued_at + 0.9, datetime.timezone.utc)
+    monkeypatch.setattr(crud_refresh_token, "_now_utc", lambda: same_second)
+    assert client.post("/v1/auth/logout-all", headers=headers).status_code == 204
+
+    assert client.get("/v1/users/me", headers=headers).status_code == 401
+    assert client.post("/v1/auth/refresh", params={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+    # Other workers learn about the revocation from the database
+    revocation_index.clear()
+    assert client.get("/v1/users/me", headers=headers).status_code == 401
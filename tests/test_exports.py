@@ -0,0 +1,95 @@
+"""Tests for the streaming NDJSON export endpoints."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.config import settings
+from backend.core.dependencies import get_current_user_id, get_db, get_token_payload
+from backend.core.enums import AIOutputTargetType, KitchenRole, OutputFormat, OutputType, UnitType
+from backend.crud import ai_model_output as crud_ai
+from backend.crud import inventory as crud_inventory
+from backend.crud import recipe as crud_recipe
+from backend.main import create_app
+from backend.models.core import Unit
+from backend.models.food import FoodItem
+from backend.models.inventory import InventoryItem, StorageLocation
+from backend.models.kitchen import Kitchen, UserKitchen
+from backend.models.recipe import Recipe, RecipeIngredient, RecipeStep
+from backend.models.user import User
+from backend.schemas.ai_model_output import AIModelOutputCreate
+
+
+@pytest.fixture
+def engine(engine, monkeypatch):
+    # Several fetches per export
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    with Session(engine) as db:
+        db.add_all([
+            User(id=1, name="Owner", email="owner@example.com"),
+            User(id=2, name="Other", email="other@example.com"),
+            Kitchen(id=1, name="Home"),
+            UserKitchen(user_id=1, kitchen_id=1, role=KitchenRole.MEMBER),
+            Unit(id=1, name="g", type=UnitType.WEIGHT, to_base_factor=1.0),
+            StorageLocation(id=1, kitchen_id=1, name="Pantry"),
+            *(FoodItem(id=i, name=f"Food {i}", base_unit_id=1) for i in range(1, 6)),
+            *(InventoryItem(kitchen_id=1, food_item_id=i, storage_location_id=1, quantity=i) for i in range(1, 6)),
+            *(Recipe(id=i, title=f"Recipe {i}", created_by_user_id=1) for i in range(1, 4)),
+            RecipeIngredient(recipe_id=1, food_item_id=1, amount_in_base_unit=200, original_unit_id=1),
+            RecipeStep(recipe_id=1, step_number=1, instruction="Boil"),
+        ])
+        db.commit()
+        for user_id in (1, 1, 2):
+            crud_ai.create_ai_output(db, AIModelOutputCreate(
+                user_id=user_id,
+                output_type=OutputType.RECIPE,
+                output_format=OutputFormat.JSON,
+                prompt_used="Generate a recipe",
+                raw_output='{"title": "Soup"}',
+                target_type=AIOutputTargetType.RECIPE,
+            ))
+    return engine
+
+
+@pytest.fixture
+def client(engine):
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: Session(engine)
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+    app.dependency_overrides[get_token_payload] = lambda: {"sub": "1"}
+    return TestClient(app)
+
+
+def _lines(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_inventory_export_streams_every_item(client, engine):
+    response = client.get("/v1/items/export", params={"kitchen_id": 1})
+
+    with Session(engine) as db:
+        expected = [item.model_dump(mode="json") for item in crud_inventory.get_kitchen_inventory(db, 1)]
+    assert _lines(response) == expected
+
+
+def test_recipe_export_includes_details(client, engine):
+    rows = _lines(client.get("/v1/recipes/export"))
+
+    with Session(engine) as db:
+        expected = crud_recipe.get_recipe_with_details(db, 1).model_dump(mode="json")
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert rows[0] == expected
+    assert rows[0]["ingredients"][0]["food_item_name"] == "Food 1"
+
+
+def test_ai_output_export_is_limited_to_own_outputs(client):
+    rows = _lines(client.get("/v1/ai/outputs/export", params={"user_id": 2}))
+
+    assert [row["user_id"] for row in rows] == [1, 1]
+    assert rows[0]["id"] > rows[1]["id"]
+    assert rows[0]["raw_output"] == '{"title": "Soup"}'
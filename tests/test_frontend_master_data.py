@@ -0,0 +1,93 @@
+"""Tests for the frontend master data cache and its invalidation by client writes."""
+
+import pytest
+
+from frontend.clients import base, master_data
+from frontend.clients.food_items_client import FoodItemsClient
+from frontend.clients.master_data import MasterDataCache
+from frontend.clients.storage_locations_client import StorageLocationsClient
+from frontend.clients.units_client import UnitsClient
+
+
+class _Response:
+    status_code = 200
+    headers = {}
+    content = b"[]"
+
+    def json(self):
+        return [{"id": 1, "name": "g"}]
+
+
+class _Session:
+    """Fake HTTP session recording every request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        return _Response()
+
+    def gets(self):
+        return [url for method, url in self.requests if method == "GET"]
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(base, "_session", session)
+    monkeypatch.setattr(master_data, "master_data_cache", MasterDataCache(ttl_seconds=60))
+    return session
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(master_data.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_hit_within_ttl_skips_the_http_call(session, clock):
+    client = UnitsClient(base_url="http://api")
+
+    assert master_data.unit_names(client) == {1: "g"}
+    clock[0] += 59
+    assert master_data.get_units(client) == [{"id": 1, "name": "g"}]
+
+    assert session.gets() == ["http://api/v1/units/"]
+
+
+def test_entries_expire_after_the_ttl(session, clock):
+    client = StorageLocationsClient(base_url="http://api")
+
+    master_data.get_storage_locations(client, 1)
+    clock[0] += 60
+    master_data.get_storage_locations(client, 1)
+
+    assert session.gets() == ["http://api/v1/storage-locations/"] * 2
+
+
+@pytest.mark.parametrize("client_cls, read, write", [
+    (UnitsClient, master_data.get_units, lambda c: c.create_unit({"name": "kg"})),
+    (UnitsClient, master_data.get_units, lambda c: c.update_unit(1, {"name": "kg"})),
+    (UnitsClient, master_data.get_units, lambda c: c.delete_unit(1)),
+    (FoodItemsClient, master_data.get_food_items, lambda c: c.create_food_item({"name": "Rice"})),
+    (FoodItemsClient, master_data.get_food_items, lambda c: c.update_food_item(1, {"name": "Rice"})),
+    (FoodItemsClient, master_data.get_food_items, lambda c: c.delete_food_item(1)),
+    (StorageLocationsClient, lambda c: master_data.get_storage_locations(c, 1),
+     lambda c: c.create_storage_location("Fridge", 1)),
+    (StorageLocationsClient, lambda c: master_data.get_storage_locations(c, 1),
+     lambda c: c.update_storage_location(1, {"name": "Fridge"})),
+    (StorageLocationsClient, lambda c: master_data.get_storage_locations(c, 1),
+     lambda c: c.delete_storage_location(1)),
+])
+def test_write_methods_invalidate_their_entry(session, clock, client_cls, read, write):
+    client = client_cls(base_url="http://api")
+
+    read(client)
+    read(client)
+    assert len(session.gets()) == 1
+
+    write(client)
+    read(client)
+    assert len(session.gets()) == 2
@@ -0,0 +1,96 @@
+"""Tests for refresh token rotation shared between concurrent frontend clients."""
+
+import threading
+import time
+
+import pytest
+
+from frontend.clients import base
+from frontend.clients.base import BaseClient, gather, rotate_refresh_token
+
+
+class _Response:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.headers = {}
+        self._payload = payload
+
+    @property
+    def content(self):
+        return b"{}" if self._payload is not None else b""
+
+    def json(self):
+        return self._payload
+
+    def close(self):
+        pass
+
+
+class _Backend:
+    """Fake API: single-use refresh tokens, one valid access token at a time."""
+
+    def __init__(self):
+        self.valid_access = None  # clients start with the expired "access-1"
+        self.valid_refresh = "refresh-1"
+        self.exchanges = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, headers, **kwargs):
+        if headers.get("Authorization") != f"Bearer {self.valid_access}":
+            return _Response(401, {"detail": "Invalid or expired token"})
+        return _Response(200, {"url": url})
+
+    def refresh(self, refresh_token):
+        time.sleep(0.05)  # let the other callers pile up
+        with self.lock:
+            if refresh_token != self.valid_refresh:
+                raise base.APIException("Refresh token has been revoked", 401)
+            self.exchanges += 1
+            self.valid_access = f"access-{self.exchanges + 1}"
+            self.valid_refresh = f"refresh-{self.exchanges + 1}"
+            return {"access_token": self.valid_access, "refresh_token": self.valid_refresh}
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = _Backend()
+    monkeypatch.setattr(base, "_session", backend)
+    monkeypatch.setattr(base, "_rotations", base.OrderedDict())
+    return backend
+
+
+def _client(backend):
+    client = BaseClient(base_url="http://api")
+    client.set_tokens("access-1", "refresh-1")
+    client._auth_client = backend
+    return client
+
+
+def test_concurrent_401s_share_one_refresh(backend):
+    clients = [_client(backend) for _ in range(3)]
+
+    results = gather([lambda client=client: client.get(f"/v1/{id(client)}") for client in clients])
+
+    assert len(results) == 3
+    assert backend.exchanges == 1  # one exchange for the three clients
+    assert {client._refresh_token for client in clients} == {"refresh-2"}
+
+
+def test_client_holding_a_rotated_out_token_reuses_the_exchange(backend):
+    _client(backend).get("/v1/units/")
+
+    # E.g. a rerun that read the session before the new pair was stored
+    late = _client(backend)
+    assert late.get("/v1/units/") == {"url": "http://api/v1/units/"}
+    assert backend.exchanges == 1
+    assert late._access_token == backend.valid_access
+
+
+def test_failed_exchange_is_not_remembered(backend):
+    def reject(token):
+        raise base.APIException("Refresh token has been revoked", 401)
+
+    with pytest.raises(base.APIException):
+        rotate_refresh_token("refresh-1", reject)
+
+    assert rotate_refresh_token("refresh-1", backend.refresh) == ("access-2", "refresh-2")
@@ -0,0 +1,56 @@
+"""Tests for conditional GETs with ETag / If-None-Match."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.dependencies import get_current_user_id, get_db
+from backend.core.enums import UnitType
+from backend.main import create_app
+from backend.models.core import Unit
+from backend.models.recipe import Recipe
+
+
+@pytest.fixture
+def db(db):
+    db.add_all([
+        Unit(id=1, name="g", type=UnitType.WEIGHT, to_base_factor=1.0),
+        Recipe(id=1, title="Soup"),
+    ])
+    db.commit()
+    return db
+
+
+@pytest.fixture
+def client(db):
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+    return TestClient(app)
+
+
+def test_unit_list_revalidates_against_table_fingerprint(client, db):
+    first = client.get("/v1/units/")
+    etag = first.headers["ETag"]
+
+    cached = client.get("/v1/units/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    db.add(Unit(id=2, name="kg", type=UnitType.WEIGHT, to_base_factor=1000.0))
+    db.commit()
+    changed = client.get("/v1/units/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [u["name"] for u in changed.json()] == ["g", "kg"]
+
+
+def test_recipe_details_revalidate_against_content_hash(client, db):
+    etag = client.get("/v1/recipes/1/details").headers["ETag"]
+    assert client.get("/v1/recipes/1/details", headers={"If-None-Match": etag}).status_code == 304
+
+    db.get(Recipe, 1).title = "Stew"
+    db.commit()
+    changed = client.get("/v1/recipes/1/details", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "Stew"
@@ -0,0 +1,47 @@
+"""Tests for the orjson default response class."""
+
+import datetime
+import decimal
+import json
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from backend.core.enums import UnitType
+from backend.core.serialization import FastJSONResponse
+from backend.main import create_app
+
+
+class _Point(BaseModel):
+    x: int
+
+
+def test_renders_types_like_the_stdlib_encoder():
+    content = {
+        "when": datetime.datetime(2025, 1, 2, 3, 4, 5, 600, tzinfo=datetime.timezone.utc),
+        "day": datetime.date(2025, 1, 2),
+        "unit": UnitType.WEIGHT,
+        "price": decimal.Decimal("1.50"),
+        "count": decimal.Decimal("3"),
+        "point": _Point(x=1),
+        1: "int key",
+    }
+
+    assert json.loads(FastJSONResponse(content).body) == {
+        "when": "2025-01-02T03:04:05.000600+00:00",
+        "day": "2025-01-02",
+        "unit": "weight",
+        "price": 1.5,
+        "count": 3,
+        "point": {"x": 1},
+        "1": "int key",
+    }
+
+
+def test_app_renders_with_orjson():
+    app = create_app()
+    health = next(route for route in app.routes if getattr(route, "path", None) == "/health")
+    assert health.response_class is FastJSONResponse
+
+    response = TestClient(app).get("/health")
+    assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,136 @@
+"""Tests for the Prometheus-style metrics registry, middleware and /metrics."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.dependencies import get_current_user_id, get_db
+from backend.core.metrics import (
+    AI_REQUEST_DURATION,
+    AI_TOKENS,
+    DB_POOL_CHECKOUT_WAIT,
+    HTTP_REQUEST_DURATION,
+    HTTP_SERVER_ERRORS,
+    MetricsMiddleware,
+    MetricsRegistry,
+    instrument_pool,
+)
+from backend.db.base import Base
+from backend.main import create_app
+from backend.services.ai.openai_service import OpenAIService
+
+
+def test_registry_renders_text_exposition_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests served.", ("path",))
+    in_flight = registry.gauge("in_flight", "Open requests.")
+    latency = registry.histogram("latency_seconds", 'Latency "per" request.', buckets=(0.1, 1.0))
+
+    requests.inc('/a"b')
+    requests.inc('/a"b', amount=2)
+    in_flight.inc()
+    in_flight.dec()
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(3)
+
+    assert registry.render() == "\n".join([
+        "# HELP requests_total Requests served.",
+        "# TYPE requests_total counter",
+        'requests_total{path="/a\\"b"} 3',
+        "# HELP in_flight Open requests.",
+        "# TYPE in_flight gauge",
+        "in_flight 0",
+        '# HELP latency_seconds Latency \\"per\\" request.',
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 3.55",
+        "latency_seconds_count 3",
+    ]) + "\n"
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("requests_total", "Again.")
+    with pytest.raises(ValueError, match="expects labels"):
+        requests.inc()
+
+
+def test_middleware_labels_requests_by_route_template():
+    app = FastAPI()
+
+    @app.get("/things/{thing_id}")
+    def get_thing(thing_id: int) -> int:
+        if thing_id == 0:
+            raise RuntimeError("boom")
+        return thing_id
+
+    client = TestClient(MetricsMiddleware(app), raise_server_exceptions=False)
+    before_ok = HTTP_REQUEST_DURATION.count("GET", "/things/{thing_id}", 200)
+    before_errors = HTTP_SERVER_ERRORS.value("GET", "/things/{thing_id}")
+    before_unmatched = HTTP_REQUEST_DURATION.count("GET", "<unmatched>", 404)
+
+    assert client.get("/things/1").status_code == 200
+    assert client.get("/things/2").status_code == 200
+    assert client.get("/things/0").status_code == 500
+    assert client.get("/missing").status_code == 404
+
+    assert HTTP_REQUEST_DURATION.count("GET", "/things/{thing_id}", 200) == before_ok + 2
+    assert HTTP_SERVER_ERRORS.value("GET", "/things/{thing_id}") == before_errors + 1
+    assert HTTP_REQUEST_DURATION.count("GET", "<unmatched>", 404) == before_unmatched + 1
+
+
+def test_metrics_endpoint_includes_cache_and_ai_collectors():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: Session(engine)
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+    client = TestClient(app)
+
+    client.get("/v1/units/")
+    client.get("/v1/units/")
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    assert 'http_request_duration_seconds_count{method="GET",route="/v1/units/",status="200"}' in response.text
+    assert "http_requests_in_flight 1" in response.text  # the scrape itself
+    assert 'reference_cache_lookups_total{namespace="units",result="hits"}' in response.text
+    assert "# TYPE ai_operation_events_total counter" in response.text
+
+
+def test_instrument_pool_times_checkouts():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    instrument_pool(engine.pool)
+    before = DB_POOL_CHECKOUT_WAIT.count()
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert DB_POOL_CHECKOUT_WAIT.count() == before + 1
+
+
+def test_openai_calls_record_latency_and_token_usage():
+    async def create(**kwargs):
+        return SimpleNamespace(
+            id="cmpl-1",
+            model=kwargs["model"],
+            usage=SimpleNamespace(prompt_tokens=120, completion_tokens=30),
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"tip": "Use the eggs"}'))],
+        )
+
+    service = OpenAIService(db=None, model="metrics-test-model", api_key="test-key")
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    assert asyncio.run(service._create_json_completion("system", "user")) == {"tip": "Use the eggs"}
+
+    assert AI_REQUEST_DURATION.count("metrics-test-model", "json_completion") == 1
+    assert AI_TOKENS.value("metrics-test-model", "prompt") == 120
+    assert AI_TOKENS.value("metrics-test-model", "completion") == 30
@@ -0,0 +1,143 @@
+"""Tests for the request profiling middleware, profile store and aggregation."""
+
+import json
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.core.dependencies import require_super_admin
+from backend.core.profiling import (
+    PROFILE_ID_HEADER,
+    ProfileStore,
+    ProfilingMiddleware,
+    aggregate_profiles,
+    is_admin_request,
+)
+from backend.main import create_app
+from backend.security.tokens import create_access_token
+
+
+def _busy_work(seconds: float) -> int:
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+def _client(store, sample_rate=0.0, admin=True):
+    app = FastAPI()
+
+    @app.get("/slow")
+    def slow() -> int:
+        return _busy_work(0.05)
+
+    middleware = ProfilingMiddleware(
+        app, store=store, sample_rate=sample_rate, interval=0.001, authorize=lambda scope: admin
+    )
+    return TestClient(middleware)
+
+
+def test_admin_header_profiles_a_single_request(tmp_path):
+    store = ProfileStore(tmp_path, max_files=10)
+    client = _client(store)
+
+    assert PROFILE_ID_HEADER not in client.get("/slow").headers
+    assert store.list() == []
+
+    name = client.get("/slow", headers={"X-Profile": "1"}).headers[PROFILE_ID_HEADER]
+    assert [profile["name"] for profile in store.list()] == [name]
+
+    document = json.loads(store.path(name).read_text())
+    [profile] = document["profiles"]
+    assert profile["type"] == "sampled" and profile["name"] == "GET /slow"
+    assert len(profile["samples"]) == len(profile["weights"]) > 0
+    sampled = {document["shared"]["frames"][frame_id]["name"] for stack in profile["samples"] for frame_id in stack}
+    assert "_busy_work" in sampled
+
+
+def test_header_is_ignored_for_non_admins(tmp_path):
+    store = ProfileStore(tmp_path, max_files=10)
+    response = _client(store, admin=False).get("/slow", headers={"X-Profile": "1"})
+
+    assert PROFILE_ID_HEADER not in response.headers
+    assert store.list() == []
+
+
+def test_sample_rate_profiles_without_header_and_store_is_pruned(tmp_path):
+    store = ProfileStore(tmp_path, max_files=2)
+    client = _client(store, sample_rate=1.0, admin=False)
+
+    names = [client.get("/slow").headers[PROFILE_ID_HEADER] for _ in range(3)]
+
+    assert [profile["name"] for profile in store.list()] == names[:0:-1]
+    assert store.path(names[0]) is None
+    assert store.path("../secrets.speedscope.json") is None
+
+
+def test_aggregate_profiles_ranks_functions_by_own_time(tmp_path):
+    frames = [
+        {"name": "endpoint", "file": "/app/backend/api/v1/recipe.py", "line": 1},
+        {"name": "cook_recipe", "file": "/app/backend/crud/recipe.py", "line": 10},
+        {"name": "execute", "file": "/lib/sqlalchemy/orm/session.py", "line": 99},
+        {"name": "build_prompt", "file": "/app/backend/services/ai/prompt_builder.py", "line": 5},
+    ]
+    for index, samples in enumerate(([[0, 1, 2], [0, 1, 2], [0, 1]], [[0, 1, 3], [0]])):
+        (tmp_path / f"{index}.speedscope.json").write_text(json.dumps({
+            "shared": {"frames": frames},
+            "profiles": [{"type": "sampled", "samples": samples, "weights": [0.01] * len(samples)}],
+        }))
+
+    cook, prompt = aggregate_profiles(sorted(tmp_path.iterdir()), ("backend/crud/", "backend/services/"))
+
+    assert (cook.function, cook.profiles) == ("cook_recipe", 2)
+    assert (round(cook.total, 3), round(cook.own, 3)) == (0.04, 0.03)
+    assert (prompt.function, round(prompt.total, 3), round(prompt.own, 3)) == ("build_prompt", 0.01, 0.01)
+
+
+def test_profile_endpoints_list_and_serve_profiles(tmp_path, monkeypatch):
+    store = ProfileStore(tmp_path, max_files=10)
+    store.save("1-GET-v1_units.speedscope.json", {"profiles": []})
+    monkeypatch.setattr("backend.main.profile_store", store)
+    app = create_app()
+    app.dependency_overrides[require_super_admin] = lambda: None
+    client = TestClient(app)
+
+    [profile] = client.get("/health/profiles").json()["profiles"]
+    assert profile["name"] == "1-GET-v1_units.speedscope.json"
+    assert client.get(f"/health/profiles/{profile['name']}").json() == {"profiles": []}
+    assert client.get("/health/profiles/unknown.speedscope.json").status_code == 404
+
+
+def test_is_admin_request_requires_a_valid_bearer_token(monkeypatch):
+    assert not is_admin_request({"type": "http", "headers": []})
+    assert not is_admin_request({"type": "http", "headers": [(b"authorization", b"Bearer not-a-jwt")]})
+
+    # Tokens without admin claims are rejected without a database round-trip
+    def no_database():
+        raise AssertionError("opened a session")
+
+    monkeypatch.setattr("backend.db.session.SessionLocal", no_database)
+    user_token = create_access_token(user_id=4).encode()
+    assert not is_admin_request({"type": "http", "headers": [(b"authorization", b"Bearer " + user_token)]})
+
+
+def test_admin_check_runs_off_the_event_loop(tmp_path):
+    threads = {}
+    app = FastAPI()
+
+    @app.get("/loop")
+    async def loop() -> None:
+        threads["loop"] = threading.get_ident()
+
+    def authorize(scope):
+        threads["authorize"] = threading.get_ident()
+        return False
+
+    middleware = ProfilingMiddleware(app, store=ProfileStore(tmp_path, max_files=1), sample_rate=0.0,
+                                     authorize=authorize)
+    TestClient(middleware).get("/loop", headers={"X-Profile": "1"})
+
+    assert threads["authorize"] != threads["loop"]
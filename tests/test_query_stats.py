@@ -0,0 +1,148 @@
+"""Tests for per-request SQL instrumentation and query budgets."""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import backend.models  # noqa: F401  – registers all tables
+from backend.core.config import settings
+from backend.core.dependencies import get_current_user_id, get_db, require_super_admin
+from backend.core.enums import UnitType
+from backend.core.query_stats import QueryLog, QueryStatsMiddleware, query_log, track_queries
+from backend.crud import inventory as crud_inventory
+from backend.crud import recipe as crud_recipe
+from backend.main import create_app
+from backend.models.core import Unit
+from backend.models.food import FoodItem, FoodItemUnitConversion
+from backend.models.inventory import InventoryItem, StorageLocation
+from backend.models.kitchen import Kitchen
+from backend.models.recipe import Recipe, RecipeIngredient
+from backend.models.user import User
+from backend.schemas.ai_service import PromptContext, RecipeGenerationRequest
+
+
+@pytest.fixture
+def engine(engine):
+    with Session(engine) as db:
+        db.add_all([
+            User(id=1, name="Cook", email="cook@example.com"),
+            Kitchen(id=1, name="Home"),
+            Unit(id=1, name="g", type=UnitType.WEIGHT, to_base_factor=1.0),
+            Unit(id=2, name="cup", type=UnitType.VOLUME, to_base_factor=240.0),
+            *(StorageLocation(id=i, kitchen_id=1, name=f"Shelf {i}") for i in range(1, 4)),
+            *(FoodItem(id=i, name=f"Food {i}", base_unit_id=1) for i in range(1, 7)),
+            *(FoodItemUnitConversion(food_item_id=i, from_unit_id=2, to_unit_id=1, factor=100.0 + i)
+              for i in range(1, 7)),
+            *(InventoryItem(kitchen_id=1, food_item_id=i, storage_location_id=i % 3 + 1, quantity=100)
+              for i in range(1, 7)),
+            Recipe(id=1, title="Stew", created_by_user_id=1),
+            *(RecipeIngredient(recipe_id=1, food_item_id=i, amount_in_base_unit=40, original_unit_id=1)
+              for i in range(1, 7)),
+        ])
+        db.commit()
+    return engine
+
+
+def test_track_queries_counts_statement_shapes(db):
+    with track_queries() as outer:
+        db.execute(select(Unit)).all()
+        with track_queries() as inner:
+            for ids in ([1], [1, 2], [1, 2, 3]):
+                db.execute(select(FoodItem).where(FoodItem.id.in_(ids))).all()
+
+    assert (outer.count, inner.count) == (4, 3)
+    assert outer.duration >= inner.duration > 0
+    # Expanded IN lists of different lengths are one shape
+    [(statement, count)] = inner.repeated(threshold=1).items()
+    assert count == 3 and statement.endswith("WHERE food_items.id IN (?)")
+    assert outer.as_dict(threshold=5)["repeated"] == {}
+
+
+def test_query_budget_fixture_fails_when_exceeded(db, query_budget):
+    with query_budget(1) as stats:
+        db.execute(select(Unit)).all()
+    assert stats.count == 1
+
+    with pytest.raises(pytest.fail.Exception, match="ran 2 SQL statements, budget is 1"):
+        with query_budget(1):
+            db.execute(select(Unit)).all()
+            db.execute(select(Unit)).all()
+
+
+@pytest.mark.query_budget(2)
+def test_grouped_inventory_queries_independent_of_locations(db):
+    grouped = crud_inventory.get_kitchen_inventory_grouped_by_storage(db, kitchen_id=1)
+
+    assert {location.id: [item.food_item_id for item in items] for location, items in grouped.items()} == {
+        1: [3, 6], 2: [1, 4], 3: [2, 5],
+    }
+
+
+@pytest.mark.query_budget(8)
+def test_prompt_context_loads_conversions_in_one_batch(db):
+    context = PromptContext.build_from_ids(db, user_id=1, kitchen_id=1, request=RecipeGenerationRequest())
+
+    assert [item.food_item.unit_conversions[0].factor for item in context.inventory_items] == [
+        101.0, 102.0, 103.0, 104.0, 105.0, 106.0,
+    ]
+
+
+def test_cook_recipe_queries_independent_of_ingredients(db, query_budget):
+    with query_budget(10) as stats:
+        result = crud_recipe.cook_recipe(db, recipe_id=1, kitchen_id=1)
+
+    assert len(result["updated_inventory_items"]) == 6
+    # Previously one inventory query per ingredient
+    assert stats.repeated(threshold=2) == {}
+    assert {item.quantity for item in db.scalars(select(InventoryItem))} == {60}
+
+
+def test_server_timing_is_off_by_default(engine):
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: Session(engine)
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+
+    assert "Server-Timing" not in TestClient(app).get("/v1/units/").headers
+
+
+def test_requests_report_server_timing_and_history(engine, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_STATS_ENABLED", True)
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: Session(engine)
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+    app.dependency_overrides[require_super_admin] = lambda: None
+    client = TestClient(app)
+    query_log.clear()
+
+    response = client.get("/v1/units/")
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert response.headers["Server-Timing"].endswith('desc="2 queries"')
+
+    [entry] = client.get("/health/queries").json()["requests"]
+    assert entry["method"] == "GET" and entry["path"] == "/v1/units/"
+    assert (entry["status_code"], entry["queries"], entry["repeated"]) == (200, 2, {})
+
+
+def test_repeated_statements_are_logged(engine, caplog):
+    app = FastAPI()
+
+    @app.get("/loop")
+    def loop() -> int:
+        with Session(engine) as db:
+            for food_item_id in range(1, 4):
+                db.get(FoodItem, food_item_id)
+        return 3
+
+    log = QueryLog(max_entries=1)
+    client = TestClient(QueryStatsMiddleware(app, log=log, repeat_threshold=2))
+    with caplog.at_level(logging.WARNING, logger="backend.core.query_stats"):
+        assert client.get("/loop").headers["Server-Timing"].endswith('desc="3 queries"')
+
+    [entry] = log.recent()
+    assert list(entry["repeated"].values()) == [3]
+    assert "Possible N+1 queries in GET /loop" in caplog.text